@@ -0,0 +1,134 @@
+"""The timing loop and result file shared by the benchmark suite.
+
+A case is a context manager yielding a *timer*: a function that runs the
+operation ``loops`` times and returns the seconds that took. Setup - building
+a payload, starting a server, connecting - happens before the ``yield`` and is
+never timed; teardown after it. Simple cases wrap a zero-argument function
+with :func:`timed`.
+
+Each case is calibrated until one sample takes at least ``min_time``, warmed
+up once, then sampled ``samples`` times. A sample's time is divided by its
+loop count, so every figure in the results is seconds per operation. This is
+pyperf's model, kept to the standard library so the suite runs wherever the
+SDK's own dependencies do.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+from typing import Any
+
+Timer = Callable[[int], float]
+Case = Callable[[], AbstractContextManager[Timer]]
+
+
+class Cases:
+    """The cases of one benchmark module, by dotted name."""
+
+    def __init__(self, group: str) -> None:
+        self.group = group
+        self.cases: dict[str, Case] = {}
+
+    def add(self, name: str) -> Callable[[Case], Case]:
+        def register(case: Case) -> Case:
+            self.cases[f"{self.group}.{name}"] = case
+            return case
+
+        return register
+
+    def function(self, name: str) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+        """Register a zero-argument function as a case that times calling it."""
+
+        def register(fn: Callable[[], Any]) -> Callable[[], Any]:
+            self.cases[f"{self.group}.{name}"] = lambda: timed(fn)
+            return fn
+
+        return register
+
+
+@contextmanager
+def timed(fn: Callable[[], Any]) -> Iterator[Timer]:
+    def timer(loops: int) -> float:
+        perf_counter = time.perf_counter
+        started = perf_counter()
+        for _ in range(loops):
+            fn()
+        return perf_counter() - started
+
+    yield timer
+
+
+def measure(timer: Timer, samples: int, min_time: float) -> dict[str, Any]:
+    """Calibrate, warm up and sample *timer*; seconds per operation."""
+    loops = 1
+    while True:
+        elapsed = timer(loops)
+        if elapsed >= min_time or loops >= 1 << 24:
+            break
+        # Aim a little past `min_time`, but never grow by more than 10x a step
+        # so one unusually fast run cannot overshoot by orders of magnitude.
+        loops *= min(10, max(2, int(min_time * 1.2 / max(elapsed, 1e-9))))
+    timer(loops)
+    times = [timer(loops) / loops for _ in range(samples)]
+    return {
+        "loops": loops,
+        "samples": times,
+        "median": statistics.median(times),
+        "min": min(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def metadata() -> dict[str, Any]:
+    """What a result was measured on, so two files can be judged comparable."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        sdk = version("surrealdb")
+    except PackageNotFoundError:
+        sdk = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "sdk": sdk,
+        "commit": commit,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "argv": sys.argv[1:],
+    }
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def load(path: str | Path) -> dict[str, Any]:
+    with open(path) as fp:
+        results: dict[str, Any] = json.load(fp)
+    return results
@@ -0,0 +1,165 @@
+"""CBOR encode and decode, and mapping decoded rows onto classes.
+
+The payloads are the shapes that have been slow before: a wide result set of
+mixed column types, a document nested to the depth SurrealDB allows in
+practice, a polygon with tens of thousands of vertices, and a large ``bytes``
+value. Run through ``benchmarks/run.py``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import math
+import uuid
+from typing import Any
+
+from _harness import Cases
+
+from surrealdb import map_rows
+from surrealdb.data.cbor import decode, encode
+from surrealdb.data.types.geometry import (
+    GeometryLine,
+    GeometryMultiPolygon,
+    GeometryPoint,
+    GeometryPolygon,
+)
+from surrealdb.data.types.record_id import RecordID
+
+cases = Cases("codec")
+
+ROWS = 1_000
+COLUMNS = 30
+DEPTH = 64
+VERTICES = 20_000
+BYTES = 8 * 1024 * 1024
+
+
+def _wide_rows() -> list[dict[str, Any]]:
+    moment = datetime.datetime(2025, 2, 3, 12, 30, 45, tzinfo=datetime.timezone.utc)
+    rows = []
+    for n in range(ROWS):
+        row: dict[str, Any] = {"id": RecordID("person", n)}
+        for column in range(COLUMNS - 1):
+            kind = column % 6
+            if kind == 0:
+                value: Any = f"value {n} {column}"
+            elif kind == 1:
+                value = n * column
+            elif kind == 2:
+                value = n / (column + 1)
+            elif kind == 3:
+                value = bool(n & 1)
+            elif kind == 4:
+                value = moment
+            else:
+                value = None if n % 3 else RecordID("company", column)
+            row[f"field_{column}"] = value
+        rows.append(row)
+    return rows
+
+
+def _deep() -> dict[str, Any]:
+    leaf = [1, 2.5, "three"]
+    node: dict[str, Any] = {"leaf": True, "values": leaf}
+    for depth in range(DEPTH):
+        node = {"depth": depth, "child": node, "siblings": [leaf, {}]}
+    return node
+
+
+def _ring(count: int, radius: float) -> list[GeometryPoint]:
+    points = [
+        GeometryPoint(
+            radius * math.cos(2 * math.pi * n / count),
+            radius * math.sin(2 * math.pi * n / count),
+        )
+        for n in range(count)
+    ]
+    return [*points, points[0]]
+
+
+def _polygon() -> GeometryPolygon:
+    exterior = _ring(VERTICES, 10.0)
+    hole = _ring(VERTICES // 10, 1.0)
+    return GeometryPolygon(GeometryLine(*exterior), GeometryLine(*hole))
+
+
+def _multipolygon() -> GeometryMultiPolygon:
+    return GeometryMultiPolygon(
+        *(GeometryPolygon(GeometryLine(*_ring(200, 1.0 + n))) for n in range(100))
+    )
+
+
+PAYLOADS: dict[str, Any] = {
+    "wide_rows": _wide_rows(),
+    "deep_nesting": _deep(),
+    "polygon": _polygon(),
+    "multipolygon": _multipolygon(),
+    "bytes": {"id": str(uuid.UUID(int=0)), "content": bytes(BYTES)},
+}
+ENCODED = {name: encode(value) for name, value in PAYLOADS.items()}
+
+
+def _register(name: str) -> None:
+    value = PAYLOADS[name]
+    data = ENCODED[name]
+    cases.function(f"encode.{name}")(lambda: encode(value))
+    cases.function(f"decode.{name}")(lambda: decode(data))
+
+
+for _name in PAYLOADS:
+    _register(_name)
+
+
+# --------------------------------------------------------------------------- #
+#  mapping rows onto classes                                                   #
+# --------------------------------------------------------------------------- #
+
+
+@dataclasses.dataclass
+class Person:
+    id: RecordID
+    name: str
+    age: int
+    score: float
+    active: bool
+    joined: datetime.datetime
+
+
+PEOPLE = [
+    {
+        "id": RecordID("person", n),
+        "name": f"person {n}",
+        "age": n % 90,
+        "score": n / 7,
+        "active": bool(n & 1),
+        "joined": datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+    }
+    for n in range(ROWS)
+]
+
+
+@cases.function("map_rows.dataclass")
+def _map_dataclass() -> None:
+    map_rows(Person, PEOPLE)
+
+
+try:
+    import pydantic
+except ImportError:  # pragma: no cover - pydantic is an optional extra
+    pass
+else:
+
+    class PersonModel(pydantic.BaseModel):
+        model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+
+        id: RecordID
+        name: str
+        age: int
+        score: float
+        active: bool
+        joined: datetime.datetime
+
+    @cases.function("map_rows.pydantic")
+    def _map_pydantic() -> None:
+        map_rows(PersonModel, PEOPLE)
@@ -0,0 +1,69 @@
+"""Building and encoding the request envelope of each RPC method.
+
+Every RPC pays for this once before anything is sent: validating the
+arguments and encoding ``{"id", "method", "params"}``. Run through
+``benchmarks/run.py``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from _harness import Cases
+
+from surrealdb.data.types.record_id import RecordID
+from surrealdb.data.types.table import Table
+from surrealdb.request_message.message import RequestMessage
+from surrealdb.request_message.methods import RequestMethod
+
+cases = Cases("envelope")
+
+_UUID = "0189d6e3-8eac-703a-9a48-d9faa78b44b9"
+_RECORD = {"name": "Tobie", "age": 42, "tags": ["founder", "cto"]}
+
+ENVELOPES: dict[RequestMethod, dict[str, Any]] = {
+    RequestMethod.USE: {"namespace": "ns", "database": "db"},
+    RequestMethod.INFO: {},
+    RequestMethod.VERSION: {},
+    RequestMethod.SIGN_IN: {"params": {"username": "root", "password": "root"}},
+    RequestMethod.AUTHENTICATE: {
+        "token": "eyJhbGciOiJIUzI1NiJ9." + "a" * 200 + ".c2lnbmF0dXJl"
+    },
+    RequestMethod.INVALIDATE: {},
+    RequestMethod.LET: {"key": "name", "value": "Tobie"},
+    RequestMethod.UNSET: {"params": ["name"]},
+    RequestMethod.LIVE: {"table": "person"},
+    RequestMethod.KILL: {"uuid": _UUID},
+    RequestMethod.QUERY: {
+        "query": "SELECT * FROM person WHERE age > $age",
+        "params": {"age": 18},
+    },
+    RequestMethod.CREATE: {"collection": "person", "data": _RECORD},
+    RequestMethod.INSERT: {"collection": "person", "params": [_RECORD] * 100},
+    RequestMethod.PATCH: {
+        "collection": "person",
+        "params": [{"op": "replace", "path": "/age", "value": 43}],
+    },
+    RequestMethod.SELECT: {"params": ["person", "tobie"]},
+    RequestMethod.UPDATE: {"record_id": RecordID("person", "tobie"), "data": _RECORD},
+    RequestMethod.UPSERT: {"record_id": RecordID("person", "tobie"), "data": _RECORD},
+    RequestMethod.MERGE: {"record_id": Table("person"), "data": {"age": 43}},
+    RequestMethod.DELETE: {"record_id": RecordID("person", "tobie")},
+    RequestMethod.BEGIN: {},
+    RequestMethod.COMMIT: {"txn": _UUID},
+    RequestMethod.CANCEL: {"txn": _UUID},
+    RequestMethod.ATTACH: {"session": _UUID},
+    RequestMethod.DETACH: {"session": _UUID},
+}
+
+
+def _register(method: RequestMethod, kwargs: dict[str, Any]) -> None:
+    def build() -> bytes:
+        return RequestMessage(method, **kwargs).WS_CBOR_DESCRIPTOR
+
+    build()  # fail here, not mid-run, if the arguments are not accepted
+    cases.function(method.value)(build)
+
+
+for _method, _kwargs in ENVELOPES.items():
+    _register(_method, _kwargs)
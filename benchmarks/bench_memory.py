@@ -0,0 +1,69 @@
+"""Parsing the memory client's chat stream (Server-Sent Events).
+
+Each case replays a recorded ``memory.chat(..., stream=True)`` reply - a
+token per event, then the closing ``done`` event - through
+``iter_sse_blocking`` in the 512-byte reads it gets from a socket, so what is
+timed is the parser and building each ``ChatChunk``, not the network. Left
+out, with a note, when the ``memory`` extra is not installed. Run through
+``benchmarks/run.py``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+
+from _harness import Cases
+
+cases = Cases("memory")
+
+TOKENS = 2000
+
+MEMORY = importlib.util.find_spec("surrealdb_memory") is not None
+
+
+def _recording(newline: str) -> bytes:
+    words = [f"tok{n % 97} " for n in range(TOKENS)]
+    events = [
+        ": keep-alive",
+        *(f"data: {json.dumps({'delta': word})}" for word in words),
+        "event: done\ndata: "
+        + json.dumps(
+            {
+                "traceId": "trace:01HZX3",
+                "sessionId": "session:01HZX3",
+                "reply": "".join(words),
+            }
+        ),
+    ]
+    return "".join(event + "\n\n" for event in events).replace("\n", newline).encode()
+
+
+RECORDINGS = {
+    f"sse.{TOKENS}_tokens": _recording("\n"),
+    f"sse.{TOKENS}_tokens_crlf": _recording("\r\n"),
+}
+
+
+def _register(name: str, body: bytes) -> None:
+    import requests
+
+    from surrealdb_memory._streaming import iter_sse_blocking
+
+    def replay() -> int:
+        response = requests.Response()
+        response.raw = io.BytesIO(body)
+        return sum(1 for _ in iter_sse_blocking(response))
+
+    if replay() != TOKENS + 1:
+        raise AssertionError(f"memory.{name}: the recording did not parse")
+    cases.function(name)(replay)
+
+
+NOTES: list[str] = []
+if MEMORY:
+    for _name, _body in RECORDINGS.items():
+        _register(_name, _body)
+else:
+    NOTES.append("memory.*: skipped, the memory extra is not installed")
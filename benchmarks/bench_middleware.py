@@ -0,0 +1,109 @@
+"""What ``use_middleware`` costs per RPC.
+
+Times ``query`` RPCs through an async websocket connection whose socket
+answers in-process, and through a blocking HTTP connection whose
+``requests.post`` does the same, so what is timed is the client and nothing
+else. Each runs with no middleware, then with chains of 1 and 5 middleware
+that only call ``call_next``. Run through ``benchmarks/run.py``
+(``-k middleware``).
+
+No middleware is one attribute check on top of the transport; the difference
+between that case and the others is the price of the chain itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from _harness import Cases, Timer
+
+from surrealdb.connections import blocking_http
+from surrealdb.connections.async_ws import AsyncWsSurrealConnection
+from surrealdb.connections.blocking_http import BlockingHttpSurrealConnection
+from surrealdb.data.cbor import decode, encode
+from surrealdb.request_message.message import RequestMessage
+
+cases = Cases("middleware")
+
+CHAINS = (0, 1, 5)
+_RESULT = [{"result": [{"id": 1}], "status": "OK", "time": "1ms"}]
+
+
+async def _pass_async(message: RequestMessage, call_next: Any) -> dict[str, Any]:
+    return await call_next(message)
+
+
+def _pass(message: RequestMessage, call_next: Any) -> dict[str, Any]:
+    return call_next(message)
+
+
+class _AnsweringSocket:
+    def __init__(self, conn: AsyncWsSurrealConnection) -> None:
+        self._conn = conn
+
+    async def send(self, data: bytes) -> None:
+        reply = encode({"id": decode(data)["id"], "result": _RESULT})
+        asyncio.get_running_loop().call_soon(self._conn._route_frame, reply)
+
+
+class _Response:
+    status_code = 200
+    content = encode({"id": "1", "result": _RESULT})
+
+
+def _async_ws(chain: int) -> None:
+    @contextmanager
+    def case() -> Iterator[Timer]:
+        loop = asyncio.new_event_loop()
+        conn = AsyncWsSurrealConnection("ws://localhost:8000")
+        conn.loop = loop
+        conn.socket = _AnsweringSocket(conn)
+        for _ in range(chain):
+            conn.use_middleware(_pass_async)
+
+        async def run(loops: int) -> float:
+            started = time.perf_counter()
+            for _ in range(loops):
+                await conn.query_raw("RETURN 1")
+            return time.perf_counter() - started
+
+        try:
+            yield lambda loops: loop.run_until_complete(run(loops))
+        finally:
+            loop.close()
+
+    cases.add(f"async_ws.chain_{chain}")(case)
+
+
+def _blocking_http(chain: int) -> None:
+    @contextmanager
+    def case() -> Iterator[Timer]:
+        requests = blocking_http.requests
+        post = requests.post
+        response = _Response()
+        requests.post = lambda url, **kwargs: response
+        conn = BlockingHttpSurrealConnection("http://localhost:8000")
+        for _ in range(chain):
+            conn.use_middleware(_pass)
+
+        def run(loops: int) -> float:
+            started = time.perf_counter()
+            for _ in range(loops):
+                conn.query_raw("RETURN 1")
+            return time.perf_counter() - started
+
+        try:
+            yield run
+        finally:
+            requests.post = post
+
+    cases.add(f"blocking_http.chain_{chain}")(case)
+
+
+for _chain in CHAINS:
+    _async_ws(_chain)
+    _blocking_http(_chain)
@@ -0,0 +1,225 @@
+"""Whole RPCs, end to end: latency one at a time, and throughput concurrently.
+
+Two backends. A stand-in websocket server on localhost replays canned CBOR
+replies, so what is timed is the client, the socket and the loop - not a
+database. It runs in its own process so it does not share the client's GIL,
+and it decodes each distinct request only once: after that a reply is the
+cached body with the request's id spliced in. The other backend is the
+embedded engine on ``mem://``, whose cases are left out - with a note - when
+the ``embedded`` extra is not installed.
+
+Run through ``benchmarks/run.py``; ``python benchmarks/bench_rpc.py --serve``
+starts the stand-in alone and prints its port.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from _harness import Cases, Timer
+
+from surrealdb import AsyncSurreal, Surreal
+from surrealdb.data.cbor import decode, encode
+from surrealdb.data.types.record_id import RecordID
+
+cases = Cases("rpc")
+
+CONCURRENCY = 64
+ROWS = 100
+SMALL = "RETURN 1"
+SELECT = "SELECT * FROM person"
+
+EMBEDDED = importlib.util.find_spec("surrealdb_embedded") is not None
+
+
+def _statement(rows: Any) -> list[dict[str, Any]]:
+    return [{"result": rows, "status": "OK", "time": "1ms"}]
+
+
+def _people() -> list[dict[str, Any]]:
+    return [
+        {
+            "id": RecordID("person", n),
+            "name": f"person {n}",
+            "age": n % 90,
+            "score": n / 7,
+            "tags": ["a", "b", "c"],
+            "address": {"city": "London", "postcode": "EC1A 1BB"},
+        }
+        for n in range(ROWS)
+    ]
+
+
+# --------------------------------------------------------------------------- #
+#  the stand-in server                                                         #
+# --------------------------------------------------------------------------- #
+
+# Every request envelope starts `{"id": <36-character uuid>, ...`: a map
+# header, the key, then the id at a fixed offset. A reply is a two-entry map.
+_ID_KEY = b"bidx$"
+_ID = slice(6, 42)
+_REPLY_HEAD = b"\xa2" + _ID_KEY
+_RESULT_KEY = encode("result")
+
+
+def _result_for(request: dict[str, Any]) -> Any:
+    if request["method"] != "query":
+        return None
+    return _statement(_people() if request["params"][0] == SELECT else [1])
+
+
+async def _serve() -> None:
+    import websockets
+
+    replies: dict[bytes, bytes] = {}
+
+    async def answer(socket: Any) -> None:
+        async for data in socket:
+            if data[1:6] != _ID_KEY:
+                request = decode(data)
+                await socket.send(
+                    encode({"id": request["id"], "result": _result_for(request)})
+                )
+                continue
+            tail = data[42:]
+            body = replies.get(tail)
+            if body is None:
+                body = replies[tail] = _RESULT_KEY + encode(_result_for(decode(data)))
+            await socket.send(_REPLY_HEAD + data[_ID] + body)
+
+    async with websockets.serve(
+        answer, "127.0.0.1", 0, subprotocols=[websockets.Subprotocol("cbor")]
+    ) as server:
+        port = next(iter(server.sockets)).getsockname()[1]
+        print(port, flush=True)
+        await asyncio.Future()
+
+
+@contextmanager
+def _stand_in() -> Iterator[str]:
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve"], stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert server.stdout is not None
+        yield f"ws://127.0.0.1:{server.stdout.readline().strip()}"
+    finally:
+        server.terminate()
+        server.wait()
+
+
+# --------------------------------------------------------------------------- #
+#  the cases                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+def _seed() -> str:
+    people = ", ".join(
+        f"{{ id: person:{n}, name: 'person {n}', age: {n % 90}, score: {n / 7},"
+        " tags: ['a', 'b', 'c'], address: { city: 'London', postcode: 'EC1A 1BB' } }"
+        for n in range(ROWS)
+    )
+    return f"INSERT INTO person [{people}]"
+
+
+@contextmanager
+def _async_timer(url: str, query: str, concurrency: int) -> Iterator[Timer]:
+    loop = asyncio.new_event_loop()
+    db = AsyncSurreal(url)
+
+    async def run(loops: int) -> float:
+        started = time.perf_counter()
+        if concurrency == 1:
+            for _ in range(loops):
+                await db.query_raw(query)
+        else:
+            for _ in range(loops):
+                await asyncio.gather(*(db.query_raw(query) for _ in range(concurrency)))
+        return time.perf_counter() - started
+
+    try:
+        loop.run_until_complete(db.connect())
+        loop.run_until_complete(db.use("bench", "bench"))
+        if url == "mem://":
+            loop.run_until_complete(db.query_raw(_seed()))
+        # Per operation, so a concurrent case reads as throughput: the time
+        # one RPC costs when `concurrency` of them share the connection.
+        yield lambda loops: loop.run_until_complete(run(loops)) / concurrency
+    finally:
+        loop.run_until_complete(db.close())
+        loop.close()
+
+
+@contextmanager
+def _blocking_timer(url: str, query: str) -> Iterator[Timer]:
+    db = Surreal(url)
+    db.connect()
+    try:
+        db.use("bench", "bench")
+        if url == "mem://":
+            db.query_raw(_seed())
+
+        def run(loops: int) -> float:
+            started = time.perf_counter()
+            for _ in range(loops):
+                db.query_raw(query)
+            return time.perf_counter() - started
+
+        yield run
+    finally:
+        db.close()
+
+
+def _register(
+    backend: str, url: Callable[[], Any], mode: str, name: str, query: str
+) -> None:
+    concurrency = CONCURRENCY if name.endswith("concurrent") else 1
+
+    @contextmanager
+    def case() -> Iterator[Timer]:
+        with url() as where:
+            if mode == "async":
+                with _async_timer(where, query, concurrency) as timer:
+                    yield timer
+            else:
+                with _blocking_timer(where, query) as timer:
+                    yield timer
+
+    cases.add(f"{backend}.{mode}.{name}")(case)
+
+
+@contextmanager
+def _memory() -> Iterator[str]:
+    yield "mem://"
+
+
+_QUERIES = {
+    "query_small": SMALL,
+    f"select_{ROWS}_rows": SELECT,
+    f"query_small.x{CONCURRENCY}_concurrent": SMALL,
+}
+
+_BACKENDS: dict[str, Callable[[], Any]] = {"ws": _stand_in}
+NOTES: list[str] = []
+if EMBEDDED:
+    _BACKENDS["mem"] = _memory
+else:
+    NOTES.append("rpc.mem.*: skipped, the embedded extra is not installed")
+
+for _backend, _url in _BACKENDS.items():
+    for _mode in ("async", "blocking"):
+        for _name, _query in _QUERIES.items():
+            if _mode == "blocking" and _name.endswith("concurrent"):
+                continue
+            _register(_backend, _url, _mode, _name, _query)
+
+
+if __name__ == "__main__" and sys.argv[1:] == ["--serve"]:
+    asyncio.run(_serve())
@@ -0,0 +1,79 @@
+"""Compare two results files from ``benchmarks/run.py`` and flag regressions.
+
+Run it from the repository root::
+
+    python benchmarks/compare.py base.json new.json [--threshold 0.10]
+
+Prints each case present in both with its median before and after. A case is
+a regression when its new median is slower by more than ``--threshold``
+(a fraction) *and* the gap is wider than the noise of the two runs - the sum
+of their standard deviations - so a single noisy sample on a fast case does
+not fail a build. Exits 1 if any case regressed, so it can gate CI::
+
+    git stash && python benchmarks/run.py --output base.json
+    git stash pop && python benchmarks/run.py --output new.json
+    python benchmarks/compare.py base.json new.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any
+
+from _harness import format_time, load
+
+
+def _verdict(base: dict[str, Any], new: dict[str, Any], threshold: float) -> str:
+    change = new["median"] / base["median"] - 1
+    noise = base["stdev"] + new["stdev"]
+    if abs(new["median"] - base["median"]) <= noise or abs(change) <= threshold:
+        return "same"
+    return "slower" if change > 0 else "faster"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    base, new = load(args.base), load(args.new)
+    for key in ("python", "implementation", "machine"):
+        if base["metadata"].get(key) != new["metadata"].get(key):
+            print(
+                f"warning: {key} differs ({base['metadata'].get(key)} vs"
+                f" {new['metadata'].get(key)}); the numbers are not comparable",
+                file=sys.stderr,
+            )
+
+    names = [name for name in base["benchmarks"] if name in new["benchmarks"]]
+    if not names:
+        print("the two files have no benchmark in common", file=sys.stderr)
+        return 2
+    width = max(map(len, names))
+    regressions = 0
+    print(f"{'benchmark':<{width}}  {'base':>10}  {'new':>10}  {'change':>8}")
+    for name in names:
+        before, after = base["benchmarks"][name], new["benchmarks"][name]
+        verdict = _verdict(before, after, args.threshold)
+        regressions += verdict == "slower"
+        change = (after["median"] / before["median"] - 1) * 100
+        print(
+            f"{name:<{width}}  {format_time(before['median']):>10}"
+            f"  {format_time(after['median']):>10}  {change:+7.1f}%"
+            f"  {'' if verdict == 'same' else verdict}"
+        )
+    for name in sorted(set(base["benchmarks"]) ^ set(new["benchmarks"])):
+        side = "base" if name in base["benchmarks"] else "new"
+        print(f"{name}: only in {side}")
+
+    if regressions:
+        print(f"\n{regressions} benchmark(s) slower by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""What ``import surrealdb`` costs, checked against a budget.
+
+Runs ``python -X importtime -c "import surrealdb"`` in fresh interpreters and
+reports the package's cumulative import time (the best of *runs*, after one
+warm-up that writes the bytecode cache), the slowest modules underneath it,
+and any transport library that was imported eagerly. Exits non-zero when the
+time is over the budget or a transport library was loaded, so it can gate CI::
+
+    python benchmarks/import_time.py [--budget MS] [--runs N] [--top N]
+
+The budget is deliberately loose - timings on shared runners are noisy. What
+it catches is the regression it was written for: one transport imported at
+the top of a module put aiohttp, requests or websockets back on every cold
+start, at 50-250ms each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# Loaded by the first connection that needs them, never by the import.
+DEFERRED = (
+    "aiohttp",
+    "requests",
+    "websockets",
+    "pydantic_core",
+    "surrealdb_embedded",
+)
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+_PROBE = (
+    "import sys, surrealdb; "
+    f"print(','.join(m for m in {DEFERRED!r} if m in sys.modules))"
+)
+
+
+def _run() -> tuple[dict[str, tuple[int, int]], list[str]]:
+    """One cold import: ``{module: (self_us, cumulative_us)}`` and the leaks."""
+    env = dict(os.environ)
+    # A warm bytecode cache is what an installed package has; without it every
+    # run pays for compiling the SDK, which is not what is being measured.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    done = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in done.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match[4]] = (int(match[1]), int(match[2]))
+    leaked = [name for name in done.stdout.strip().split(",") if name]
+    return times, leaked
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=150.0, help="ms")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    _run()
+    runs = [_run() for _ in range(args.runs)]
+    times, leaked = min(runs, key=lambda run: run[0]["surrealdb"][1])
+    total = times["surrealdb"][1] / 1000
+
+    print(f"import surrealdb: {total:.1f}ms (best of {args.runs})")
+    print(f"\n{'self ms':>8}{'cumul ms':>10}  module")
+    slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (own, cumulative) in slowest[: args.top]:
+        print(f"{own / 1000:8.1f}{cumulative / 1000:10.1f}  {name}")
+
+    failed = False
+    if leaked:
+        print(f"\nimported eagerly: {', '.join(leaked)}")
+        failed = True
+    if total > args.budget:
+        print(f"\nover budget: {total:.1f}ms > {args.budget:.1f}ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Bytes held per decoded record link, with and without the compact layout.
+
+Decodes a ``SELECT VALUE ->edge->node`` style result - *count* record ids into
+a few tables - and reports what the decoded result keeps alive per id,
+measured with ``tracemalloc``.
+
+"before" decodes the same bytes with the layout the types used to have: a
+``RecordID`` with a ``__dict__`` and a freshly decoded table-name string per
+id. "after" is the decoder as it is. Run it from the repository root::
+
+    python benchmarks/memory_records.py [count]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from surrealdb.data import cbor
+from surrealdb.data.types.record_id import RecordID
+
+TABLES = ("person", "company", "product", "order")
+
+
+class _DictRecordID(RecordID):
+    """A ``RecordID`` that has a ``__dict__`` again, as before ``__slots__``."""
+
+
+@contextmanager
+def _previous_layout() -> Iterator[None]:
+    saved = cbor.RecordID, cbor._table_name
+    # A copy is what decoding the name always produced before it was interned.
+    cbor.RecordID = _DictRecordID  # type: ignore[misc]
+    cbor._table_name = lambda name: "".join(list(name))
+    try:
+        yield
+    finally:
+        cbor.RecordID, cbor._table_name = saved  # type: ignore[misc]
+
+
+def _retained(build: Callable[[], Any]) -> tuple[int, Any]:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def main(count: int) -> None:
+    payload = cbor.encode([RecordID(TABLES[n % len(TABLES)], n) for n in range(count)])
+
+    with _previous_layout():
+        before, rows = _retained(lambda: cbor.decode(payload))
+        assert type(rows[0]) is _DictRecordID
+        del rows
+    after, rows = _retained(lambda: cbor.decode(payload))
+    assert type(rows[0]) is RecordID
+
+    print(f"{count:,} record ids, {len(TABLES)} tables")
+    print(f"{'':8}{'bytes/id':>12}{'total MiB':>12}")
+    for label, size in (("before", before), ("after", after)):
+        print(f"{label:8}{size / count:12.1f}{size / 2**20:12.1f}")
+    print(f"saved   {(before - after) / count:12.1f}{(before - after) / 2**20:12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,99 @@
+"""Run the benchmark suite and save the results as JSON.
+
+Run it from the repository root::
+
+    python benchmarks/run.py [-k SUBSTRING ...] [--samples N] [--min-time S]
+                             [--output results.json]
+
+``-k`` selects the cases whose name contains any of the given substrings
+(``-k codec.decode -k rpc.ws``); ``--list`` prints the names and exits. The
+results file records what it was measured on - Python, platform, SDK version,
+git commit - next to each case's samples, and ``benchmarks/compare.py``
+compares two of them.
+
+Numbers are only comparable from the same machine and the same Python. For a
+quieter run, close what else is running and pin the process to one core
+(``taskset -c 2 python benchmarks/run.py``).
+
+Two scripts beside it are deliberately not cases, because what they measure
+is not seconds per operation in this process: ``import_time.py`` times
+``import surrealdb`` in fresh interpreters and fails over a budget, and
+``memory_records.py`` reports the bytes a decoded result keeps alive. Run
+them on their own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from _harness import Case, format_time, measure, metadata
+
+MODULES = (
+    "bench_codec",
+    "bench_envelopes",
+    "bench_memory",
+    "bench_middleware",
+    "bench_rpc",
+)
+
+
+def collect() -> tuple[dict[str, Case], list[str]]:
+    import importlib
+
+    cases: dict[str, Case] = {}
+    notes: list[str] = []
+    for name in MODULES:
+        module = importlib.import_module(name)
+        cases.update(module.cases.cases)
+        notes.extend(getattr(module, "NOTES", []))
+    return cases, notes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", action="append", default=[], metavar="SUBSTRING")
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args(argv)
+
+    cases, notes = collect()
+    selected = {
+        name: case
+        for name, case in cases.items()
+        if not args.k or any(pattern in name for pattern in args.k)
+    }
+    if args.list:
+        print("\n".join(selected))
+        return 0
+    if not selected:
+        print("no benchmark matches", " or ".join(args.k), file=sys.stderr)
+        return 2
+    for note in notes:
+        print(f"note: {note}", file=sys.stderr)
+
+    width = max(map(len, selected))
+    results = {}
+    for name, case in selected.items():
+        with case() as timer:
+            result = measure(timer, args.samples, args.min_time)
+        results[name] = result
+        spread = result["stdev"] / result["median"] * 100 if result["median"] else 0
+        print(
+            f"{name:<{width}}  {format_time(result['median']):>10}"
+            f"  +- {spread:4.1f}%  (min {format_time(result['min'])})",
+            flush=True,
+        )
+
+    if args.output:
+        document = {"metadata": metadata(), "notes": notes, "benchmarks": results}
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
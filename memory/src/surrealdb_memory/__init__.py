@@ -84,6 +84,8 @@ from surrealdb_memory._namespaces.principals import (
 from surrealdb_memory._namespaces.scopes import AsyncScopes, BlockingScopes
 from surrealdb_memory._namespaces.sessions import AsyncSessions, BlockingSessions
 from surrealdb_memory._namespaces.traces import AsyncTraces, BlockingTraces
+from surrealdb_memory._pool import PoolOptions, PoolStats
+from surrealdb_memory._retry import RetryPolicy
 from surrealdb_memory._scope import ScopeArg
 from surrealdb_memory._streaming import ChatChunk
 from surrealdb_memory._transport import AsyncTransport, BlockingTransport
@@ -96,6 +98,9 @@ __all__ = [
     # transports
     "BlockingTransport",
     "AsyncTransport",
+    "PoolOptions",
+    "PoolStats",
+    "RetryPolicy",
     # namespaces
     "BlockingDocuments",
     "AsyncDocuments",
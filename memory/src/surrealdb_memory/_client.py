@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json as _json
-from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
 from surrealdb_memory._idempotency import idempotency_key
@@ -43,11 +43,12 @@ from surrealdb_memory._namespaces.sessions import (
     BlockingSessions,
 )
 from surrealdb_memory._namespaces.traces import AsyncTraces, BlockingTraces
+from surrealdb_memory._pool import PoolOptions, PoolStats
+from surrealdb_memory._retry import RetryPolicy
 from surrealdb_memory._scope import ScopeArg
 from surrealdb_memory._scope import scope_sets as _scope_sets
 from surrealdb_memory._streaming import ChatChunk
 from surrealdb_memory._transport import (
-    DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
     AsyncTransport,
     BlockingTransport,
@@ -55,6 +56,8 @@ from surrealdb_memory._transport import (
     quote_path,
 )
 from surrealdb_memory._util import drop_none as _drop_none
+from surrealdb_memory._util import run_concurrently as _run_concurrently
+from surrealdb_memory._util import run_threaded as _run_threaded
 
 
 def _base_path(context_id: str) -> str:
@@ -70,6 +73,17 @@ def _idempotency_header(method: str, path: str, body: Any) -> dict[str, str]:
     return {"Idempotency-Key": idempotency_key(method, path, body_bytes)}
 
 
+def _recall_calls(
+    queries: Iterable[str | Mapping[str, Any]], options: Mapping[str, Any]
+) -> list[dict[str, Any]]:
+    if isinstance(queries, str):
+        raise TypeError("gather_recall() takes a list of queries, not one string")
+    return [
+        {**options, "query": query} if isinstance(query, str) else {**options, **query}
+        for query in queries
+    ]
+
+
 class Memory:
     def __init__(
         self,
@@ -78,7 +92,9 @@ class Memory:
         endpoint: str | None = None,
         api_key: str | None = None,
         timeout: float = DEFAULT_TIMEOUT,
-        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_retries: int | None = None,
+        pool: PoolOptions | None = None,
+        retry: RetryPolicy | None = None,
         transport: BlockingTransport | None = None,
     ) -> None:
         self._context_id = context
@@ -87,6 +103,8 @@ class Memory:
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
+            pool=pool,
+            retry=retry,
         )
         self._owns_transport = transport is None
         self._base = _base_path(context)
@@ -111,6 +129,9 @@ class Memory:
     def api_key(self) -> str:
         return self._transport.api_key
 
+    def pool_stats(self) -> PoolStats:
+        return self._transport.pool_stats()
+
     def remember(
         self,
         text: str | None = None,
@@ -225,9 +246,25 @@ class Memory:
             f"{self._base}/query",
             json=payload,
             headers=on_behalf_of_header(on_behalf_of) or None,
+            coalesce=True,
         )
         return RecallResponse.from_dict(result)
 
+    def gather_recall(
+        self,
+        queries: Iterable[str | Mapping[str, Any]],
+        *,
+        concurrency: int = 8,
+        **options: Any,
+    ) -> list[RecallResponse]:
+        """Run ``recall`` for many queries on a pool of threads; results in order.
+
+        Each query is a string, or a mapping of ``recall`` arguments; ``options``
+        are ``recall`` arguments shared by every query. Identical queries in
+        flight at the same time share one request. The first error is raised.
+        """
+        return _run_threaded(self.recall, _recall_calls(queries, options), concurrency)
+
     def forget(
         self, query: str, *, purge: bool = False, on_behalf_of: str | None = None
     ) -> ForgetResponse:
@@ -422,6 +459,7 @@ class Memory:
             f"{self._base}/context",
             json=payload,
             headers=on_behalf_of_header(on_behalf_of) or None,
+            coalesce=True,
         )
         return ContextQueryResponse.from_dict(result)
 
@@ -472,7 +510,9 @@ class AsyncMemory:
         endpoint: str | None = None,
         api_key: str | None = None,
         timeout: float = DEFAULT_TIMEOUT,
-        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_retries: int | None = None,
+        pool: PoolOptions | None = None,
+        retry: RetryPolicy | None = None,
         transport: AsyncTransport | None = None,
     ) -> None:
         self._context_id = context
@@ -481,6 +521,8 @@ class AsyncMemory:
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
+            pool=pool,
+            retry=retry,
         )
         self._owns_transport = transport is None
         self._base = _base_path(context)
@@ -505,6 +547,9 @@ class AsyncMemory:
     def api_key(self) -> str:
         return self._transport.api_key
 
+    def pool_stats(self) -> PoolStats:
+        return self._transport.pool_stats()
+
     async def remember(
         self,
         text: str | None = None,
@@ -619,9 +664,29 @@ class AsyncMemory:
             f"{self._base}/query",
             json=payload,
             headers=on_behalf_of_header(on_behalf_of) or None,
+            coalesce=True,
         )
         return RecallResponse.from_dict(result)
 
+    async def gather_recall(
+        self,
+        queries: Iterable[str | Mapping[str, Any]],
+        *,
+        concurrency: int = 8,
+        **options: Any,
+    ) -> list[RecallResponse]:
+        """Run ``recall`` for many queries concurrently; results in order.
+
+        Each query is a string, or a mapping of ``recall`` arguments; ``options``
+        are ``recall`` arguments shared by every query. At most ``concurrency``
+        requests are in flight, all over the transport's one pooled session,
+        and identical queries share a request. The first error is raised and
+        the queries still running are cancelled.
+        """
+        return await _run_concurrently(
+            self.recall, _recall_calls(queries, options), concurrency
+        )
+
     async def forget(
         self, query: str, *, purge: bool = False, on_behalf_of: str | None = None
     ) -> ForgetResponse:
@@ -816,6 +881,7 @@ class AsyncMemory:
             f"{self._base}/context",
             json=payload,
             headers=on_behalf_of_header(on_behalf_of) or None,
+            coalesce=True,
         )
         return ContextQueryResponse.from_dict(result)
 
@@ -6,6 +6,16 @@ import time
 DEFAULT_BUCKET_SECONDS = 30
 
 
+def request_hash(method: str, path: str, body: bytes, *extra: bytes) -> str:
+    """sha256 over ``method | path | body | extra...``, NUL-separated."""
+    h = hashlib.sha256()
+    h.update(method.upper().encode("ascii"))
+    for part in (path.encode("utf-8"), body, *extra):
+        h.update(b"\0")
+        h.update(part)
+    return h.hexdigest()
+
+
 def idempotency_key(
     method: str,
     path: str,
@@ -14,15 +24,7 @@ def idempotency_key(
     bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
 ) -> str:
     bucket = int(time.time() // bucket_seconds)
-    h = hashlib.sha256()
-    h.update(method.upper().encode("ascii"))
-    h.update(b"\0")
-    h.update(path.encode("utf-8"))
-    h.update(b"\0")
-    h.update(body)
-    h.update(b"\0")
-    h.update(str(bucket).encode("ascii"))
-    return h.hexdigest()
+    return request_hash(method, path, body, str(bucket).encode("ascii"))
 
 
-__all__ = ["idempotency_key", "DEFAULT_BUCKET_SECONDS"]
+__all__ = ["idempotency_key", "request_hash", "DEFAULT_BUCKET_SECONDS"]
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json as _json
+import os
+import secrets
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+from typing import IO, Any
+
+import aiohttp
+from aiohttp.abc import AbstractStreamWriter
+
+CHUNK_SIZE = 64 * 1024
+
+# Called as `progress(sent, total)` as a file uploads; `total` may be None.
+Progress = Callable[[int, int | None], None]
+
+FileArg = str | os.PathLike[str] | IO[bytes] | bytes | bytearray | memoryview
+
+
+class _Borrowed(io.RawIOBase):
+    """A caller's file handle, read through but never closed."""
+
+    def __init__(self, handle: IO[bytes]) -> None:
+        super().__init__()
+        self._handle = handle
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._handle.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class UploadSource:
+    """The bytes of one upload, read in chunks and never held whole.
+
+    A path is opened afresh, and bytes re-read, for every attempt; a file
+    handle is sent from where it stood when the upload began, and so can be
+    resent only if it can seek.
+    """
+
+    def __init__(self, file: FileArg) -> None:
+        self._path: Path | None = None
+        self._data: bytes | bytearray | memoryview | None = None
+        self._handle: IO[bytes] | None = None
+        self._start: int | None = None
+        self._opened = False
+        self.size: int | None = None
+        if isinstance(file, (bytes, bytearray, memoryview)):
+            self._data = file
+            self.size = memoryview(file).nbytes
+        elif isinstance(file, (str, os.PathLike)):
+            self._path = Path(file)
+            self.size = self._path.stat().st_size
+        else:
+            self._handle = file
+            try:
+                self._start = file.tell()
+                self.size = os.fstat(file.fileno()).st_size - self._start
+            except (AttributeError, OSError, ValueError):
+                self.size = None
+
+    def open(self) -> IO[bytes]:
+        if self._path is not None:
+            return open(self._path, "rb")
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        assert self._handle is not None
+        if self._start is not None:
+            self._handle.seek(self._start)
+        elif self._opened:
+            raise ValueError("This upload's file cannot seek, so it cannot be resent")
+        self._opened = True
+        return io.BufferedReader(_Borrowed(self._handle))
+
+
+def _quote(value: str) -> str:
+    # As browsers do (the HTML form-data rules), so no value ends the header.
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _field_part(boundary: str, name: str, value: Any) -> bytes:
+    if isinstance(value, (dict, list)):
+        body, content_type = _json.dumps(value), "\r\nContent-Type: application/json"
+    else:
+        body, content_type = str(value), ""
+    return (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{_quote(name)}"{content_type}\r\n'
+        f"\r\n{body}\r\n"
+    ).encode()
+
+
+class MultipartStream:
+    """A ``multipart/form-data`` body that reads its file as it is sent.
+
+    Fields go before the `file` part: the upload handler reads parts in
+    order and only derives metadata from the file when `file` comes first.
+    requests sends it as a stream (it has ``__iter__``) with a Content-Length
+    when the file's size is known (``len``), and urllib3 pulls it through
+    ``read``. ``seek(0)`` starts it over for a retry.
+    """
+
+    def __init__(
+        self,
+        *,
+        file: UploadSource,
+        filename: str | None,
+        mime_type: str | None,
+        fields: Mapping[str, Any] | None,
+        progress: Progress | None = None,
+    ) -> None:
+        boundary = secrets.token_hex(16)
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._file = file
+        self._progress = progress
+        head = [
+            _field_part(boundary, k, v)
+            for k, v in (fields or {}).items()
+            if v is not None
+        ]
+        head.append(
+            (
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="file"; '
+                f'filename="{_quote(filename or "upload")}"\r\n'
+                f"Content-Type: {mime_type or 'application/octet-stream'}\r\n\r\n"
+            ).encode()
+        )
+        self._head = b"".join(head)
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        if file.size is not None:
+            self.len = len(self._head) + file.size + len(self._tail)
+        self._chunks: Iterator[bytes] = iter(self)
+        self._buffer = bytearray()
+        self._position = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        sent = 0
+        with self._file.open() as fp:
+            while chunk := fp.read(CHUNK_SIZE):
+                yield chunk
+                sent += len(chunk)
+                if self._progress is not None:
+                    self._progress(sent, self._file.size)
+        yield self._tail
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            out, self._buffer = bytes(self._buffer), bytearray()
+        else:
+            out = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        self._position += len(out)
+        return out
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if (offset, whence) != (0, io.SEEK_SET):
+            raise io.UnsupportedOperation("A multipart stream can only seek to 0")
+        self._chunks = iter(self)
+        self._buffer = bytearray()
+        self._position = 0
+        return 0
+
+
+class _FilePayload(aiohttp.Payload):
+    """Writes an `UploadSource` chunk by chunk, reading off the event loop."""
+
+    def __init__(
+        self, source: UploadSource, progress: Progress | None, **kwargs: Any
+    ) -> None:
+        super().__init__(source, **kwargs)
+        self._source = source
+        self._progress = progress
+        self._size = source.size
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        raise TypeError("A streamed upload cannot be decoded")
+
+    async def write(self, writer: AbstractStreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        fp = await loop.run_in_executor(None, self._source.open)
+        sent = 0
+        try:
+            while chunk := await loop.run_in_executor(None, fp.read, CHUNK_SIZE):
+                await writer.write(chunk)
+                sent += len(chunk)
+                if self._progress is not None:
+                    self._progress(sent, self._source.size)
+        finally:
+            fp.close()
+
+
+def build_multipart_writer(
+    *,
+    file: UploadSource,
+    filename: str | None,
+    mime_type: str | None,
+    fields: Mapping[str, Any] | None,
+    progress: Progress | None = None,
+) -> aiohttp.MultipartWriter:
+    writer = aiohttp.MultipartWriter("form-data")
+    # Fields first, as in `MultipartStream`.
+    for k, v in (fields or {}).items():
+        if v is None:
+            continue
+        if isinstance(v, (dict, list)):
+            part = writer.append(_json.dumps(v), {"Content-Type": "application/json"})
+        else:
+            part = writer.append(str(v))
+        part.set_content_disposition("form-data", name=k)
+    part = writer.append_payload(
+        _FilePayload(
+            file, progress, content_type=mime_type or "application/octet-stream"
+        )
+    )
+    part.set_content_disposition(
+        "form-data", name="file", filename=filename or "upload"
+    )
+    return writer
+
+
+__all__ = [
+    "CHUNK_SIZE",
+    "FileArg",
+    "MultipartStream",
+    "Progress",
+    "UploadSource",
+    "build_multipart_writer",
+]
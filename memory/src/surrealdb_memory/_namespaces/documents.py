@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from pathlib import Path
-from typing import IO, Any
+from typing import Any
 
 from surrealdb_memory._models import (
     ChunkPage,
@@ -17,31 +17,43 @@ from surrealdb_memory._models import (
     RecomputeLinksResponse,
     UploadResponse,
 )
+from surrealdb_memory._multipart import (
+    FileArg,
+    MultipartStream,
+    Progress,
+    UploadSource,
+    build_multipart_writer,
+)
 from surrealdb_memory._scope import ScopeArg, scope_sets
 from surrealdb_memory._transport import (
     AsyncTransport,
     BlockingTransport,
-    build_aiohttp_form,
-    build_multipart_payload,
     on_behalf_of_header,
     quote_path,
 )
-from surrealdb_memory._util import drop_none
+from surrealdb_memory._util import drop_none, run_concurrently, run_threaded
 
 
 def _resolve_file(
-    path: str | os.PathLike[str] | IO[bytes] | bytes | bytearray | memoryview,
-    filename: str | None,
-) -> tuple[Any, str | None]:
-    if isinstance(path, (bytes, bytearray, memoryview)):
-        return path, filename
+    path: FileArg, filename: str | None
+) -> tuple[UploadSource, str | None]:
     if isinstance(path, (str, os.PathLike)):
         p = Path(path)
         if not p.is_file():
             raise FileNotFoundError(p)
-        return str(p), filename or p.name
-    # File-like object
-    return path, filename
+        return UploadSource(p), filename or p.name
+    return UploadSource(path), filename
+
+
+def _upload_calls(
+    files: Iterable[FileArg | Mapping[str, Any]], options: Mapping[str, Any]
+) -> list[dict[str, Any]]:
+    if isinstance(files, (str, os.PathLike, bytes, bytearray, memoryview)):
+        raise TypeError("upload_many() takes a list of files, not one")
+    return [
+        {**options, **file} if isinstance(file, Mapping) else {**options, "path": file}
+        for file in files
+    ]
 
 
 def _metadata_fields(
@@ -167,7 +179,7 @@ class BlockingDocuments:
 
     def upload(
         self,
-        path: str | os.PathLike[str] | IO[bytes] | bytes | bytearray | memoryview,
+        path: FileArg,
         *,
         content_type: str | None = None,
         filename: str | None = None,
@@ -175,23 +187,47 @@ class BlockingDocuments:
         source: str | None = None,
         scopes: ScopeArg = None,
         on_behalf_of: str | None = None,
+        progress: Progress | None = None,
     ) -> UploadResponse:
-        file_payload, resolved_filename = _resolve_file(path, filename)
-        files, data = build_multipart_payload(
-            file=file_payload,
+        """Upload one document, streaming it from disk in 64 KiB chunks.
+
+        ``progress(sent, total)`` is called after each chunk; ``total`` is
+        None when the size of a file-like ``path`` cannot be told.
+        """
+        file, resolved_filename = _resolve_file(path, filename)
+        body = MultipartStream(
+            file=file,
             filename=resolved_filename,
             mime_type=content_type,
             fields=_metadata_fields(title, source, scopes),
+            progress=progress,
         )
         result = self._transport.request(
             "POST",
             self._base,
-            files=files,
-            data=data or None,
-            headers=on_behalf_of_header(on_behalf_of) or None,
+            data=body,
+            headers={
+                **on_behalf_of_header(on_behalf_of),
+                "Content-Type": body.content_type,
+            },
         )
         return UploadResponse.from_dict(result)
 
+    def upload_many(
+        self,
+        files: Iterable[FileArg | Mapping[str, Any]],
+        *,
+        concurrency: int = 4,
+        **options: Any,
+    ) -> list[UploadResponse]:
+        """Upload many documents on a pool of threads; results in order.
+
+        Each entry is a ``path``, or a mapping of ``upload`` arguments;
+        ``options`` are ``upload`` arguments shared by every entry. The first
+        error is raised.
+        """
+        return run_threaded(self.upload, _upload_calls(files, options), concurrency)
+
     def get(self, doc_id: str, *, on_behalf_of: str | None = None) -> Document:
         result = self._transport.request(
             "GET",
@@ -383,7 +419,7 @@ class AsyncDocuments:
 
     async def upload(
         self,
-        path: str | os.PathLike[str] | IO[bytes] | bytes | bytearray | memoryview,
+        path: FileArg,
         *,
         content_type: str | None = None,
         filename: str | None = None,
@@ -391,13 +427,21 @@ class AsyncDocuments:
         source: str | None = None,
         scopes: ScopeArg = None,
         on_behalf_of: str | None = None,
+        progress: Progress | None = None,
     ) -> UploadResponse:
-        file_payload, resolved_filename = _resolve_file(path, filename)
-        form = build_aiohttp_form(
-            file=file_payload,
+        """Upload one document, streaming it from disk in 64 KiB chunks.
+
+        Reads run off the event loop. ``progress(sent, total)`` is called on
+        the loop after each chunk; ``total`` is None when the size of a
+        file-like ``path`` cannot be told.
+        """
+        file, resolved_filename = _resolve_file(path, filename)
+        form = build_multipart_writer(
+            file=file,
             filename=resolved_filename,
             mime_type=content_type,
             fields=_metadata_fields(title, source, scopes),
+            progress=progress,
         )
         result = await self._transport.request(
             "POST",
@@ -407,6 +451,24 @@ class AsyncDocuments:
         )
         return UploadResponse.from_dict(result)
 
+    async def upload_many(
+        self,
+        files: Iterable[FileArg | Mapping[str, Any]],
+        *,
+        concurrency: int = 4,
+        **options: Any,
+    ) -> list[UploadResponse]:
+        """Upload many documents concurrently; results in order.
+
+        Each entry is a ``path``, or a mapping of ``upload`` arguments;
+        ``options`` are ``upload`` arguments shared by every entry. At most
+        ``concurrency`` uploads run at once. The first error is raised and
+        the uploads still running are cancelled.
+        """
+        return await run_concurrently(
+            self.upload, _upload_calls(files, options), concurrency
+        )
+
     async def get(self, doc_id: str, *, on_behalf_of: str | None = None) -> Document:
         result = await self._transport.request(
             "GET",
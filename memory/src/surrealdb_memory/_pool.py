@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+
+@dataclass(frozen=True, slots=True)
+class PoolOptions:
+    """Connection pool settings for a transport.
+
+    `max_connections` caps open connections in total, `max_per_host` per host
+    (`None` for no per-host cap). `requests` has only a per-host pool, so
+    `BlockingTransport` sizes it to the smaller of the two. `block` is
+    blocking-only: when the pool is full, wait for a free connection rather
+    than open one that is closed after use. `keepalive_timeout` (seconds an
+    idle connection is kept) and `dns_cache_ttl` (`None` turns the cache off)
+    are async-only; urllib3 keeps idle connections until the server closes
+    them and does not cache DNS.
+    """
+
+    max_connections: int = 100
+    max_per_host: int | None = None
+    keepalive_timeout: float = 15.0
+    dns_cache_ttl: int | None = 10
+    block: bool = False
+
+    def __post_init__(self) -> None:
+        if self.max_connections < 1:
+            raise ValueError(
+                f"max_connections must be at least 1, got {self.max_connections}"
+            )
+        if self.max_per_host is not None and self.max_per_host < 1:
+            raise ValueError(
+                f"max_per_host must be at least 1 or None, got {self.max_per_host}"
+            )
+        if self.keepalive_timeout < 0:
+            raise ValueError(
+                f"keepalive_timeout must not be negative, got {self.keepalive_timeout}"
+            )
+        if self.dns_cache_ttl is not None and self.dns_cache_ttl < 0:
+            raise ValueError(
+                f"dns_cache_ttl must not be negative, got {self.dns_cache_ttl}"
+            )
+
+    @property
+    def limit(self) -> int:
+        """Connections one host can have open at once."""
+        if self.max_per_host is None:
+            return self.max_connections
+        return min(self.max_connections, self.max_per_host)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """A snapshot of how busy a transport's connection pool is.
+
+    `in_flight` counts requests waiting on a response and `peak` the most
+    there have been at once. `waited` counts requests that found every
+    connection busy: on `AsyncTransport` they queued for one, on
+    `BlockingTransport` they waited (`block=True`) or opened an extra one.
+    A `waited` that keeps climbing, or a `peak` at `limit`, means the pool
+    is too small for the load. `limit` is 0 for a pool with no limit, which
+    is never saturated. On an `AsyncTransport` given its own `session=`,
+    `waited` stays 0: the queueing is only seen through trace hooks, and a
+    caller's session has its own.
+    """
+
+    limit: int
+    in_flight: int
+    peak: int
+    waited: int
+
+    @property
+    def saturated(self) -> bool:
+        return self.limit > 0 and self.in_flight >= self.limit
+
+
+class _Usage:
+    """Counters behind `PoolStats`; shared by threads on `BlockingTransport`."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.peak = 0
+        self.waited = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def busy(self, *, count_wait: bool) -> Iterator[None]:
+        with self._lock:
+            if count_wait and 0 < self.limit <= self.in_flight:
+                self.waited += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def wait(self) -> None:
+        with self._lock:
+            self.waited += 1
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(self.limit, self.in_flight, self.peak, self.waited)
+
+
+def mount_pool(session: requests.Session, pool: PoolOptions) -> None:
+    adapter = HTTPAdapter(pool_maxsize=pool.limit, pool_block=pool.block)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def session_limit(session: requests.Session, url: str) -> int:
+    """The pool size of a caller's own session; urllib3 keeps it private."""
+    adapter = session.get_adapter(url)
+    return int(getattr(adapter, "_pool_maxsize", DEFAULT_POOLSIZE))
+
+
+def connector_limit(connector: aiohttp.BaseConnector | None) -> int:
+    """The connections one host gets from a caller's own connector.
+
+    The smaller of aiohttp's two limits, where 0 means none; 0 if neither is set.
+    """
+    if connector is None:
+        return 0
+    limits = [limit for limit in (connector.limit, connector.limit_per_host) if limit]
+    return min(limits, default=0)
+
+
+def connector(pool: PoolOptions) -> aiohttp.TCPConnector:
+    return aiohttp.TCPConnector(
+        limit=pool.max_connections,
+        limit_per_host=pool.max_per_host or 0,
+        keepalive_timeout=pool.keepalive_timeout,
+        use_dns_cache=pool.dns_cache_ttl is not None,
+        ttl_dns_cache=pool.dns_cache_ttl,
+    )
+
+
+def trace_waits(usage: _Usage) -> aiohttp.TraceConfig:
+    """Counts requests the connector queues because every connection is busy."""
+
+    async def queued(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        usage.wait()
+
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_queued_start.append(queued)
+    return trace
+
+
+__all__ = ["PoolOptions", "PoolStats"]
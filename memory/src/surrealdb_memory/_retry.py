@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-_BACKOFF_SECONDS: tuple[float, ...] = (0.25, 0.5, 1.0)
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
-
-def backoff_schedule(max_retries: int = 3) -> tuple[float, ...]:
-    capped = max(0, min(max_retries, len(_BACKOFF_SECONDS)))
-    return _BACKOFF_SECONDS[:capped]
+RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
 
 
 def should_retry(
@@ -15,14 +17,183 @@ def should_retry(
     max_retries: int,
     *,
     idempotent: bool = False,
+    statuses: frozenset[int] = RETRY_STATUSES,
 ) -> bool:
     if attempt >= max_retries:
         return False
+    # A 429 was turned away before it ran, so any method can be sent again.
+    if status == 429:
+        return 429 in statuses
     if method.upper() != "GET" and not idempotent:
         return False
     if status is None:
         return True
-    return status >= 500
+    return status in statuses
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a `Retry-After` header: delay-seconds or an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """How a transport retries failed requests.
+
+    Delays use decorrelated jitter: each is drawn from `base_delay` to three
+    times the last, capped at `max_delay`, so clients that failed together
+    do not retry together. A `Retry-After` header replaces the drawn delay;
+    one longer than `max_delay` (or the time left before `deadline`) ends
+    the retries instead of stalling the call.
+
+    `deadline` caps the seconds one call may take, retries included.
+    `budget` is a token bucket shared by every call on the transport: a
+    retry spends a token and a success earns back `budget_refill`, so during
+    an outage retries fall to about one per `1 / budget_refill` successes
+    rather than multiplying the load. `None` turns it off.
+
+    Subclass and override `retryable` or `backoff` to change either rule.
+    """
+
+    max_retries: int = 3
+    base_delay: float = 0.25
+    max_delay: float = 8.0
+    statuses: frozenset[int] = RETRY_STATUSES
+    deadline: float | None = None
+    budget: float | None = 10.0
+    budget_refill: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError(
+                f"max_retries must not be negative, got {self.max_retries}"
+            )
+        if not 0 < self.base_delay <= self.max_delay:
+            raise ValueError(
+                "base_delay must be positive and at most max_delay, "
+                f"got {self.base_delay} and {self.max_delay}"
+            )
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError(f"deadline must be positive, got {self.deadline}")
+        if self.budget is not None and self.budget < 1:
+            raise ValueError(f"budget must be at least 1 or None, got {self.budget}")
+
+    def retryable(
+        self, method: str, status: int | None, attempt: int, *, idempotent: bool
+    ) -> bool:
+        """Whether attempt number `attempt` (from 0) may be followed by another."""
+        return should_retry(
+            method,
+            status,
+            attempt,
+            self.max_retries,
+            idempotent=idempotent,
+            statuses=self.statuses,
+        )
+
+    def backoff(self, previous: float) -> float:
+        """The next delay, given the last one (`base_delay` before the first)."""
+        return min(self.max_delay, random.uniform(self.base_delay, previous * 3))
+
+
+class RetryBudget:
+    """The token bucket behind `RetryPolicy.budget`, one per transport."""
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._capacity = policy.budget
+        self._refill = policy.budget_refill
+        self._tokens = policy.budget or 0.0
+        self._lock = threading.Lock()
+
+    def spend(self) -> bool:
+        if self._capacity is None:
+            return True
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def earn(self) -> None:
+        if self._capacity is None:
+            return
+        with self._lock:
+            self._tokens = min(self._capacity, self._tokens + self._refill)
+
+
+class Attempts:
+    """The retry state of one call."""
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        budget: RetryBudget,
+        method: str,
+        *,
+        idempotent: bool,
+        deadline: float | None,
+    ) -> None:
+        self._policy = policy
+        self._budget = budget
+        self._method = method
+        self._idempotent = idempotent
+        self._deadline = deadline if deadline is not None else policy.deadline
+        self._started = time.monotonic()
+        self._delay = policy.base_delay
+        self.attempt = 0
+
+    def timeout(self, timeout: float) -> float:
+        """`timeout`, cut down to what is left of the deadline."""
+        if self._deadline is None:
+            return timeout
+        # Never 0: aiohttp reads that as no timeout, and requests rejects it.
+        return max(0.001, min(timeout, self._deadline - self._elapsed()))
+
+    def next_delay(
+        self, status: int | None, retry_after: float | None = None
+    ) -> float | None:
+        """Seconds to wait before trying again, or None to give up."""
+        policy = self._policy
+        if not policy.retryable(
+            self._method, status, self.attempt, idempotent=self._idempotent
+        ):
+            return None
+        delay = policy.backoff(self._delay)
+        wait = delay if retry_after is None else retry_after
+        if retry_after is not None and retry_after > policy.max_delay:
+            return None
+        if self._deadline is not None and self._elapsed() + wait >= self._deadline:
+            return None
+        if not self._budget.spend():
+            return None
+        self._delay = delay
+        self.attempt += 1
+        return wait
+
+    def succeeded(self) -> None:
+        self._budget.earn()
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._started
 
 
-__all__ = ["backoff_schedule", "should_retry"]
+__all__ = [
+    "Attempts",
+    "RETRY_STATUSES",
+    "RetryBudget",
+    "RetryPolicy",
+    "parse_retry_after",
+    "should_retry",
+]
@@ -19,18 +19,26 @@ class ChatChunk:
     raw: dict[str, Any] = field(default_factory=dict)
 
 
-def _frame(event: str | None, payload: str) -> ChatChunk:
-    if payload == "[DONE]":
+# `json.loads` without its type and encoding checks: payloads are str here.
+_loads = json.JSONDecoder().decode
+
+
+def _frame(event: bytes | bytearray | None, payload: bytes | bytearray) -> ChatChunk:
+    if payload == b"[DONE]":
         return ChatChunk(done=True)
     try:
-        data = json.loads(payload)
-    except json.JSONDecodeError:
-        return ChatChunk(delta=payload)
+        text = payload.decode("utf-8")
+    except UnicodeDecodeError:
+        return ChatChunk(delta=payload.decode("utf-8", errors="replace"))
+    try:
+        data = _loads(text)
+    except ValueError:
+        return ChatChunk(delta=text)
     if not isinstance(data, dict):
         return ChatChunk(delta=str(data))
     trace_id = data.get("traceId") or data.get("trace_id")
     session_id = data.get("sessionId") or data.get("session_id")
-    if event == "done" or data.get("done"):
+    if event == b"done" or data.get("done"):
         return ChatChunk(
             done=True,
             trace_id=trace_id,
@@ -45,47 +53,77 @@ def _frame(event: str | None, payload: str) -> ChatChunk:
     )
 
 
-def _decode_line(raw: bytes | str) -> str:
-    if isinstance(raw, bytes):
-        try:
-            return raw.decode("utf-8").rstrip("\r\n")
-        except UnicodeDecodeError:
-            return raw.decode("utf-8", errors="replace").rstrip("\r\n")
-    return raw.rstrip("\r\n")
-
-
-def _consume(line: str, state: dict[str, Any]) -> ChatChunk | None:
-    if line == "":
-        if state["data_lines"]:
-            payload = "\n".join(state["data_lines"])
-            chunk = _frame(state["event"], payload)
-            state["event"] = None
-            state["data_lines"] = []
-            return chunk
-        state["event"] = None
-        state["data_lines"] = []
+def _event(block: bytes | bytearray) -> ChatChunk | None:
+    """The chunk for one event, the lines between two blank lines."""
+    # Nearly every event of a chat stream is a single `data:` line.
+    if block.startswith(b"data:") and b"\n" not in block:
+        return _frame(None, block[5:].lstrip(b" "))
+    event: bytes | bytearray | None = None
+    data: list[bytes | bytearray] = []
+    for line in block.split(b"\n"):
+        if line.startswith(b"data:"):
+            data.append(line[5:].lstrip(b" "))
+        elif line.startswith(b"event:"):
+            event = line[6:].strip()
+        # Anything else - a `:` comment, `id:`, `retry:`, a blank line left
+        # by a run of them - is not used.
+    if not data:
         return None
-    if line.startswith(":"):
-        return None
-    if line.startswith("event:"):
-        state["event"] = line[len("event:") :].strip()
-    elif line.startswith("data:"):
-        state["data_lines"].append(line[len("data:") :].lstrip(" "))
-    return None
+    return _frame(event, b"\n".join(data))
+
+
+class SSEDecoder:
+    """Splits Server-Sent Events out of a byte stream, chunk by chunk.
+
+    Bytes are buffered until a blank line ends an event, and each event is
+    parsed once, whole, instead of decoding it line by line. ``\\r\\n`` and
+    a bare ``\\r`` end lines as ``\\n`` does, including a ``\\r\\n`` split
+    across two chunks.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._cr = False
+
+    def feed(self, data: bytes) -> list[ChatChunk]:
+        if self._cr and data.startswith(b"\n"):
+            # The rest of a \r\n whose \r already ended the line.
+            data = data[1:]
+        self._cr = data.endswith(b"\r")
+        if b"\r" in data:
+            data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        buffer = self._buffer
+        # Only the new bytes, and the one before them, can end an event.
+        searched = max(0, len(buffer) - 1)
+        buffer += data
+        if buffer.find(b"\n\n", searched) == -1:
+            return []
+        *blocks, self._buffer = buffer.split(b"\n\n")
+        chunks: list[ChatChunk] = []
+        for block in blocks:
+            chunk = _event(block)
+            if chunk is not None:
+                chunks.append(chunk)
+        return chunks
+
+    def close(self) -> list[ChatChunk]:
+        """The event left when the stream ends without a blank line."""
+        block = bytes(self._buffer)
+        self._buffer.clear()
+        self._cr = False
+        chunk = _event(block)
+        return [] if chunk is None else [chunk]
 
 
 def iter_sse_blocking(response: requests.Response) -> Iterator[ChatChunk]:
-    state: dict[str, Any] = {"event": None, "data_lines": []}
+    decoder = SSEDecoder()
+    # A chunked reply is read a chunk at a time as each arrives; reading one
+    # of fixed length in larger pieces would hold events back until they fill.
+    size = None if getattr(response.raw, "chunked", False) else 512
     try:
-        for raw_line in response.iter_lines(decode_unicode=False):
-            if raw_line is None:
-                continue
-            line = _decode_line(raw_line) if raw_line else ""
-            chunk = _consume(line, state)
-            if chunk is not None:
-                yield chunk
-        if state["data_lines"]:
-            yield _frame(state["event"], "\n".join(state["data_lines"]))
+        for data in response.iter_content(chunk_size=size):
+            yield from decoder.feed(data)
+        yield from decoder.close()
     finally:
         response.close()
 
@@ -93,17 +131,15 @@ def iter_sse_blocking(response: requests.Response) -> Iterator[ChatChunk]:
 async def iter_sse_async(
     response: aiohttp.ClientResponse,
 ) -> AsyncIterator[ChatChunk]:
-    state: dict[str, Any] = {"event": None, "data_lines": []}
+    decoder = SSEDecoder()
     try:
-        async for raw_line in response.content:
-            line = _decode_line(raw_line)
-            chunk = _consume(line, state)
-            if chunk is not None:
+        async for data in response.content.iter_any():
+            for chunk in decoder.feed(data):
                 yield chunk
-        if state["data_lines"]:
-            yield _frame(state["event"], "\n".join(state["data_lines"]))
+        for chunk in decoder.close():
+            yield chunk
     finally:
         response.release()
 
 
-__all__ = ["ChatChunk", "iter_sse_blocking", "iter_sse_async"]
+__all__ = ["ChatChunk", "SSEDecoder", "iter_sse_blocking", "iter_sse_async"]
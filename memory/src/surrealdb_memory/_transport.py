@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-import io
+import dataclasses
 import json as _json
-import os
+import threading
 import time
-from collections.abc import AsyncIterator, Iterator, Mapping
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
 from typing import Any
 from urllib.parse import quote
 
@@ -13,7 +13,24 @@ import aiohttp
 import requests
 
 from surrealdb_memory._errors import MemoryAPIError, error_from_response
-from surrealdb_memory._retry import backoff_schedule, should_retry
+from surrealdb_memory._idempotency import request_hash
+from surrealdb_memory._multipart import MultipartStream
+from surrealdb_memory._pool import (
+    PoolOptions,
+    PoolStats,
+    _Usage,
+    connector,
+    connector_limit,
+    mount_pool,
+    session_limit,
+    trace_waits,
+)
+from surrealdb_memory._retry import (
+    Attempts,
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
 from surrealdb_memory._streaming import ChatChunk, iter_sse_async, iter_sse_blocking
 
 DEFAULT_TIMEOUT = 30.0
@@ -69,6 +86,50 @@ def _decode_json(body: bytes | str | None) -> Any:
         return body
 
 
+def _flight_key(
+    method: str,
+    path: str,
+    params: Mapping[str, Any] | None,
+    json: Any,
+    headers: Mapping[str, str] | None,
+) -> str:
+    """Identifies requests that would get the same answer.
+
+    Params, body and extra headers are canonicalised (sorted keys) so two
+    callers building the same request in a different order still share one
+    flight; headers count because `X-Memory-On-Behalf-Of` changes the answer.
+    """
+    body = b"" if json is None else _json.dumps(json, sort_keys=True).encode("utf-8")
+    extra = [
+        _json.dumps(sorted((params or {}).items()), default=str).encode("utf-8"),
+        _json.dumps(sorted((headers or {}).items())).encode("utf-8"),
+    ]
+    return request_hash(method, path, body, *extra)
+
+
+def _coalescible(method: str, coalesce: bool, return_raw: bool, data: Any) -> bool:
+    # Only reads: GETs, and the POSTs that callers mark as reads (`recall`).
+    # A raw response is a stream only one caller can consume.
+    return (method == "GET" or coalesce) and not return_raw and data is None
+
+
+def _rewind(data: Any) -> None:
+    # An upload read partway (or wholly) by the failed attempt starts over.
+    if isinstance(data, MultipartStream):
+        data.seek(0)
+
+
+class _Flight:
+    """One in-flight request that identical concurrent requests wait on."""
+
+    __slots__ = ("body", "done", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.body: bytes = b""
+        self.error: BaseException | None = None
+
+
 class _BaseTransport:
     def __init__(
         self,
@@ -76,12 +137,51 @@ class _BaseTransport:
         endpoint: str | None = None,
         api_key: str | None = None,
         timeout: float = DEFAULT_TIMEOUT,
-        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_retries: int | None = None,
+        coalesce: bool = True,
+        retry: RetryPolicy | None = None,
     ) -> None:
         self.endpoint = _resolve_endpoint(endpoint)
         self.api_key = _resolve_api_key(api_key)
         self.timeout = timeout
-        self.max_retries = max_retries
+        if retry is not None and max_retries is not None:
+            raise ValueError("Pass either retry or max_retries, not both")
+        if retry is None:
+            retry = RetryPolicy(
+                max_retries=DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+            )
+        self.retry = retry
+        # One bucket for every call, so an outage cannot turn each caller's
+        # retries into a multiple of the load.
+        self._budget = RetryBudget(self.retry)
+        self._usage = _Usage(0)
+        # Single-flight: while a read is in flight, an identical read waits
+        # for its answer instead of sending another request. Agent workloads
+        # fire the same `recall()` many times within milliseconds.
+        self.coalesce = coalesce
+
+    @property
+    def max_retries(self) -> int:
+        """`retry.max_retries`; setting it replaces `retry` with a copy."""
+        return self.retry.max_retries
+
+    @max_retries.setter
+    def max_retries(self, value: int) -> None:
+        self.retry = dataclasses.replace(self.retry, max_retries=value)
+
+    def pool_stats(self) -> PoolStats:
+        return self._usage.stats()
+
+    def _attempts(
+        self, method_upper: str, idempotent: bool, deadline: float | None
+    ) -> Attempts:
+        return Attempts(
+            self.retry,
+            self._budget,
+            method_upper,
+            idempotent=idempotent,
+            deadline=deadline,
+        )
 
     def _headers(
         self,
@@ -109,17 +209,33 @@ class BlockingTransport(_BaseTransport):
         endpoint: str | None = None,
         api_key: str | None = None,
         timeout: float = DEFAULT_TIMEOUT,
-        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_retries: int | None = None,
         session: requests.Session | None = None,
+        coalesce: bool = True,
+        pool: PoolOptions | None = None,
+        retry: RetryPolicy | None = None,
     ) -> None:
         super().__init__(
             endpoint=endpoint,
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
+            coalesce=coalesce,
+            retry=retry,
         )
-        self._session = session or requests.Session()
+        if session is not None and pool is not None:
+            raise ValueError("Pass either session or pool, not both")
         self._owns_session = session is None
+        if session is None:
+            pool = pool or PoolOptions()
+            session = requests.Session()
+            mount_pool(session, pool)
+            self._usage = _Usage(pool.limit)
+        else:
+            self._usage = _Usage(session_limit(session, self.endpoint))
+        self._session = session
+        self._flights: dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
 
     def close(self) -> None:
         if self._owns_session:
@@ -146,11 +262,92 @@ class BlockingTransport(_BaseTransport):
         allow_redirects: bool = True,
         return_raw: bool = False,
         idempotent: bool = False,
+        coalesce: bool = False,
+        deadline: float | None = None,
     ) -> Any:
-        url = _build_url(self.endpoint, path)
-        attempt = 0
-        schedule = backoff_schedule(self.max_retries)
         method_upper = method.upper()
+        if (
+            self.coalesce
+            and not stream
+            and files is None
+            and _coalescible(method_upper, coalesce, return_raw, data)
+        ):
+            key = _flight_key(method_upper, path, params, json, headers)
+            body = self._coalesced(
+                key,
+                lambda: (
+                    self._send(
+                        method_upper,
+                        path,
+                        params=params,
+                        json=json,
+                        headers=headers,
+                        timeout=timeout,
+                        allow_redirects=allow_redirects,
+                        return_raw=True,
+                        idempotent=idempotent,
+                        deadline=deadline,
+                    ).content
+                ),
+            )
+            return _decode_json(body) if body else None
+        return self._send(
+            method_upper,
+            path,
+            params=params,
+            json=json,
+            data=data,
+            files=files,
+            headers=headers,
+            timeout=timeout,
+            stream=stream,
+            allow_redirects=allow_redirects,
+            return_raw=return_raw,
+            idempotent=idempotent,
+            deadline=deadline,
+        )
+
+    def _coalesced(self, key: str, fetch: Callable[[], bytes]) -> bytes:
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.body
+        try:
+            flight.body = fetch()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.body
+
+    def _send(
+        self,
+        method_upper: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        data: Any | None = None,
+        files: Any | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+        allow_redirects: bool = True,
+        return_raw: bool = False,
+        idempotent: bool = False,
+        deadline: float | None = None,
+    ) -> Any:
+        url = _build_url(self.endpoint, path)
+        attempts = self._attempts(method_upper, idempotent, deadline)
         content_type: str | None = "application/json" if json is not None else None
         if files is not None or data is not None:
             content_type = None
@@ -159,50 +356,49 @@ class BlockingTransport(_BaseTransport):
             params = {k: v for k, v in params.items() if v is not None}
         while True:
             try:
-                response = self._session.request(
-                    method_upper,
-                    url,
-                    params=params,
-                    json=json,
-                    data=data,
-                    files=files,
-                    headers=h,
-                    timeout=timeout if timeout is not None else self.timeout,
-                    stream=stream,
-                    allow_redirects=allow_redirects,
-                )
+                # Past `limit`, urllib3 either blocks for a connection or opens
+                # one it throws away; either way the request found it full.
+                with self._usage.busy(count_wait=True):
+                    response = self._session.request(
+                        method_upper,
+                        url,
+                        params=params,
+                        json=json,
+                        data=data,
+                        files=files,
+                        headers=h,
+                        timeout=attempts.timeout(
+                            timeout if timeout is not None else self.timeout
+                        ),
+                        stream=stream,
+                        allow_redirects=allow_redirects,
+                    )
             except (requests.ConnectionError, requests.Timeout) as exc:
-                if not should_retry(
-                    method_upper,
-                    None,
-                    attempt,
-                    self.max_retries,
-                    idempotent=idempotent,
-                ):
+                wait = attempts.next_delay(None)
+                if wait is None:
                     raise MemoryAPIError(
                         status_code=0,
                         message=f"Connection failed: {exc}",
                     ) from exc
-                time.sleep(schedule[attempt])
-                attempt += 1
+                time.sleep(wait)
+                _rewind(data)
                 continue
 
             status = response.status_code
-            if status >= 400 and should_retry(
-                method_upper,
-                status,
-                attempt,
-                self.max_retries,
-                idempotent=idempotent,
-            ):
-                time.sleep(schedule[attempt])
-                attempt += 1
-                continue
-
             if status >= 400:
+                wait = attempts.next_delay(
+                    status, parse_retry_after(response.headers.get("Retry-After"))
+                )
+                if wait is not None:
+                    response.close()
+                    time.sleep(wait)
+                    _rewind(data)
+                    continue
                 body = _decode_json(response.content)
                 raise error_from_response(status, body, dict(response.headers))
 
+            attempts.succeeded()
+
             if return_raw or stream:
                 return response
             if status == 204 or not response.content:
@@ -263,21 +459,39 @@ class AsyncTransport(_BaseTransport):
         endpoint: str | None = None,
         api_key: str | None = None,
         timeout: float = DEFAULT_TIMEOUT,
-        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_retries: int | None = None,
         session: aiohttp.ClientSession | None = None,
+        coalesce: bool = True,
+        pool: PoolOptions | None = None,
+        retry: RetryPolicy | None = None,
     ) -> None:
         super().__init__(
             endpoint=endpoint,
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
+            coalesce=coalesce,
+            retry=retry,
         )
+        if session is not None and pool is not None:
+            raise ValueError("Pass either session or pool, not both")
         self._session = session
         self._owns_session = session is None
+        self._flights: dict[str, asyncio.Future[bytes]] = {}
+        # The session, and so the connector, is made on first use because
+        # aiohttp wants a running loop; the pool is fixed now.
+        self._pool = pool or PoolOptions()
+        if session is None:
+            self._usage = _Usage(self._pool.limit)
+        else:
+            self._usage = _Usage(connector_limit(session.connector))
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=connector(self._pool),
+                trace_configs=[trace_waits(self._usage)],
+            )
             self._owns_session = True
         return self._session
 
@@ -305,70 +519,127 @@ class AsyncTransport(_BaseTransport):
         timeout: float | None = None,
         return_raw: bool = False,
         idempotent: bool = False,
+        coalesce: bool = False,
+        deadline: float | None = None,
+    ) -> Any:
+        method_upper = method.upper()
+        if self.coalesce and _coalescible(method_upper, coalesce, return_raw, data):
+            key = _flight_key(method_upper, path, params, json, headers)
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = asyncio.ensure_future(
+                    self._read(
+                        method_upper,
+                        path,
+                        params=params,
+                        json=json,
+                        headers=headers,
+                        timeout=timeout,
+                        idempotent=idempotent,
+                        deadline=deadline,
+                    )
+                )
+                self._flights[key] = flight
+                flight.add_done_callback(lambda _: self._land(key))
+            # Shielded: one waiter being cancelled must not cancel the
+            # request the others are waiting on.
+            body = await asyncio.shield(flight)
+            return _decode_json(body) if body else None
+        return await self._send(
+            method_upper,
+            path,
+            params=params,
+            json=json,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            return_raw=return_raw,
+            idempotent=idempotent,
+            deadline=deadline,
+        )
+
+    def _land(self, key: str) -> None:
+        flight = self._flights.pop(key)
+        # Retrieved here so that a failure nobody is left waiting for - every
+        # waiter was cancelled - is not logged as "never retrieved".
+        if not flight.cancelled():
+            flight.exception()
+
+    async def _read(self, method_upper: str, path: str, **kw: Any) -> bytes:
+        response = await self._send(method_upper, path, return_raw=True, **kw)
+        try:
+            return b"" if response.status == 204 else await response.read()
+        finally:
+            response.release()
+
+    async def _send(
+        self,
+        method_upper: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        data: Any | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        return_raw: bool = False,
+        idempotent: bool = False,
+        deadline: float | None = None,
     ) -> Any:
         session = await self._ensure_session()
         url = _build_url(self.endpoint, path)
-        attempt = 0
-        schedule = backoff_schedule(self.max_retries)
-        method_upper = method.upper()
+        attempts = self._attempts(method_upper, idempotent, deadline)
         content_type: str | None = "application/json" if json is not None else None
         if data is not None:
             content_type = None
         h = self._headers(extra=headers, content_type=content_type)
         if params is not None:
             params = {k: v for k, v in params.items() if v is not None}
-        req_timeout = aiohttp.ClientTimeout(
-            total=timeout if timeout is not None else self.timeout
-        )
 
         while True:
             try:
-                response = await session.request(
-                    method_upper,
-                    url,
-                    params=params,
-                    json=json,
-                    data=data,
-                    headers=h,
-                    timeout=req_timeout,
-                    allow_redirects=True,
-                )
+                # aiohttp queues past `limit`; the trace counts those waits.
+                with self._usage.busy(count_wait=False):
+                    response = await session.request(
+                        method_upper,
+                        url,
+                        params=params,
+                        json=json,
+                        data=data,
+                        headers=h,
+                        timeout=aiohttp.ClientTimeout(
+                            total=attempts.timeout(
+                                timeout if timeout is not None else self.timeout
+                            )
+                        ),
+                        allow_redirects=True,
+                    )
             except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
-                if not should_retry(
-                    method_upper,
-                    None,
-                    attempt,
-                    self.max_retries,
-                    idempotent=idempotent,
-                ):
+                wait = attempts.next_delay(None)
+                if wait is None:
                     raise MemoryAPIError(
                         status_code=0,
                         message=f"Connection failed: {exc}",
                     ) from exc
-                await asyncio.sleep(schedule[attempt])
-                attempt += 1
+                await asyncio.sleep(wait)
                 continue
 
             status = response.status
-            if status >= 400 and should_retry(
-                method_upper,
-                status,
-                attempt,
-                self.max_retries,
-                idempotent=idempotent,
-            ):
-                response.release()
-                await asyncio.sleep(schedule[attempt])
-                attempt += 1
-                continue
-
             if status >= 400:
+                wait = attempts.next_delay(
+                    status, parse_retry_after(response.headers.get("Retry-After"))
+                )
+                if wait is not None:
+                    response.release()
+                    await asyncio.sleep(wait)
+                    continue
                 body_bytes = await response.read()
                 headers_dict = dict(response.headers.items())
                 response.release()
                 body = _decode_json(body_bytes)
                 raise error_from_response(status, body, headers_dict)
 
+            attempts.succeeded()
             if return_raw:
                 return response
             if status == 204:
@@ -418,80 +689,9 @@ class AsyncTransport(_BaseTransport):
             yield chunk
 
 
-def build_multipart_payload(
-    *,
-    file: bytes | bytearray | memoryview | io.IOBase | str,
-    filename: str | None,
-    mime_type: str | None,
-    fields: Mapping[str, Any] | None,
-) -> tuple[Mapping[str, Any], dict[str, Any]]:
-    if isinstance(file, str):
-        fp = open(file, "rb")  # noqa: SIM115
-        if filename is None:
-            filename = os.path.basename(file)
-        payload: Any = fp
-    elif isinstance(file, (bytes, bytearray, memoryview)):
-        payload = bytes(file)
-    else:
-        payload = file
-    files: dict[str, tuple[str | None, Any, str | None]] = {
-        "file": (filename, payload, mime_type),
-    }
-    data: dict[str, Any] = {}
-    if fields:
-        for k, v in fields.items():
-            if v is None:
-                continue
-            if isinstance(v, (dict, list)):
-                data[k] = _json.dumps(v)
-            else:
-                data[k] = str(v)
-    return files, data
-
-
-def build_aiohttp_form(
-    *,
-    file: bytes | bytearray | memoryview | io.IOBase | str,
-    filename: str | None,
-    mime_type: str | None,
-    fields: Mapping[str, Any] | None,
-) -> aiohttp.FormData:
-    form = aiohttp.FormData()
-    payload: Any
-    if isinstance(file, str):
-        with open(file, "rb") as fp:
-            payload = fp.read()
-        if filename is None:
-            filename = os.path.basename(file)
-    elif isinstance(file, (bytes, bytearray, memoryview)):
-        payload = bytes(file)
-    else:
-        payload = file.read() if hasattr(file, "read") else file
-    # Send non-file parts (e.g. `metadata`) before the `file` part: the upload
-    # handler reads fields in declaration order and only falls back to deriving
-    # metadata from the file part when `file` arrives first.
-    if fields:
-        for k, v in fields.items():
-            if v is None:
-                continue
-            if isinstance(v, (dict, list)):
-                form.add_field(k, _json.dumps(v), content_type="application/json")
-            else:
-                form.add_field(k, str(v))
-    form.add_field(
-        "file",
-        payload,
-        filename=filename or "upload",
-        content_type=mime_type or "application/octet-stream",
-    )
-    return form
-
-
 __all__ = [
     "BlockingTransport",
     "AsyncTransport",
-    "build_multipart_payload",
-    "build_aiohttp_form",
     "quote_path",
     "on_behalf_of_header",
     "DEFAULT_TIMEOUT",
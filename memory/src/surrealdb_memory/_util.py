@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import Any
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
 
 
 def drop_none(payload: Mapping[str, Any]) -> dict[str, Any]:
@@ -9,4 +13,55 @@ def drop_none(payload: Mapping[str, Any]) -> dict[str, Any]:
     return {k: v for k, v in payload.items() if v is not None}
 
 
-__all__ = ["drop_none"]
+def check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+
+def run_threaded(
+    fn: Callable[..., T], calls: Sequence[Mapping[str, Any]], concurrency: int
+) -> list[T]:
+    """``fn(**call)`` for each of *calls* on up to *concurrency* threads.
+
+    Results come back in the order of *calls*. The first error is raised and
+    the calls not yet started are cancelled.
+    """
+    check_concurrency(concurrency)
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(calls))) as pool:
+        futures = [pool.submit(fn, **call) for call in calls]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+async def run_concurrently(
+    fn: Callable[..., Awaitable[T]],
+    calls: Sequence[Mapping[str, Any]],
+    concurrency: int,
+) -> list[T]:
+    """``await fn(**call)`` for each of *calls*, at most *concurrency* at once.
+
+    Results come back in the order of *calls*. The first error is raised and
+    the calls still running are cancelled.
+    """
+    check_concurrency(concurrency)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(call: Mapping[str, Any]) -> T:
+        async with slots:
+            return await fn(**call)
+
+    tasks = [asyncio.ensure_future(one(call)) for call in calls]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+__all__ = ["check_concurrency", "drop_none", "run_concurrently", "run_threaded"]
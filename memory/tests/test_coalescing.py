@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+import responses
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from surrealdb_memory import AsyncMemory, Memory, MemoryNotFoundError
+from surrealdb_memory._transport import AsyncTransport, BlockingTransport
+
+API_KEY = "test-key"
+CONTEXT = "acme-prod"
+ROOT = f"/api/v1/{CONTEXT}"
+BASE = "https://api.spectron.test"
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+def _hits(query: str) -> dict[str, Any]:
+    return {
+        "hits": [{"id": "h:1", "score": 1.0, "source": "fact", "text": query}],
+        "tier": "hot",
+    }
+
+
+class _Server:
+    """Answers `recall` after a delay, counting requests and concurrency."""
+
+    def __init__(self, delay: float = 0.05, status: int = 200) -> None:
+        self.delay = delay
+        self.status = status
+        self.bodies: list[Any] = []
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        body: Any = await request.json() if request.can_read_body else None
+        self.bodies.append(body)
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.status != 200:
+            return web.json_response({"error": "gone"}, status=self.status)
+        if request.path.endswith("/forget"):
+            return web.json_response({"deleted": 1})
+        return web.json_response(_hits(body["query"]))
+
+
+@asynccontextmanager
+async def _memory(handler: Handler, **kw: Any) -> AsyncIterator[AsyncMemory]:
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    transport = AsyncTransport(
+        endpoint=str(server.make_url("/")), api_key=API_KEY, **kw
+    )
+    try:
+        async with AsyncMemory(CONTEXT, transport=transport) as memory:
+            yield memory
+    finally:
+        await transport.close()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_identical_recalls_in_flight_share_one_request() -> None:
+    server = _Server()
+    async with _memory(server.handle) as memory:
+        results = await asyncio.gather(*(memory.recall("acme", k=5) for _ in range(10)))
+
+    assert len(server.bodies) == 1
+    assert all(r.hits[0].text == "acme" for r in results)
+    # Each caller decodes its own copy, so none can mutate another's result.
+    assert len({id(r.hits) for r in results}) == 10
+
+
+@pytest.mark.asyncio
+async def test_only_identical_requests_are_coalesced() -> None:
+    server = _Server()
+    async with _memory(server.handle) as memory:
+        await asyncio.gather(
+            memory.recall("acme", k=5),
+            memory.recall("acme", k=6),
+            memory.recall("acme", k=5, on_behalf_of="principal:agent-7"),
+            memory.forget("acme"),
+            memory.forget("acme"),
+        )
+
+    assert len(server.bodies) == 5
+
+
+@pytest.mark.asyncio
+async def test_requests_after_a_flight_lands_are_sent_again() -> None:
+    server = _Server(delay=0)
+    async with _memory(server.handle) as memory:
+        await memory.recall("acme")
+        await memory.recall("acme")
+
+    assert len(server.bodies) == 2
+
+
+@pytest.mark.asyncio
+async def test_every_waiter_sees_the_error() -> None:
+    server = _Server(status=404)
+    async with _memory(server.handle) as memory:
+        results = await asyncio.gather(
+            *(memory.recall("acme") for _ in range(3)), return_exceptions=True
+        )
+
+    assert len(server.bodies) == 1
+    assert all(isinstance(r, MemoryNotFoundError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_waiter_does_not_cancel_the_others() -> None:
+    server = _Server()
+    async with _memory(server.handle) as memory:
+        first = asyncio.ensure_future(memory.recall("acme"))
+        second = asyncio.ensure_future(memory.recall("acme"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert (await second).hits[0].text == "acme"
+    assert len(server.bodies) == 1
+
+
+@pytest.mark.asyncio
+async def test_coalescing_can_be_turned_off() -> None:
+    server = _Server()
+    async with _memory(server.handle, coalesce=False) as memory:
+        await asyncio.gather(*(memory.recall("acme") for _ in range(3)))
+
+    assert len(server.bodies) == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_recall_bounds_concurrency_and_keeps_order() -> None:
+    server = _Server(delay=0.02)
+    queries: list[Any] = [f"q{n}" for n in range(12)]
+    queries.append({"query": "special", "k": 1})
+    async with _memory(server.handle) as memory:
+        results = await memory.gather_recall(queries, concurrency=3, mode="hybrid")
+
+    assert [r.hits[0].text for r in results] == [*queries[:12], "special"]
+    assert server.most_in_flight == 3
+    assert all(body["mode"] == "hybrid" for body in server.bodies)
+    assert [b.get("k") for b in server.bodies].count(1) == 1
+
+
+@pytest.mark.asyncio
+async def test_gather_recall_raises_the_first_error() -> None:
+    server = _Server(status=404)
+    async with _memory(server.handle) as memory:
+        with pytest.raises(MemoryNotFoundError):
+            await memory.gather_recall(["a", "b", "c"], concurrency=1)
+        with pytest.raises(TypeError, match="list of queries"):
+            await memory.gather_recall("acme")
+        with pytest.raises(ValueError, match="concurrency"):
+            await memory.gather_recall(["a"], concurrency=0)
+
+    # The first query failed, so the other two were cancelled before sending.
+    assert len(server.bodies) == 1
+
+
+def _recall_callback(
+    calls: list[Any],
+) -> Callable[[Any], tuple[int, dict[str, str], str]]:
+    def callback(request: Any) -> tuple[int, dict[str, str], str]:
+        calls.append(request.body)
+        time.sleep(0.05)
+        query = json.loads(request.body)["query"]
+        return 200, {}, json.dumps(_hits(query))
+
+    return callback
+
+
+@responses.activate
+def test_blocking_threads_share_identical_requests() -> None:
+    calls: list[Any] = []
+    responses.add_callback(
+        responses.POST, f"{BASE}{ROOT}/query", callback=_recall_callback(calls)
+    )
+    memory = Memory(CONTEXT, endpoint=BASE, api_key=API_KEY)
+    results: list[Any] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(memory.recall("acme")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert [r.hits[0].text for r in results] == ["acme"] * 8
+
+
+@responses.activate
+def test_blocking_gather_recall_keeps_order() -> None:
+    calls: list[Any] = []
+    responses.add_callback(
+        responses.POST, f"{BASE}{ROOT}/query", callback=_recall_callback(calls)
+    )
+    with Memory(CONTEXT, endpoint=BASE, api_key=API_KEY) as memory:
+        results = memory.gather_recall(["a", "b", "a", {"query": "c"}], concurrency=4)
+
+    assert [r.hits[0].text for r in results] == ["a", "b", "a", "c"]
+    assert len(calls) == 3
+
+
+@responses.activate
+def test_blocking_gets_coalesce_but_writes_do_not() -> None:
+    responses.add(responses.GET, f"{BASE}/x", json={"ok": True})
+    responses.add(responses.POST, f"{BASE}/y", json={"ok": True})
+    transport = BlockingTransport(endpoint=BASE, api_key=API_KEY)
+
+    assert transport.get("/x") == {"ok": True}
+    assert transport.post("/y", json={"a": 1}) == {"ok": True}
+    assert transport._flights == {}
@@ -10,7 +10,7 @@ from surrealdb_memory import (
     MemoryServiceError,
 )
 from surrealdb_memory._errors import error_for_status, error_from_response
-from surrealdb_memory._retry import backoff_schedule, should_retry
+from surrealdb_memory._retry import RetryPolicy, should_retry
 from surrealdb_memory._scope import scope_sets
 
 
@@ -54,12 +54,14 @@ def test_error_from_response_picks_up_trace_header() -> None:
     assert exc.trace_id == "tr:1"
 
 
-def test_backoff_schedule_capped() -> None:
-    assert backoff_schedule(0) == ()
-    assert backoff_schedule(1) == (0.25,)
-    assert backoff_schedule(2) == (0.25, 0.5)
-    assert backoff_schedule(3) == (0.25, 0.5, 1.0)
-    assert backoff_schedule(10) == (0.25, 0.5, 1.0)
+def test_backoff_is_jittered_and_capped() -> None:
+    policy = RetryPolicy(base_delay=0.25, max_delay=2.0)
+    delay = policy.base_delay
+    for _ in range(50):
+        nxt = policy.backoff(delay)
+        assert policy.base_delay <= nxt <= min(policy.max_delay, delay * 3)
+        delay = nxt
+    assert len({policy.backoff(1.0) for _ in range(20)}) > 1
 
 
 def test_should_retry_rules() -> None:
@@ -69,6 +71,9 @@ def test_should_retry_rules() -> None:
     assert should_retry("POST", 500, 0, 3) is False
     assert should_retry("PUT", 502, 0, 3) is False
     assert should_retry("GET", 500, 3, 3) is False
+    assert should_retry("GET", 501, 0, 3) is False
+    # A 429 never ran, so even a plain POST may go again.
+    assert should_retry("POST", 429, 0, 3) is True
 
 
 def test_idempotent_post_can_retry() -> None:
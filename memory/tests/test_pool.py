@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import aiohttp
+import pytest
+import requests
+import responses
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from requests.adapters import HTTPAdapter
+
+from surrealdb_memory import (
+    AsyncMemory,
+    AsyncTransport,
+    BlockingTransport,
+    Memory,
+    PoolOptions,
+    PoolStats,
+)
+
+API_KEY = "test-key"
+CONTEXT = "acme-prod"
+BASE = "https://api.spectron.test"
+
+
+def test_pool_options_are_checked() -> None:
+    with pytest.raises(ValueError, match="max_connections"):
+        PoolOptions(max_connections=0)
+    with pytest.raises(ValueError, match="max_per_host"):
+        PoolOptions(max_per_host=0)
+    with pytest.raises(ValueError, match="keepalive_timeout"):
+        PoolOptions(keepalive_timeout=-1)
+    with pytest.raises(ValueError, match="dns_cache_ttl"):
+        PoolOptions(dns_cache_ttl=-1)
+
+    assert PoolOptions().limit == 100
+    assert PoolOptions(max_connections=50, max_per_host=8).limit == 8
+
+
+def test_blocking_transport_sizes_its_urllib3_pool() -> None:
+    transport = BlockingTransport(
+        endpoint=BASE, api_key=API_KEY, pool=PoolOptions(max_per_host=24, block=True)
+    )
+    adapter = transport._session.get_adapter(BASE)
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 24
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert transport.pool_stats() == PoolStats(limit=24, in_flight=0, peak=0, waited=0)
+
+
+def test_a_session_of_your_own_keeps_its_pool() -> None:
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=3))
+
+    transport = BlockingTransport(endpoint=BASE, api_key=API_KEY, session=session)
+
+    assert transport.pool_stats().limit == 3
+    with pytest.raises(ValueError, match="session or pool"):
+        BlockingTransport(
+            endpoint=BASE, api_key=API_KEY, session=session, pool=PoolOptions()
+        )
+
+
+@responses.activate
+def test_blocking_stats_count_requests_past_the_limit() -> None:
+    def slow(request: Any) -> tuple[int, dict[str, str], str]:
+        time.sleep(0.1)
+        return 200, {}, '{"deleted": 1}'
+
+    responses.add_callback(
+        responses.POST, f"{BASE}/api/v1/{CONTEXT}/forget", callback=slow
+    )
+    memory = Memory(
+        CONTEXT,
+        endpoint=BASE,
+        api_key=API_KEY,
+        pool=PoolOptions(max_connections=2),
+    )
+    seen: list[PoolStats] = []
+    threads = [
+        threading.Thread(target=memory.forget, args=(f"fact {n}",)) for n in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    seen.append(memory.pool_stats())
+    for thread in threads:
+        thread.join()
+
+    assert seen[0].in_flight == 4
+    assert seen[0].saturated
+    assert memory.pool_stats() == PoolStats(limit=2, in_flight=0, peak=4, waited=2)
+
+
+@pytest.mark.asyncio
+async def test_async_transport_builds_its_connector() -> None:
+    pool = PoolOptions(
+        max_connections=20, max_per_host=5, keepalive_timeout=3, dns_cache_ttl=None
+    )
+    async with AsyncTransport(endpoint=BASE, api_key=API_KEY, pool=pool) as transport:
+        connector = transport._session.connector
+
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert (connector.limit, connector.limit_per_host) == (20, 5)
+        assert not connector.use_dns_cache
+        assert transport.pool_stats().limit == 5
+
+    session = aiohttp.ClientSession()
+    try:
+        with pytest.raises(ValueError, match="session or pool"):
+            AsyncTransport(endpoint=BASE, api_key=API_KEY, session=session, pool=pool)
+        own = AsyncTransport(endpoint=BASE, api_key=API_KEY, session=session)
+        assert own.pool_stats().limit == 100
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("limit", "limit_per_host", "expected"),
+    [(10, 20, 10), (20, 10, 10), (0, 10, 10), (10, 0, 10), (0, 0, 0)],
+)
+async def test_a_session_of_your_own_is_limited_by_its_tighter_cap(
+    limit: int, limit_per_host: int, expected: int
+) -> None:
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+    )
+    try:
+        own = AsyncTransport(endpoint=BASE, api_key=API_KEY, session=session)
+        assert own.pool_stats().limit == expected
+    finally:
+        await session.close()
+
+
+def test_a_pool_with_no_limit_is_never_saturated() -> None:
+    assert not PoolStats(limit=0, in_flight=500, peak=500, waited=0).saturated
+    assert PoolStats(limit=2, in_flight=2, peak=2, waited=0).saturated
+
+
+@pytest.mark.asyncio
+async def test_async_stats_count_requests_queued_for_a_connection() -> None:
+    release = asyncio.Event()
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        await release.wait()
+        return web.json_response({"deleted": 1})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with AsyncMemory(
+            CONTEXT,
+            endpoint=str(server.make_url("/")),
+            api_key=API_KEY,
+            pool=PoolOptions(max_connections=2),
+        ) as memory:
+            calls = [
+                asyncio.ensure_future(memory.forget(f"fact {n}")) for n in range(5)
+            ]
+            await asyncio.sleep(0.1)
+            during = memory.pool_stats()
+            release.set()
+            await asyncio.gather(*calls)
+
+            assert during.in_flight == 5
+            assert during.waited == 3
+            assert memory.pool_stats() == PoolStats(
+                limit=2, in_flight=0, peak=5, waited=3
+            )
+    finally:
+        await server.close()
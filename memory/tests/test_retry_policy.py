@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from surrealdb_memory import (
+    AsyncTransport,
+    BlockingTransport,
+    Memory,
+    MemoryAPIError,
+    RetryPolicy,
+)
+from surrealdb_memory._retry import parse_retry_after
+
+API_KEY = "test-key"
+
+# Short enough to keep the suite fast, long enough to measure.
+FAST = RetryPolicy(base_delay=0.01, max_delay=0.05)
+
+Reply = tuple[int, dict[str, str]]
+
+
+class _Flaky:
+    """Answers with the scripted replies in turn, then with the last one."""
+
+    def __init__(self, *replies: Reply, delay: float = 0.0) -> None:
+        self.replies = list(replies)
+        self.delay = delay
+        self.times: list[float] = []
+
+    def next(self) -> Reply:
+        self.times.append(time.monotonic())
+        return self.replies[min(len(self.times), len(self.replies)) - 1]
+
+    @property
+    def calls(self) -> int:
+        return len(self.times)
+
+
+@contextmanager
+def _serve_blocking(flaky: _Flaky) -> Iterator[str]:
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            status, headers = flaky.next()
+            time.sleep(flaky.delay)
+            body = json.dumps({"message": "flaky", "ok": status < 400}).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = _reply
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _transport(base: str, policy: RetryPolicy = FAST) -> BlockingTransport:
+    return BlockingTransport(endpoint=base, api_key=API_KEY, retry=policy)
+
+
+def test_a_flaky_read_is_retried_until_it_succeeds() -> None:
+    flaky = _Flaky((503, {}), (502, {}), (200, {}))
+    with _serve_blocking(flaky) as base, _transport(base) as t:
+        assert t.get("/x") == {"message": "flaky", "ok": True}
+    assert flaky.calls == 3
+
+
+def test_more_than_three_retries_are_allowed() -> None:
+    flaky = _Flaky(*[(503, {})] * 6, (200, {}))
+    policy = RetryPolicy(max_retries=6, base_delay=0.01, max_delay=0.02)
+    with _serve_blocking(flaky) as base, _transport(base, policy) as t:
+        assert t.get("/x")["ok"] is True
+    assert flaky.calls == 7
+
+
+def test_retry_after_is_honoured_even_for_a_plain_post() -> None:
+    flaky = _Flaky((429, {"Retry-After": "0.2"}), (200, {}))
+    with _serve_blocking(flaky) as base, _transport(base, RetryPolicy()) as t:
+        assert t.post("/x", json={})["ok"] is True
+    assert flaky.calls == 2
+    assert flaky.times[1] - flaky.times[0] >= 0.2
+
+
+def test_a_retry_after_longer_than_max_delay_gives_up() -> None:
+    flaky = _Flaky((503, {"Retry-After": "120"}), (200, {}))
+    with (
+        _serve_blocking(flaky) as base,
+        _transport(base) as t,
+        pytest.raises(MemoryAPIError) as info,
+    ):
+        t.get("/x")
+    assert info.value.status_code == 503
+    assert flaky.calls == 1
+
+
+def test_a_deadline_caps_the_time_spent_retrying() -> None:
+    flaky = _Flaky((503, {}))
+    policy = RetryPolicy(max_retries=100, base_delay=0.05, max_delay=0.1, deadline=0.4)
+    with _serve_blocking(flaky) as base, _transport(base, policy) as t:
+        started = time.monotonic()
+        with pytest.raises(MemoryAPIError):
+            t.get("/x")
+        assert time.monotonic() - started < 0.4
+    assert 2 < flaky.calls < 100
+
+
+def test_a_per_call_deadline_also_cuts_the_request_timeout() -> None:
+    flaky = _Flaky((200, {}), delay=1.0)
+    with _serve_blocking(flaky) as base, _transport(base) as t:
+        started = time.monotonic()
+        with pytest.raises(MemoryAPIError) as info:
+            t.request("GET", "/x", deadline=0.2)
+        assert time.monotonic() - started < 0.9
+    assert info.value.status_code == 0
+
+
+def test_the_budget_is_shared_across_calls() -> None:
+    flaky = _Flaky((503, {}))
+    policy = RetryPolicy(base_delay=0.01, max_delay=0.02, budget=2, budget_refill=1)
+    with _serve_blocking(flaky) as base, _transport(base, policy) as t:
+        for _ in range(2):
+            with pytest.raises(MemoryAPIError):
+                t.get("/x")
+        # Two retries spent the bucket; the second call got none.
+        assert flaky.calls == 4
+
+        flaky.replies = [(200, {})]
+        t.get("/x")
+        flaky.replies = [(503, {})]
+        with pytest.raises(MemoryAPIError):
+            t.get("/x")
+    # The success earned one retry back.
+    assert flaky.calls == 7
+
+
+def test_memory_passes_its_policy_on() -> None:
+    policy = RetryPolicy(max_retries=5)
+    memory = Memory("ctx", endpoint="http://127.0.0.1:1", api_key=API_KEY, retry=policy)
+
+    assert memory._transport.retry is policy
+    assert memory._transport.max_retries == 5
+    assert BlockingTransport(
+        endpoint="http://x", api_key=API_KEY, max_retries=1
+    ).retry == RetryPolicy(max_retries=1)
+
+
+def test_retry_and_max_retries_are_not_both_taken() -> None:
+    with pytest.raises(ValueError, match="retry or max_retries"):
+        BlockingTransport(
+            endpoint="http://x",
+            api_key=API_KEY,
+            max_retries=1,
+            retry=RetryPolicy(max_retries=5),
+        )
+    with pytest.raises(ValueError, match="retry or max_retries"):
+        Memory(
+            "ctx",
+            endpoint="http://127.0.0.1:1",
+            api_key=API_KEY,
+            max_retries=1,
+            retry=RetryPolicy(),
+        )
+
+
+def test_setting_max_retries_changes_the_policy() -> None:
+    policy = RetryPolicy(max_retries=5, max_delay=2.0)
+    transport = BlockingTransport(endpoint="http://x", api_key=API_KEY, retry=policy)
+
+    transport.max_retries = 0
+
+    assert transport.retry == RetryPolicy(max_retries=0, max_delay=2.0)
+    assert policy.max_retries == 5
+    with pytest.raises(ValueError, match="max_retries"):
+        transport.max_retries = -1
+
+
+def test_policies_are_checked() -> None:
+    with pytest.raises(ValueError, match="max_retries"):
+        RetryPolicy(max_retries=-1)
+    with pytest.raises(ValueError, match="base_delay"):
+        RetryPolicy(base_delay=2, max_delay=1)
+    with pytest.raises(ValueError, match="deadline"):
+        RetryPolicy(deadline=0)
+    with pytest.raises(ValueError, match="budget"):
+        RetryPolicy(budget=0.5)
+
+
+def test_retry_after_takes_seconds_or_a_date() -> None:
+    soon = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert parse_retry_after("2") == 2.0
+    assert 28 < (parse_retry_after(format_datetime(soon, usegmt=True)) or 0) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_async_transport_follows_the_same_policy() -> None:
+    flaky = _Flaky((429, {"Retry-After": "0.04"}), (503, {}), (200, {}))
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        status, headers = flaky.next()
+        await asyncio.sleep(flaky.delay)
+        return web.json_response({"ok": status < 400}, status=status, headers=headers)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with AsyncTransport(
+            endpoint=str(server.make_url("/")), api_key=API_KEY, retry=FAST
+        ) as t:
+            assert await t.get("/x") == {"ok": True}
+            assert flaky.calls == 3
+            assert flaky.times[1] - flaky.times[0] >= 0.04
+
+            flaky.delay = 1.0
+            started = time.monotonic()
+            with pytest.raises(MemoryAPIError) as info:
+                await t.request("GET", "/x", deadline=0.2)
+            assert time.monotonic() - started < 0.9
+            assert info.value.status_code == 0
+    finally:
+        await server.close()
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
-from typing import Any
+import io
 
-from surrealdb_memory import ChatChunk
-from surrealdb_memory._streaming import _consume, _frame
+import pytest
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
+from surrealdb_memory import AsyncTransport, ChatChunk
+from surrealdb_memory._streaming import SSEDecoder, iter_sse_blocking
 
-def _drain(lines: list[str]) -> list[ChatChunk]:
-    # `_consume` mutates `state` in place and types it as ``dict[str, Any]``;
-    # mirror that here so the heterogeneous values flow through cleanly.
-    state: dict[str, Any] = {"event": None, "data_lines": []}
+API_KEY = "test-key"
+
+
+def _drain(lines: list[str], *, size: int | None = None) -> list[ChatChunk]:
+    """Decode `lines` as one stream, fed `size` bytes at a time."""
+    body = "".join(line + "\n" for line in lines).encode()
+    size = size or len(body) or 1
+    decoder = SSEDecoder()
     out: list[ChatChunk] = []
-    for line in lines:
-        chunk = _consume(line, state)
-        if chunk is not None:
-            out.append(chunk)
-    if state["data_lines"]:
-        out.append(_frame(state["event"], "\n".join(state["data_lines"])))
+    for start in range(0, len(body), size):
+        out.extend(decoder.feed(body[start : start + size]))
+    out.extend(decoder.close())
     return out
 
 
@@ -71,3 +76,84 @@ def test_comment_lines_are_ignored() -> None:
 def test_multi_line_data_is_joined() -> None:
     chunks = _drain(['data: {"delta":', 'data:  "split"}', ""])
     assert chunks[0].delta == "split"
+
+
+def test_an_event_may_arrive_a_byte_at_a_time() -> None:
+    lines = [
+        "event: done",
+        'data: {"traceId": "tr", "reply": "caf\u00e9 \u2615"}',
+        "",
+    ]
+    for size in (1, 2, 3):
+        [chunk] = _drain(lines, size=size)
+        assert chunk.done is True
+        assert chunk.raw["reply"] == "caf\u00e9 \u2615"
+
+
+@pytest.mark.parametrize("newline", ["\r\n", "\r"])
+def test_carriage_returns_end_lines(newline: str) -> None:
+    body = newline.join(['data: {"delta": "a"}', "", "data: b", "", ""]).encode()
+    for size in (1, len(body)):
+        decoder = SSEDecoder()
+        chunks = [
+            chunk
+            for start in range(0, len(body), size)
+            for chunk in decoder.feed(body[start : start + size])
+        ]
+        assert [c.delta for c in chunks] == ["a", "b"]
+        assert decoder.close() == []
+
+
+def test_a_stream_may_end_without_a_blank_line() -> None:
+    chunks = _drain(["", "", 'data: {"delta": "last"}'])
+    assert [c.delta for c in chunks] == ["last"]
+    assert _drain([": only a comment"]) == []
+
+
+def test_bytes_that_are_not_utf8_are_replaced() -> None:
+    decoder = SSEDecoder()
+    [chunk] = decoder.feed(b"data: caf\xe9\n\n")
+    assert chunk.delta == "caf\ufffd"
+
+
+def test_iter_sse_blocking_reads_a_response() -> None:
+    response = requests.Response()
+    response.raw = io.BytesIO(
+        b'data: {"delta": "Hi"}\r\n\r\n: ping\r\n\r\n'
+        b'event: done\r\ndata: {"sessionId": "s:1"}\r\n\r\n'
+    )
+    chunks = list(iter_sse_blocking(response))
+    assert [c.delta for c in chunks] == ["Hi", ""]
+    assert chunks[-1].done is True
+    assert chunks[-1].session_id == "s:1"
+
+
+@pytest.mark.asyncio
+async def test_async_transport_streams_events_as_they_arrive() -> None:
+    async def handler(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for piece in (
+            b'data: {"del',
+            b'ta": "a"}\n',
+            b"\ndata: b\n\n",
+            b"data: [DONE]",
+        ):
+            await response.write(piece)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_route("POST", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with AsyncTransport(
+            endpoint=str(server.make_url("/")), api_key=API_KEY
+        ) as transport:
+            chunks = [chunk async for chunk in transport.stream_sse("/chat", json={})]
+    finally:
+        await server.close()
+
+    assert [c.delta for c in chunks] == ["a", "b", ""]
+    assert chunks[-1].done is True
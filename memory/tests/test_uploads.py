@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+from aiohttp import BodyPartReader, web
+from aiohttp.test_utils import TestServer
+
+from surrealdb_memory import AsyncMemory, Memory, MemoryAPIError, RetryPolicy
+from surrealdb_memory._multipart import CHUNK_SIZE, MultipartStream, UploadSource
+
+API_KEY = "test-key"
+CONTEXT = "acme-prod"
+
+
+class _Upload:
+    def __init__(self, headers: Any, parts: dict[str, tuple[str | None, bytes]]):
+        self.headers = headers
+        self.parts = parts
+
+    @property
+    def metadata(self) -> Any:
+        return json.loads(self.parts["metadata"][1])
+
+
+class _Server:
+    """Parses each multipart upload the way the memory service would."""
+
+    def __init__(self) -> None:
+        self.uploads: list[_Upload] = []
+        self.statuses: list[int] = []
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            parts: dict[str, tuple[str | None, bytes]] = {}
+            async for part in await request.multipart():
+                assert isinstance(part, BodyPartReader)
+                parts[part.name or ""] = (part.filename, bytes(await part.read()))
+            self.uploads.append(_Upload(request.headers, parts))
+            await asyncio.sleep(0.02)
+        finally:
+            self.in_flight -= 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status != 200:
+            return web.json_response({"message": "slow down"}, status=status)
+        return web.json_response(
+            {
+                "contentHash": "h",
+                "deduplicated": False,
+                "id": f"document:{parts['file'][0]}",
+                "status": "queued",
+            }
+        )
+
+
+@asynccontextmanager
+async def _serve(server: _Server) -> AsyncIterator[str]:
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_route("POST", "/{tail:.*}", server.handle)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    try:
+        yield str(test_server.make_url("/"))
+    finally:
+        await test_server.close()
+
+
+@pytest.fixture
+def big_file(tmp_path: Path) -> Path:
+    path = tmp_path / "big.pdf"
+    path.write_bytes(bytes(range(256)) * 1200)  # 300 KiB, five chunks
+    return path
+
+
+@pytest.mark.asyncio
+async def test_blocking_upload_streams_with_a_content_length(big_file: Path) -> None:
+    server = _Server()
+    seen: list[tuple[int, int | None]] = []
+    async with _serve(server) as base:
+        with Memory(CONTEXT, endpoint=base, api_key=API_KEY) as memory:
+            result = await asyncio.to_thread(
+                memory.documents.upload,
+                big_file,
+                content_type="application/pdf",
+                title="Big",
+                progress=lambda sent, total: seen.append((sent, total)),
+            )
+
+    assert result.id == "document:big.pdf"
+    upload = server.uploads[0]
+    assert int(upload.headers["Content-Length"]) > big_file.stat().st_size
+    assert upload.parts["file"] == ("big.pdf", big_file.read_bytes())
+    assert upload.metadata == {"title": "Big"}
+    assert list(upload.parts) == ["metadata", "file"]
+    size = big_file.stat().st_size
+    assert seen == [(min(n * CHUNK_SIZE, size), size) for n in range(1, 6)]
+
+
+@pytest.mark.asyncio
+async def test_async_upload_streams(big_file: Path) -> None:
+    server = _Server()
+    seen: list[tuple[int, int | None]] = []
+    async with (
+        _serve(server) as base,
+        AsyncMemory(CONTEXT, endpoint=base, api_key=API_KEY) as memory,
+    ):
+        await memory.documents.upload(
+            big_file,
+            scopes="org/acme",
+            progress=lambda sent, total: seen.append((sent, total)),
+        )
+
+    upload = server.uploads[0]
+    assert "Content-Length" in upload.headers
+    assert upload.parts["file"] == ("big.pdf", big_file.read_bytes())
+    assert upload.metadata == {"scopes": [["org/acme"]]}
+    assert seen[-1] == (big_file.stat().st_size,) * 2
+    assert len(seen) == 5
+
+
+class _Pipe:
+    """A readable that cannot tell its size or seek, like a pipe."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._data.read(size)
+
+
+@pytest.mark.asyncio
+async def test_a_handle_of_unknown_size_is_sent_chunked() -> None:
+    server = _Server()
+    data = b"x" * (CHUNK_SIZE + 10)
+    seen: list[tuple[int, int | None]] = []
+    async with _serve(server) as base:
+        with Memory(CONTEXT, endpoint=base, api_key=API_KEY) as memory:
+            await asyncio.to_thread(
+                memory.documents.upload,
+                _Pipe(data),  # type: ignore[arg-type]
+                filename="pipe.bin",
+                progress=lambda sent, total: seen.append((sent, total)),
+            )
+        async with AsyncMemory(CONTEXT, endpoint=base, api_key=API_KEY) as memory:
+            await memory.documents.upload(_Pipe(data), filename="pipe.bin")  # type: ignore[arg-type]
+
+    for upload in server.uploads:
+        assert upload.headers["Transfer-Encoding"] == "chunked"
+        assert upload.parts["file"] == ("pipe.bin", data)
+    assert seen == [(CHUNK_SIZE, None), (CHUNK_SIZE + 10, None)]
+
+
+@pytest.mark.asyncio
+async def test_a_retried_upload_is_sent_whole_again(big_file: Path) -> None:
+    server = _Server()
+    retry = RetryPolicy(base_delay=0.01, max_delay=0.05)
+    async with _serve(server) as base:
+        server.statuses = [429]
+        with Memory(CONTEXT, endpoint=base, api_key=API_KEY, retry=retry) as memory:
+            await asyncio.to_thread(memory.documents.upload, big_file)
+        server.statuses = [429]
+        async with AsyncMemory(
+            CONTEXT, endpoint=base, api_key=API_KEY, retry=retry
+        ) as memory:
+            with big_file.open("rb") as fp:
+                await memory.documents.upload(fp, filename="big.pdf")
+
+    assert len(server.uploads) == 4
+    assert all(u.parts["file"][1] == big_file.read_bytes() for u in server.uploads)
+
+
+def test_a_handle_that_cannot_seek_is_not_resent() -> None:
+    source = UploadSource(_Pipe(b"abc"))  # type: ignore[arg-type]
+    body = MultipartStream(file=source, filename="a", mime_type=None, fields=None)
+
+    assert b"abc" in body.read()
+    assert not hasattr(body, "len")
+    body.seek(0)
+    with pytest.raises(ValueError, match="cannot be resent"):
+        body.read()
+
+
+def test_the_body_never_holds_more_than_a_chunk_of_the_file(big_file: Path) -> None:
+    body = MultipartStream(
+        file=UploadSource(big_file), filename="big.pdf", mime_type=None, fields=None
+    )
+    pieces = list(body)
+
+    assert max(len(piece) for piece in pieces) <= CHUNK_SIZE
+    assert body.len == sum(len(piece) for piece in pieces)
+
+
+@pytest.mark.asyncio
+async def test_upload_many_keeps_order_and_bounds_concurrency(tmp_path: Path) -> None:
+    paths = []
+    for n in range(10):
+        path = tmp_path / f"{n}.txt"
+        path.write_text(f"doc {n}")
+        paths.append(path)
+    server = _Server()
+    async with (
+        _serve(server) as base,
+        AsyncMemory(CONTEXT, endpoint=base, api_key=API_KEY) as memory,
+    ):
+        results = await memory.documents.upload_many(
+            [*paths, {"path": b"raw", "filename": "raw.txt", "title": "Raw"}],
+            concurrency=3,
+            source="kb",
+        )
+
+    assert [r.id for r in results] == [f"document:{n}.txt" for n in range(10)] + [
+        "document:raw.txt"
+    ]
+    assert server.most_in_flight == 3
+    assert all(u.metadata["source"] == "kb" for u in server.uploads)
+    assert {u.metadata.get("title") for u in server.uploads} == {None, "Raw"}
+
+
+@pytest.mark.asyncio
+async def test_blocking_upload_many_raises_the_first_error(tmp_path: Path) -> None:
+    paths = [tmp_path / f"{n}.txt" for n in range(4)]
+    for path in paths:
+        path.write_text("x")
+    server = _Server()
+    async with _serve(server) as base:
+        with Memory(CONTEXT, endpoint=base, api_key=API_KEY) as memory:
+            results = await asyncio.to_thread(
+                memory.documents.upload_many, paths, concurrency=2
+            )
+            assert [r.id for r in results] == [f"document:{n}.txt" for n in range(4)]
+
+            server.statuses = [400]
+            with pytest.raises(MemoryAPIError):
+                await asyncio.to_thread(
+                    memory.documents.upload_many, paths, concurrency=1
+                )
+            with pytest.raises(TypeError, match="list of files"):
+                memory.documents.upload_many(paths[0])  # type: ignore[arg-type]
+            with pytest.raises(ValueError, match="concurrency"):
+                memory.documents.upload_many(paths, concurrency=0)
+            with pytest.raises(FileNotFoundError):
+                memory.documents.upload_many([tmp_path / "missing"])
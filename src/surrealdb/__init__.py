@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 from typing import TYPE_CHECKING, Any
 
 from surrealdb.connections.async_http import AsyncHttpSurrealConnection
@@ -22,14 +23,39 @@ from surrealdb.connections.builders import (
     SyncCrudBuilder,
     SyncInsertBuilder,
     SyncQueryBuilder,
+    map_rows,
 )
-from surrealdb.connections.files import AsyncFiles, BlockingFiles, FileMetadata
+from surrealdb.connections.embedded_options import EmbeddedOptions
+from surrealdb.connections.files import (
+    AsyncFiles,
+    BlockingFiles,
+    FileMetadata,
+    FileResult,
+)
+from surrealdb.connections.live_multiplex import (
+    AsyncLiveMultiplexer,
+    LiveMultiplexer,
+)
+from surrealdb.connections.live_queue import (
+    AsyncLiveSubscription,
+    LiveQueueStats,
+    LiveSubscription,
+    OverflowPolicy,
+)
+from surrealdb.connections.middleware import (
+    AsyncCallNext,
+    AsyncMiddleware,
+    CallNext,
+    Middleware,
+)
+from surrealdb.connections.stats import ConnectionStats, LatencySummary
 from surrealdb.connections.url import Url, UrlScheme
 from surrealdb.data.types.datetime import Datetime, PreciseDatetime
 from surrealdb.data.types.duration import Duration
 from surrealdb.data.types.file import File
 from surrealdb.data.types.geometry import (
     Geometry,
+    GeometryBuffer,
     GeometryCollection,
     GeometryLine,
     GeometryMultiLine,
@@ -63,6 +89,7 @@ from surrealdb.errors import (
     InvalidRecordIdError,
     InvalidTableError,
     InvalidUrlError,
+    LiveQueueOverflowError,
     NotAllowedDetailKind,
     NotAllowedError,
     NotFoundDetailKind,
@@ -85,23 +112,23 @@ from surrealdb.errors import (
 )
 from surrealdb.types import Tokens, Value
 
-# The optional native engine. Probed here, *below* the imports above, rather
-# than at the top of the module: a `try`/`except ImportError` is a statement, so
-# everything following it counts as an import after code (`E402`) - which is
-# what kept this file exempt from the linter entirely. Nothing above depends on
-# the probe, and the probe's own modules import what they need themselves, so
-# the order is free.
-_EMBEDDED_AVAILABLE = False
-try:
+# The optional native engine. Looked up here, *below* the imports above, rather
+# than at the top of the module: an `if` is a statement, so everything following
+# it counts as an import after code (`E402`) - which is what kept this file
+# exempt from the linter entirely. Nothing above depends on the lookup, and its
+# modules import what they need themselves, so the order is free.
+#
+# `find_spec` rather than importing the extension: that loaded the native
+# library into every process that imported `surrealdb`, including the ones that
+# only ever talk to a server. The embedded classes import it when they open a
+# database.
+_EMBEDDED_AVAILABLE = importlib.util.find_spec("surrealdb_embedded") is not None
+if _EMBEDDED_AVAILABLE:
     from surrealdb.connections.async_embedded import AsyncEmbeddedSurrealConnection
     from surrealdb.connections.blocking_embedded import (
         BlockingEmbeddedSurrealConnection,
     )
 
-    _EMBEDDED_AVAILABLE = True  # pyright: ignore[reportConstantRedefinition]
-except ImportError:
-    pass
-
 if TYPE_CHECKING:
     from surrealdb.connections.async_embedded import (
         AsyncEmbeddedSurrealConnection as AsyncEmbeddedSurrealConnection,
@@ -134,6 +161,25 @@ __all__ = [
     # Connection type aliases (for annotating the objects the factories return)
     "AsyncSurrealConnection",
     "BlockingSurrealConnection",
+    # Embedded engine tuning. Importable without the engine, like the rest of
+    # this list, so configuration code does not need the extra installed.
+    "EmbeddedOptions",
+    # What `subscribe_live` returns, and the counters and overflow policies of
+    # the bounded queue behind it.
+    "AsyncLiveSubscription",
+    "LiveSubscription",
+    "LiveQueueStats",
+    "AsyncLiveMultiplexer",
+    "LiveMultiplexer",
+    "OverflowPolicy",
+    # What `use_middleware` takes, and the `call_next` each middleware is handed.
+    "AsyncMiddleware",
+    "AsyncCallNext",
+    "Middleware",
+    "CallNext",
+    # What `stats()` returns.
+    "ConnectionStats",
+    "LatencySummary",
     # Builders (returned by create/update/upsert/delete/insert/query)
     "AsyncCrudBuilder",
     "AsyncInsertBuilder",
@@ -142,14 +188,18 @@ __all__ = [
     "SyncCrudBuilder",
     "SyncInsertBuilder",
     "SyncQueryBuilder",
+    # What `into=` does to a list of records, for rows fetched another way.
+    "map_rows",
     # Data types
     "Table",
     "Duration",
     # A reference to a file in a storage bucket - bucket plus key, no contents.
-    # `FileMetadata` is what `files.head()` and `files.list()` return; the two
+    # `FileMetadata` is what `files.head()` and `files.list()` return, and
+    # `FileResult` what the `*_many` methods return one of per file; the two
     # `*Files` helpers are what `db.files` is, exported so they can be annotated.
     "File",
     "FileMetadata",
+    "FileResult",
     "BlockingFiles",
     "AsyncFiles",
     # Same shape of mistake as `Range` below, one worse: `Geometry` is the base
@@ -163,6 +213,7 @@ __all__ = [
     "GeometryMultiLine",
     "GeometryMultiPolygon",
     "GeometryCollection",
+    "GeometryBuffer",
     # `Range` was exported without its bounds, so the one exported name could
     # not actually be constructed from the public package - every range in user
     # code had to reach into `surrealdb.data.types.range` for the other half.
@@ -216,6 +267,7 @@ __all__ = [
     "UnsupportedEngineError",
     "UnsupportedFeatureError",
     "UnexpectedResponseError",
+    "LiveQueueOverflowError",
     "InvalidRecordIdError",
     "InvalidDurationError",
     "InvalidGeometryError",
@@ -272,12 +324,17 @@ else:
 
 def Surreal(
     url: str,
+    options: EmbeddedOptions | None = None,
 ) -> BlockingSurrealConnection:
     constructed_url = Url(url)
     if constructed_url.scheme in _EMBEDDED_SCHEMES:
         if not _EMBEDDED_AVAILABLE:
             raise UnsupportedEngineError(url)
-        return BlockingEmbeddedSurrealConnection(url=url)
+        return BlockingEmbeddedSurrealConnection(url=url, options=options)
+    elif options is not None:
+        raise ValueError(
+            f"EmbeddedOptions only apply to an embedded database, not {url!r}"
+        )
     elif (
         constructed_url.scheme == UrlScheme.HTTP
         or constructed_url.scheme == UrlScheme.HTTPS
@@ -294,12 +351,17 @@ def Surreal(
 
 def AsyncSurreal(
     url: str,
+    options: EmbeddedOptions | None = None,
 ) -> AsyncSurrealConnection:
     constructed_url = Url(url)
     if constructed_url.scheme in _EMBEDDED_SCHEMES:
         if not _EMBEDDED_AVAILABLE:
             raise UnsupportedEngineError(url)
-        return AsyncEmbeddedSurrealConnection(url=url)
+        return AsyncEmbeddedSurrealConnection(url=url, options=options)
+    elif options is not None:
+        raise ValueError(
+            f"EmbeddedOptions only apply to an embedded database, not {url!r}"
+        )
     elif (
         constructed_url.scheme == UrlScheme.HTTP
         or constructed_url.scheme == UrlScheme.HTTPS
@@ -61,6 +61,7 @@ class CBORDecoder:
         "_str_errors",
         "_stringref_namespace",
         "null_value",
+        "raw_tag_decoders",
     )
 
     _fp: IO[bytes]  # pyright: ignore[reportUninitializedInstanceVariable]
@@ -109,6 +110,11 @@ class CBORDecoder:
         # SurrealDB layer sets it to `Null`, because on that wire a null is
         # SurrealDB's NULL and has to stay distinct from its NONE.
         self.null_value: Any = None
+        # Decoders for particular tags that read the tagged value from the
+        # stream themselves, consulted before the built-in ones. The SurrealDB
+        # layer uses it to read geometry straight into flat buffers, which a
+        # `tag_hook` cannot do: it only sees the value once it is decoded.
+        self.raw_tag_decoders: Mapping[int, Callable[[CBORDecoder], Any]] = {}
 
     @property
     def immutable(self) -> bool:
@@ -481,6 +487,8 @@ class CBORDecoder:
     def decode_semantic(self, subtype: int) -> Any:
         # Major tag 6
         tagnum = self._decode_length(subtype)
+        if self.raw_tag_decoders and (raw_decoder := self.raw_tag_decoders.get(tagnum)):
+            return raw_decoder(self)
         if semantic_decoder := semantic_decoders.get(tagnum):
             return semantic_decoder(self)
 
@@ -1,12 +1,12 @@
 import asyncio
+import time
 import uuid
-from collections.abc import AsyncGenerator, Sequence
+from collections.abc import Coroutine, Sequence
 from types import TracebackType
-from typing import Any, cast, overload
+from typing import TYPE_CHECKING, Any, cast, overload
 from uuid import UUID
 
-import aiohttp
-
+from surrealdb import telemetry
 from surrealdb.connections.async_template import AsyncTemplate
 from surrealdb.connections.builders import (
     _UNSET,
@@ -14,9 +14,13 @@ from surrealdb.connections.builders import (
     AsyncInsertBuilder,
     AsyncQueryBuilder,
     M,
+    _decoding_into,
     _map_result,
 )
 from surrealdb.connections.files import AsyncFiles
+from surrealdb.connections.live_queue import AsyncLiveSubscription, OverflowPolicy
+from surrealdb.connections.middleware import AsyncMiddleware, run_chain_async
+from surrealdb.connections.stats import ConnectionStats, StatsCollector
 from surrealdb.connections.url import Url
 from surrealdb.connections.utils_mixin import (
     AUTH_FALLBACK_QUERY,
@@ -37,6 +41,9 @@ from surrealdb.request_message.message import RequestMessage
 from surrealdb.request_message.methods import RequestMethod
 from surrealdb.types import Tokens, Value, parse_auth_result
 
+if TYPE_CHECKING:
+    import aiohttp
+
 # Live queries need a persistent connection to push notifications down, which
 # is what makes them a websocket-only feature - as the README documents.
 _NO_LIVE_QUERIES = (
@@ -45,6 +52,18 @@ _NO_LIVE_QUERIES = (
 )
 
 
+def __getattr__(name: str) -> Any:
+    # `aiohttp` is imported by the first request rather than at the top: it
+    # was most of what `import surrealdb` cost (~200ms), HTTP or not. Still
+    # reachable here for code that patches it
+    # (`mock.patch("surrealdb.connections.async_http.aiohttp.ClientSession")`).
+    if name == "aiohttp":
+        import aiohttp
+
+        return aiohttp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class AsyncHttpSurrealConnection(AsyncTemplate, UtilsMixin):
     """
     An async connection to a SurrealDB instance using HTTP.
@@ -77,10 +96,65 @@ class AsyncHttpSurrealConnection(AsyncTemplate, UtilsMixin):
         self.id: str = str(uuid.uuid4())
         self.namespace: str | None = None
         self.database: str | None = None
+        # See `use_middleware`; a tuple, so `_send` can test it for
+        # emptiness and a chain in flight never sees it change.
+        self._middleware: tuple[AsyncMiddleware, ...] = ()
+        # Counters behind `stats()`, fed by `_transmit` and `_request`.
+        self._stats = StatsCollector()
         self.vars: dict[str, Value] = {}
         self._session: aiohttp.ClientSession | None = None
 
-    async def _send(
+    def stats(self) -> ConnectionStats:
+        """Counters and latency percentiles for this connection so far.
+
+        Always collected, and cheap enough to leave that way; see
+        :mod:`surrealdb.connections.stats`.
+        """
+        return self._stats.snapshot({})
+
+    def use_middleware(self, middleware: AsyncMiddleware) -> None:
+        """Run every RPC on this connection through *middleware*.
+
+        *middleware* is ``async def (message, call_next) -> response``. The
+        first one added is the outermost, and one that returns without
+        awaiting ``call_next`` answers the RPC itself - nothing is sent.
+        Sessions and transactions on this connection go through it too; see
+        :mod:`surrealdb.connections.middleware`.
+        """
+        self._middleware += (middleware,)
+
+    def _send(
+        self,
+        message: RequestMessage,
+        operation: str,
+        bypass: bool = False,
+        token: str | None = None,
+    ) -> Coroutine[Any, Any, dict[str, Any]]:
+        # Not a coroutine function itself: without middleware the caller
+        # awaits `_transmit` directly, one coroutine fewer on every RPC.
+        if not self._middleware:
+            return self._transmit(message, operation, bypass, token)
+        return self._send_through_middleware(message, operation, bypass, token)
+
+    async def _send_through_middleware(
+        self,
+        message: RequestMessage,
+        operation: str,
+        bypass: bool = False,
+        token: str | None = None,
+    ) -> dict[str, Any]:
+        response = await run_chain_async(
+            self._middleware,
+            message,
+            lambda message: self._transmit(message, operation, bypass, token),
+        )
+        # A middleware may have answered without sending; its answer is
+        # checked as the server's would have been.
+        if bypass is False:
+            self.check_response_for_error(response, operation)
+        return response
+
+    async def _transmit(
         self,
         message: RequestMessage,
         operation: str,
@@ -92,37 +166,66 @@ class AsyncHttpSurrealConnection(AsyncTemplate, UtilsMixin):
         *token* authorises this request alone, without adopting it as the
         connection's identity - see :meth:`authenticate`.
         """
-        data = message.WS_CBOR_DESCRIPTOR
-        url = f"{self.url.raw_url}/rpc"
-        headers: dict[str, str] = {}
-        headers["Accept"] = "application/cbor"
-        headers["content-type"] = "application/cbor"
-        bearer = self.token if token is None else token
-        if bearer:
-            headers["Authorization"] = f"Bearer {bearer}"
-        if self.namespace:
-            headers["Surreal-NS"] = self.namespace
-        if self.database:
-            headers["Surreal-DB"] = self.database
-
-        # Reuse the pooled session when running inside a context manager,
-        # otherwise fall back to a fresh per-request session.
-        if self._session is not None and not self._session.closed:
-            return await self._request(
-                self._session, url, headers, data, operation, bypass
-            )
-        async with aiohttp.ClientSession() as session:
-            return await self._request(session, url, headers, data, operation, bypass)
+        stats = self._stats
+        stats.requests += 1
+        stats.in_flight += 1
+        method = message.method.value
+        started = time.perf_counter_ns()
+        # One attribute read when nothing is instrumented; see `telemetry`.
+        call = (
+            telemetry.start(self, message, "http")
+            if telemetry.recorder is not None
+            else None
+        )
+        try:
+            data = message.WS_CBOR_DESCRIPTOR if call is None else call.encode(message)
+            url = f"{self.url.raw_url}/rpc"
+            headers: dict[str, str] = {}
+            headers["Accept"] = "application/cbor"
+            headers["content-type"] = "application/cbor"
+            bearer = self.token if token is None else token
+            if bearer:
+                headers["Authorization"] = f"Bearer {bearer}"
+            if self.namespace:
+                headers["Surreal-NS"] = self.namespace
+            if self.database:
+                headers["Surreal-DB"] = self.database
+
+            # Reuse the pooled session when running inside a context manager,
+            # otherwise fall back to a fresh per-request session.
+            if self._session is not None and not self._session.closed:
+                return await self._request(
+                    self._session, url, headers, data, operation, bypass, call
+                )
+            import aiohttp
+
+            async with aiohttp.ClientSession() as session:
+                return await self._request(
+                    session, url, headers, data, operation, bypass, call
+                )
+        except BaseException as exc:
+            stats.errors += 1
+            if call is not None:
+                call.fail(exc)
+            raise
+        finally:
+            stats.finished(method, time.perf_counter_ns() - started)
+            if call is not None:
+                call.end()
 
     async def _request(
         self,
-        session: aiohttp.ClientSession,
+        session: "aiohttp.ClientSession",
         url: str,
         headers: dict[str, str],
         data: bytes,
         operation: str,
         bypass: bool,
+        call: telemetry.RpcCall | None = None,
     ) -> dict[str, Any]:
+        import aiohttp
+
+        self._stats.sent(len(data))
         try:
             async with session.request(
                 method="POST",
@@ -134,6 +237,9 @@ class AsyncHttpSurrealConnection(AsyncTemplate, UtilsMixin):
                 status = response.status
                 raw_cbor = await response.read()
         except asyncio.TimeoutError as exc:
+            self._stats.timeouts += 1
+            if call is not None:
+                call.event("timeout", timeout=30)
             raise TransportTimeoutError(
                 f"timed out while {operation} against {url}: {exc}"
             ) from exc
@@ -141,10 +247,15 @@ class AsyncHttpSurrealConnection(AsyncTemplate, UtilsMixin):
             raise ConnectionUnavailableError(
                 f"could not reach {url} while {operation}: {exc}"
             ) from exc
+        self._stats.received(len(raw_cbor))
 
         self.check_status_for_error(status, raw_cbor, url)
 
-        result = self.decode_response(raw_cbor, operation)
+        result = (
+            self.decode_response(raw_cbor, operation)
+            if call is None
+            else call.decode(self.decode_response, raw_cbor, operation)
+        )
         if bypass is False:
             self.check_response_for_error(result, operation)
         return result
@@ -575,7 +686,8 @@ class AsyncHttpSurrealConnection(AsyncTemplate, UtilsMixin):
         projection = render_projection(fields)
         query = f"SELECT {projection} FROM {resource_ref}"
 
-        response = await self.query_raw(query, variables)
+        with _decoding_into(into):
+            response = await self.query_raw(query, variables)
         self.check_response_for_error(response, "select")
         self._check_query_result(response["result"][0])
         result = response["result"][0]["result"]
@@ -638,6 +750,8 @@ class AsyncHttpSurrealConnection(AsyncTemplate, UtilsMixin):
         session.
         """
         if self._session is None or self._session.closed:
+            import aiohttp
+
             self._session = aiohttp.ClientSession()
         return self
 
@@ -663,12 +777,30 @@ class AsyncHttpSurrealConnection(AsyncTemplate, UtilsMixin):
     async def live(self, table: str | Table, diff: bool = False) -> UUID:
         raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
 
+    async def live_query(
+        self, query: str, vars: dict[str, Value] | None = None
+    ) -> UUID:
+        raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
+
     async def kill(self, query_uuid: str | UUID) -> None:
         raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
 
     async def subscribe_live(
-        self, query_uuid: str | UUID
-    ) -> AsyncGenerator[dict[str, Value], None]:
+        self,
+        query_uuid: str | UUID,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> AsyncLiveSubscription[dict[str, Value]]:
+        raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
+
+    async def subscribe_live_batches(
+        self,
+        query_uuid: str | UUID,
+        max_items: int = 100,
+        max_latency: float = 0.05,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> AsyncLiveSubscription[list[dict[str, Value]]]:
         raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
 
     async def attach(self) -> None:
@@ -1,4 +1,3 @@
-from collections.abc import AsyncGenerator
 from typing import Any, overload
 from uuid import UUID
 
@@ -8,6 +7,7 @@ from surrealdb.connections.builders import (
     AsyncQueryBuilder,
     M,
 )
+from surrealdb.connections.live_queue import AsyncLiveSubscription, OverflowPolicy
 from surrealdb.data.types.record_id import RecordID, RecordIdType
 from surrealdb.data.types.table import Table
 from surrealdb.types import Tokens, Value
@@ -393,12 +393,32 @@ class AsyncTemplate:
         """
         raise NotImplementedError(f"live not implemented for: {self}")
 
+    async def live_query(
+        self, query: str, vars: dict[str, Value] | None = None
+    ) -> UUID:
+        """Start a ``LIVE SELECT`` statement and return its live query UUID."""
+        raise NotImplementedError(f"live_query not implemented for: {self}")
+
     async def subscribe_live(
-        self, query_uuid: str | UUID
-    ) -> AsyncGenerator[dict[str, Value], None]:
+        self,
+        query_uuid: str | UUID,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> AsyncLiveSubscription[dict[str, Value]]:
         """Iterate live notifications for the given live query id."""
         raise NotImplementedError(f"subscribe_live not implemented for: {self}")
 
+    async def subscribe_live_batches(
+        self,
+        query_uuid: str | UUID,
+        max_items: int = 100,
+        max_latency: float = 0.05,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> AsyncLiveSubscription[list[dict[str, Value]]]:
+        """Iterate live notifications for the given live query id in batches."""
+        raise NotImplementedError(f"subscribe_live_batches not implemented for: {self}")
+
     async def kill(self, query_uuid: str | UUID) -> None:
         """Kill a running live query by its UUID."""
         raise NotImplementedError(f"kill not implemented for: {self}")
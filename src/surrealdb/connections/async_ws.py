@@ -3,36 +3,51 @@ A basic async connection to a SurrealDB instance.
 """
 
 import asyncio
+import importlib
 import logging
+import time
 import uuid
 import warnings
 import weakref
 from asyncio import AbstractEventLoop, Future, Queue, Task
-from collections.abc import AsyncGenerator, Sequence
+from collections.abc import AsyncGenerator, Awaitable, Coroutine, Sequence
 from types import TracebackType
-from typing import Any, overload
+from typing import Any, TypeVar, cast, overload
 from uuid import UUID
 
-import websockets
-from websockets.exceptions import ConnectionClosed, WebSocketException
-
+from surrealdb import telemetry
 from surrealdb.connections.async_template import AsyncTemplate
 from surrealdb.connections.builders import (
+    _DECODE_ROWS,
     _UNSET,
     AsyncCrudBuilder,
     AsyncInsertBuilder,
     AsyncQueryBuilder,
     M,
+    _decoding_into,
     _map_result,
 )
 from surrealdb.connections.files import AsyncFiles
+from surrealdb.connections.live_queue import (
+    AsyncLiveQueue,
+    AsyncLiveSubscription,
+    OverflowPolicy,
+    check_batch_options,
+    check_queue_options,
+    is_overflow_marker,
+    overflow_error,
+)
+from surrealdb.connections.middleware import AsyncMiddleware, run_chain_async
+from surrealdb.connections.stats import ConnectionStats, StatsCollector
 from surrealdb.connections.url import Url
 from surrealdb.connections.utils_mixin import (
     AUTH_FALLBACK_QUERY,
     UtilsMixin,
+    check_live_select,
+    live_query_id,
     render_projection,
 )
-from surrealdb.data.cbor import decode
+from surrealdb.data.cbor import RowsHook, decode
 from surrealdb.data.types.record_id import RecordID, RecordIdType
 from surrealdb.data.types.table import Table
 from surrealdb.errors import (
@@ -48,6 +63,8 @@ from surrealdb.types import Tokens, Value, parse_auth_result
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Sentinel pushed into a live-query queue to tell a ``subscribe_live`` consumer
 # to stop iterating. Emitted by ``kill`` (the query was killed) and ``close``
 # (the connection is going away) so waiting consumers do not leak.
@@ -75,12 +92,45 @@ _LIVE_KILLED = "KILLED"
 _RPC_RECV_TIMEOUT = 30.0
 
 
+def _socket_errors() -> tuple[type[BaseException], ...]:
+    """What a socket raises when the connection behind it fails.
+
+    A function rather than a module-level tuple so ``websockets`` is imported
+    by the first connection, not by ``import surrealdb``: everyone paid for it
+    at import, including programs that only ever spoke HTTP. An ``except``
+    clause is evaluated only once an exception reaches it, so calling this
+    there costs the send path nothing.
+    """
+    from websockets.exceptions import WebSocketException
+
+    return (WebSocketException, OSError)
+
+
+# What this module used to import at the top, still reachable here for code
+# that patches it (`mock.patch("surrealdb.connections.async_ws.websockets...")`).
+_DEFERRED_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "websockets": ("websockets", None),
+    "ConnectionClosed": ("websockets.exceptions", "ConnectionClosed"),
+    "WebSocketException": ("websockets.exceptions", "WebSocketException"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attribute = _DEFERRED_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    imported = importlib.import_module(module)
+    return imported if attribute is None else getattr(imported, attribute)
+
+
 def _release_live_queue(
     live_queues: dict[str, list["Queue[Any]"]],
     suid: str,
-    result_queue: "Queue[Any]",
+    result_queue: AsyncLiveQueue,
 ) -> None:
     """Deregister one subscriber's queue. Safe to call twice."""
+    result_queue.release()
     queues = live_queues.get(suid)
     if queues is None:
         return
@@ -90,6 +140,34 @@ def _release_live_queue(
         live_queues.pop(suid, None)
 
 
+def _live_item(
+    suid: str, result_queue: AsyncLiveQueue, ret: Any
+) -> dict[str, Any] | None:
+    """The notification *ret* carries, or ``None`` if the stream ended cleanly.
+
+    :raises ConnectionUnavailableError: if the connection broke.
+    :raises LiveQueueOverflowError: if the ``error`` policy tripped.
+    """
+    # ``kill`` / ``close`` push this sentinel to wake waiting consumers so the
+    # generator terminates instead of leaking.
+    if ret is _LIVE_QUEUE_CLOSED:
+        return None
+    if ret is _LIVE_QUEUE_BROKEN:
+        raise ConnectionUnavailableError(
+            f"WebSocket connection closed while subscribed to live query {suid}."
+        )
+    if is_overflow_marker(ret):
+        raise overflow_error(suid, result_queue.stats)
+    # The server's own end-of-subscription marker. `kill()` here pushes the
+    # sentinel above and never reaches this, but a query killed by anyone else
+    # - another connection, or the server - arrives only as this notification,
+    # and yielding it handed the consumer a notification whose `result` was
+    # None before iterating on forever.
+    if isinstance(ret, dict) and ret.get("action") == _LIVE_KILLED:
+        return None
+    return cast(dict[str, Any], ret)
+
+
 async def _read_frames(
     ref: "weakref.ReferenceType[AsyncWsSurrealConnection]", socket: Any
 ) -> None:
@@ -108,6 +186,8 @@ async def _read_frames(
     between frames - which is where a suspended reader spends essentially all
     of its time - nothing here refers to the connection.
     """
+    from websockets.exceptions import WebSocketException
+
     try:
         async for data in socket:
             connection = ref()
@@ -116,10 +196,15 @@ async def _read_frames(
                 # resurrect the connection for the length of a frame.
                 return
             try:
-                connection._route_frame(data)  # pyright: ignore[reportPrivateUsage]
+                backpressure = connection._route_frame(data)  # pyright: ignore[reportPrivateUsage]
             finally:
                 del connection
-    except (ConnectionClosed, WebSocketException, asyncio.CancelledError):
+            # A subscriber with `on_overflow="block"` is full: stop reading
+            # until it has room. Awaited with the connection reference already
+            # dropped, since a slow consumer can hold this for a long time.
+            for wait in backpressure:
+                await wait
+    except (WebSocketException, asyncio.CancelledError):
         # Connection was closed or cancelled, this is expected
         pass
     except Exception as e:
@@ -214,9 +299,26 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
         self.host: str | None = self.url.hostname
         self.port: int | None = self.url.port
         self.token: str | None = None
+        # What the last connection-wide `use()` selected, as the HTTP
+        # transport keeps it; sessions select their own.
+        self.namespace: str | None = None
+        self.database: str | None = None
+        # See `use_middleware`; a tuple, so `_send` can test it for
+        # emptiness and a chain in flight never sees it change.
+        self._middleware: tuple[AsyncMiddleware, ...] = ()
+        # Counters behind `stats()`, fed by `_transmit`, `_route_frame` and `connect`.
+        self._stats = StatsCollector()
         self.socket: Any = None  # WebSocket connection
         self.loop: AbstractEventLoop | None = None
         self.qry: dict[str, Future[dict[str, Any]]] = {}
+        # Row hooks for in-flight queries sent under `_decoding_into`, by
+        # request id. Responses are decoded by the reader task, outside the
+        # caller's context, so the hook has to travel with the id.
+        self._row_hooks: dict[str, RowsHook] = {}
+        # The same for instrumented requests, so the reader can charge each
+        # reply's decoding to the RPC that is waiting for it. Empty unless
+        # `surrealdb.telemetry` has a recorder.
+        self._rpc_calls: dict[str, telemetry.RpcCall] = {}
         self.recv_task: Task[None] | None = None
         # Queues hold live-notification dicts plus the ``_LIVE_QUEUE_CLOSED``
         # sentinel, so the value type is ``Any``.
@@ -284,6 +386,7 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
         unavoidable, since nothing on the wire says which one it is - while
         letting the others finish normally.
         """
+        self._stats.uncorrelated_errors += 1
         pending = [
             (query_id, fut) for query_id, fut in self.qry.items() if not fut.done()
         ]
@@ -329,29 +432,43 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
         if not self._uncorrelated_for:
             self._forget_uncorrelated()
 
-    def _route_frame(self, data: Any) -> None:
-        """Hand one received frame to whoever is waiting for it."""
+    def _route_frame(self, data: Any) -> list[Awaitable[None]]:
+        """Hand one received frame to whoever is waiting for it.
+
+        Returns what the reader has to await before reading the next frame:
+        room in any ``block``-policy subscriber queue this frame filled.
+        """
+        backpressure: list[Awaitable[None]] = []
+        self._stats.received(len(data))
         # A single frame this loop cannot handle must not end it. When it did,
         # the socket stayed open - so `connect()` saw a live socket and
         # no-opped, and every later request registered a future that nothing
         # would ever resolve. The caller then waited forever, with no timeout
         # anywhere on this path.
+        calls = self._rpc_calls
+        started = time.perf_counter_ns() if calls else 0
         try:
-            response = decode(data)
+            response = decode(data, self._row_hooks.get if self._row_hooks else None)
         except Exception as exc:
             self._fail_pending(
                 UnexpectedResponseError(f"could not decode a websocket frame: {exc}")
             )
-            return
+            return backpressure
 
         try:
             if response_id := response.get("id"):
+                if calls and (call := calls.get(response_id)) is not None:
+                    call.decoded(len(data), time.perf_counter_ns() - started)
                 if (fut := self.qry.get(response_id)) and not fut.done():
                     fut.set_result(response)
             elif response_result := response.get("result"):
                 live_id = str(response_result["id"])
                 for queue in self.live_queues.get(live_id, []):
-                    queue.put_nowait(response_result)
+                    if isinstance(queue, AsyncLiveQueue):
+                        if (wait := queue.offer(response_result)) is not None:
+                            backpressure.append(wait)
+                    else:
+                        queue.put_nowait(response_result)
             else:
                 # An id-less frame carrying no result is a protocol-level error
                 # the server could not correlate to a request, so everyone in
@@ -364,6 +481,7 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
             self._fail_pending(
                 UnexpectedResponseError(f"could not route a websocket frame: {exc}")
             )
+        return backpressure
 
     def _reader_stopped(self) -> None:
         """Tell everyone still waiting that no more frames are coming."""
@@ -384,53 +502,134 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
             for queue in queues:
                 queue.put_nowait(_LIVE_QUEUE_BROKEN)
 
-    async def _send(
+    def stats(self) -> ConnectionStats:
+        """Counters and latency percentiles for this connection so far.
+
+        Always collected, and cheap enough to leave that way; see
+        :mod:`surrealdb.connections.stats`.
+        """
+        return self._stats.snapshot(self.live_queues)
+
+    def use_middleware(self, middleware: AsyncMiddleware) -> None:
+        """Run every RPC on this connection through *middleware*.
+
+        *middleware* is ``async def (message, call_next) -> response``. The
+        first one added is the outermost, and one that returns without
+        awaiting ``call_next`` answers the RPC itself - nothing is sent.
+        Sessions and transactions on this connection go through it too; see
+        :mod:`surrealdb.connections.middleware`.
+        """
+        self._middleware += (middleware,)
+
+    def _send(
+        self, message: RequestMessage, process: str, bypass: bool = False
+    ) -> Coroutine[Any, Any, dict[str, Any]]:
+        # Not a coroutine function itself: without middleware the caller
+        # awaits `_transmit` directly, one coroutine fewer on every RPC.
+        if not self._middleware:
+            return self._transmit(message, process, bypass)
+        return self._send_through_middleware(message, process, bypass)
+
+    async def _send_through_middleware(
         self, message: RequestMessage, process: str, bypass: bool = False
     ) -> dict[str, Any]:
-        await self.connect()
-        assert (
-            self.socket is not None and self.loop is not None
-        )  # will always not be None as the self.connect ensures there's a connection
-
-        # setup future to wait for response
-        fut = self.loop.create_future()
-        query_id = message.id
-        self.qry[query_id] = fut
+        response = await run_chain_async(
+            self._middleware,
+            message,
+            lambda message: self._transmit(message, process, bypass),
+        )
+        # A middleware may have answered without sending; its answer is
+        # checked as the server's would have been.
+        if bypass is False:
+            self.check_response_for_error(response, process)
+        return response
+
+    async def _transmit(
+        self, message: RequestMessage, process: str, bypass: bool = False
+    ) -> dict[str, Any]:
+        stats = self._stats
+        stats.requests += 1
+        stats.in_flight += 1
+        method = message.method.value
+        started = time.perf_counter_ns()
+        # One attribute read when nothing is instrumented; see `telemetry`.
+        call = (
+            telemetry.start(self, message, "ws")
+            if telemetry.recorder is not None
+            else None
+        )
         try:
-            # correlate message to query, send and forget it
+            await self.connect()
+            assert (
+                self.socket is not None and self.loop is not None
+            )  # will always not be None as the self.connect ensures there's a connection
+
+            # setup future to wait for response
+            fut = self.loop.create_future()
+            query_id = message.id
+            self.qry[query_id] = fut
+            if message.method == RequestMethod.QUERY and (hook := _DECODE_ROWS.get()):
+                self._row_hooks[query_id] = hook
+            if call is not None:
+                self._rpc_calls[query_id] = call
             try:
-                await self.socket.send(message.WS_CBOR_DESCRIPTOR)
-            except (WebSocketException, OSError) as exc:
-                raise ConnectionUnavailableError(
-                    f"the connection to {self.raw_url} failed while {process}: {exc}"
-                ) from exc
-            del message
-
-            # wait for response, bounded so a reply that never arrives cannot
-            # block the caller forever
-            try:
-                response = await asyncio.wait_for(fut, _RPC_RECV_TIMEOUT)
-            except asyncio.TimeoutError as exc:
-                # The server may have rejected this request's frame outright,
-                # in which case it answered with an error carrying no `id` and
-                # no reply is ever coming. That error was held rather than
-                # failing every other request in flight; this is the request it
-                # belongs to, so report it instead of a bare deadline.
-                uncorrelated = self._take_uncorrelated(query_id)
-                if uncorrelated is not None:
-                    raise uncorrelated from exc
-                raise TransportTimeoutError(
-                    f"timed out while {process} on {self.raw_url}: no reply "
-                    f"within {_RPC_RECV_TIMEOUT}s"
-                ) from exc
+                # correlate message to query, send and forget it
+                try:
+                    data = (
+                        message.WS_CBOR_DESCRIPTOR
+                        if call is None
+                        else call.encode(message)
+                    )
+                    await self.socket.send(data)
+                    stats.sent(len(data))
+                except _socket_errors() as exc:
+                    raise ConnectionUnavailableError(
+                        f"the connection to {self.raw_url} failed while "
+                        f"{process}: {exc}"
+                    ) from exc
+                del message, data
+
+                # wait for response, bounded so a reply that never arrives
+                # cannot block the caller forever
+                try:
+                    response = await asyncio.wait_for(fut, _RPC_RECV_TIMEOUT)
+                except asyncio.TimeoutError as exc:
+                    stats.timeouts += 1
+                    if call is not None:
+                        call.event("timeout", timeout=_RPC_RECV_TIMEOUT)
+                    # The server may have rejected this request's frame
+                    # outright, in which case it answered with an error
+                    # carrying no `id` and no reply is ever coming. That error
+                    # was held rather than failing every other request in
+                    # flight; this is the request it belongs to, so report it
+                    # instead of a bare deadline.
+                    uncorrelated = self._take_uncorrelated(query_id)
+                    if uncorrelated is not None:
+                        raise uncorrelated from exc
+                    raise TransportTimeoutError(
+                        f"timed out while {process} on {self.raw_url}: no reply "
+                        f"within {_RPC_RECV_TIMEOUT}s"
+                    ) from exc
+            finally:
+                # ``_recv_task`` clears ``self.qry`` when the socket closes, so
+                # the key may already be gone; ``pop`` avoids a spurious
+                # ``KeyError``.
+                self.qry.pop(query_id, None)
+                self._row_hooks.pop(query_id, None)
+                self._rpc_calls.pop(query_id, None)
+                self._prune_uncorrelated()
+
+            if bypass is False:
+                self.check_response_for_error(response, process)
+        except BaseException as exc:
+            stats.errors += 1
+            if call is not None:
+                call.fail(exc)
+            raise
         finally:
-            # ``_recv_task`` clears ``self.qry`` when the socket closes, so the
-            # key may already be gone; ``pop`` avoids a spurious ``KeyError``.
-            self.qry.pop(query_id, None)
-            self._prune_uncorrelated()
-
-        if bypass is False:
-            self.check_response_for_error(response, process)
+            stats.finished(method, time.perf_counter_ns() - started)
+            if call is not None:
+                call.end()
 
         # Response comes from Future[dict[str, Any]] defined in self.qry
         # The decode() function returns Any, but we know it's always a dict in this context
@@ -513,6 +712,8 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
             self.host = self.url.hostname
             self.port = self.url.port
 
+        import websockets
+
         try:
             self.socket = await websockets.connect(
                 self.raw_url,
@@ -523,10 +724,11 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
             raise TransportTimeoutError(
                 f"timed out connecting to {self.raw_url}: {exc}"
             ) from exc
-        except (WebSocketException, OSError) as exc:
+        except _socket_errors() as exc:
             raise ConnectionUnavailableError(
                 f"could not connect to {self.raw_url}: {exc}"
             ) from exc
+        self._stats.connects += 1
         self.loop = asyncio.get_running_loop()
         self.recv_task = asyncio.create_task(
             _read_frames(weakref.ref(self), self.socket)
@@ -614,6 +816,8 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
             kwargs["session"] = session_id
         message = RequestMessage(RequestMethod.USE, **kwargs)
         await self._send(message, "use")
+        if session_id is None:
+            self.namespace, self.database = namespace, database
 
     def query(
         self,
@@ -783,9 +987,10 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
         projection = render_projection(fields)
         query = f"SELECT {projection} FROM {resource_ref}"
 
-        response = await self.query_raw(
-            query, variables, session_id=session_id, txn_id=txn_id
-        )
+        with _decoding_into(into):
+            response = await self.query_raw(
+                query, variables, session_id=session_id, txn_id=txn_id
+            )
         self.check_response_for_error(response, "select")
         self._check_query_result(response["result"][0])
         result = response["result"][0]["result"]
@@ -1216,9 +1421,37 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
         self.live_queues[str(uuid)] = []
         return uuid
 
+    async def live_query(
+        self,
+        query: str,
+        vars: dict[str, Value] | None = None,
+        session_id: UUID | None = None,
+    ) -> UUID:
+        """Start a ``LIVE SELECT`` and return its UUID.
+
+        :meth:`live` watches a whole table and sends every field of every
+        change. A ``LIVE SELECT`` filters and projects on the server -
+        ``LIVE SELECT id, status FROM order WHERE tenant = $tenant`` - so rows
+        this consumer does not care about are never sent or decoded. The id is
+        registered like :meth:`live`'s, for :meth:`subscribe_live` and
+        :meth:`kill`.
+
+        :raises ValueError: if *query* is not a ``LIVE SELECT`` statement.
+        :raises UnexpectedResponseError: if the server answers with anything
+            but a live query id.
+        """
+        check_live_select(query)
+        result = await self.query(query, vars, session_id=session_id).first()
+        live_id = live_query_id(result)
+        self.live_queues.setdefault(str(live_id), [])
+        return live_id
+
     async def subscribe_live(
-        self, query_uuid: str | UUID
-    ) -> AsyncGenerator[dict[str, Value], None]:
+        self,
+        query_uuid: str | UUID,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> AsyncLiveSubscription[dict[str, Value]]:
         """Return an async generator yielding notifications for a live query.
 
         Multiple consumers may subscribe to the same ``query_uuid``; each gets
@@ -1226,62 +1459,162 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
         (a plain ``return``, so ``async for`` stops cleanly) when the query is
         killed via :meth:`kill` or the connection is closed via :meth:`close`.
 
+        ``maxsize`` bounds this consumer's queue; ``0``, the default, leaves it
+        unbounded. What happens when a notification arrives and the queue is
+        full is ``on_overflow``:
+
+        * ``"block"`` - stop reading the socket until the consumer makes room.
+          Nothing is lost, but every other reply on this connection waits too.
+        * ``"drop_oldest"`` / ``"drop_newest"`` - discard one notification.
+        * ``"coalesce_by_id"`` - keep only the latest pending notification per
+          record, which is all a cache-invalidation consumer needs; a queue of
+          distinct records that is still full drops its oldest.
+        * ``"error"`` - deliver what was queued, then raise
+          :class:`LiveQueueOverflowError`.
+
+        The returned subscription's ``stats`` counts what was received,
+        delivered and dropped, and how far behind the consumer is.
+
         :raises ConnectionUnavailableError: if the connection drops while the
             subscription is active. That is not a clean end of stream - some
             changes to the table went undelivered - so it is raised rather than
             ending the iteration, matching the blocking transport.
+        :raises LiveQueueOverflowError: under ``on_overflow="error"``.
+        :raises ValueError: for a negative ``maxsize`` or an unknown policy.
         """
-        result_queue: Queue[Any] = Queue()
+        check_queue_options(maxsize, on_overflow)
         suid = str(query_uuid)
-
-        # Auto-register if not already registered
-        if suid not in self.live_queues:
-            self.live_queues[suid] = []
-
-        self.live_queues[suid].append(result_queue)
+        result_queue = self._register_live_queue(suid, maxsize, on_overflow)
 
         async def _iter() -> AsyncGenerator[dict[str, Any], None]:
             try:
                 while True:
-                    ret = await result_queue.get()
-                    # ``kill`` / ``close`` push this sentinel to wake waiting
-                    # consumers so the generator terminates instead of leaking.
-                    if ret is _LIVE_QUEUE_CLOSED:
-                        return
-                    if ret is _LIVE_QUEUE_BROKEN:
-                        raise ConnectionUnavailableError(
-                            "WebSocket connection closed while subscribed to "
-                            f"live query {suid}."
-                        )
-                    # The server's own end-of-subscription marker. `kill()`
-                    # here pushes the sentinel above and never reaches this,
-                    # but a query killed by anyone else - another connection,
-                    # or the server - arrives only as this notification, and
-                    # yielding it handed the consumer a notification whose
-                    # `result` was None before iterating on forever.
-                    if isinstance(ret, dict) and ret.get("action") == _LIVE_KILLED:
+                    item = _live_item(suid, result_queue, await result_queue.get())
+                    if item is None:
                         return
-                    yield ret
+                    yield item
             finally:
                 # Deregister this consumer's queue when the generator is
                 # closed (consumer break, GC, kill, or close).
-                queues = self.live_queues.get(suid)
-                if queues is not None and result_queue in queues:
-                    queues.remove(result_queue)
-
-        subscription = _iter()
-        # Registration happens above, before anything is iterated, so release
-        # has to be reachable without iterating. A generator that is never
-        # started does not run its `finally` on close or GC, so a subscription
-        # set up and then abandoned stayed registered for the life of the
-        # connection while notifications kept filling a queue nobody drains.
+                self._deregister_live_queue(suid, result_queue)
+
+        return self._live_subscription(suid, result_queue, _iter())
+
+    async def subscribe_live_batches(
+        self,
+        query_uuid: str | UUID,
+        max_items: int = 100,
+        max_latency: float = 0.05,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> AsyncLiveSubscription[list[dict[str, Value]]]:
+        """Like :meth:`subscribe_live`, but yield lists of notifications.
+
+        :meth:`subscribe_live` hands notifications over one ``await`` at a
+        time, and at tens of thousands a second that per-item scheduling is a
+        real share of the consumer's cost. A batch is everything already
+        queued, topped up until it holds ``max_items`` or ``max_latency``
+        seconds have passed since its first notification, whichever is first -
+        so a consumer can apply changes in bulk, one ``executemany`` per batch.
+        ``max_latency=0`` takes only what is already queued. Batches are never
+        empty.
+
+        ``maxsize`` and ``on_overflow`` bound the queue behind the batches,
+        exactly as for :meth:`subscribe_live`. When the stream ends, or fails,
+        with notifications still gathered, they are yielded as a final batch
+        first; the failure is raised on the next iteration.
+
+        :raises ConnectionUnavailableError: if the connection drops while the
+            subscription is active.
+        :raises LiveQueueOverflowError: under ``on_overflow="error"``.
+        :raises ValueError: for a ``max_items`` below one, a negative
+            ``max_latency``, a negative ``maxsize`` or an unknown policy.
+        """
+        check_batch_options(max_items, max_latency)
+        check_queue_options(maxsize, on_overflow)
+        suid = str(query_uuid)
+        result_queue = self._register_live_queue(suid, maxsize, on_overflow)
+
+        async def _iter() -> AsyncGenerator[list[dict[str, Any]], None]:
+            loop = asyncio.get_running_loop()
+            try:
+                while True:
+                    batch: list[dict[str, Any]] = []
+                    ended = False
+                    failure: SurrealError | None = None
+                    ret = await result_queue.get()
+                    deadline = loop.time() + max_latency
+                    while True:
+                        try:
+                            item = _live_item(suid, result_queue, ret)
+                        except SurrealError as exc:
+                            failure = exc
+                            break
+                        if item is None:
+                            ended = True
+                            break
+                        batch.append(item)
+                        if len(batch) >= max_items:
+                            break
+                        if not result_queue.empty():
+                            ret = result_queue.get_nowait()
+                            continue
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        # `asyncio.wait` rather than `wait_for`: before 3.12 a
+                        # `wait_for` timing out as the get completed could drop
+                        # the item it had already taken off the queue. A `get`
+                        # cancelled before it wakes has taken nothing.
+                        getter = asyncio.ensure_future(result_queue.get())
+                        await asyncio.wait((getter,), timeout=remaining)
+                        if not getter.done():
+                            getter.cancel()
+                            break
+                        ret = getter.result()
+                    if batch:
+                        yield batch
+                    if failure is not None:
+                        raise failure
+                    if ended:
+                        return
+            finally:
+                self._deregister_live_queue(suid, result_queue)
+
+        return self._live_subscription(suid, result_queue, _iter())
+
+    def _register_live_queue(
+        self, suid: str, maxsize: int, on_overflow: OverflowPolicy
+    ) -> AsyncLiveQueue:
+        """Add one consumer's queue for *suid*, registering the id if new."""
+        result_queue = AsyncLiveQueue(maxsize, on_overflow)
+        self.live_queues.setdefault(suid, []).append(result_queue)
+        return result_queue
+
+    def _deregister_live_queue(self, suid: str, result_queue: AsyncLiveQueue) -> None:
+        result_queue.release()
+        queues = self.live_queues.get(suid)
+        if queues is not None and result_queue in queues:
+            queues.remove(result_queue)
+
+    def _live_subscription(
+        self,
+        suid: str,
+        result_queue: AsyncLiveQueue,
+        subscription: AsyncGenerator[_T, None],
+    ) -> AsyncLiveSubscription[_T]:
+        # Registration happens before anything is iterated, so release has to
+        # be reachable without iterating. A generator that is never started
+        # does not run its `finally` on close or GC, so a subscription set up
+        # and then abandoned stayed registered for the life of the connection
+        # while notifications kept filling a queue nobody drains.
         #
         # Closing over `live_queues` rather than `self`, so the finalizer does
         # not keep the connection alive for as long as the generator.
         weakref.finalize(
             subscription, _release_live_queue, self.live_queues, suid, result_queue
         )
-        return subscription
+        return AsyncLiveSubscription(subscription, result_queue.stats)
 
     async def kill(
         self,
@@ -1293,10 +1626,16 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
         if session_id is not None:
             kwargs["session"] = session_id
         message = RequestMessage(RequestMethod.KILL, **kwargs)
+        suid = str(query_uuid)
+        # A full ``block``-policy subscriber holds the reader, and with it the
+        # reply to this very request: let go first, since the subscription is
+        # ending anyway.
+        for queue in self.live_queues.get(suid, []):
+            if isinstance(queue, AsyncLiveQueue):
+                queue.release()
         await self._send(message, "kill")
         # Wake any subscribers so their generators terminate, then drop the
         # registration. Each ``_iter`` removes its own queue in its ``finally``.
-        suid = str(query_uuid)
         for queue in self.live_queues.get(suid, []):
             queue.put_nowait(_LIVE_QUEUE_CLOSED)
         self.live_queues.pop(suid, None)
@@ -1375,6 +1714,8 @@ class AsyncWsSurrealConnection(AsyncTemplate, UtilsMixin):
         # waiting forever on a socket that is about to disappear.
         for queues in self.live_queues.values():
             for queue in queues:
+                if isinstance(queue, AsyncLiveQueue):
+                    queue.release()
                 queue.put_nowait(_LIVE_QUEUE_CLOSED)
 
         if self.loop is not None and self.loop is not asyncio.get_running_loop():
@@ -1712,12 +2053,22 @@ class AsyncSurrealSession:
     ) -> UUID:
         return await self._connection.live(table, diff, session_id=self._session_id)
 
+    async def live_query(
+        self, query: str, vars: dict[str, Value] | None = None
+    ) -> UUID:
+        return await self._connection.live_query(
+            query, vars, session_id=self._session_id
+        )
+
     async def kill(self, query_uuid: str | UUID) -> None:
         await self._connection.kill(query_uuid, session_id=self._session_id)
 
     async def subscribe_live(
-        self, query_uuid: str | UUID
-    ) -> AsyncGenerator[dict[str, Value], None]:
+        self,
+        query_uuid: str | UUID,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> AsyncLiveSubscription[dict[str, Value]]:
         """Return an async generator of notifications for a live query.
 
         The session exposed :meth:`live` and :meth:`kill` but not this, so a
@@ -1733,7 +2084,20 @@ class AsyncSurrealSession:
             async for change in notifications:
                 ...
         """
-        return await self._connection.subscribe_live(query_uuid)
+        return await self._connection.subscribe_live(query_uuid, maxsize, on_overflow)
+
+    async def subscribe_live_batches(
+        self,
+        query_uuid: str | UUID,
+        max_items: int = 100,
+        max_latency: float = 0.05,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> AsyncLiveSubscription[list[dict[str, Value]]]:
+        """Batched :meth:`subscribe_live`; forwards to the connection unchanged."""
+        return await self._connection.subscribe_live_batches(
+            query_uuid, max_items, max_latency, maxsize, on_overflow
+        )
 
     async def begin_transaction(self) -> "AsyncSurrealTransaction":
         txn_id = await self._connection.begin(session_id=self._session_id)
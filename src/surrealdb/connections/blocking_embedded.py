@@ -4,22 +4,35 @@ Blocking embedded SurrealDB connection using the Rust extension with CBOR messag
 
 from __future__ import annotations
 
-from collections.abc import Generator
-from typing import Any
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from surrealdb import telemetry
 from surrealdb.connections.blocking_ws import (
     BlockingSurrealSession,
     BlockingWsSurrealConnection,
 )
+from surrealdb.connections.builders import _decode_rows_for
+from surrealdb.connections.embedded_options import EmbeddedOptions, engine_url
+from surrealdb.connections.live_queue import LiveSubscription, OverflowPolicy
 from surrealdb.connections.url import Url
-from surrealdb.connections.utils_mixin import mapped_engine_errors
+from surrealdb.connections.utils_mixin import (
+    BatchQuery,
+    build_query_batch,
+    mapped_engine_errors,
+    query_batch_results,
+)
 from surrealdb.data.cbor import decode
 from surrealdb.data.types.table import Table
 from surrealdb.errors import UnsupportedFeatureError
 from surrealdb.request_message.message import RequestMessage
+from surrealdb.request_message.methods import RequestMethod
 from surrealdb.types import Value
-from surrealdb_embedded import SyncEmbeddedDB
+
+if TYPE_CHECKING:
+    from surrealdb_embedded import SyncEmbeddedDB
 
 # The embedded engine builds no live-query notification channel (the Rust
 # extension reports ``LQ_SUPPORT = false``), so there is nowhere for
@@ -43,11 +56,13 @@ class BlockingEmbeddedSurrealConnection(BlockingWsSurrealConnection):
         id: The ID of the connection.
     """
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, options: EmbeddedOptions | None = None) -> None:
         """
         Constructor for the BlockingEmbeddedSurrealConnection class.
 
         :param url: (str) The URL of the embedded database (mem:// or file://).
+        :param options: (EmbeddedOptions) Datastore tuning - versioning and
+            storage-engine parameters. Kept for every reopen by :meth:`connect`.
         """
         # The parent constructor opens nothing - it only sets attributes - and
         # running it is what guarantees every inherited method finds the state
@@ -58,12 +73,22 @@ class BlockingEmbeddedSurrealConnection(BlockingWsSurrealConnection):
         # keep their original form instead of the parent's ``/rpc`` suffix.
         self.raw_url = url
 
+        self._options = options
         # Embedded database handle
-        with mapped_engine_errors("opening the database"):
-            self._db: SyncEmbeddedDB = SyncEmbeddedDB(url)
+        self._db: SyncEmbeddedDB = self._open(url)
         # Whether `close()` has shut the engine down - see `connect`.
         self._closed: bool = False
 
+    def _open(self, url: str) -> SyncEmbeddedDB:
+        """Open the native engine on *url* with this connection's options."""
+        endpoint = engine_url(url, self._options)
+        # Imported here rather than at the top, so that `import surrealdb` does
+        # not load the native engine for a program that never opens one.
+        from surrealdb_embedded import SyncEmbeddedDB
+
+        with mapped_engine_errors("opening the database"):
+            return SyncEmbeddedDB(endpoint)
+
     def __enter__(self) -> BlockingEmbeddedSurrealConnection:
         """Context manager entry - connect to the embedded database."""
         self.connect()
@@ -104,12 +129,10 @@ class BlockingEmbeddedSurrealConnection(BlockingWsSurrealConnection):
         if url is not None:
             self.url = Url(url)
             self.raw_url = url
-            with mapped_engine_errors("opening the database"):
-                self._db = SyncEmbeddedDB(url)
+            self._db = self._open(url)
             self._closed = False
         elif self._closed:
-            with mapped_engine_errors("opening the database"):
-                self._db = SyncEmbeddedDB(self.raw_url)
+            self._db = self._open(self.raw_url)
             self._closed = False
 
         with mapped_engine_errors("connecting"):
@@ -129,13 +152,13 @@ class BlockingEmbeddedSurrealConnection(BlockingWsSurrealConnection):
         self._closed = True
         self.socket = None
 
-    def _send(
+    def _transmit(
         self, message: RequestMessage, process: str, bypass: bool = False
     ) -> dict[str, Any]:
         """
         Send a message to the embedded database using CBOR encoding.
 
-        This method overrides the WebSocket _send to use the Rust extension
+        This method overrides the WebSocket _transmit to use the Rust extension
         instead of a network connection, while maintaining the same CBOR
         message format for perfect compatibility.
 
@@ -147,19 +170,48 @@ class BlockingEmbeddedSurrealConnection(BlockingWsSurrealConnection):
         Returns:
             The decoded response dictionary.
         """
-        # Encode message to CBOR (reuses existing WebSocket CBOR encoding)
-        cbor_request = message.WS_CBOR_DESCRIPTOR
-
-        # Execute via Rust extension
-        with mapped_engine_errors(process):
-            cbor_response_bytes = self._db.execute(cbor_request)
-
-        # Decode CBOR response (reuses existing CBOR decoding)
-        response = decode(cbor_response_bytes)
-
-        # Check for errors (inherited method from UtilsMixin)
-        if not bypass:
-            self.check_response_for_error(response, process)
+        stats = self._stats
+        stats.requests += 1
+        stats.in_flight += 1
+        method = message.method.value
+        started = time.perf_counter_ns()
+        # One attribute read when nothing is instrumented; see `telemetry`.
+        call = (
+            telemetry.start(self, message, "embedded")
+            if telemetry.recorder is not None
+            else None
+        )
+        try:
+            # Encode message to CBOR (reuses existing WebSocket CBOR encoding)
+            cbor_request = (
+                message.WS_CBOR_DESCRIPTOR if call is None else call.encode(message)
+            )
+
+            # Execute via Rust extension
+            stats.sent(len(cbor_request))
+            with mapped_engine_errors(process):
+                cbor_response_bytes = self._db.execute(cbor_request)
+            stats.received(len(cbor_response_bytes))
+
+            # Decode CBOR response (reuses existing CBOR decoding)
+            response = (
+                decode(cbor_response_bytes, _decode_rows_for())
+                if call is None
+                else call.decode(decode, cbor_response_bytes, _decode_rows_for())
+            )
+
+            # Check for errors (inherited method from UtilsMixin)
+            if not bypass:
+                self.check_response_for_error(response, process)
+        except BaseException as exc:
+            stats.errors += 1
+            if call is not None:
+                call.fail(exc)
+            raise
+        finally:
+            stats.finished(method, time.perf_counter_ns() - started)
+            if call is not None:
+                call.end()
 
         # Ensure response is a dict
         if not isinstance(response, dict):
@@ -167,6 +219,45 @@ class BlockingEmbeddedSurrealConnection(BlockingWsSurrealConnection):
 
         return response
 
+    def query_many(self, queries: Iterable[BatchQuery]) -> list[list[Value]]:
+        """Run a batch of queries, one after another.
+
+        Each entry is a SurrealQL string or a ``(query, vars)`` pair, and the
+        result is what ``query(...).execute()`` would have returned for each,
+        in order. The queries run against this connection's session, exactly
+        as separate ``query()`` calls would - each is its own ``query`` RPC to
+        :meth:`stats`, telemetry and middleware, and crosses into the engine
+        on its own.
+
+        A batch is not a transaction: a query that fails does not undo the
+        ones before it or stop the ones after it. Every query is applied, then
+        the first failure is raised. For all-or-nothing, put ``BEGIN`` and
+        ``COMMIT`` around the statements of a single :meth:`query`.
+
+        Args:
+            queries: The queries to run, as strings or ``(query, vars)`` pairs.
+
+        Returns:
+            One ``list[Value]`` per query, one value per statement.
+
+        :raises TypeError: if an entry is malformed. Nothing is run.
+        :raises ServerError: for the first statement that failed.
+
+        Example:
+            db.query_many(
+                ("CREATE person CONTENT $row", {"row": row}) for row in rows
+            )
+        """
+        responses = [
+            self._send(
+                RequestMessage(RequestMethod.QUERY, query=query, params=params),
+                "query_many",
+                bypass=True,
+            )
+            for query, params in build_query_batch(queries)
+        ]
+        return query_batch_results(responses)
+
     def attach(self) -> UUID:
         raise UnsupportedFeatureError(
             "Multi-session and client-side transactions are only supported for WebSocket connections"
@@ -212,6 +303,14 @@ class BlockingEmbeddedSurrealConnection(BlockingWsSurrealConnection):
     ) -> UUID:
         raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
 
+    def live_query(
+        self,
+        query: str,
+        vars: dict[str, Value] | None = None,
+        session_id: UUID | None = None,
+    ) -> UUID:
+        raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
+
     def kill(
         self,
         query_uuid: str | UUID,
@@ -222,11 +321,23 @@ class BlockingEmbeddedSurrealConnection(BlockingWsSurrealConnection):
     def subscribe_live(
         self,
         query_uuid: str | UUID,
-    ) -> Generator[dict[str, Value], None, None]:
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> LiveSubscription[dict[str, Value]]:
         # Deliberately not a generator function: raising on the call itself
         # reports the problem where it is made, rather than on the first
         # ``next()`` somewhere further away.
         raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
 
+    def subscribe_live_batches(
+        self,
+        query_uuid: str | UUID,
+        max_items: int = 100,
+        max_latency: float = 0.05,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> LiveSubscription[list[dict[str, Value]]]:
+        raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
+
     # All other methods (query, select, create, update, delete, merge, patch, etc.)
     # are inherited from BlockingWsSurrealConnection and work automatically via _send()!
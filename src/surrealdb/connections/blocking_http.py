@@ -1,20 +1,24 @@
+import time
 import uuid
-from collections.abc import Generator, Sequence
+from collections.abc import Sequence
 from types import TracebackType
-from typing import Any, overload
+from typing import TYPE_CHECKING, Any, overload
 from uuid import UUID
 
-import requests
-
+from surrealdb import telemetry
 from surrealdb.connections.builders import (
     _UNSET,
     M,
     SyncCrudBuilder,
     SyncInsertBuilder,
     SyncQueryBuilder,
+    _decoding_into,
     _map_result,
 )
 from surrealdb.connections.files import BlockingFiles
+from surrealdb.connections.live_queue import LiveSubscription, OverflowPolicy
+from surrealdb.connections.middleware import Middleware, run_chain
+from surrealdb.connections.stats import ConnectionStats, StatsCollector
 from surrealdb.connections.sync_template import SyncTemplate
 from surrealdb.connections.url import Url
 from surrealdb.connections.utils_mixin import (
@@ -36,6 +40,9 @@ from surrealdb.request_message.message import RequestMessage
 from surrealdb.request_message.methods import RequestMethod
 from surrealdb.types import Tokens, Value, parse_auth_result
 
+if TYPE_CHECKING:
+    import requests
+
 # Live queries need a persistent connection to push notifications down, which
 # is what makes them a websocket-only feature - as the README documents.
 _NO_LIVE_QUERIES = (
@@ -44,6 +51,17 @@ _NO_LIVE_QUERIES = (
 )
 
 
+def __getattr__(name: str) -> Any:
+    # `requests` is imported by the first request rather than at the top: it
+    # cost every `import surrealdb` ~45ms, HTTP or not. Still reachable here
+    # for code that patches it (`mock.patch("...blocking_http.requests.post")`).
+    if name == "requests":
+        import requests
+
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
     def __init__(self, url: str) -> None:
         self.url: Url = Url(url)
@@ -54,61 +72,139 @@ class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
         self.id: str = str(uuid.uuid4())
         self.namespace: str | None = None
         self.database: str | None = None
+        # See `use_middleware`; a tuple, so `_send` can test it for
+        # emptiness and a chain in flight never sees it change.
+        self._middleware: tuple[Middleware, ...] = ()
+        # Counters behind `stats()`, fed by `_transmit`.
+        self._stats = StatsCollector()
         self.vars: dict[str, Value] = {}
         self.session: requests.Session | None = None
 
+    def stats(self) -> ConnectionStats:
+        """Counters and latency percentiles for this connection so far.
+
+        Always collected, and cheap enough to leave that way; see
+        :mod:`surrealdb.connections.stats`.
+        """
+        return self._stats.snapshot({})
+
+    def use_middleware(self, middleware: Middleware) -> None:
+        """Run every RPC on this connection through *middleware*.
+
+        *middleware* is ``def (message, call_next) -> response``. The first
+        one added is the outermost, and one that returns without calling
+        ``call_next`` answers the RPC itself - nothing is sent. Sessions and
+        transactions on this connection go through it too; see
+        :mod:`surrealdb.connections.middleware`.
+        """
+        self._middleware += (middleware,)
+
     def _send(
         self,
         message: RequestMessage,
         operation: str,
         bypass: bool = False,
         token: str | None = None,
+    ) -> dict[str, Any]:
+        if not self._middleware:
+            return self._transmit(message, operation, bypass, token)
+        response = run_chain(
+            self._middleware,
+            message,
+            lambda message: self._transmit(message, operation, bypass, token),
+        )
+        # A middleware may have answered without sending; its answer is
+        # checked as the server's would have been.
+        if bypass is False:
+            self.check_response_for_error(response, operation)
+        return response
+
+    def _transmit(
+        self,
+        message: RequestMessage,
+        operation: str,
+        bypass: bool = False,
+        token: str | None = None,
     ) -> dict[str, Any]:
         """Send one RPC over HTTP.
 
         *token* authorises this request alone, without adopting it as the
         connection's identity - see :meth:`authenticate`.
         """
-        data = message.WS_CBOR_DESCRIPTOR
-        url = f"{self.url.raw_url}/rpc"
-        headers = {
-            "Accept": "application/cbor",
-            "Content-Type": "application/cbor",
-        }
-        bearer = self.token if token is None else token
-        if bearer:
-            headers["Authorization"] = f"Bearer {bearer}"
-        if self.namespace:
-            headers["Surreal-NS"] = self.namespace
-        if self.database:
-            headers["Surreal-DB"] = self.database
-
-        # Reuse the pooled session when running inside a context manager,
-        # otherwise fall back to a fresh per-request request.
+        stats = self._stats
+        stats.requests += 1
+        stats.in_flight += 1
+        method = message.method.value
+        started = time.perf_counter_ns()
+        # One attribute read when nothing is instrumented; see `telemetry`.
+        call = (
+            telemetry.start(self, message, "http")
+            if telemetry.recorder is not None
+            else None
+        )
         try:
-            if self.session is not None:
-                response = self.session.post(
-                    url, headers=headers, data=data, timeout=30
-                )
-            else:
-                response = requests.post(url, headers=headers, data=data, timeout=30)
-        except requests.exceptions.Timeout as exc:
-            raise TransportTimeoutError(
-                f"timed out while {operation} against {url}: {exc}"
-            ) from exc
-        except requests.exceptions.RequestException as exc:
-            raise ConnectionUnavailableError(
-                f"could not reach {url} while {operation}: {exc}"
-            ) from exc
-
-        self.check_status_for_error(response.status_code, response.content, url)
-
-        data_dict = self.decode_response(response.content, operation)
-
-        if not bypass:
-            self.check_response_for_error(data_dict, operation)
-
-        return data_dict
+            data = message.WS_CBOR_DESCRIPTOR if call is None else call.encode(message)
+            url = f"{self.url.raw_url}/rpc"
+            headers = {
+                "Accept": "application/cbor",
+                "Content-Type": "application/cbor",
+            }
+            bearer = self.token if token is None else token
+            if bearer:
+                headers["Authorization"] = f"Bearer {bearer}"
+            if self.namespace:
+                headers["Surreal-NS"] = self.namespace
+            if self.database:
+                headers["Surreal-DB"] = self.database
+
+            import requests
+
+            # Reuse the pooled session when running inside a context manager,
+            # otherwise fall back to a fresh per-request request.
+            stats.sent(len(data))
+            try:
+                if self.session is not None:
+                    response = self.session.post(
+                        url, headers=headers, data=data, timeout=30
+                    )
+                else:
+                    response = requests.post(
+                        url, headers=headers, data=data, timeout=30
+                    )
+            except requests.exceptions.Timeout as exc:
+                stats.timeouts += 1
+                if call is not None:
+                    call.event("timeout", timeout=30)
+                raise TransportTimeoutError(
+                    f"timed out while {operation} against {url}: {exc}"
+                ) from exc
+            except requests.exceptions.RequestException as exc:
+                raise ConnectionUnavailableError(
+                    f"could not reach {url} while {operation}: {exc}"
+                ) from exc
+
+            stats.received(len(response.content))
+            self.check_status_for_error(response.status_code, response.content, url)
+
+            data_dict = (
+                self.decode_response(response.content, operation)
+                if call is None
+                else call.decode(self.decode_response, response.content, operation)
+            )
+
+            if not bypass:
+                self.check_response_for_error(data_dict, operation)
+
+            return data_dict
+        except BaseException as exc:
+            stats.errors += 1
+            if call is not None:
+                call.fail(exc)
+            raise
+        finally:
+            stats.finished(method, time.perf_counter_ns() - started)
+            if call is not None:
+                call.end()
 
     def authenticate(self, token: str) -> None:
         """Authenticate this connection with an existing token.
@@ -525,7 +621,8 @@ class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
         projection = render_projection(fields)
         query = f"SELECT {projection} FROM {resource_ref}"
 
-        response = self.query_raw(query, variables)
+        with _decoding_into(into):
+            response = self.query_raw(query, variables)
         self.check_response_for_error(response, "select")
         self._check_query_result(response["result"][0])
         result = response["result"][0]["result"]
@@ -588,6 +685,8 @@ class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
         the server-side session.
         """
         if self.session is None:
+            import requests
+
             self.session = requests.Session()
         return self
 
@@ -613,17 +712,33 @@ class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
     def live(self, table: str | Table, diff: bool = False) -> UUID:
         raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
 
+    def live_query(self, query: str, vars: dict[str, Value] | None = None) -> UUID:
+        raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
+
     def kill(self, query_uuid: str | UUID) -> None:
         raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
 
     def subscribe_live(
-        self, query_uuid: str | UUID
-    ) -> Generator[dict[str, Value], None, None]:
+        self,
+        query_uuid: str | UUID,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> LiveSubscription[dict[str, Value]]:
         # Deliberately not a generator function: raising on the call itself
         # reports the problem where it is made, rather than on the first
         # ``next()`` somewhere further away.
         raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
 
+    def subscribe_live_batches(
+        self,
+        query_uuid: str | UUID,
+        max_items: int = 100,
+        max_latency: float = 0.05,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> LiveSubscription[list[dict[str, Value]]]:
+        raise UnsupportedFeatureError(_NO_LIVE_QUERIES)
+
     def attach(self) -> None:
         raise UnsupportedFeatureError(
             "Multi-session and client-side transactions are only supported for WebSocket connections"
@@ -2,6 +2,7 @@
 A basic blocking connection to a SurrealDB instance.
 """
 
+import importlib
 import logging
 import queue
 import threading
@@ -10,35 +11,45 @@ import uuid
 import weakref
 from collections.abc import Generator, Sequence
 from types import TracebackType
-from typing import Any, overload
+from typing import TYPE_CHECKING, Any, TypeVar, overload
 from uuid import UUID
 
-import websockets
-import websockets.sync.client as ws_sync
-from websockets.exceptions import ConnectionClosed, WebSocketException
-from websockets.protocol import State
-from websockets.sync.client import ClientConnection
-
+from surrealdb import telemetry
 from surrealdb.connections.builders import (
     _UNSET,
     M,
     SyncCrudBuilder,
     SyncInsertBuilder,
     SyncQueryBuilder,
+    _decoding_into,
     _map_result,
 )
 from surrealdb.connections.files import BlockingFiles
+from surrealdb.connections.live_queue import (
+    LiveQueue,
+    LiveSubscription,
+    OverflowPolicy,
+    check_batch_options,
+    check_queue_options,
+    is_overflow_marker,
+    overflow_error,
+)
+from surrealdb.connections.middleware import Middleware, run_chain
+from surrealdb.connections.stats import ConnectionStats, StatsCollector
 from surrealdb.connections.sync_template import SyncTemplate
 from surrealdb.connections.url import Url
 from surrealdb.connections.utils_mixin import (
     AUTH_FALLBACK_QUERY,
     UtilsMixin,
+    check_live_select,
+    live_query_id,
     render_projection,
 )
 from surrealdb.data.types.record_id import RecordID, RecordIdType
 from surrealdb.data.types.table import Table
 from surrealdb.errors import (
     ConnectionUnavailableError,
+    SurrealError,
     TransportTimeoutError,
     UnexpectedResponseError,
     parse_rpc_error,
@@ -47,8 +58,13 @@ from surrealdb.request_message.message import RequestMessage
 from surrealdb.request_message.methods import RequestMethod
 from surrealdb.types import Tokens, Value, parse_auth_result
 
+if TYPE_CHECKING:
+    from websockets.sync.client import ClientConnection
+
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # How long ``subscribe_live`` blocks on a single socket read before releasing
 # the connection lock so concurrent RPCs on the same socket can proceed.
 _LIVE_RECV_TIMEOUT = 0.1
@@ -71,12 +87,47 @@ _LIVE_KILLED_SENTINEL: dict[str, Any] = {"action": _LIVE_KILLED, "id": None}
 _RPC_RECV_TIMEOUT = 30.0
 
 
+def _socket_errors() -> tuple[type[BaseException], ...]:
+    """What a socket raises when the connection behind it fails.
+
+    Looked up when a failure reaches the ``except`` clause rather than held in
+    a module-level tuple, so ``websockets`` is imported by the first
+    connection instead of by ``import surrealdb``.
+    """
+    from websockets.exceptions import WebSocketException
+
+    return (WebSocketException, OSError)
+
+
+# What this module used to import at the top, still reachable here for code
+# that patches it (`mock.patch("surrealdb.connections.blocking_ws.ws_sync...")`).
+_DEFERRED_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "websockets": ("websockets", None),
+    "ws_sync": ("websockets.sync.client", None),
+    "ClientConnection": ("websockets.sync.client", "ClientConnection"),
+    "ConnectionClosed": ("websockets.exceptions", "ConnectionClosed"),
+    "WebSocketException": ("websockets.exceptions", "WebSocketException"),
+    "State": ("websockets.protocol", "State"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attribute = _DEFERRED_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    imported = importlib.import_module(module)
+    return imported if attribute is None else getattr(imported, attribute)
+
+
 def _release_live_queue(
     live_queues: dict[str, list["queue.Queue[dict[str, Any]]"]],
     suid: str,
     notifications: "queue.Queue[dict[str, Any]]",
 ) -> None:
     """Deregister one subscriber's queue. Safe to call twice."""
+    if isinstance(notifications, LiveQueue):
+        notifications.release()
     queues = live_queues.get(suid)
     if queues is None:
         return
@@ -111,6 +162,15 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
         self.port: int | None = self.url.port
         self.id: str = str(uuid.uuid4())
         self.token: str | None = None
+        # What the last connection-wide `use()` selected, as the HTTP
+        # transport keeps it; sessions select their own.
+        self.namespace: str | None = None
+        self.database: str | None = None
+        # See `use_middleware`; a tuple, so `_send` can test it for
+        # emptiness and a chain in flight never sees it change.
+        self._middleware: tuple[Middleware, ...] = ()
+        # Counters behind `stats()`, fed by `_transmit` and `_connect_socket`.
+        self._stats = StatsCollector()
         self.socket: ClientConnection | None = None
         self._lock: threading.Lock = threading.Lock()
         # Live-query notification queues keyed by live-query UUID string. A
@@ -124,10 +184,13 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
         # later request's reply.
         self._abandoned: set[str] = set()
 
-    def _connect_socket(self) -> ClientConnection:
+    def _connect_socket(self) -> "ClientConnection":
         """Open the websocket, mapping transport failures to SDK errors."""
+        import websockets
+        import websockets.sync.client as ws_sync
+
         try:
-            return ws_sync.connect(
+            socket = ws_sync.connect(
                 self.raw_url,
                 max_size=None,
                 subprotocols=[websockets.Subprotocol("cbor")],
@@ -136,10 +199,12 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
             raise TransportTimeoutError(
                 f"timed out connecting to {self.raw_url}: {exc}"
             ) from exc
-        except (WebSocketException, OSError) as exc:
+        except _socket_errors() as exc:
             raise ConnectionUnavailableError(
                 f"could not connect to {self.raw_url}: {exc}"
             ) from exc
+        self._stats.connects += 1
+        return socket
 
     def connect(self, url: str | None = None) -> None:
         """Open the websocket.
@@ -183,6 +248,8 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
             self.port = target.port
 
         if self.socket is not None:
+            from websockets.protocol import State
+
             if self.socket.state is State.OPEN:
                 return
             # The socket object is still here but the connection behind it is
@@ -197,80 +264,153 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
 
         self.socket = self._connect_socket()
 
+    def stats(self) -> ConnectionStats:
+        """Counters and latency percentiles for this connection so far.
+
+        Always collected, and cheap enough to leave that way; see
+        :mod:`surrealdb.connections.stats`.
+        """
+        return self._stats.snapshot(self.live_queues)
+
+    def use_middleware(self, middleware: Middleware) -> None:
+        """Run every RPC on this connection through *middleware*.
+
+        *middleware* is ``def (message, call_next) -> response``. The first
+        one added is the outermost, and one that returns without calling
+        ``call_next`` answers the RPC itself - nothing is sent. Sessions and
+        transactions on this connection go through it too; see
+        :mod:`surrealdb.connections.middleware`.
+        """
+        self._middleware += (middleware,)
+
     def _send(
         self, message: RequestMessage, process: str, bypass: bool = False
     ) -> dict[str, Any]:
-        # Use a lock to ensure thread-safe send/recv operations
-        # This prevents race conditions when multiple threads share the same connection
-        with self._lock:
-            if self.socket is None:
-                self.socket = self._connect_socket()
-
-            # Correlate the reply to this request. Live-query notifications
-            # carry no top-level "id" and may be delivered between our send and
-            # our reply; route those to their live queue (if a subscriber is
-            # registered, else drop) and keep reading, so a notification is
-            # never returned as an RPC result.
-            try:
-                self.socket.send(message.WS_CBOR_DESCRIPTOR)
-                deadline = time.monotonic() + _RPC_RECV_TIMEOUT
-                while True:
-                    remaining = deadline - time.monotonic()
-                    if remaining <= 0:
-                        # The request was sent, so a reply is still coming.
-                        # Remember it, or the next call reads this reply,
-                        # mismatches the id and fails - and so does every call
-                        # after it, permanently out of step by one.
-                        self._abandoned.add(message.id)
-                        raise TransportTimeoutError(
-                            f"timed out while {process} on {self.raw_url}: no "
-                            f"reply within {_RPC_RECV_TIMEOUT}s"
-                        )
-                    data = self.socket.recv(timeout=remaining)
-                    response = self.decode_response(
-                        data if isinstance(data, bytes) else data.encode(), process
+        if not self._middleware:
+            return self._transmit(message, process, bypass)
+        response = run_chain(
+            self._middleware,
+            message,
+            lambda message: self._transmit(message, process, bypass),
+        )
+        # A middleware may have answered without sending; its answer is
+        # checked as the server's would have been.
+        if bypass is False:
+            self.check_response_for_error(response, process)
+        return response
+
+    def _transmit(
+        self, message: RequestMessage, process: str, bypass: bool = False
+    ) -> dict[str, Any]:
+        stats = self._stats
+        stats.requests += 1
+        stats.in_flight += 1
+        method = message.method.value
+        started = time.perf_counter_ns()
+        # One attribute read when nothing is instrumented; see `telemetry`.
+        call = (
+            telemetry.start(self, message, "ws")
+            if telemetry.recorder is not None
+            else None
+        )
+        try:
+            # Use a lock to ensure thread-safe send/recv operations
+            # This prevents race conditions when multiple threads share the same connection
+            with self._lock:
+                if self.socket is None:
+                    self.socket = self._connect_socket()
+
+                # Correlate the reply to this request. Live-query notifications
+                # carry no top-level "id" and may be delivered between our send and
+                # our reply; route those to their live queue (if a subscriber is
+                # registered, else drop) and keep reading, so a notification is
+                # never returned as an RPC result.
+                try:
+                    data = (
+                        message.WS_CBOR_DESCRIPTOR
+                        if call is None
+                        else call.encode(message)
                     )
-                    response_id = response.get("id")
-                    if response_id is None:
-                        # A frame with no `id` is normally a live-query
-                        # notification. A protocol-level error - a request the
-                        # server could not parse or correlate - also arrives
-                        # without one, and routing that to the notification
-                        # path discarded the only reply this call would ever
-                        # get, leaving the loop blocked on recv() forever.
-                        if response.get("error") is not None:
-                            self.check_response_for_error(response, process)
-                        self._route_live_notification(response)
-                        continue
-                    if response_id in self._abandoned:
-                        # The late reply to a timed-out request. Drop it and
-                        # keep reading for this request's own reply.
-                        self._abandoned.discard(response_id)
-                        continue
-                    if response_id != message.id:
-                        raise UnexpectedResponseError(
-                            f"Response ID mismatch: expected {message.id}, got "
-                            f"{response_id}. This should not happen with proper "
-                            "locking."
+                    self.socket.send(data)
+                    stats.sent(len(data))
+                    deadline = time.monotonic() + _RPC_RECV_TIMEOUT
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            # The request was sent, so a reply is still coming.
+                            # Remember it, or the next call reads this reply,
+                            # mismatches the id and fails - and so does every call
+                            # after it, permanently out of step by one.
+                            self._abandoned.add(message.id)
+                            stats.timeouts += 1
+                            if call is not None:
+                                call.event("timeout", timeout=_RPC_RECV_TIMEOUT)
+                            raise TransportTimeoutError(
+                                f"timed out while {process} on {self.raw_url}: no "
+                                f"reply within {_RPC_RECV_TIMEOUT}s"
+                            )
+                        frame = self.socket.recv(timeout=remaining)
+                        body = frame if isinstance(frame, bytes) else frame.encode()
+                        stats.received(len(body))
+                        response = (
+                            self.decode_response(body, process)
+                            if call is None
+                            else call.decode(self.decode_response, body, process)
                         )
-                    break
-            except TimeoutError as exc:
-                # `recv(timeout=...)` expiring is the path that actually fires;
-                # the deadline check above only catches the next iteration.
-                # Both have to record the id, or the abandoned reply is still
-                # waiting in the socket for the next caller to trip over.
-                self._abandoned.add(message.id)
-                raise TransportTimeoutError(
-                    f"timed out while {process} on {self.raw_url}: {exc}"
-                ) from exc
-            except (WebSocketException, OSError) as exc:
-                raise ConnectionUnavailableError(
-                    f"the connection to {self.raw_url} failed while {process}: {exc}"
-                ) from exc
-
-            if bypass is False:
-                self.check_response_for_error(response, process)
-            return response
+                        response_id = response.get("id")
+                        if response_id is None:
+                            # A frame with no `id` is normally a live-query
+                            # notification. A protocol-level error - a request the
+                            # server could not parse or correlate - also arrives
+                            # without one, and routing that to the notification
+                            # path discarded the only reply this call would ever
+                            # get, leaving the loop blocked on recv() forever.
+                            if response.get("error") is not None:
+                                stats.uncorrelated_errors += 1
+                                self.check_response_for_error(response, process)
+                            self._route_live_notification(response)
+                            continue
+                        if response_id in self._abandoned:
+                            # The late reply to a timed-out request. Drop it and
+                            # keep reading for this request's own reply.
+                            self._abandoned.discard(response_id)
+                            continue
+                        if response_id != message.id:
+                            raise UnexpectedResponseError(
+                                f"Response ID mismatch: expected {message.id}, got "
+                                f"{response_id}. This should not happen with proper "
+                                "locking."
+                            )
+                        break
+                except TimeoutError as exc:
+                    # `recv(timeout=...)` expiring is the path that actually fires;
+                    # the deadline check above only catches the next iteration.
+                    # Both have to record the id, or the abandoned reply is still
+                    # waiting in the socket for the next caller to trip over.
+                    self._abandoned.add(message.id)
+                    stats.timeouts += 1
+                    if call is not None:
+                        call.event("timeout", timeout=_RPC_RECV_TIMEOUT)
+                    raise TransportTimeoutError(
+                        f"timed out while {process} on {self.raw_url}: {exc}"
+                    ) from exc
+                except _socket_errors() as exc:
+                    raise ConnectionUnavailableError(
+                        f"the connection to {self.raw_url} failed while {process}: {exc}"
+                    ) from exc
+
+                if bypass is False:
+                    self.check_response_for_error(response, process)
+        except BaseException as exc:
+            stats.errors += 1
+            if call is not None:
+                call.fail(exc)
+            raise
+        finally:
+            stats.finished(method, time.perf_counter_ns() - started)
+            if call is not None:
+                call.end()
+        return response
 
     def _route_live_notification(self, response: dict[str, Any]) -> None:
         """Hand a live-query notification off to its subscriber queue.
@@ -369,6 +509,8 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
         message = RequestMessage(RequestMethod.USE, **kwargs)
         self.id = message.id
         self._send(message, "use")
+        if session_id is None:
+            self.namespace, self.database = namespace, database
 
     def query(
         self,
@@ -542,9 +684,10 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
         projection = render_projection(fields)
         query = f"SELECT {projection} FROM {resource_ref}"
 
-        response = self.query_raw(
-            query, variables, session_id=session_id, txn_id=txn_id
-        )
+        with _decoding_into(into):
+            response = self.query_raw(
+                query, variables, session_id=session_id, txn_id=txn_id
+            )
         self.check_response_for_error(response, "select")
         self._check_query_result(response["result"][0])
         result = response["result"][0]["result"]
@@ -1108,6 +1251,28 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
         self.check_response_for_result(response, "live")
         return response["result"]
 
+    def live_query(
+        self,
+        query: str,
+        vars: dict[str, Value] | None = None,
+        session_id: UUID | None = None,
+    ) -> UUID:
+        """Start a ``LIVE SELECT`` and return its UUID.
+
+        :meth:`live` watches a whole table and sends every field of every
+        change. A ``LIVE SELECT`` filters and projects on the server -
+        ``LIVE SELECT id, status FROM order WHERE tenant = $tenant`` - so rows
+        this consumer does not care about are never sent or decoded. Consume it
+        with :meth:`subscribe_live` and stop it with :meth:`kill`, as for
+        :meth:`live`.
+
+        :raises ValueError: if *query* is not a ``LIVE SELECT`` statement.
+        :raises UnexpectedResponseError: if the server answers with anything
+            but a live query id.
+        """
+        check_live_select(query)
+        return live_query_id(self.query(query, vars, session_id=session_id).first())
+
     def kill(
         self,
         query_uuid: str | UUID,
@@ -1137,7 +1302,9 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
     def subscribe_live(
         self,
         query_uuid: str | UUID,
-    ) -> Generator[dict[str, Value], None, None]:
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> LiveSubscription[dict[str, Value]]:
         """Yield notifications for a live query over this WebSocket.
 
         The blocking client has no background reader, so a single socket is
@@ -1165,13 +1332,72 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
         notification whose ``result`` was ``None``, and the generator then ran
         on forever waiting for a query that no longer existed.
 
+        ``maxsize`` and ``on_overflow`` bound the queue notifications wait in,
+        as on the async transport: ``0`` is unbounded, and a full queue
+        blocks, drops the oldest or newest, coalesces by record id, or raises
+        :class:`LiveQueueOverflowError` once the backlog is delivered. On this
+        transport ``"block"`` waits on whichever thread routed the
+        notification - an RPC call, or another subscription reading the socket
+        - so only use it for a subscription consumed on a thread of its own.
+        The returned subscription's ``stats`` counts what was received,
+        delivered and dropped.
+
         :raises ConnectionUnavailableError: if the socket is not established or
             is closed while the subscription is active.
+        :raises LiveQueueOverflowError: under ``on_overflow="error"``.
+        :raises ValueError: for a negative ``maxsize`` or an unknown policy.
         """
+        check_queue_options(maxsize, on_overflow)
         suid = str(query_uuid)
-        notifications: queue.Queue[dict[str, Any]] = queue.Queue()
+        notifications = LiveQueue(maxsize, on_overflow)
         self.live_queues.setdefault(suid, []).append(notifications)
-        subscription = self._iter_live(suid, notifications)
+        return self._live_subscription(
+            suid, notifications, self._iter_live(suid, notifications)
+        )
+
+    def subscribe_live_batches(
+        self,
+        query_uuid: str | UUID,
+        max_items: int = 100,
+        max_latency: float = 0.05,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> LiveSubscription[list[dict[str, Value]]]:
+        """Like :meth:`subscribe_live`, but yield lists of notifications.
+
+        A batch holds up to ``max_items`` notifications and is yielded once
+        full, or once ``max_latency`` seconds have passed since its first
+        notification and nothing more is waiting - so a consumer can apply
+        changes in bulk, one ``executemany`` per batch. Batches are never
+        empty, and one still being gathered when the stream ends or fails is
+        yielded before the failure is raised.
+
+        The same single-subscriber caveat, bounds and policies apply as for
+        :meth:`subscribe_live`.
+
+        :raises ConnectionUnavailableError: if the socket is not established or
+            is closed while the subscription is active.
+        :raises LiveQueueOverflowError: under ``on_overflow="error"``.
+        :raises ValueError: for a ``max_items`` below one, a negative
+            ``max_latency``, a negative ``maxsize`` or an unknown policy.
+        """
+        check_batch_options(max_items, max_latency)
+        check_queue_options(maxsize, on_overflow)
+        suid = str(query_uuid)
+        notifications = LiveQueue(maxsize, on_overflow)
+        self.live_queues.setdefault(suid, []).append(notifications)
+        return self._live_subscription(
+            suid,
+            notifications,
+            self._iter_live_batches(suid, notifications, max_items, max_latency),
+        )
+
+    def _live_subscription(
+        self,
+        suid: str,
+        notifications: LiveQueue,
+        subscription: Generator[_T, None, None],
+    ) -> LiveSubscription[_T]:
         # Registration is eager, so release has to be reachable without ever
         # iterating. A generator that is never started does not run its
         # `finally` on close or GC, so a subscription that was set up and then
@@ -1185,14 +1411,72 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
         weakref.finalize(
             subscription, _release_live_queue, self.live_queues, suid, notifications
         )
-        return subscription
+        return LiveSubscription(subscription, notifications.stats)
 
     def _iter_live(
         self,
         suid: str,
-        notifications: "queue.Queue[dict[str, Any]]",
+        notifications: LiveQueue,
     ) -> Generator[dict[str, Value], None, None]:
         """The body of :meth:`subscribe_live`, split out so registration is eager."""
+        events = self._live_events(suid, notifications, _LIVE_RECV_TIMEOUT)
+        try:
+            for event in events:
+                if event is not None:
+                    yield event
+        finally:
+            events.close()
+
+    def _iter_live_batches(
+        self,
+        suid: str,
+        notifications: LiveQueue,
+        max_items: int,
+        max_latency: float,
+    ) -> Generator[list[dict[str, Value]], None, None]:
+        """The body of :meth:`subscribe_live_batches`."""
+        # Reads wake at least every `max_latency`, so an idle socket cannot
+        # hold a partial batch back much past its deadline.
+        recv_timeout = min(_LIVE_RECV_TIMEOUT, max_latency) or _LIVE_RECV_TIMEOUT
+        events = self._live_events(suid, notifications, recv_timeout)
+        batch: list[dict[str, Value]] = []
+        deadline = 0.0
+        failure: SurrealError | None = None
+        try:
+            while True:
+                try:
+                    event = next(events)
+                except StopIteration:
+                    break
+                except SurrealError as exc:
+                    failure = exc
+                    break
+                if event is not None:
+                    if not batch:
+                        deadline = time.monotonic() + max_latency
+                    batch.append(event)
+                # Past the deadline, what was already routed here still joins
+                # the batch: it costs no wait.
+                if batch and (
+                    len(batch) >= max_items
+                    or (time.monotonic() >= deadline and notifications.empty())
+                ):
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+            if failure is not None:
+                raise failure
+        finally:
+            events.close()
+
+    def _live_events(
+        self,
+        suid: str,
+        notifications: LiveQueue,
+        recv_timeout: float,
+    ) -> Generator[dict[str, Value] | None, None, None]:
+        """Notifications for *suid*, and ``None`` each time a read times out idle."""
         try:
             while True:
                 # Hand back anything ``_send`` routed to us while correlating.
@@ -1201,6 +1485,8 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
                 except queue.Empty:
                     pass
                 else:
+                    if is_overflow_marker(routed):
+                        raise overflow_error(suid, notifications.stats)
                     if routed.get("action") == _LIVE_KILLED:
                         return
                     yield routed
@@ -1215,10 +1501,10 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
                             "WebSocket connection is not established."
                         )
                     try:
-                        data = self.socket.recv(timeout=_LIVE_RECV_TIMEOUT)
+                        data = self.socket.recv(timeout=recv_timeout)
                     except TimeoutError:
                         data = None
-                    except (ConnectionClosed, WebSocketException, OSError) as exc:
+                    except _socket_errors() as exc:
                         logger.warning("Live subscription socket closed: %s", exc)
                         raise ConnectionUnavailableError(
                             "WebSocket connection closed while subscribed to a "
@@ -1226,12 +1512,12 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
                         ) from exc
 
                 if data is None:
+                    yield None
                     continue
 
-                response = self.decode_response(
-                    data if isinstance(data, bytes) else data.encode(),
-                    "reading a live notification",
-                )
+                body = data if isinstance(data, bytes) else data.encode()
+                self._stats.received(len(body))
+                response = self.decode_response(body, "reading a live notification")
                 if response.get("id") is not None:
                     # Stray RPC reply with no waiter (should not happen while
                     # the lock serialises RPCs); ignore rather than yield it.
@@ -1243,9 +1529,10 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
                 if rid is None:
                     continue
                 if str(rid) == suid:
-                    if result.get("action") == _LIVE_KILLED:
-                        return
-                    yield result
+                    # Through the queue rather than straight out, so that this
+                    # subscription's policy and counters see it too. The queue
+                    # was just drained, so it always has room.
+                    notifications.put(result)
                 else:
                     # Notification for a different live query; route it onward.
                     for other in self.live_queues.get(str(rid), []):
@@ -1253,6 +1540,7 @@ class BlockingWsSurrealConnection(SyncTemplate, UtilsMixin):
         finally:
             # Deregister this consumer's queue on exit (consumer break, GC,
             # error, or connection close).
+            notifications.release()
             queues = self.live_queues.get(suid)
             if queues is not None and notifications in queues:
                 queues.remove(notifications)
@@ -1637,12 +1925,18 @@ class BlockingSurrealSession:
     ) -> UUID:
         return self._connection.live(table, diff, session_id=self._session_id)
 
+    def live_query(self, query: str, vars: dict[str, Value] | None = None) -> UUID:
+        return self._connection.live_query(query, vars, session_id=self._session_id)
+
     def kill(self, query_uuid: str | UUID) -> None:
         self._connection.kill(query_uuid, session_id=self._session_id)
 
     def subscribe_live(
-        self, query_uuid: str | UUID
-    ) -> Generator[dict[str, Value], None, None]:
+        self,
+        query_uuid: str | UUID,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> LiveSubscription[dict[str, Value]]:
         """Yield notifications for a live query started on this session.
 
         The session exposed :meth:`live` and :meth:`kill` but not this, so a
@@ -1651,7 +1945,20 @@ class BlockingSurrealSession:
         are keyed by the live-query id rather than the session, so this
         forwards unchanged.
         """
-        return self._connection.subscribe_live(query_uuid)
+        return self._connection.subscribe_live(query_uuid, maxsize, on_overflow)
+
+    def subscribe_live_batches(
+        self,
+        query_uuid: str | UUID,
+        max_items: int = 100,
+        max_latency: float = 0.05,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> LiveSubscription[list[dict[str, Value]]]:
+        """Batched :meth:`subscribe_live`; forwards to the connection unchanged."""
+        return self._connection.subscribe_live_batches(
+            query_uuid, max_items, max_latency, maxsize, on_overflow
+        )
 
     def begin_transaction(self) -> "BlockingSurrealTransaction":
         txn_id = self._connection.begin(session_id=self._session_id)
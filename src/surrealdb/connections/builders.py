@@ -55,13 +55,26 @@ Safety
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import re
 import threading
-from collections.abc import Awaitable, Callable, Generator, Mapping
+import weakref
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
 from dataclasses import fields, is_dataclass
 from typing import Any, Generic, Literal, TypeVar, cast, overload
 
+from surrealdb.data.cbor import RowsHook
+from surrealdb.data.columns import Column, ColumnBuffers, decode_columns
 from surrealdb.data.types.range import Range
 from surrealdb.data.types.record_id import RecordID, RecordIdType, escape_identifier
 from surrealdb.data.types.table import Table
@@ -444,11 +457,19 @@ class _QueryState:
         self._variables: dict[str, Any] = dict(variables) if variables else {}
 
     def _statement_values(self, response: dict[str, Any]) -> list[Any]:
-        stmts = _check_response(response, "query")
-        for stmt in stmts:
-            if stmt.get("status") == "ERR":
-                raise parse_query_error(stmt)
-        return [stmt.get("result") for stmt in stmts]
+        return _query_statement_values(response)
+
+
+def _query_statement_values(response: dict[str, Any]) -> list[Any]:
+    """Return one result per statement of a ``query`` response.
+
+    :raises ServerError: for the first statement that came back ``ERR``.
+    """
+    stmts = _check_response(response, "query")
+    for stmt in stmts:
+        if stmt.get("status") == "ERR":
+            raise parse_query_error(stmt)
+    return [stmt.get("result") for stmt in stmts]
 
 
 def _constructor_parameters(cls: type[Any]) -> str:
@@ -475,74 +496,296 @@ def _constructor_parameters(cls: type[Any]) -> str:
     return str(names)
 
 
-def _map_to_class(cls: type[T], values: list[Any] | Mapping[str, Any]) -> T:
-    """Construct ``cls`` from statement results or a single record row.
+class _ModelMapper:
+    """How to build one model class from records, worked out once per class.
 
-    Two calling conventions share this one kwargs-construction helper:
+    ``_map_to_class`` used to rediscover this on every call - ``fields()`` or
+    ``inspect.signature`` for each positional mapping, and an ABC
+    ``isinstance`` for each row - so mapping 100k rows with ``into=`` cost more
+    than the query that fetched them. A mapper is built the first time a class
+    is mapped and kept for as long as the class lives.
 
-    - A ``Mapping`` (a single record dict, as produced by ``select`` /
-      ``create`` / ``query().into(cls, rows=True)`` with ``into=``) is expanded
-      straight into keyword arguments - ``cls(**row)``. This covers
-      dataclasses, pydantic ``BaseModel``, and any class whose constructor
-      accepts the record's fields as keywords.
-    - A ``list`` (the N statement results from ``query().into(cls)``) is mapped
-      positionally onto the fields / constructor parameters of ``cls`` - the
-      historic ``into(cls)`` behaviour, unchanged.
+    Records are still built with ``cls(**row)``: for a dataclass that *is* the
+    fast constructor - its generated ``__init__`` beat ``__new__`` plus direct
+    attribute assignment when measured - and it keeps ``__post_init__``,
+    defaults and custom constructors behaving exactly as before. What changes
+    is everything around it, and pydantic models, whose rows are validated as
+    one list in a single pydantic-core call.
+
+    The mapper does not hold the class, so caching it does not keep a class
+    alive. A pydantic model's list validator does refer to the class, so it is
+    kept on the class itself rather than here: a mapper holding it would keep
+    its own ``_MAPPERS`` key alive, while on the class it is only a cycle the
+    collector frees with the class.
     """
-    if isinstance(values, Mapping):
-        # Row -> model: the record's keys are the constructor kwargs. Works
-        # uniformly for dataclasses, pydantic models, and plain classes.
+
+    __slots__ = ("_positional", "_validates_list")
+
+    def __init__(self) -> None:
+        self._positional: list[str] | None = None
+        # Whether the class has a list validator; None until worked out.
+        self._validates_list: bool | None = None
+
+    def row(self, cls: type[T], values: Mapping[str, Any]) -> T:
+        """Build one *cls* from a record, whose keys are the keyword arguments."""
         try:
             return cls(**values)
         except TypeError as exc:
-            # A record whose fields do not line up with the model surfaced as
-            # a bare `TypeError: Person.__init__() got an unexpected keyword
-            # argument 'active'` - raised from inside the model, naming neither
-            # `into=` nor the record that failed to map, so the obvious reading
-            # was that the caller had constructed a `Person` wrongly somewhere.
-            # The README's own `into=` example hit it: it declared a two-field
-            # `Person` and then wrote a third field to the table.
-            raise UnexpectedResponseError(
-                f"into={cls.__name__} could not be built from this record: {exc}. "
-                f"The record has {sorted(values)}; {cls.__name__} accepts "
-                f"{_constructor_parameters(cls)}. Add the missing field(s) to "
-                "the model, give them defaults, or select only the columns it "
-                "declares."
-            ) from exc
-
-    if is_dataclass(cls):
-        field_list = list(fields(cls))
-        if len(field_list) != len(values):
+            raise _unmappable_record(cls, values, exc) from exc
+
+    def rows(self, cls: type[T], rows: list[Any]) -> list[T]:
+        """Build a *cls* from every record in *rows*."""
+        if type(rows) is _DecodedRows and rows.into is cls:
+            if rows.error is not None:
+                raise rows.error
+            # A plain list: the caller gets no `into`/`error` of ours.
+            return list(rows)
+        for row in rows:
+            if type(row) is not dict:
+                _require_record(cls, row)
+        validate = self._validate_list(cls)
+        if validate is not None:
+            return cast("list[T]", validate(rows))
+        mapped: list[T] = []
+        append = mapped.append
+        for row in rows:
+            try:
+                append(cls(**row))
+            except TypeError as exc:
+                raise _unmappable_record(cls, row, exc) from exc
+        return mapped
+
+    def decoded(self, cls: type[Any], rows: Iterator[Any]) -> _DecodedRows:
+        """Build a *cls* from each row as the decoder produces it.
+
+        A row that cannot be built is not raised from here - that would fail
+        the whole frame, and on a websocket every other request waiting on the
+        connection with it. The error is kept on the result and raised when
+        the caller maps it; that row and the rest stay as decoded, so a
+        single-record target that unwraps its one row still fails with the
+        same message.
+
+        A pydantic model's rows are gathered and validated as one list once
+        the statement's rows are decoded, with the validator :meth:`rows`
+        uses, so both paths build and report errors the same way.
+        """
+        built = _DecodedRows(cls)
+        validate = self._validate_list(cls)
+        if validate is not None:
+            built.extend(rows)
+            try:
+                for row in built:
+                    if type(row) is not dict:
+                        _require_record(cls, row)
+                built[:] = validate(list(built))
+            except Exception as exc:
+                built.error = exc
+            return built
+        append = built.append
+        for row in rows:
+            try:
+                append(
+                    self.row(
+                        cls, row if type(row) is dict else _require_record(cls, row)
+                    )
+                )
+            except Exception as exc:
+                built.error = exc
+                append(row)
+                built.extend(rows)
+                break
+        return built
+
+    def positional(self, cls: type[T], values: list[Any]) -> T:
+        """Build *cls* from N statement results, one per field / parameter."""
+        names = self._positional
+        if names is None:
+            names = self._positional = _positional_parameters(cls)
+        if len(names) != len(values):
+            what = "dataclass fields" if is_dataclass(cls) else "constructor parameters"
             raise UnexpectedResponseError(
-                f"query().into({cls.__name__}) expects {len(field_list)} statement "
-                f"results to match dataclass fields, got {len(values)}"
+                f"query().into({cls.__name__}) expects {len(names)} statement "
+                f"results to match {what}, got {len(values)}"
             )
-        kwargs = {f.name: v for f, v in zip(field_list, values, strict=True)}
-        return cls(**kwargs)
+        return cls(**dict(zip(names, values, strict=True)))
+
+    def _validate_list(self, cls: type[Any]) -> Callable[[list[Any]], list[Any]] | None:
+        if self._validates_list is None:
+            validate = _pydantic_list_validator(cls)
+            if validate is not None:
+                setattr(cls, _LIST_VALIDATOR, validate)
+            self._validates_list = validate is not None
+        if not self._validates_list:
+            return None
+        # `__dict__`, not `getattr`: a subclass needs a validator of its own.
+        return cast("Callable[[list[Any]], list[Any]]", cls.__dict__[_LIST_VALIDATOR])
+
+
+# Where a pydantic model's list validator is kept, on the model class.
+_LIST_VALIDATOR = "__surrealdb_list_validator__"
 
+_MAPPERS: weakref.WeakKeyDictionary[type[Any], _ModelMapper] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _DecodedRows(list[Any]):
+    """A statement's rows, already built as ``into`` while they were decoded."""
+
+    __slots__ = ("error", "into")
+
+    def __init__(self, into: type[Any]) -> None:
+        super().__init__()
+        self.into = into
+        self.error: Exception | None = None
+
+
+# What the query sent from this context should decode its rows into: models
+# for `into=`, column buffers for `to_columns()`. A context variable rather
+# than a parameter, because the response is decoded several calls below the
+# builder - through `query_raw`, the transport's `_send` and its reader - none
+# of which otherwise know about rows.
+_DECODE_ROWS: ContextVar[RowsHook | None] = ContextVar("_DECODE_ROWS", default=None)
+
+
+@contextmanager
+def _decoding_rows(hook: RowsHook | None) -> Generator[None, None, None]:
+    """Have responses decoded in this block hand their rows to *hook*."""
+    token = _DECODE_ROWS.set(hook)
+    try:
+        yield
+    finally:
+        _DECODE_ROWS.reset(token)
+
+
+def _decoding_into(into: type[Any] | None) -> AbstractContextManager[None]:
+    """Have responses decoded in this block build their rows as *into*."""
+    return _decoding_rows(_rows_hook(into))
+
+
+def _rows_hook(into: type[Any] | None) -> RowsHook | None:
+    """The decoder hook that builds rows as *into*, or None without a model."""
+    if into is None:
+        return None
+    _require_model_class(into)
+    return functools.partial(_mapper_for(into).decoded, into)
+
+
+def _decode_rows_for() -> Callable[[Any], RowsHook | None] | None:
+    """A ``rows_for`` for :func:`decode`, if this context has a rows hook.
+
+    For transports that decode the response in the caller's own context, so
+    any response id is the caller's.
+    """
+    hook = _DECODE_ROWS.get()
+    if hook is None:
+        return None
+    return lambda _response_id: hook
+
+
+def _mapper_for(cls: type[Any]) -> _ModelMapper:
+    mapper = _MAPPERS.get(cls)
+    if mapper is None:
+        # Two threads may both build one; either is correct and one is kept.
+        mapper = _MAPPERS.setdefault(cls, _ModelMapper())
+    return mapper
+
+
+def _pydantic_list_validator(
+    cls: type[Any],
+) -> Callable[[list[Any]], list[Any]] | None:
+    """A one-call validator for ``list[cls]`` if *cls* is a pydantic model.
+
+    Only for a model pydantic has finished building: one with unresolved
+    forward references is left to ``cls(**row)``, which retries the build and
+    reports the failure the way pydantic users expect.
+    """
+    if not getattr(cls, "__pydantic_complete__", False) or not hasattr(
+        cls, "model_validate"
+    ):
+        return None
+    # The model exists, so pydantic is installed; it is an optional extra, so
+    # it is only imported here.
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(list[cls]).validate_python  # type: ignore[valid-type]
+
+
+def _positional_parameters(cls: type[Any]) -> list[str]:
+    if is_dataclass(cls):
+        return [f.name for f in fields(cls)]
     try:
         sig = inspect.signature(cls.__init__)
     except (ValueError, TypeError) as exc:
         raise UnexpectedResponseError(
             f"query().into({cls.__name__}) cannot inspect constructor: {exc}"
         ) from exc
-
     accepted = (
         inspect.Parameter.POSITIONAL_OR_KEYWORD,
         inspect.Parameter.KEYWORD_ONLY,
     )
-    param_names = [
+    return [
         name
         for name, param in sig.parameters.items()
         if name != "self" and param.kind in accepted
     ]
-    if len(param_names) != len(values):
-        raise UnexpectedResponseError(
-            f"query().into({cls.__name__}) expects {len(param_names)} statement "
-            f"results to match constructor parameters, got {len(values)}"
-        )
-    kwargs = dict(zip(param_names, values, strict=True))
-    return cls(**kwargs)
+
+
+def _unmappable_record(
+    cls: type[Any], values: Mapping[str, Any], exc: TypeError
+) -> UnexpectedResponseError:
+    # A record whose fields do not line up with the model surfaced as a bare
+    # `TypeError: Person.__init__() got an unexpected keyword argument
+    # 'active'` - raised from inside the model, naming neither `into=` nor the
+    # record that failed to map, so the obvious reading was that the caller had
+    # constructed a `Person` wrongly somewhere. The README's own `into=`
+    # example hit it: it declared a two-field `Person` and then wrote a third
+    # field to the table.
+    return UnexpectedResponseError(
+        f"into={cls.__name__} could not be built from this record: {exc}. "
+        f"The record has {sorted(values)}; {cls.__name__} accepts "
+        f"{_constructor_parameters(cls)}. Add the missing field(s) to "
+        "the model, give them defaults, or select only the columns it "
+        "declares."
+    )
+
+
+def _map_to_class(cls: type[T], values: list[Any] | Mapping[str, Any]) -> T:
+    """Construct ``cls`` from statement results or a single record row.
+
+    Two calling conventions share this one kwargs-construction helper:
+
+    - A ``Mapping`` (a single record dict, as produced by ``select`` /
+      ``create`` / ``query().into(cls, rows=True)`` with ``into=``) is expanded
+      straight into keyword arguments - ``cls(**row)``. This covers
+      dataclasses, pydantic ``BaseModel``, and any class whose constructor
+      accepts the record's fields as keywords.
+    - A ``list`` (the N statement results from ``query().into(cls)``) is mapped
+      positionally onto the fields / constructor parameters of ``cls`` - the
+      historic ``into(cls)`` behaviour, unchanged.
+
+    Both go through the class's cached :class:`_ModelMapper`.
+    """
+    mapper = _mapper_for(cls)
+    if type(values) is dict or isinstance(values, Mapping):
+        return mapper.row(cls, values)
+    return mapper.positional(cls, values)
+
+
+def map_rows(cls: type[M], rows: Iterable[Mapping[str, Any]]) -> list[M]:
+    """Map record rows onto *cls* in one pass.
+
+    What ``into=`` does to a list of records, for rows fetched some other way -
+    ``query_raw``, a batch, a live-query backlog. The class is inspected once,
+    not per row, and rows of a pydantic model are validated as one list in a
+    single pydantic-core call rather than one model at a time.
+
+    :raises TypeError: if *cls* is not a class.
+    :raises UnexpectedResponseError: if a row is not a record, or a record's
+        fields do not fit the class's constructor.
+    """
+    _require_model_class(cls)
+    return _mapper_for(cls).rows(cls, rows if isinstance(rows, list) else list(rows))
 
 
 def _statement_rows(values: list[Any]) -> list[Any]:
@@ -566,6 +809,26 @@ def _statement_rows(values: list[Any]) -> list[Any]:
     return [first]
 
 
+def _columns_of(values: list[Any]) -> ColumnBuffers:
+    """The first statement's rows as columns, however they were decoded."""
+    if values and isinstance(values[0], ColumnBuffers):
+        return values[0]
+    buffers = ColumnBuffers()
+    buffers.extend(_statement_rows(values))
+    return buffers
+
+
+def _rows_not_kept() -> RuntimeError:
+    # Columns cannot be turned back into the rows exactly - ints that met a
+    # float are floats, a NULL and an absent field are both None - and
+    # running the query again would repeat any writes in it.
+    return RuntimeError(
+        "this query was read with to_columns() or to_arrow(), which keep no "
+        "rows; build the query again to read its rows, or read the rows first "
+        "and then the columns"
+    )
+
+
 def _require_model_class(cls: Any) -> None:
     """Reject a non-class model argument, at the call that passed it.
 
@@ -620,9 +883,12 @@ def _map_result(into: type[Any] | None, result: Any) -> Any:
         return result
     _require_model_class(into)
     if isinstance(result, list):
-        return [_map_to_class(into, _require_record(into, row)) for row in result]
+        return _mapper_for(into).rows(into, result)
     if result is None:
         return None
+    if type(result) is into:
+        # A single record, built while it was decoded.
+        return result
     return _map_to_class(into, _require_record(into, result))
 
 
@@ -769,7 +1035,8 @@ class AsyncCrudBuilder(_CrudState, Generic[T]):
 
     async def _do_execute(self) -> T:
         query, variables = self._build()
-        response = await self._executor(query, variables)
+        with _decoding_into(self._into):
+            response = await self._executor(query, variables)
         return cast(T, _map_result(self._into, self._extract(response)))
 
     async def execute(self) -> T:
@@ -824,7 +1091,8 @@ class AsyncInsertBuilder(_InsertState, Generic[T]):
 
     async def _do_execute(self) -> list[T]:
         query, variables = self._build()
-        response = await self._executor(query, variables)
+        with _decoding_into(self._into):
+            response = await self._executor(query, variables)
         return cast(list[T], _map_result(self._into, self._extract(response)))
 
     async def execute(self) -> list[T]:
@@ -841,8 +1109,8 @@ class AsyncQueryBuilder(_QueryState):
     single statement (fixes the historic silent-discard behaviour, GH issue
     #232). Use ``.first()`` for the first statement's result.
 
-    Idempotent: the underlying RPC fires once, and ``.into(cls)`` shares
-    the same cached fetch.
+    Idempotent: the underlying RPC fires once, and ``.into(cls)`` and
+    ``.to_columns()`` share the same cached fetch.
     """
 
     def __init__(
@@ -854,14 +1122,55 @@ class AsyncQueryBuilder(_QueryState):
         super().__init__(query, variables)
         self._executor = executor
         self._runner = _AsyncCachedRunner()
+        # Whether the fetch decoded its rows straight into columns; set by
+        # whichever call starts it.
+        self._as_columns = False
+        self._columns: ColumnBuffers | None = None
 
-    async def _fetch_values(self) -> list[Any]:
+    async def _fetch(self, *, as_columns: bool) -> list[Any]:
         async def _do() -> list[Any]:
-            response = await self._executor(self._query, self._variables)
+            with _decoding_rows(decode_columns) if as_columns else nullcontext():
+                response = await self._executor(self._query, self._variables)
             return self._statement_values(response)
 
+        if not self._runner.has_started:
+            self._as_columns = as_columns
         return cast(list[Any], await self._runner.run(_do))
 
+    async def _fetch_values(self) -> list[Any]:
+        values = await self._fetch(as_columns=False)
+        if self._as_columns:
+            raise _rows_not_kept()
+        return values
+
+    async def _fetch_columns(self) -> ColumnBuffers:
+        values = await self._fetch(as_columns=True)
+        if self._columns is None:
+            self._columns = _columns_of(values)
+        return self._columns
+
+    async def to_columns(self) -> dict[str, Column]:
+        """The first statement's rows as typed columns, keyed by field name.
+
+        Numbers come back as ``array`` buffers, other values as lists - see
+        :mod:`surrealdb.data.columns` for the full mapping. On a builder that
+        has not run yet the rows are decoded straight into the columns and
+        never kept, so awaiting the same builder afterwards raises rather than
+        sending the query - and any writes in it - a second time; one that
+        has already run converts the rows it holds.
+        """
+        return (await self._fetch_columns()).to_columns()
+
+    async def to_arrow(self) -> Any:
+        """:meth:`to_columns` as a ``pyarrow.Table``.
+
+        Annotated ``Any`` because pyarrow is optional: an annotation naming it
+        could not be resolved at runtime on an install without it.
+
+        :raises ImportError: if ``pyarrow`` is not installed.
+        """
+        return (await self._fetch_columns()).to_arrow()
+
     @overload
     def into(self, cls: type[U]) -> AsyncQueryIntoBuilder[U]: ...
     @overload
@@ -923,13 +1232,7 @@ class AsyncQueryIntoBuilder(Generic[T_co]):
     async def execute(self) -> T_co:
         values = await self._parent._fetch_values()  # pyright: ignore[reportPrivateUsage]
         if self._rows:
-            return cast(
-                "T_co",
-                [
-                    _map_to_class(self._cls, _require_record(self._cls, row))
-                    for row in _statement_rows(values)
-                ],
-            )
+            return cast("T_co", map_rows(self._cls, _statement_rows(values)))
         return cast("T_co", _map_to_class(self._cls, values))
 
     def __await__(self) -> Generator[Any, None, T_co]:
@@ -1017,7 +1320,8 @@ class SyncCrudBuilder(_CrudState, Generic[T]):
         with self._lock:
             if not self._executed:
                 query, variables = self._build()
-                response = self._executor(query, variables)
+                with _decoding_into(self._into):
+                    response = self._executor(query, variables)
                 self._cached_result = _map_result(self._into, self._extract(response))
                 self._executed = True
             return self._cached_result
@@ -1072,7 +1376,8 @@ class SyncInsertBuilder(_InsertState, Generic[T]):
         with self._lock:
             if not self._executed:
                 query, variables = self._build()
-                response = self._executor(query, variables)
+                with _decoding_into(self._into):
+                    response = self._executor(query, variables)
                 self._cached_result = _map_result(self._into, self._extract(response))
                 self._executed = True
             return self._cached_result
@@ -1090,9 +1395,12 @@ class SyncQueryBuilder(_QueryState):
       statements).
     - ``.into(cls)`` -> the N statement results mapped positionally onto a
       dataclass / class.
+    - ``.to_columns()`` / ``.to_arrow()`` -> the first statement's rows as
+      typed columns.
 
     There are **no** magic dunders. Idempotent: ``.execute()``,
-    ``.first()``, and ``.into(cls)`` all share a single cached fetch.
+    ``.first()``, ``.into(cls)`` and ``.to_columns()`` all share a single
+    cached fetch.
     """
 
     def __init__(
@@ -1105,8 +1413,40 @@ class SyncQueryBuilder(_QueryState):
         self._executor = executor
         self._executed = False
         self._cached_values: list[Any] | None = None
+        # Whether the fetch decoded its rows straight into columns.
+        self._as_columns = False
+        self._columns: ColumnBuffers | None = None
         self._lock = threading.Lock()
 
+    def to_columns(self) -> dict[str, Column]:
+        """The first statement's rows as typed columns, keyed by field name.
+
+        Numbers come back as ``array`` buffers, other values as lists - see
+        :mod:`surrealdb.data.columns` for the full mapping. On a builder that
+        has not run yet the rows are decoded straight into the columns and
+        never kept, so ``.execute()`` on the same builder afterwards raises
+        rather than sending the query - and any writes in it - a second time;
+        one that has already run converts the rows it holds.
+        """
+        return self._fetch_columns().to_columns()
+
+    def to_arrow(self) -> Any:
+        """:meth:`to_columns` as a ``pyarrow.Table``.
+
+        Annotated ``Any`` because pyarrow is optional: an annotation naming it
+        could not be resolved at runtime on an install without it.
+
+        :raises ImportError: if ``pyarrow`` is not installed.
+        """
+        return self._fetch_columns().to_arrow()
+
+    def _fetch_columns(self) -> ColumnBuffers:
+        with self._lock:
+            values = self._fetch(as_columns=True)
+            if self._columns is None:
+                self._columns = _columns_of(values)
+            return self._columns
+
     @overload
     def into(self, cls: type[T]) -> T: ...
     @overload
@@ -1129,10 +1469,7 @@ class SyncQueryBuilder(_QueryState):
         _require_model_class(cls)
         values = self._run_once()
         if rows:
-            return [
-                _map_to_class(cls, _require_record(cls, row))
-                for row in _statement_rows(values)
-            ]
+            return map_rows(cls, _statement_rows(values))
         return _map_to_class(cls, values)
 
     def execute(self) -> list[Value]:
@@ -1147,12 +1484,21 @@ class SyncQueryBuilder(_QueryState):
 
     def _run_once(self) -> list[Any]:
         with self._lock:
-            if not self._executed:
+            values = self._fetch(as_columns=False)
+            if self._as_columns:
+                raise _rows_not_kept()
+            return values
+
+    def _fetch(self, *, as_columns: bool) -> list[Any]:
+        # Called with `_lock` held.
+        if not self._executed:
+            with _decoding_rows(decode_columns) if as_columns else nullcontext():
                 response = self._executor(self._query, self._variables)
-                self._cached_values = self._statement_values(response)
-                self._executed = True
-            assert self._cached_values is not None
-            return self._cached_values
+            self._cached_values = self._statement_values(response)
+            self._as_columns = as_columns
+            self._executed = True
+        assert self._cached_values is not None
+        return self._cached_values
 
 
 __all__ = [
@@ -1166,4 +1512,5 @@ __all__ = [
     "SyncQueryBuilder",
     "_UNSET",
     "_map_result",
+    "map_rows",
 ]
@@ -0,0 +1,110 @@
+"""Tuning for the embedded engine.
+
+The embedded constructors used to take a URL and nothing else, so the only way
+to configure the datastore behind them was whatever the engine happened to read
+from the URL's query string - undocumented here, untyped, and easy to get
+silently wrong. :class:`EmbeddedOptions` is the typed surface for what the
+linked engine reads from the endpoint: versioning, and any storage-engine
+parameter, checked for shape here and rendered into the endpoint's query string.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from urllib.parse import urlencode
+
+from surrealdb.connections.url import Url, UrlScheme
+
+# Schemes backed by files on disk. ``memory``/``mem://`` has no storage engine
+# parameters and no history to version.
+_FILE_SCHEMES = (UrlScheme.FILE, UrlScheme.SURREALKV, UrlScheme.SURREALKV_VERSIONED)
+
+
+@dataclass(frozen=True)
+class EmbeddedOptions:
+    """Datastore settings for an embedded connection.
+
+    Every field defaults to the engine's own behaviour, so
+    ``EmbeddedOptions()`` opens exactly what the bare URL opens.
+
+    Attributes:
+        versioned: Keep MVCC history, as ``surrealkv+versioned://`` does.
+            File-backed only.
+        storage: Storage-engine parameters, passed through as query parameters
+            of the ``surrealkv://`` endpoint - durability, block cache and
+            compaction settings among them. Their names and values are the
+            linked engine's and are only checked for shape. File-backed only.
+    """
+
+    versioned: bool = False
+    storage: Mapping[str, str | int | bool] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Refuse values that cannot be rendered into the endpoint.
+
+        :raises ValueError: for a ``storage`` name that cannot be a query
+            parameter, or that is ``versioned``.
+        :raises TypeError: for a ``storage`` value that is not a str, int or
+            bool.
+        """
+        for key, value in self.storage.items():
+            if not key or any(char in key for char in "&=?#"):
+                raise ValueError(f"{key!r} is not a valid storage parameter name")
+            if key == "versioned":
+                raise ValueError(
+                    "storage parameter 'versioned' has a field of its own; pass "
+                    "EmbeddedOptions(versioned=...) instead"
+                )
+            if not isinstance(value, (str, int, bool)):  # pyright: ignore[reportUnnecessaryIsInstance]
+                raise TypeError(
+                    f"storage parameter {key!r} must be a str, int or bool, got "
+                    f"{type(value).__name__}"
+                )
+
+
+def engine_url(url: str, options: EmbeddedOptions | None) -> str:
+    """Render *url* with *options* applied.
+
+    ``versioned`` and ``storage`` are query parameters of the endpoint, which
+    is where the engine reads them, so they are appended to whatever query
+    string the caller's URL already has. Setting one parameter in both places
+    is refused rather than resolved: a duplicate would leave the engine to
+    pick one, and neither choice is obviously what the caller meant.
+
+    :raises ValueError: if *options* asks for storage parameters or versioning
+        on an in-memory database, or repeats a parameter the URL already sets.
+    """
+    if options is None:
+        return url
+    params: dict[str, str] = {
+        key: _render(value) for key, value in options.storage.items()
+    }
+    if options.versioned:
+        params["versioned"] = "true"
+    if not params:
+        return url
+    if Url(url).scheme not in _FILE_SCHEMES:
+        raise ValueError(
+            f"{', '.join(sorted(params))} only apply to a file-backed database "
+            f"(file://, surrealkv://), not {url!r}"
+        )
+    base, _, existing = url.partition("?")
+    present = {pair.partition("=")[0] for pair in existing.split("&") if pair}
+    if url.startswith("surrealkv+versioned://"):
+        present.add("versioned")
+    clashes = sorted(present & params.keys())
+    if clashes:
+        raise ValueError(
+            f"{url!r} already sets {', '.join(clashes)}; set it in the URL or in "
+            "EmbeddedOptions, not both"
+        )
+    query = "&".join(part for part in (existing, urlencode(params)) if part)
+    return f"{base}?{query}"
+
+
+def _render(value: str | int | bool) -> str:
+    # ``str(True)`` is ``"True"``, which is not how the engine spells it.
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
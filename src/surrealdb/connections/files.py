@@ -18,10 +18,33 @@ query. That is not a style preference: SurrealQL's ``f"bucket:/key"`` literal
 accepts only ``[A-Za-z0-9_-./]`` and has no escape mechanism, so a key with a
 space, an accent or an emoji cannot be written as a literal at all. Bound, every
 key works - see ``surrealdb.data.types.file`` for the parser's own wording.
+
+``put_many``, ``get_many``, ``copy_many`` and ``delete_many`` pack one
+statement per file into a few multi-statement queries - still bound, ``$f0``,
+``$f1``, ... - and report each file's outcome on its own, as a ``FileResult``.
+
+``put_stream`` and ``open`` move a file in parts, so the client never holds a
+large transfer whole. The server does: it has no append and no ranged read, so
+parts are temporary files next to the real one, joined or split by a single
+server-side query - see ``_ASSEMBLE`` - and that query holds the whole file,
+and its base64 text, in the server's memory while it runs.
 """
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import io
+import itertools
+import uuid
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextlib import suppress
 from dataclasses import dataclass
 from typing import Any, Protocol
 
@@ -31,9 +54,81 @@ from typing import Any, Protocol
 # for type checkers raises `NameError` there.
 from surrealdb.data.types.datetime import PreciseDatetime
 from surrealdb.data.types.file import File
-from surrealdb.errors import UnexpectedResponseError
+from surrealdb.errors import (
+    UnexpectedResponseError,
+    parse_query_error,
+    parse_rpc_error,
+)
+
+__all__ = [
+    "AsyncFileReader",
+    "AsyncFiles",
+    "BlockingFileReader",
+    "BlockingFiles",
+    "FileMetadata",
+    "FileResult",
+]
+
+#: The default part size of ``put_stream`` and ``open``. A multiple of 3; see
+#: ``_ASSEMBLE``.
+DEFAULT_CHUNK_SIZE = 6 * 1024 * 1024
+
+_Bytes = bytes | bytearray | memoryview
+
+
+class _Readable(Protocol):
+    def read(self, size: int, /) -> _Bytes: ...
+
+
+class _AsyncReadable(Protocol):
+    async def read(self, size: int, /) -> _Bytes: ...
+
+
+#: What ``put_stream`` reads from: bytes, a binary file object, or an iterable
+#: of byte chunks of any size.
+StreamSource = _Bytes | _Readable | Iterable[_Bytes]
+#: The async ``put_stream`` also takes an async iterable, or an async ``read()``.
+AsyncStreamSource = StreamSource | _AsyncReadable | AsyncIterable[_Bytes]
 
-__all__ = ["AsyncFiles", "BlockingFiles", "FileMetadata"]
+# SurrealQL has no append and no ranged read for files, and no operator that
+# joins two `bytes` values. Base64 bridges that: parts that are each a
+# multiple of 3 bytes long encode to text that concatenates into the encoding
+# of the whole, with padding only ever at the very end, so joining strings does
+# what a bytes join would. The parts are deleted in the same query, so a
+# finished upload leaves nothing behind.
+#
+# The server holds every part's text, their join and the decoded file at once,
+# about 3.7 times the file's size. Joining in smaller groups would not bound
+# that: the last join still builds the whole file, as `file::put` takes it in
+# one value.
+_ASSEMBLE = (
+    "RETURN file::put($f, encoding::base64::decode(array::join("
+    'array::map($parts, |$p| encoding::base64::encode(file::get($p))), "")));'
+    "RETURN array::map($parts, |$p| file::delete($p));"
+)
+# The reverse, for `open`: encode once, and cut the text into slices of
+# `$n` characters - 3 bytes per 4 characters, so each decodes on its own.
+# `file::get` returns the whole file, so the server holds it and its text.
+_SPLIT = (
+    "LET $e = encoding::base64::encode(file::get($f));"
+    "RETURN array::map($parts, |$p| file::put($p.file, "
+    "encoding::base64::decode(string::slice($e, $p.start, $n))));"
+)
+_DELETE_ALL = "RETURN array::map($parts, |$p| file::delete($p))"
+
+# The `*_many` methods send one statement per file, `{n}` numbering its
+# parameters within the query. Separate statements rather than one
+# `array::map`, because a statement fails as a whole: one missing source
+# would fail every copy mapped alongside it.
+_PUT_ONE = "RETURN file::put($f{n}, $c{n})"
+_GET_ONE = "RETURN file::get($f{n})"
+_COPY_ONE = "RETURN file::copy($s{n}, $t{n})"
+_DELETE_ONE = "RETURN file::delete($f{n})"
+#: At most this many statements go in one ``*_many`` query, ...
+_BATCH_STATEMENTS = 64
+#: ... and at most this many bytes of ``put_many`` content, unless one file is
+#: larger on its own - it then goes alone, in a query of one statement.
+_BATCH_BYTES = 4 * 1024 * 1024
 
 
 @dataclass(frozen=True)
@@ -45,9 +140,32 @@ class FileMetadata:
     updated: PreciseDatetime | None
 
 
+@dataclass(frozen=True)
+class FileResult:
+    """One file's outcome in a ``put_many``, ``get_many``, ``copy_many`` or
+    ``delete_many`` call - which return one per file, in the order given.
+
+    ``value`` is the file's bytes (or ``None`` if it does not exist) for
+    ``get_many``, and ``None`` otherwise. ``file`` is the target for
+    ``copy_many``.
+    """
+
+    file: File
+    value: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class _QueryRunner(Protocol):
     def query(self, query: str, vars: dict[str, Any] | None = ...) -> Any: ...
 
+    # Not `query`: that raises on the first failed statement, and a `*_many`
+    # batch needs every statement's status.
+    def query_raw(self, query: str, vars: dict[str, Any] | None = ...) -> Any: ...
+
 
 def _metadata(raw: Any) -> FileMetadata:
     """Turn one ``{file, size, updated}`` object into a ``FileMetadata``.
@@ -148,6 +266,216 @@ def _check_key(value: object) -> None:
         raise TypeError(f"key must be a str, not {type(value).__name__}: {value!r}")
 
 
+def _part_size(chunk_size: int) -> int:
+    """*chunk_size*, rounded down to the multiple of 3 ``_ASSEMBLE`` needs."""
+    if isinstance(chunk_size, bool) or not isinstance(chunk_size, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError(f"chunk_size must be an int, not {type(chunk_size).__name__}")
+    if chunk_size < 3:
+        raise ValueError(f"chunk_size must be at least 3 bytes, got {chunk_size}")
+    return chunk_size - chunk_size % 3
+
+
+def _part_file(file: File, token: str, n: int) -> File:
+    """The *n*-th temporary part beside *file*, for the transfer *token*."""
+    return File(file.bucket, f"{file.key}.~part-{token}-{n:06d}")
+
+
+class _Rechunker:
+    """Cuts byte chunks of any size into parts of exactly ``size`` bytes."""
+
+    __slots__ = ("_buffer", "size")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._buffer = bytearray()
+
+    def feed(self, piece: object) -> Iterator[bytes]:
+        if not isinstance(piece, (bytes, bytearray, memoryview)):
+            _check_content(piece)  # raises, saying what to pass instead
+        buffer = self._buffer
+        buffer += piece  # type: ignore[arg-type]
+        while len(buffer) >= self.size:
+            yield bytes(buffer[: self.size])
+            del buffer[: self.size]
+
+    def rest(self) -> bytes | None:
+        return bytes(self._buffer) if self._buffer else None
+
+
+def _parts_of(source: Any, size: int) -> Iterator[bytes]:
+    """The parts of a blocking ``put_stream`` source, one at a time."""
+    if isinstance(source, str):
+        _check_content(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        for start in range(0, len(view), size):
+            yield bytes(view[start : start + size])
+        return
+    chunker = _Rechunker(size)
+    if hasattr(source, "read"):
+        # `read(n)` may return less than `n` before the end - a pipe or a
+        # socket does - so the result goes through the rechunker too.
+        while piece := source.read(size):
+            yield from chunker.feed(piece)
+    else:
+        for piece in source:
+            yield from chunker.feed(piece)
+    if (rest := chunker.rest()) is not None:
+        yield rest
+
+
+async def _aparts_of(source: Any, size: int) -> AsyncIterator[bytes]:
+    """The parts of an async ``put_stream`` source, one at a time."""
+    if isinstance(source, AsyncIterable):
+        chunker = _Rechunker(size)
+        async for piece in source:
+            for part in chunker.feed(piece):
+                yield part
+        if (rest := chunker.rest()) is not None:
+            yield rest
+    elif hasattr(source, "read") and inspect.iscoroutinefunction(source.read):
+        chunker = _Rechunker(size)
+        while piece := await source.read(size):
+            for part in chunker.feed(piece):
+                yield part
+        if (rest := chunker.rest()) is not None:
+            yield rest
+    else:
+        for part in _parts_of(source, size):
+            yield part
+
+
+def _split(file: File, size: int, part_size: int) -> tuple[list[File], dict[str, Any]]:
+    """The parts *file* is read through, and the vars of ``_SPLIT`` for them."""
+    token = uuid.uuid4().hex[:12]
+    parts = [_part_file(file, token, n) for n in range(-(-size // part_size))]
+    width = part_size // 3 * 4
+    return parts, {
+        "f": file,
+        "n": width,
+        "parts": [{"file": part, "start": n * width} for n, part in enumerate(parts)],
+    }
+
+
+def _not_found(file: File) -> FileNotFoundError:
+    return FileNotFoundError(f"{file.bucket}:{file.key} does not exist")
+
+
+def _check_positive(value: int, argument: str) -> None:
+    if isinstance(value, bool) or not isinstance(value, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError(f"{argument} must be an int, not {type(value).__name__}")
+    if value < 1:
+        raise ValueError(f"{argument} must be positive, got {value}")
+
+
+def _check_bucket(value: object) -> None:
+    if not isinstance(value, str):
+        raise TypeError(f"bucket must be a str, not {type(value).__name__}")
+
+
+def _pairs(items: Any, method: str) -> list[tuple[Any, Any]]:
+    """``put_many``'s and ``copy_many``'s argument, as a list of pairs."""
+    pairs = list(items.items() if isinstance(items, Mapping) else items)
+    for pair in pairs:
+        if not isinstance(pair, tuple) or len(pair) != 2:
+            raise TypeError(
+                f"{method}() takes a mapping or (file, ...) pairs, not {pair!r}"
+            )
+    return pairs
+
+
+#: One ``*_many`` query: the files it is about, its SurrealQL, and its vars.
+_Batch = tuple[list[File], str, dict[str, Any]]
+#: What the ``*_many`` methods return - an alias, because inside the ``*Files``
+#: classes ``list`` is the method, not the builtin.
+_Results = list[FileResult]
+
+
+def _pack(
+    template: str,
+    files: list[File],
+    params: list[dict[str, Any]],
+    sizes: list[int] | None = None,
+) -> list[_Batch]:
+    """Pack one *template* statement per file into as few queries as the limits allow.
+
+    Batches are runs of consecutive files, so results come back in the
+    caller's order by concatenating them.
+    """
+    batches: list[_Batch] = []
+    start = 0
+    while start < len(files):
+        end, budget = start, 0
+        while end < len(files) and end - start < _BATCH_STATEMENTS:
+            size = sizes[end] if sizes is not None else 0
+            if end > start and budget + size > _BATCH_BYTES:
+                break
+            budget += size
+            end += 1
+        vars = {
+            f"{name}{n}": value
+            for n, item in enumerate(params[start:end])
+            for name, value in item.items()
+        }
+        query = ";".join(template.format(n=n) for n in range(end - start))
+        batches.append((files[start:end], query, vars))
+        start = end
+    return batches
+
+
+def _batch_results(files: list[File], response: Any) -> list[FileResult]:
+    """Split a ``query_raw`` response into one ``FileResult`` per statement."""
+    if isinstance(response, dict) and response.get("error") is not None:
+        error = parse_rpc_error(response["error"])
+        return [FileResult(file, error=error) for file in files]
+    statements = response.get("result") if isinstance(response, dict) else None
+    if not isinstance(statements, list) or len(statements) != len(files):
+        raise UnexpectedResponseError(
+            f"expected {len(files)} statement results, got {response!r}"
+        )
+    return [
+        FileResult(file, error=parse_query_error(statement))
+        if statement.get("status") == "ERR"
+        else FileResult(file, value=statement.get("result"))
+        for file, statement in zip(files, statements, strict=True)
+    ]
+
+
+def _failed(files: list[File], error: Exception) -> list[FileResult]:
+    # The whole query failed - the connection dropped, say - so every file in
+    # it did, and the batches after it still get their chance.
+    return [FileResult(file, error=error) for file in files]
+
+
+def _put_batches(items: Any) -> list[_Batch]:
+    pairs = _pairs(items, "put_many")
+    files, params, sizes = [], [], []
+    for file, content in pairs:
+        _check_file(file)
+        payload = _check_content(content)
+        files.append(file)
+        params.append({"f": file, "c": payload})
+        sizes.append(len(payload))
+    return _pack(_PUT_ONE, files, params, sizes)
+
+
+def _file_batches(template: str, files: Iterable[File]) -> list[_Batch]:
+    files = list(files)
+    for file in files:
+        _check_file(file)
+    return _pack(template, files, [{"f": file} for file in files])
+
+
+def _copy_batches(pairs: Any) -> list[_Batch]:
+    targets, params = [], []
+    for source, target in _pairs(pairs, "copy_many"):
+        _check_file(source, "source")
+        _check_file(target, "target")
+        targets.append(target)
+        params.append({"s": source, "t": target})
+    return _pack(_COPY_ONE, targets, params)
+
+
 class BlockingFiles:
     """``db.files`` on a blocking connection, session or transaction."""
 
@@ -212,8 +540,7 @@ class BlockingFiles:
         behaviour and worth surfacing rather than flattening to ``[]`` - an empty
         bucket and a misspelled one are different mistakes.
         """
-        if not isinstance(bucket, str):  # pyright: ignore[reportUnnecessaryIsInstance]
-            raise TypeError(f"bucket must be a str, not {type(bucket).__name__}")
+        _check_bucket(bucket)
         options = _list_options(limit, prefix, start)
         if options:
             raw = self._first("RETURN file::list($b, $o)", {"b": bucket, "o": options})
@@ -221,6 +548,37 @@ class BlockingFiles:
             raw = self._first("RETURN file::list($b)", {"b": bucket})
         return [_metadata(entry) for entry in (raw or [])]
 
+    def iter(
+        self,
+        bucket: str,
+        *,
+        prefix: str | None = None,
+        start: str | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[FileMetadata]:
+        """Every file in ``bucket``, as ``list`` returns them, a page at a time.
+
+        Each page is a ``list`` call of ``page_size`` files, continuing after
+        the last key of the one before - ``start`` being exclusive - so a
+        bucket of millions of files is never held in memory at once. Pages are
+        fetched as the iteration reaches them; arguments are checked here,
+        when ``iter`` is called.
+        """
+        _check_bucket(bucket)
+        _check_positive(page_size, "page_size")
+        _list_options(None, prefix, start)
+        return self._pages(bucket, prefix, start, page_size)
+
+    def _pages(
+        self, bucket: str, prefix: str | None, start: str | None, page_size: int
+    ) -> Iterator[FileMetadata]:
+        while True:
+            page = self.list(bucket, limit=page_size, prefix=prefix, start=start)
+            yield from page
+            if len(page) < page_size:
+                return
+            start = page[-1].file.key
+
     def copy(self, source: File, target: File) -> None:
         _check_file(source, "source")
         _check_file(target, "target")
@@ -244,6 +602,116 @@ class BlockingFiles:
         _check_key(key)
         self._first("RETURN file::rename_if_not_exists($f, $k)", {"f": file, "k": key})
 
+    def put_many(
+        self, items: Mapping[File, _Bytes] | Iterable[tuple[File, _Bytes]]
+    ) -> _Results:
+        """Write many files in a few queries; one ``FileResult`` each, in order.
+
+        *items* maps each file to its content, as a mapping or as pairs. Every
+        file and content is checked before anything is sent, so a ``str`` in
+        the middle raises rather than leaving half the files written. After
+        that nothing raises: a file that fails, or a query that does, is
+        reported in its results and the rest still go.
+        """
+        return self._run(_put_batches(items))
+
+    def get_many(self, files: Iterable[File]) -> _Results:
+        """Read many files in a few queries; see ``put_many``.
+
+        Each result's ``value`` is the bytes, or ``None`` if that file does
+        not exist.
+        """
+        return self._run(_file_batches(_GET_ONE, files))
+
+    def copy_many(
+        self, pairs: Mapping[File, File] | Iterable[tuple[File, File]]
+    ) -> _Results:
+        """Copy each source to its target in a few queries; see ``put_many``."""
+        return self._run(_copy_batches(pairs))
+
+    def delete_many(self, files: Iterable[File]) -> _Results:
+        """Delete many files in a few queries; see ``put_many``."""
+        return self._run(_file_batches(_DELETE_ONE, files))
+
+    def _run(self, batches: Iterable[_Batch]) -> _Results:
+        # One batch at a time: a blocking connection sends one request at a
+        # time anyway, so the saving is in the packing.
+        results: _Results = []
+        for files, query, vars in batches:
+            try:
+                results += _batch_results(files, self._runner.query_raw(query, vars))
+            except Exception as error:
+                results += _failed(files, error)
+        return results
+
+    def put_stream(
+        self,
+        file: File,
+        source: StreamSource,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Write *source* to ``file`` a part at a time; return the bytes written.
+
+        For content too large to hold in memory at once. *source* is bytes, a
+        binary file object, or an iterable of byte chunks of any size, and at
+        most one part of it - ``chunk_size`` bytes, rounded down to a multiple
+        of 3 - is held at a time. Content that fits in one part is a plain
+        :meth:`put`. Anything larger is written as temporary parts beside
+        ``file`` and joined into it server-side, so ``file`` is replaced only
+        once every part has arrived; if the upload fails, the parts written so
+        far are deleted.
+
+        Only the client's memory is bounded. The join is one query that holds
+        the whole file on the server, with its base64 text - several times the
+        file's size at once.
+
+        The parts go one at a time: a blocking connection sends one RPC at a
+        time anyway. ``AsyncFiles.put_stream`` sends several at once.
+        """
+        _check_file(file)
+        parts = _parts_of(source, _part_size(chunk_size))
+        first = next(parts, b"")
+        second = next(parts, None)
+        if second is None:
+            self.put(file, first)
+            return len(first)
+        token = uuid.uuid4().hex[:12]
+        written: list[File] = []
+        total = 0
+        try:
+            for part in itertools.chain((first, second), parts):
+                target = _part_file(file, token, len(written))
+                written.append(target)
+                self.put(target, part)
+                total += len(part)
+            self._runner.query(_ASSEMBLE, {"f": file, "parts": written}).execute()
+        except BaseException:
+            with suppress(Exception):
+                self._runner.query(_DELETE_ALL, {"parts": written}).execute()
+            raise
+        return total
+
+    def open(
+        self, file: File, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> BlockingFileReader:
+        """Read ``file`` a part at a time, as a binary file object.
+
+        Raises ``FileNotFoundError`` if it does not exist. Close the reader -
+        or use it as a context manager - so that the temporary parts of a large
+        file are not left behind if it is not read to the end.
+
+        Only the client's memory is bounded: a file larger than one part is
+        split by one query that holds it whole on the server, with its base64
+        text.
+        """
+        _check_file(file)
+        part_size = _part_size(chunk_size)
+        metadata = self.head(file)
+        if metadata is None:
+            raise _not_found(file)
+        return BlockingFileReader(self, file, metadata.size, part_size)
+
 
 class AsyncFiles:
     """``db.files`` on an async connection, session or transaction."""
@@ -301,8 +769,7 @@ class AsyncFiles:
         start: str | None = None,
     ) -> list[FileMetadata]:
         """Every file in ``bucket``, ordered by key. ``start`` is exclusive."""
-        if not isinstance(bucket, str):  # pyright: ignore[reportUnnecessaryIsInstance]
-            raise TypeError(f"bucket must be a str, not {type(bucket).__name__}")
+        _check_bucket(bucket)
         options = _list_options(limit, prefix, start)
         if options:
             raw = await self._first(
@@ -312,6 +779,48 @@ class AsyncFiles:
             raw = await self._first("RETURN file::list($b)", {"b": bucket})
         return [_metadata(entry) for entry in (raw or [])]
 
+    def iter(
+        self,
+        bucket: str,
+        *,
+        prefix: str | None = None,
+        start: str | None = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[FileMetadata]:
+        """As ``BlockingFiles.iter``, for ``async for``.
+
+        The next page is requested as soon as the current one arrives, so it
+        is on its way while the caller works through this one. Stopping early
+        cancels it.
+        """
+        _check_bucket(bucket)
+        _check_positive(page_size, "page_size")
+        _list_options(None, prefix, start)
+        return self._pages(bucket, prefix, start, page_size)
+
+    async def _pages(
+        self, bucket: str, prefix: str | None, start: str | None, page_size: int
+    ) -> AsyncIterator[FileMetadata]:
+        def fetch(start: str | None) -> asyncio.Future[Any]:
+            return asyncio.ensure_future(
+                self.list(bucket, limit=page_size, prefix=prefix, start=start)
+            )
+
+        next_page: asyncio.Future[Any] | None = fetch(start)
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if len(page) == page_size:
+                    next_page = fetch(page[-1].file.key)
+                for entry in page:
+                    yield entry
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+                # Retrieves the page's error too, had it failed unawaited.
+                await asyncio.gather(next_page, return_exceptions=True)
+
     async def copy(self, source: File, target: File) -> None:
         _check_file(source, "source")
         _check_file(target, "target")
@@ -336,3 +845,311 @@ class AsyncFiles:
         await self._first(
             "RETURN file::rename_if_not_exists($f, $k)", {"f": file, "k": key}
         )
+
+    async def put_many(
+        self,
+        items: Mapping[File, _Bytes] | Iterable[tuple[File, _Bytes]],
+        *,
+        concurrency: int = 4,
+    ) -> _Results:
+        """As ``BlockingFiles.put_many``, with up to ``concurrency`` queries in flight."""
+        return await self._run(_put_batches(items), concurrency)
+
+    async def get_many(
+        self, files: Iterable[File], *, concurrency: int = 4
+    ) -> _Results:
+        """As ``BlockingFiles.get_many``, with up to ``concurrency`` queries in flight."""
+        return await self._run(_file_batches(_GET_ONE, files), concurrency)
+
+    async def copy_many(
+        self,
+        pairs: Mapping[File, File] | Iterable[tuple[File, File]],
+        *,
+        concurrency: int = 4,
+    ) -> _Results:
+        """As ``BlockingFiles.copy_many``, with up to ``concurrency`` queries in flight."""
+        return await self._run(_copy_batches(pairs), concurrency)
+
+    async def delete_many(
+        self, files: Iterable[File], *, concurrency: int = 4
+    ) -> _Results:
+        """As ``BlockingFiles.delete_many``, with up to ``concurrency`` queries in flight."""
+        return await self._run(_file_batches(_DELETE_ONE, files), concurrency)
+
+    async def _run(self, batches: Iterable[_Batch], concurrency: int) -> _Results:
+        _check_positive(concurrency, "concurrency")
+        slots = asyncio.Semaphore(concurrency)
+
+        async def run(batch: _Batch) -> _Results:
+            files, query, vars = batch
+            async with slots:
+                try:
+                    response = await self._runner.query_raw(query, vars)
+                    return _batch_results(files, response)
+                except Exception as error:
+                    return _failed(files, error)
+
+        done = await asyncio.gather(*(run(batch) for batch in batches))
+        return [result for results in done for result in results]
+
+    async def put_stream(
+        self,
+        file: File,
+        source: AsyncStreamSource,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = 4,
+    ) -> int:
+        """Write *source* to ``file`` a part at a time; return the bytes written.
+
+        As ``BlockingFiles.put_stream``, but *source* may also be an async
+        iterable or have an async ``read()``, and up to ``concurrency`` parts
+        are uploaded at once - so at most that many, plus the one being read,
+        are held in the client's memory. The join holds the whole file on the
+        server, as there.
+        """
+        _check_file(file)
+        _check_positive(concurrency, "concurrency")
+        parts = _aparts_of(source, _part_size(chunk_size))
+        first = await anext(parts, b"")
+        second = await anext(parts, None)
+        if second is None:
+            await self.put(file, first)
+            return len(first)
+        token = uuid.uuid4().hex[:12]
+        written: list[File] = []
+        uploads: set[asyncio.Future[None]] = set()
+        total = 0
+
+        async def upload(part: bytes) -> None:
+            nonlocal uploads, total
+            if len(uploads) >= concurrency:
+                done, uploads = await asyncio.wait(
+                    uploads, return_when=asyncio.FIRST_COMPLETED
+                )
+                # gather, not .result() on each: a second failure in the
+                # same batch would otherwise be logged as never retrieved.
+                await asyncio.gather(*done)
+            target = _part_file(file, token, len(written))
+            written.append(target)
+            uploads.add(asyncio.ensure_future(self.put(target, part)))
+            total += len(part)
+
+        try:
+            await upload(first)
+            await upload(second)
+            async for part in parts:
+                await upload(part)
+            await asyncio.gather(*uploads)
+            await self._runner.query(_ASSEMBLE, {"f": file, "parts": written}).execute()
+        except BaseException:
+            for pending in uploads:
+                pending.cancel()
+            await asyncio.gather(*uploads, return_exceptions=True)
+            with suppress(Exception):
+                await self._runner.query(_DELETE_ALL, {"parts": written}).execute()
+            raise
+        return total
+
+    def open(
+        self, file: File, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncFileReader:
+        """Read ``file`` a part at a time; use with ``async with``.
+
+        Nothing is sent until the reader is entered or first read, which is
+        when a missing file raises ``FileNotFoundError``. While one part is
+        being consumed the next is already being fetched. As with
+        ``BlockingFiles.open``, the split holds the whole file on the server.
+        """
+        _check_file(file)
+        return AsyncFileReader(self, file, _part_size(chunk_size))
+
+
+class BlockingFileReader(io.RawIOBase):
+    """A stored file read a part at a time: what ``files.open()`` returns.
+
+    A read-only, unseekable binary file object, so ``shutil.copyfileobj`` and
+    ``io.BufferedReader`` take it. :meth:`chunks` yields whole parts, without
+    the copying that small reads do. A file larger than one part is first split
+    into temporary parts server-side, on the first read; each is deleted once it
+    has been read, and :meth:`close` deletes any left.
+    """
+
+    def __init__(
+        self, files: BlockingFiles, file: File, size: int, part_size: int
+    ) -> None:
+        super().__init__()
+        #: The file being read, and its size in bytes when it was opened.
+        self.file = file
+        self.size = size
+        self._files = files
+        self._part_size = part_size
+        self._pending: list[File] | None = None
+        self._owned = False
+        self._current = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_part(self) -> bytes | None:
+        if self._pending is None:
+            if self.size <= self._part_size:
+                self._pending = [self.file]
+            else:
+                self._pending, split_vars = _split(
+                    self.file, self.size, self._part_size
+                )
+                self._owned = True
+                self._files._runner.query(_SPLIT, split_vars).execute()
+        if not self._pending:
+            return None
+        part = self._pending[0]
+        data = self._files.get(part)
+        if self._owned:
+            self._files.delete(part)
+        del self._pending[0]
+        if data is None:
+            raise _not_found(self.file)
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._current:
+            part = self._next_part()
+            if part is None:
+                return 0
+            self._current = memoryview(part)
+        count = min(len(buffer), len(self._current))
+        buffer[:count] = self._current[:count]
+        self._current = self._current[count:]
+        return count
+
+    def readall(self) -> bytes:
+        return b"".join(self.chunks())
+
+    def chunks(self) -> Iterator[bytes]:
+        """The rest of the file, a part at a time."""
+        if self._current:
+            yield bytes(self._current)
+            self._current = memoryview(b"")
+        while (part := self._next_part()) is not None:
+            yield part
+
+    def close(self) -> None:
+        if not self.closed and self._owned and self._pending:
+            with suppress(Exception):
+                self._files._runner.query(
+                    _DELETE_ALL, {"parts": self._pending}
+                ).execute()
+            self._pending = []
+        super().close()
+
+
+class AsyncFileReader:
+    """A stored file read a part at a time: what ``files.open()`` returns.
+
+    ``await reader.read(n)`` as from a file, or ``async for chunk in reader``
+    for whole parts. The next part is fetched while the current one is being
+    consumed. A file larger than one part is first split into temporary parts
+    server-side; each is deleted once it has been read, and :meth:`close`
+    deletes any left.
+    """
+
+    def __init__(self, files: AsyncFiles, file: File, part_size: int) -> None:
+        #: The file being read, and - once the reader has started - its size in
+        #: bytes when it was opened.
+        self.file = file
+        self.size: int | None = None
+        self._files = files
+        self._part_size = part_size
+        self._pending: list[File] | None = None
+        self._owned: list[File] = []
+        self._prefetch: asyncio.Future[bytes] | None = None
+        self._current = memoryview(b"")
+        self._closed = False
+
+    async def _start(self) -> None:
+        if self._pending is not None:
+            return
+        metadata = await self._files.head(self.file)
+        if metadata is None:
+            raise _not_found(self.file)
+        self.size = metadata.size
+        if self.size <= self._part_size:
+            self._pending = [self.file]
+            return
+        parts, split_vars = _split(self.file, self.size, self._part_size)
+        self._owned = list(parts)
+        await self._files._runner.query(_SPLIT, split_vars).execute()
+        self._pending = parts
+
+    async def _fetch(self, part: File) -> bytes:
+        data = await self._files.get(part)
+        if part in self._owned:
+            await self._files.delete(part)
+            self._owned.remove(part)
+        if data is None:
+            raise _not_found(self.file)
+        return data
+
+    async def _next_part(self) -> bytes | None:
+        if self._closed:
+            raise ValueError("read from a closed file reader")
+        await self._start()
+        assert self._pending is not None
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is None:
+            if not self._pending:
+                return None
+            prefetch = asyncio.ensure_future(self._fetch(self._pending.pop(0)))
+        part = await prefetch
+        if self._pending:
+            self._prefetch = asyncio.ensure_future(self._fetch(self._pending.pop(0)))
+        return part
+
+    async def read(self, size: int = -1) -> bytes:
+        """Up to *size* bytes - all that are left if negative; ``b""`` at the end."""
+        if size < 0:
+            return b"".join([part async for part in self])
+        while not self._current:
+            part = await self._next_part()
+            if part is None:
+                return b""
+            self._current = memoryview(part)
+        data = bytes(self._current[:size])
+        self._current = self._current[size:]
+        return data
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """The rest of the file, a part at a time."""
+        if self._current:
+            yield bytes(self._current)
+            self._current = memoryview(b"")
+        while (part := await self._next_part()) is not None:
+            yield part
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.chunks()
+
+    async def close(self) -> None:
+        """Stop reading, and delete the temporary parts not yet read."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            # Not `suppress(BaseException)`: that would also swallow a
+            # cancellation aimed at `close()` itself.
+            await asyncio.gather(self._prefetch, return_exceptions=True)
+        if self._owned:
+            with suppress(Exception):
+                await self._files._runner.query(
+                    _DELETE_ALL, {"parts": self._owned}
+                ).execute()
+            self._owned = []
+
+    async def __aenter__(self) -> AsyncFileReader:
+        await self._start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
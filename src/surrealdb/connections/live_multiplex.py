@@ -0,0 +1,494 @@
+"""Many local subscribers sharing one server-side live query.
+
+A service that wants "changes to ``order`` for tenant X" per request, per
+websocket client or per worker used to open one live query each, or one
+full-table query per process and filter every notification in Python against
+every consumer. Neither scales: the first multiplies server-side live queries,
+the second tests each notification against each consumer's predicate.
+
+A multiplexer runs one ``LIVE SELECT`` - filtered and projected on the server,
+so irrelevant rows are never sent - and fans its notifications out to local
+subscribers, each with its own bounded queue and its own ``where``. Routing is
+done by :class:`PredicateDispatcher`, which indexes subscribers by one of their
+equality conditions, so delivering a notification costs a dictionary lookup per
+indexed field rather than a test per subscriber.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from collections.abc import AsyncGenerator, Generator, Mapping
+from typing import Any, Generic, Protocol, TypeVar
+from uuid import UUID
+
+from surrealdb.connections.live_queue import (
+    AsyncLiveQueue,
+    AsyncLiveSubscription,
+    LiveQueue,
+    LiveSubscription,
+    OverflowPolicy,
+    check_queue_options,
+    is_overflow_marker,
+    overflow_error,
+)
+from surrealdb.connections.utils_mixin import check_live_select
+from surrealdb.errors import SurrealError
+from surrealdb.types import Value
+
+_K = TypeVar("_K")
+
+# Marks a field a record does not have; `None` is a value a field can hold.
+_MISSING = object()
+
+# Pushed to every subscriber when the shared live query ends cleanly.
+_END = object()
+
+
+def _lookup(record: Any, path: str) -> Any:
+    """The value at a dotted *path* in *record*, or ``_MISSING``."""
+    value = record
+    for segment in path.split("."):
+        if not isinstance(value, Mapping):
+            return _MISSING
+        value = value.get(segment, _MISSING)  # pyright: ignore[reportUnknownMemberType]
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+
+def _conditions(where: Mapping[str, Value] | None) -> tuple[tuple[str, Any], ...]:
+    if where is None:
+        return ()
+    if not isinstance(where, Mapping):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError(
+            f"where must be a mapping of field to value, got {type(where).__name__}"
+        )
+    conditions: list[tuple[str, Any]] = []
+    for field, value in where.items():
+        if not isinstance(field, str) or not field:  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise ValueError(
+                f"where field names must be non-empty strings, got {field!r}"
+            )
+        try:
+            hash(value)
+        except TypeError:
+            raise TypeError(
+                f"where[{field!r}] must be a hashable value to be indexed, got "
+                f"{type(value).__name__}"
+            ) from None
+        conditions.append((field, value))
+    return tuple(conditions)
+
+
+class PredicateDispatcher(Generic[_K]):
+    """Route records to the subscribers whose ``where`` they satisfy.
+
+    A ``where`` maps field paths (``"tenant"``, ``"customer.region"``) to the
+    value each must equal; every condition has to hold. A subscriber with no
+    conditions receives every record.
+
+    Each subscriber is indexed under one of its conditions - ``field -> value
+    -> subscribers`` - and only its remaining conditions are tested, and only
+    for records that hit its bucket. A field some other subscriber is already
+    indexed under is preferred, so a thousand per-tenant subscribers cost one
+    lookup per record, not a thousand comparisons.
+    """
+
+    def __init__(self) -> None:
+        self._unfiltered: dict[_K, None] = {}
+        self._index: dict[str, dict[Any, dict[_K, tuple[tuple[str, Any], ...]]]] = {}
+        self._indexed_under: dict[_K, tuple[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._unfiltered) + len(self._indexed_under)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._unfiltered or key in self._indexed_under
+
+    def add(self, key: _K, where: Mapping[str, Value] | None = None) -> None:
+        """Register *key* for records matching *where*.
+
+        :raises ValueError: if *key* is already registered, or a field name is
+            empty.
+        :raises TypeError: if *where* is not a mapping, or a value is not
+            hashable - it could never be looked up.
+        """
+        conditions = _conditions(where)
+        if key in self:
+            raise ValueError(f"{key!r} is already registered")
+        if not conditions:
+            self._unfiltered[key] = None
+            return
+        chosen = next(
+            (condition for condition in conditions if condition[0] in self._index),
+            conditions[0],
+        )
+        rest = tuple(condition for condition in conditions if condition is not chosen)
+        field, value = chosen
+        self._index.setdefault(field, {}).setdefault(value, {})[key] = rest
+        self._indexed_under[key] = chosen
+
+    def remove(self, key: _K) -> None:
+        """Forget *key*. Does nothing if it is not registered."""
+        if self._unfiltered.pop(key, _MISSING) is not _MISSING:
+            return
+        chosen = self._indexed_under.pop(key, None)
+        if chosen is None:
+            return
+        field, value = chosen
+        by_value = self._index[field]
+        bucket = by_value[value]
+        del bucket[key]
+        if not bucket:
+            del by_value[value]
+            if not by_value:
+                del self._index[field]
+
+    def registered(self) -> list[_K]:
+        """Every registered key."""
+        return [*self._unfiltered, *self._indexed_under]
+
+    def match(self, record: Any) -> list[_K]:
+        """The keys whose conditions *record* satisfies.
+
+        A record that is not a mapping - a JSON Patch from a ``DIFF`` query,
+        say - has no fields to test, so only the unfiltered keys match it.
+        """
+        matched = list(self._unfiltered)
+        if not self._index or not isinstance(record, Mapping):
+            return matched
+        for field, by_value in self._index.items():
+            value = _lookup(record, field)
+            if value is _MISSING:
+                continue
+            try:
+                bucket = by_value.get(value)
+            except TypeError:
+                # An unhashable value cannot equal any of the hashable ones
+                # subscribers were indexed by.
+                continue
+            if not bucket:
+                continue
+            for key, rest in bucket.items():
+                if all(_lookup(record, path) == want for path, want in rest):
+                    matched.append(key)
+        return matched
+
+
+class _AsyncLiveSource(Protocol):
+    async def live_query(
+        self, query: str, vars: dict[str, Value] | None = ...
+    ) -> UUID: ...
+
+    async def subscribe_live(
+        self,
+        query_uuid: str | UUID,
+        maxsize: int = ...,
+        on_overflow: OverflowPolicy = ...,
+    ) -> AsyncLiveSubscription[dict[str, Value]]: ...
+
+    async def kill(self, query_uuid: str | UUID) -> None: ...
+
+
+class _LiveSource(Protocol):
+    def live_query(self, query: str, vars: dict[str, Value] | None = ...) -> UUID: ...
+
+    def subscribe_live(
+        self,
+        query_uuid: str | UUID,
+        maxsize: int = ...,
+        on_overflow: OverflowPolicy = ...,
+    ) -> LiveSubscription[dict[str, Value]]: ...
+
+    def kill(self, query_uuid: str | UUID) -> None: ...
+
+
+class AsyncLiveMultiplexer:
+    """One ``LIVE SELECT`` on an async connection, shared by local subscribers.
+
+    ::
+
+        orders = AsyncLiveMultiplexer(
+            db, "LIVE SELECT id, status, tenant FROM order WHERE status != 'draft'"
+        )
+        tenant_x = await orders.subscribe({"tenant": "x"}, maxsize=1000)
+        async for change in tenant_x:
+            ...
+        await orders.close()
+
+    The live query starts with the first :meth:`subscribe` (or an explicit
+    :meth:`start`). Conditions are tested against each notification's
+    ``result``, so filter on fields the statement selects. Every subscriber has
+    its own queue, bounded by ``maxsize`` and ``on_overflow`` as in
+    ``subscribe_live``; under ``"block"`` a full subscriber holds up delivery
+    to the others until it catches up, but not the connection.
+    """
+
+    def __init__(
+        self,
+        connection: _AsyncLiveSource,
+        query: str,
+        vars: dict[str, Value] | None = None,
+    ) -> None:
+        check_live_select(query)
+        self._connection = connection
+        self._query = query
+        self._vars = vars
+        self._dispatcher: PredicateDispatcher[AsyncLiveQueue] = PredicateDispatcher()
+        self._live_id: UUID | None = None
+        self._pump: asyncio.Task[None] | None = None
+        self._starting = asyncio.Lock()
+        # What subscribers receive once the shared query has ended: `_END`, or
+        # the error it ended with.
+        self._ended: object | None = None
+
+    @property
+    def live_id(self) -> UUID | None:
+        """The shared live query's id, once started."""
+        return self._live_id
+
+    async def start(self) -> UUID:
+        """Start the shared live query, if it is not running yet."""
+        async with self._starting:
+            if self._live_id is None:
+                live_id = await self._connection.live_query(self._query, self._vars)
+                upstream = await self._connection.subscribe_live(live_id)
+                self._live_id = live_id
+                self._pump = asyncio.create_task(self._run(upstream))
+            return self._live_id
+
+    async def subscribe(
+        self,
+        where: Mapping[str, Value] | None = None,
+        *,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> AsyncLiveSubscription[dict[str, Value]]:
+        """Subscribe to the notifications whose ``result`` matches *where*.
+
+        :raises ValueError: for a bad ``maxsize`` or policy, or an empty field
+            name in *where*.
+        :raises TypeError: if a value in *where* is not hashable.
+        """
+        check_queue_options(maxsize, on_overflow)
+        _conditions(where)
+        live_id = await self.start()
+        result_queue = AsyncLiveQueue(maxsize, on_overflow)
+        if self._ended is not None:
+            result_queue.put_nowait(self._ended)
+        else:
+            self._dispatcher.add(result_queue, where)
+        subscription = self._iter(str(live_id), result_queue)
+        # As in `subscribe_live`: a generator that is never started does not
+        # run its `finally`, so removal has to be reachable without it.
+        weakref.finalize(subscription, _forget, self._dispatcher, result_queue)
+        return AsyncLiveSubscription(subscription, result_queue.stats)
+
+    async def _iter(
+        self, suid: str, result_queue: AsyncLiveQueue
+    ) -> AsyncGenerator[dict[str, Value], None]:
+        try:
+            while True:
+                item = await result_queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                if is_overflow_marker(item):
+                    raise overflow_error(suid, result_queue.stats)
+                yield item
+        finally:
+            _forget(self._dispatcher, result_queue)
+
+    async def _run(self, upstream: AsyncLiveSubscription[dict[str, Value]]) -> None:
+        ended: object = _END
+        try:
+            async for notification in upstream:
+                for result_queue in self._dispatcher.match(notification.get("result")):
+                    backpressure = result_queue.offer(notification)
+                    if backpressure is not None:
+                        await backpressure
+        except SurrealError as exc:
+            ended = exc
+        finally:
+            self._ended = ended
+            for result_queue in self._dispatcher.registered():
+                result_queue.put_nowait(ended)
+            await upstream.aclose()
+
+    async def close(self) -> None:
+        """Kill the shared live query and end every subscription."""
+        pump, self._pump = self._pump, None
+        if pump is None or self._live_id is None:
+            return
+        try:
+            await self._connection.kill(self._live_id)
+        except BaseException:
+            pump.cancel()
+            raise
+        finally:
+            # The kill ends the upstream subscription, and with it the pump;
+            # if it failed, the cancel above does.
+            await asyncio.gather(pump, return_exceptions=True)
+
+    async def __aenter__(self) -> AsyncLiveMultiplexer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+
+class LiveMultiplexer:
+    """One ``LIVE SELECT`` on a blocking connection, shared by local subscribers.
+
+    The blocking transport reads notifications on the consuming thread and
+    supports one ``subscribe_live`` consumer per connection, so this is also
+    how several consumers share one. A background thread is that one
+    consumer; it routes each notification to the subscribers whose *where*
+    matches, as :class:`AsyncLiveMultiplexer` does. Under ``"block"`` a full
+    subscriber stalls that thread until it catches up.
+    """
+
+    def __init__(
+        self,
+        connection: _LiveSource,
+        query: str,
+        vars: dict[str, Value] | None = None,
+    ) -> None:
+        check_live_select(query)
+        self._connection = connection
+        self._query = query
+        self._vars = vars
+        self._dispatcher: PredicateDispatcher[LiveQueue] = PredicateDispatcher()
+        self._lock = threading.Lock()
+        self._live_id: UUID | None = None
+        self._pump: threading.Thread | None = None
+        self._ended: object | None = None
+
+    @property
+    def live_id(self) -> UUID | None:
+        """The shared live query's id, once started."""
+        return self._live_id
+
+    def start(self) -> UUID:
+        """Start the shared live query, if it is not running yet."""
+        with self._lock:
+            if self._live_id is None:
+                live_id = self._connection.live_query(self._query, self._vars)
+                upstream = self._connection.subscribe_live(live_id)
+                self._live_id = live_id
+                self._pump = threading.Thread(
+                    target=self._run,
+                    args=(upstream,),
+                    name=f"surrealdb-live-{live_id}",
+                    daemon=True,
+                )
+                self._pump.start()
+            return self._live_id
+
+    def subscribe(
+        self,
+        where: Mapping[str, Value] | None = None,
+        *,
+        maxsize: int = 0,
+        on_overflow: OverflowPolicy = "block",
+    ) -> LiveSubscription[dict[str, Value]]:
+        """Subscribe to the notifications whose ``result`` matches *where*.
+
+        :raises ValueError: for a bad ``maxsize`` or policy, or an empty field
+            name in *where*.
+        :raises TypeError: if a value in *where* is not hashable.
+        """
+        check_queue_options(maxsize, on_overflow)
+        _conditions(where)
+        live_id = self.start()
+        notifications = LiveQueue(maxsize, on_overflow)
+        with self._lock:
+            if self._ended is not None:
+                notifications.put(self._ended)
+            else:
+                self._dispatcher.add(notifications, where)
+        subscription = self._iter(str(live_id), notifications)
+        weakref.finalize(
+            subscription, _forget_locked, self._lock, self._dispatcher, notifications
+        )
+        return LiveSubscription(subscription, notifications.stats)
+
+    def _iter(
+        self, suid: str, notifications: LiveQueue
+    ) -> Generator[dict[str, Value], None, None]:
+        try:
+            while True:
+                item = notifications.get()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                if is_overflow_marker(item):
+                    raise overflow_error(suid, notifications.stats)
+                yield item
+        finally:
+            _forget_locked(self._lock, self._dispatcher, notifications)
+
+    def _run(self, upstream: LiveSubscription[dict[str, Value]]) -> None:
+        ended: object = _END
+        try:
+            for notification in upstream:
+                with self._lock:
+                    targets = self._dispatcher.match(notification.get("result"))
+                # Outside the lock: a "block" put waits for its consumer, which
+                # needs the lock to unsubscribe.
+                for notifications in targets:
+                    notifications.put(notification)
+        except SurrealError as exc:
+            ended = exc
+        finally:
+            with self._lock:
+                self._ended = ended
+                targets = self._dispatcher.registered()
+            for notifications in targets:
+                notifications.put(ended)
+            upstream.close()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Kill the shared live query, end every subscription, and wait up to
+        *timeout* seconds for the routing thread to finish."""
+        pump, self._pump = self._pump, None
+        if pump is None or self._live_id is None:
+            return
+        self._connection.kill(self._live_id)
+        pump.join(timeout)
+
+    def __enter__(self) -> LiveMultiplexer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _forget(
+    dispatcher: PredicateDispatcher[AsyncLiveQueue], result_queue: AsyncLiveQueue
+) -> None:
+    dispatcher.remove(result_queue)
+    result_queue.release()
+
+
+def _forget_locked(
+    lock: threading.Lock,
+    dispatcher: PredicateDispatcher[LiveQueue],
+    notifications: LiveQueue,
+) -> None:
+    with lock:
+        dispatcher.remove(notifications)
+    notifications.release()
+
+
+__all__ = [
+    "AsyncLiveMultiplexer",
+    "LiveMultiplexer",
+    "PredicateDispatcher",
+]
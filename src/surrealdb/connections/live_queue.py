@@ -0,0 +1,411 @@
+"""Bounded live-query queues and the subscriptions that drain them.
+
+Every ``subscribe_live`` consumer used to get an unbounded queue, filled by the
+connection for as long as the live query ran. A consumer slower than the table
+it watched grew that queue without limit, and the first sign was the process
+being killed for running out of memory. The queues here take a ``maxsize`` and
+an overflow policy, and count what they drop, so a slow consumer is a visible,
+bounded condition rather than a leak.
+
+The policy logic is shared by both transports; only the waiting differs, so
+:class:`AsyncLiveQueue` and :class:`LiveQueue` are thin ``asyncio.Queue`` and
+``queue.Queue`` subclasses over the same buffer. Subclassing keeps the
+``put_nowait`` / ``get`` surface the connections (and their tests) already
+drive, and it is the extension point both stdlib queues document: override
+``_init``, ``_qsize``, ``_put`` and ``_get``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import queue
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Generator
+from dataclasses import dataclass
+from typing import Any, Generic, Literal, TypeVar, get_args
+
+from surrealdb.errors import LiveQueueOverflowError
+
+OverflowPolicy = Literal[
+    "block", "drop_oldest", "drop_newest", "coalesce_by_id", "error"
+]
+
+_POLICIES: tuple[str, ...] = get_args(OverflowPolicy)
+
+# What a subscription yields: one notification, or a batch of them.
+_Item = TypeVar("_Item")
+
+# The `action` SurrealDB puts on the notification that ends a live query.
+_LIVE_KILLED = "KILLED"
+
+
+@dataclass
+class LiveQueueStats:
+    """Counters for one subscription's queue.
+
+    Attributes:
+        received: Notifications routed to this subscription.
+        delivered: Notifications handed to the consumer.
+        dropped: Notifications discarded by the overflow policy, including
+            those replaced by a newer one for the same record under
+            ``coalesce_by_id``.
+        lag: Notifications waiting for the consumer right now.
+        max_lag: The largest ``lag`` seen so far.
+    """
+
+    received: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    lag: int = 0
+    max_lag: int = 0
+
+
+def check_queue_options(maxsize: int, on_overflow: str) -> None:
+    """Refuse a ``subscribe_live`` bound or policy before anything registers.
+
+    :raises ValueError: for a negative ``maxsize`` or an unknown policy.
+    :raises TypeError: for a ``maxsize`` that is not an int.
+    """
+    if isinstance(maxsize, bool) or not isinstance(maxsize, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError(f"maxsize must be an int, got {type(maxsize).__name__}")
+    if maxsize < 0:
+        raise ValueError(f"maxsize must be 0 (unbounded) or more, got {maxsize}")
+    if on_overflow not in _POLICIES:
+        raise ValueError(
+            f"on_overflow must be one of {', '.join(_POLICIES)}; got {on_overflow!r}"
+        )
+
+
+def check_batch_options(max_items: int, max_latency: float) -> None:
+    """Refuse a ``subscribe_live_batches`` bound before anything registers.
+
+    :raises ValueError: for a ``max_items`` below one or a ``max_latency`` that
+        is negative or not finite.
+    :raises TypeError: for a ``max_items`` that is not an int, or a
+        ``max_latency`` that is not a number.
+    """
+    if isinstance(max_items, bool) or not isinstance(max_items, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError(f"max_items must be an int, got {type(max_items).__name__}")
+    if max_items < 1:
+        raise ValueError(f"max_items must be at least 1, got {max_items}")
+    if isinstance(max_latency, bool) or not isinstance(max_latency, (int, float)):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError(
+            f"max_latency must be a number of seconds, got {type(max_latency).__name__}"
+        )
+    if not math.isfinite(max_latency) or max_latency < 0:
+        raise ValueError(
+            f"max_latency must be 0 or a positive number of seconds, got {max_latency!r}"
+        )
+
+
+def _is_control(item: Any) -> bool:
+    """Whether *item* ends the stream rather than reporting a change.
+
+    The transports' own sentinels and the server's ``KILLED`` notification are
+    always accepted, whatever the bound: dropping one would leave the consumer
+    waiting for a stream that has already ended.
+    """
+    return not isinstance(item, dict) or item.get("action") == _LIVE_KILLED
+
+
+def _record_key(notification: dict[str, Any]) -> Any:
+    """The record a notification is about, or ``None`` if it names none."""
+    record = notification.get("record")
+    if record is None:
+        result = notification.get("result")
+        if isinstance(result, dict):
+            record = result.get("id")
+    if record is None:
+        return None
+    try:
+        hash(record)
+    except TypeError:
+        return repr(record)
+    return record
+
+
+class _Overflowed:
+    """Queued under the ``error`` policy in place of the notification that did
+    not fit; the subscription raises when it reaches it."""
+
+
+class _LiveBuffer:
+    """The policy half of a live queue: what is kept, dropped and counted.
+
+    Entries are ``[key, item]`` pairs so that ``coalesce_by_id`` can replace a
+    pending notification in place - keeping its position, which is when the
+    consumer first had something to learn about that record - without a scan.
+    """
+
+    def __init__(self, maxsize: int, policy: str, stats: LiveQueueStats) -> None:
+        self.maxsize = maxsize
+        self.policy = policy
+        self.stats = stats
+        self._entries: deque[list[Any]] = deque()
+        self._pending: dict[Any, list[Any]] = {}
+        self._failed = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= self._data_entries()
+
+    def _data_entries(self) -> int:
+        # A control item may sit past the bound - it has to be accepted - so it
+        # does not count towards it.
+        if self._entries and _is_control(self._entries[-1][1]):
+            return len(self._entries) - 1
+        return len(self._entries)
+
+    def offer(self, item: Any) -> None:
+        if _is_control(item):
+            self._entries.append([None, item])
+            return
+        stats = self.stats
+        stats.received += 1
+        if self._failed:
+            stats.dropped += 1
+            return
+        key = _record_key(item) if self.policy == "coalesce_by_id" else None
+        if key is not None and (entry := self._pending.get(key)) is not None:
+            entry[1] = item
+            stats.dropped += 1
+            return
+        if self.full():
+            if self.policy == "drop_newest":
+                stats.dropped += 1
+                return
+            if self.policy == "error":
+                self._failed = True
+                stats.dropped += 1
+                self._entries.append([None, _Overflowed()])
+                return
+            if self.policy in ("drop_oldest", "coalesce_by_id"):
+                self._forget(self._entries.popleft())
+                stats.dropped += 1
+            # "block" accepts the item; the transport then waits for room
+            # before it routes anything else.
+        entry = [key, item]
+        self._entries.append(entry)
+        if key is not None:
+            self._pending[key] = entry
+        self._note_lag()
+
+    def take(self) -> Any:
+        entry = self._entries.popleft()
+        self._forget(entry)
+        if not _is_control(entry[1]):
+            self.stats.delivered += 1
+        self._note_lag()
+        return entry[1]
+
+    def _forget(self, entry: list[Any]) -> None:
+        key = entry[0]
+        if key is not None and self._pending.get(key) is entry:
+            del self._pending[key]
+
+    def _note_lag(self) -> None:
+        stats = self.stats
+        stats.lag = self._data_entries()
+        if stats.lag > stats.max_lag:
+            stats.max_lag = stats.lag
+
+
+class AsyncLiveQueue(asyncio.Queue[Any]):
+    """A live-query queue for the async transport.
+
+    ``asyncio.Queue`` itself is created unbounded, so ``put_nowait`` never
+    raises: the bound is applied by the buffer's policy instead, and ``block``
+    is honoured by the reader awaiting :meth:`offer`'s return value.
+    """
+
+    _queue: _LiveBuffer
+
+    def __init__(self, maxsize: int = 0, on_overflow: OverflowPolicy = "block") -> None:
+        self.stats = LiveQueueStats()
+        self._bound = maxsize
+        self._policy = on_overflow
+        self._room: list[asyncio.Future[None]] = []
+        self._released = False
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = _LiveBuffer(self._bound, self._policy, self.stats)
+
+    def _put(self, item: Any) -> None:
+        self._queue.offer(item)
+
+    def _get(self) -> Any:
+        item = self._queue.take()
+        self._wake_room()
+        return item
+
+    def offer(self, item: Any) -> Awaitable[None] | None:
+        """Queue *item*; return something to await if the reader must wait.
+
+        Only the ``block`` policy ever returns an awaitable, and only once the
+        queue is full. The reader awaits it before reading the next frame, which
+        is what keeps the queue at ``maxsize`` - and what stalls every other
+        reply on the connection until this consumer catches up.
+        """
+        self.put_nowait(item)
+        if self._policy == "block" and self._queue.full() and not self._released:
+            return self._wait_for_room()
+        return None
+
+    async def _wait_for_room(self) -> None:
+        while self._queue.full() and not self._released:
+            room = asyncio.get_running_loop().create_future()
+            self._room.append(room)
+            await room
+
+    def release(self) -> None:
+        """Stop holding the reader back; called when the subscription ends.
+
+        A reader waiting for room in a queue nobody will drain again would
+        otherwise wait forever, and with it every reply on the connection.
+        """
+        self._released = True
+        self._wake_room()
+
+    def _wake_room(self) -> None:
+        while self._room:
+            room = self._room.pop()
+            if not room.done():
+                room.set_result(None)
+
+
+class LiveQueue(queue.Queue[Any]):
+    """A live-query queue for the blocking transport.
+
+    ``block`` makes :meth:`put` wait for room, which happens on whichever
+    thread routed the notification - an RPC call on this connection, or
+    another subscription reading the socket. Only use it with a subscription
+    consumed on a thread of its own.
+    """
+
+    queue: _LiveBuffer
+
+    def __init__(self, maxsize: int = 0, on_overflow: OverflowPolicy = "block") -> None:
+        self.stats = LiveQueueStats()
+        self._bound = maxsize
+        self._policy = on_overflow
+        self._released = False
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = _LiveBuffer(self._bound, self._policy, self.stats)
+
+    def _qsize(self) -> int:
+        return len(self.queue)
+
+    def _put(self, item: Any) -> None:
+        self.queue.offer(item)
+
+    def _get(self) -> Any:
+        item = self.queue.take()
+        self.not_full.notify_all()
+        return item
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        with self.not_full:
+            # Control items are accepted whatever the bound, so they never wait.
+            if self._policy == "block" and not _is_control(item):
+                while self.queue.full() and not self._released:
+                    self.not_full.wait()
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def release(self) -> None:
+        """Stop holding producers back; called when the subscription ends."""
+        with self.not_full:
+            self._released = True
+            self.not_full.notify_all()
+
+
+class AsyncLiveSubscription(AsyncGenerator[_Item, None], Generic[_Item]):
+    """What ``subscribe_live`` returns on the async transports.
+
+    An async generator of notifications, exactly as before, plus the
+    :attr:`stats` of the queue behind it. ``subscribe_live_batches`` returns
+    one that yields lists of notifications instead.
+    """
+
+    def __init__(
+        self,
+        notifications: AsyncGenerator[_Item, None],
+        stats: LiveQueueStats,
+    ) -> None:
+        self._notifications = notifications
+        self.stats = stats
+
+    async def asend(self, value: None) -> _Item:
+        return await self._notifications.asend(value)
+
+    async def athrow(self, typ: Any, val: Any = None, tb: Any = None) -> _Item:
+        # Forwarded in the one-argument form unless more was given: the
+        # three-argument form is deprecated, and passing explicit ``None``s
+        # still counts as using it.
+        if val is None and tb is None:
+            return await self._notifications.athrow(typ)
+        return await self._notifications.athrow(typ, val, tb)
+
+    async def aclose(self) -> None:
+        await self._notifications.aclose()
+
+
+class LiveSubscription(Generator[_Item, None, None], Generic[_Item]):
+    """What ``subscribe_live`` returns on the blocking transports.
+
+    A generator of notifications, exactly as before, plus the :attr:`stats`
+    of the queue behind it. ``subscribe_live_batches`` returns one that yields
+    lists of notifications instead.
+    """
+
+    def __init__(
+        self,
+        notifications: Generator[_Item, None, None],
+        stats: LiveQueueStats,
+    ) -> None:
+        self._notifications = notifications
+        self.stats = stats
+
+    def send(self, value: None) -> _Item:
+        return self._notifications.send(value)
+
+    def throw(self, typ: Any, val: Any = None, tb: Any = None) -> _Item:
+        if val is None and tb is None:
+            return self._notifications.throw(typ)
+        return self._notifications.throw(typ, val, tb)
+
+    def close(self) -> None:
+        self._notifications.close()
+
+
+def overflow_error(suid: str, stats: LiveQueueStats) -> LiveQueueOverflowError:
+    """The error a subscription raises when its ``error`` policy trips."""
+    return LiveQueueOverflowError(
+        f"live query {suid} overflowed its queue after {stats.delivered} "
+        f"notifications were delivered; {stats.dropped} were dropped"
+    )
+
+
+def is_overflow_marker(item: Any) -> bool:
+    return isinstance(item, _Overflowed)
+
+
+__all__ = [
+    "AsyncLiveQueue",
+    "AsyncLiveSubscription",
+    "LiveQueue",
+    "LiveQueueStats",
+    "LiveSubscription",
+    "OverflowPolicy",
+    "check_batch_options",
+    "check_queue_options",
+    "is_overflow_marker",
+    "overflow_error",
+]
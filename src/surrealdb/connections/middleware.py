@@ -0,0 +1,101 @@
+"""Request/response middleware around a connection's RPCs.
+
+Query logging, slow-query capture and circuit breaking were all done by
+monkey-patching a transport's private ``_send``, which broke whenever it was
+renamed or split, and differed between the websocket, HTTP and embedded
+transports. ``db.use_middleware(fn)`` is the supported way in. Each middleware
+is called with the :class:`~surrealdb.request_message.message.RequestMessage`
+about to be sent and a ``call_next`` that sends it, and returns the decoded
+response envelope (``{"id": ..., "result": ...}`` or ``{"id": ..., "error":
+...}``)::
+
+    async def log_slow(message, call_next):
+        started = time.perf_counter()
+        response = await call_next(message)
+        if time.perf_counter() - started > 0.5:
+            log.warning("slow %s: %r", message.method.value, message.kwargs)
+        return response
+
+    db.use_middleware(log_slow)
+
+The first middleware added is the outermost. One that returns without calling
+``call_next`` short-circuits the RPC - a cache answering from memory, or an
+open circuit breaker raising straight away - and nothing is sent. Whatever it
+returns is stamped with the request's ``id``, so a response cached from an
+earlier request still correlates with this one, and an ``error`` in it is
+raised exactly as the server's own would be. Raising from a middleware fails
+only its own call.
+
+A middleware sees the envelope before the connection reads the result out of
+it. An error the server returned reaches it as the exception the caller would
+get, except on the calls that inspect errors themselves, such as
+``query_raw()``, which see the ``error`` envelope. Async connections take
+``async`` middleware, blocking connections plain functions. With none added,
+a connection checks one attribute per RPC.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
+
+from surrealdb.errors import UnexpectedResponseError
+from surrealdb.request_message.message import RequestMessage
+
+#: What an async middleware is handed: sends a message on, returns its reply.
+AsyncCallNext = Callable[[RequestMessage], Awaitable[dict[str, Any]]]
+#: ``async def middleware(message, call_next) -> response``.
+AsyncMiddleware = Callable[[RequestMessage, AsyncCallNext], Awaitable[dict[str, Any]]]
+#: What a blocking middleware is handed.
+CallNext = Callable[[RequestMessage], dict[str, Any]]
+#: ``def middleware(message, call_next) -> response``.
+Middleware = Callable[[RequestMessage, CallNext], dict[str, Any]]
+
+
+async def run_chain_async(
+    middleware: tuple[AsyncMiddleware, ...],
+    message: RequestMessage,
+    transmit: AsyncCallNext,
+) -> dict[str, Any]:
+    """Pass *message* through *middleware*, outermost first, to *transmit*."""
+
+    async def call(index: int, message: RequestMessage) -> dict[str, Any]:
+        if index == len(middleware):
+            return await transmit(message)
+        return await middleware[index](message, partial(call, index + 1))
+
+    return _correlated(await call(0, message), message)
+
+
+def run_chain(
+    middleware: tuple[Middleware, ...],
+    message: RequestMessage,
+    transmit: CallNext,
+) -> dict[str, Any]:
+    """Pass *message* through *middleware*, outermost first, to *transmit*."""
+
+    def call(index: int, message: RequestMessage) -> dict[str, Any]:
+        if index == len(middleware):
+            return transmit(message)
+        return middleware[index](message, partial(call, index + 1))
+
+    return _correlated(call(0, message), message)
+
+
+def _correlated(response: Any, message: RequestMessage) -> dict[str, Any]:
+    """*response*, checked to be an envelope and carrying *message*'s id."""
+    if not isinstance(response, dict):
+        raise UnexpectedResponseError(
+            f"a middleware returned {type(response).__name__} for "
+            f"{message.method.value!r}; it has to return the response envelope "
+            "that call_next returned, or a dict shaped like one"
+        )
+    if response.get("id", message.id) != message.id:
+        # Cached from another request, or answered for a message the
+        # middleware rebuilt. Copied, so a cache's own entry is left alone.
+        response = {**response, "id": message.id}
+    return response
+
+
+__all__ = ["AsyncCallNext", "AsyncMiddleware", "CallNext", "Middleware"]
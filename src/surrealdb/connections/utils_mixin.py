@@ -1,10 +1,13 @@
 import re
-from collections.abc import Generator, Mapping, Sequence
+from collections.abc import Generator, Iterable, Mapping, Sequence
 from contextlib import contextmanager
 from typing import Any
+from uuid import UUID
 
 from surrealdb.connections.builders import (
+    _decode_rows_for,  # pyright: ignore[reportPrivateUsage]
     _is_single_record_operation,  # pyright: ignore[reportPrivateUsage]
+    _query_statement_values,  # pyright: ignore[reportPrivateUsage]
     _resource_to_variable,  # pyright: ignore[reportPrivateUsage]
 )
 from surrealdb.data.cbor import decode
@@ -91,6 +94,96 @@ def merge_query_vars(
     return merged
 
 
+# One query of a ``query_many`` batch: bare SurrealQL, or SurrealQL and its
+# parameters.
+BatchQuery = str | tuple[str, Mapping[str, Value] | None]
+
+
+def build_query_batch(
+    queries: Iterable[BatchQuery],
+) -> list[tuple[str, dict[str, Value]]]:
+    """Normalise a ``query_many`` batch into ``(query, parameters)`` pairs.
+
+    Everything is checked before anything is sent. A malformed entry found
+    halfway through would otherwise leave the queries before it applied and the
+    ones after it not - a partial write the caller never asked for and cannot
+    easily see.
+
+    :raises TypeError: if an entry is neither a string nor a ``(query, vars)``
+        pair, or *queries* is itself a bare string - which would otherwise be
+        spread into one query per character.
+    """
+    if isinstance(queries, str):
+        raise TypeError(
+            "query_many() takes a sequence of queries, not a single string; "
+            "use query() for one query"
+        )
+    batch: list[tuple[str, dict[str, Value]]] = []
+    for index, entry in enumerate(queries):
+        if isinstance(entry, str):
+            batch.append((entry, {}))
+            continue
+        if (
+            isinstance(entry, tuple)  # pyright: ignore[reportUnnecessaryIsInstance]
+            and len(entry) == 2
+            and isinstance(entry[0], str)  # pyright: ignore[reportUnnecessaryIsInstance]
+            and (entry[1] is None or isinstance(entry[1], Mapping))  # pyright: ignore[reportUnnecessaryIsInstance]
+        ):
+            batch.append((entry[0], dict(entry[1] or {})))
+            continue
+        raise TypeError(
+            f"query_many() entry {index} must be a query string or a "
+            f"(query, vars) pair, got {type(entry).__name__}: {_clip(repr(entry))}"
+        )
+    return batch
+
+
+def query_batch_results(responses: Sequence[dict[str, Any]]) -> list[list[Value]]:
+    """Turn the responses to a ``query_many`` batch into per-query results.
+
+    Each entry is what ``query(...).execute()`` would have returned for that
+    query: one value per statement. Every query in the batch has already run
+    by the time this is called, so a failing query does not stop the ones
+    after it - they have been applied, and the first failure is raised once
+    the whole batch is done.
+    """
+    return [_query_statement_values(response) for response in responses]
+
+
+# `LIVE SELECT`, however it is spaced or cased, at the start of the statement.
+_LIVE_SELECT_RE = re.compile(r"\s*LIVE\s+SELECT\b", re.IGNORECASE)
+
+
+def check_live_select(query: str) -> None:
+    """Refuse a ``live_query()`` statement that is not a ``LIVE SELECT``.
+
+    Anything else would run as an ordinary query, and its result - whatever it
+    was - would be taken for a live query id.
+
+    :raises ValueError: if *query* does not start with ``LIVE SELECT``.
+    :raises TypeError: if *query* is not a string.
+    """
+    if not isinstance(query, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError(f"live_query() takes a string, got {type(query).__name__}")
+    if not _LIVE_SELECT_RE.match(query):
+        raise ValueError(
+            f"live_query() takes a LIVE SELECT statement, got {_clip(query)!r}"
+        )
+
+
+def live_query_id(result: Value) -> UUID:
+    """The live query id a ``LIVE SELECT`` answered with.
+
+    :raises UnexpectedResponseError: if the first statement's result is not a
+        UUID.
+    """
+    if not isinstance(result, UUID):
+        raise UnexpectedResponseError(
+            f"LIVE SELECT returned {type(result).__name__}, expected a live query id"
+        )
+    return result
+
+
 # One segment of a function name that needs no quoting: `fn`, `time`, `now`.
 _PLAIN_SEGMENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
 
@@ -252,9 +345,14 @@ __all__ = [
     "RecordIdType",
     "SurrealError",
     "Table",
+    "BatchQuery",
     "UtilsMixin",
+    "build_query_batch",
     "build_run_query",
+    "check_live_select",
+    "live_query_id",
     "merge_query_vars",
+    "query_batch_results",
 ]
 
 
@@ -300,7 +398,7 @@ class UtilsMixin:
         neither the operation nor what had actually come back.
         """
         try:
-            decoded = decode(body)
+            decoded = decode(body, _decode_rows_for())
         except Exception as exc:
             raise UnexpectedResponseError(
                 f"could not decode the response while {process}: {exc}"
@@ -1,7 +1,12 @@
 import decimal
+import struct
+import sys
 import uuid
+from array import array
+from collections.abc import Callable, Iterable, Iterator
 from datetime import timezone
 from io import BytesIO
+from itertools import chain
 from typing import Any
 
 from surrealdb.cbor import (
@@ -15,6 +20,8 @@ from surrealdb.data.types.datetime import Datetime, PreciseDatetime
 from surrealdb.data.types.duration import Duration
 from surrealdb.data.types.file import File
 from surrealdb.data.types.geometry import (
+    _PACKABLE,  # pyright: ignore[reportPrivateUsage]
+    GeometryBuffer,
     GeometryCollection,
     GeometryLine,
     GeometryMultiLine,
@@ -22,20 +29,304 @@ from surrealdb.data.types.geometry import (
     GeometryMultiPolygon,
     GeometryPoint,
     GeometryPolygon,
+    _PackableGeometry,  # pyright: ignore[reportPrivateUsage]
 )
 from surrealdb.data.types.null import Null, NullType
 from surrealdb.data.types.range import BoundExcluded, BoundIncluded, Range
 from surrealdb.data.types.record_id import RecordID
 from surrealdb.data.types.set import SurrealSet
 from surrealdb.data.types.table import Table
-from surrealdb.errors import UnexpectedResponseError
+from surrealdb.errors import InvalidGeometryError, UnexpectedResponseError
 
 # Plain CBOR null: major type 7, subtype 22.
 _CBOR_NULL_SUBTYPE = 22
 
+# Decoded tables, one per name. A result of record links names the same few
+# tables over and over, and every decode of the name was a fresh string - so a
+# million `->edge->node` ids held a million copies of "node". Table names in
+# record ids go through `sys.intern` for the same reason, and the tables are
+# shared outright. Bounded, since the names come from the server: past the cap
+# the cache starts over rather than growing with every table ever seen.
+_TABLES: dict[str, Table] = {}
+_TABLES_MAX = 1024
+
+
+def _table_name(name: Any) -> Any:
+    # Only a `str` can be interned; anything else is passed on for the caller
+    # to make sense of, as it was before.
+    return sys.intern(name) if type(name) is str else name
+
+
+def _table(name: Any) -> Table:
+    if type(name) is not str:
+        return Table._unchecked(name)  # pyright: ignore[reportPrivateUsage]
+    table = _TABLES.get(name)
+    if table is None:
+        if len(_TABLES) >= _TABLES_MAX:
+            _TABLES.clear()
+        name = sys.intern(name)
+        table = _TABLES[name] = Table._unchecked(  # pyright: ignore[reportPrivateUsage]
+            name
+        )
+    return table
+
+
+# --------------------------------------------------------------------------- #
+#  Geometry as flat buffers                                                    #
+# --------------------------------------------------------------------------- #
+#
+# SurrealDB sends a line as tag 89 around an array of tag-88 points, each an
+# array of two floats; a polygon is tag 90 around tag-89 rings, and so on up
+# to tag 93. Decoded the ordinary way, every point became a `GeometryPoint`
+# holding a tuple of two floats - a 100k-vertex polygon was 100k objects before
+# anyone looked at it. These read the same bytes straight into one
+# `GeometryBuffer`, and write one back out, with no per-point objects either
+# way.
+
+_GEOMETRY_TAGS = {
+    "LineString": constants.TAG_GEOMETRY_LINE,
+    "Polygon": constants.TAG_GEOMETRY_POLYGON,
+    "MultiPoint": constants.TAG_GEOMETRY_MULTI_POINT,
+    "MultiLineString": constants.TAG_GEOMETRY_MULTI_LINE,
+    "MultiPolygon": constants.TAG_GEOMETRY_MULTI_POLYGON,
+}
+
+# A tag-88 point whose coordinates are two float64s, as the generic encoder
+# writes it: the tag, a two-item array header, then each float after 0xFB.
+_POINT = struct.Struct(">4sdcd")
+_POINT_HEAD = bytes([0xD8, constants.TAG_GEOMETRY_POINT, 0x82, 0xFB])
+_TAGGED_PAIR = bytes([constants.TAG_GEOMETRY_POINT, 0x82])
+# A whole tag-88 point of two float64s, the header bytes skipped, and where
+# in it each of those header bytes sits.
+_FLOAT64_POINT = struct.Struct(">4xdxd")
+_FLOAT64_LAYOUT = tuple(
+    (offset, bytes([byte]))
+    for offset, byte in zip((0, 1, 2, 3, 12), _POINT_HEAD + b"\xfb", strict=True)
+)
+_FLOAT64_HEAD = b"\xfb"
+
+
+def _encode_geometry_buffer(encoder: CBOREncoder, buffer: GeometryBuffer) -> None:
+    values = buffer.coordinates
+    encode_length = encoder.encode_length
+    write = encoder.write
+    pack = _POINT.pack
+
+    def points(start: int, stop: int) -> None:
+        encode_length(4, stop - start)
+        chunks = []
+        for index in range(2 * start, 2 * stop, 2):
+            x = values[index]
+            y = values[index + 1]
+            # `v - v` is 0.0 for every finite float and NaN otherwise; NaN and
+            # the infinities go through `encode_float`, which writes them in
+            # half precision, so the bytes match the generic path exactly.
+            if x - x == 0.0 and y - y == 0.0:
+                chunks.append(pack(_POINT_HEAD, x, _FLOAT64_HEAD, y))
+            else:
+                write(b"".join(chunks))
+                chunks = []
+                encode_length(6, constants.TAG_GEOMETRY_POINT)
+                encode_length(4, 2)
+                encoder.encode_float(x)
+                encoder.encode_float(y)
+        write(b"".join(chunks))
+
+    def lines(starts: "array[int]", first: int, last: int) -> None:
+        # Lines `first` to `last` (exclusive), each a tag-89 array of points.
+        encode_length(4, last - first)
+        for line in range(first, last):
+            encode_length(6, constants.TAG_GEOMETRY_LINE)
+            points(starts[line], starts[line + 1])
+
+    kind = buffer.geometry_type
+    encode_length(6, _GEOMETRY_TAGS[kind])
+    offsets = buffer.offsets
+    if kind in ("LineString", "MultiPoint"):
+        points(offsets[0][0], offsets[0][-1])
+    elif kind in ("Polygon", "MultiLineString"):
+        lines(offsets[0], offsets[1][0], offsets[1][-1])
+    else:
+        rings, polygons, outer = offsets
+        encode_length(4, outer[-1] - outer[0])
+        for polygon in range(outer[0], outer[-1]):
+            encode_length(6, constants.TAG_GEOMETRY_POLYGON)
+            lines(rings, polygons[polygon], polygons[polygon + 1])
+
+
+class _NotPacked(Exception):
+    """The geometry is not laid out the way the buffer readers expect."""
+
+
+_F64 = struct.Struct(">d").unpack
+_F32 = struct.Struct(">f").unpack
+_F16 = struct.Struct(">e").unpack
+
+
+def _items(decoder: CBORDecoder, initial: int) -> Iterator[int]:
+    """The initial byte of each member of the array whose header is *initial*.
+
+    Each member's byte is read only when the caller asks for it, by which time
+    the caller has consumed the member before.
+    """
+    if initial >> 5 != _ARRAY:
+        raise _NotPacked
+    length = decoder._decode_length(initial & 31, allow_indefinite=True)
+    read = decoder.read
+    if length is None:
+        while (byte := read(1)[0]) != _BREAK:
+            yield byte
+    else:
+        for _ in range(length):
+            yield read(1)[0]
+
+
+def _untag(decoder: CBORDecoder, initial: int, tag: int) -> int:
+    """The initial byte of the value under *tag*, whose header is *initial*."""
+    # Geometry tags are all 88-94: one byte after 0xD8 in canonical CBOR.
+    if initial != 0xD8 or decoder.read(1)[0] != tag:
+        raise _NotPacked
+    return decoder.read(1)[0]
+
+
+def _float(decoder: CBORDecoder, initial: int) -> float:
+    # Floats only. SurrealDB's coordinates are always floats, in whichever
+    # width holds them exactly; an integer coordinate means the payload came
+    # from somewhere else, and is decoded the ordinary way so it stays an int.
+    if initial == 0xFB:
+        return _F64(decoder.read(8))[0]
+    if initial == 0xFA:
+        return _F32(decoder.read(4))[0]
+    if initial == 0xF9:
+        return _F16(decoder.read(2))[0]
+    raise _NotPacked
+
+
+def _read_points(decoder: CBORDecoder, initial: int, values: "array[float]") -> int:
+    """Read an array of points into *values*; how many there were."""
+    fp = decoder.fp
+    if initial >> 5 == _ARRAY and initial & 31 != 31:
+        # A counted array, as SurrealDB sends: try the whole run as points of
+        # two float64s, checked and unpacked in C rather than point by point.
+        count = decoder._decode_length(initial & 31)
+        start = fp.tell()
+        size = _FLOAT64_POINT.size
+        run = fp.read(count * size)
+        if len(run) == count * size and all(
+            run[offset::size] == byte * count for offset, byte in _FLOAT64_LAYOUT
+        ):
+            values.extend(chain.from_iterable(_FLOAT64_POINT.iter_unpack(run)))
+            return count
+        fp.seek(start)
+        members: Iterable[int] = (decoder.read(1)[0] for _ in range(count))
+    else:
+        members = _items(decoder, initial)
+    read = decoder.read
+    append = values.append
+    count = 0
+    for point in members:
+        # Tag 88 and a definite two-item array, as every encoder writes them.
+        if point != 0xD8 or read(2) != _TAGGED_PAIR:
+            raise _NotPacked
+        append(_float(decoder, read(1)[0]))
+        append(_float(decoder, read(1)[0]))
+        count += 1
+    return count
+
+
+def _read_lines(
+    decoder: CBORDecoder, initial: int, values: "array[float]", starts: "array[int]"
+) -> int:
+    """Read an array of tag-89 lines, appending where each one ends to *starts*."""
+    count = 0
+    for line in _items(decoder, initial):
+        points = _untag(decoder, line, constants.TAG_GEOMETRY_LINE)
+        _read_points(decoder, points, values)
+        starts.append(len(values) // 2)
+        count += 1
+    return count
+
+
+def _read_geometry_buffer(decoder: CBORDecoder, kind: str) -> GeometryBuffer:
+    initial = decoder.read(1)[0]
+    values: array[float] = array("d")
+    if kind in ("LineString", "MultiPoint"):
+        count = _read_points(decoder, initial, values)
+        return GeometryBuffer(kind, values, ([0, count],))
+    starts = array("q", [0])
+    if kind in ("Polygon", "MultiLineString"):
+        count = _read_lines(decoder, initial, values, starts)
+        return GeometryBuffer(kind, values, (starts, [0, count]))
+    polygons = array("q", [0])
+    count = 0
+    for polygon in _items(decoder, initial):
+        rings = _untag(decoder, polygon, constants.TAG_GEOMETRY_POLYGON)
+        polygons.append(polygons[-1] + _read_lines(decoder, rings, values, starts))
+        count += 1
+    return GeometryBuffer(kind, values, (starts, polygons, [0, count]))
+
+
+def _geometry_reader(tag: int, kind: str) -> Callable[[CBORDecoder], Any]:
+    geometry_class = _PACKABLE[kind]
+
+    def read(decoder: CBORDecoder) -> Any:
+        start = decoder.fp.tell()
+        try:
+            buffer = _read_geometry_buffer(decoder, kind)
+        except _NotPacked:
+            # Laid out some other way - integer coordinates, an indefinite
+            # point, a tag in its long form. Rewind and decode it as before.
+            decoder.fp.seek(start)
+            value = decoder._decode(unshared=True)
+            return decoder.set_shareable(tag_decoder(decoder, CBORTag(tag, value)))
+        if kind in ("Polygon", "MultiPolygon"):
+            _check_rings(buffer)
+        return decoder.set_shareable(geometry_class._from_buffer(buffer))
+
+    return read
+
+
+def _check_rings(buffer: GeometryBuffer) -> None:
+    """The ring checks ``GeometryPolygon()`` makes, run on the buffer."""
+    values = buffer.coordinates
+    starts = buffer.offsets[0]
+    # Which ring starts each polygon, so the first of each is the exterior.
+    exteriors = (
+        set(buffer.offsets[1]) if buffer.geometry_type == "MultiPolygon" else {0}
+    )
+    hole = 0
+    for ring in range(len(starts) - 1):
+        first, last = starts[ring], starts[ring + 1] - 1
+        hole = 0 if ring in exteriors else hole + 1
+        ring_type = "exterior" if hole == 0 else f"interior (hole {hole})"
+        if last - first + 1 < 4:
+            raise InvalidGeometryError(
+                f"Invalid {ring_type} ring: must have at least 4 points "
+                f"(including closing point), got {last - first + 1}"
+            )
+        if values[2 * first : 2 * first + 2] != values[2 * last : 2 * last + 2]:
+            raise InvalidGeometryError(
+                f"Invalid {ring_type} ring: first point "
+                f"{tuple(values[2 * first : 2 * first + 2])} must equal last point "
+                f"{tuple(values[2 * last : 2 * last + 2])} to close the ring"
+            )
+
+
+#: Registered on every SurrealDB decoder as `raw_tag_decoders`.
+_GEOMETRY_READERS = {
+    tag: _geometry_reader(tag, kind) for kind, tag in _GEOMETRY_TAGS.items()
+}
+
 
 @shareable_encoder
 def default_encoder(encoder: CBOREncoder, obj: Any) -> None:
+    if isinstance(obj, GeometryBuffer):
+        _encode_geometry_buffer(encoder, obj)
+        return
+    if isinstance(obj, _PackableGeometry) and obj._buffer is not None:
+        _encode_geometry_buffer(encoder, obj._buffer)
+        return
+
     if isinstance(obj, GeometryPoint):
         tagged = CBORTag(constants.TAG_GEOMETRY_POINT, obj.get_coordinates())
 
@@ -148,7 +439,7 @@ def tag_decoder(
         # rest of the response with it, since this runs inside the decode of the
         # whole frame.
         return RecordID._unchecked(  # pyright: ignore[reportPrivateUsage]
-            tag.value[0], tag.value[1]
+            _table_name(tag.value[0]), tag.value[1]
         )
 
     elif tag.tag == constants.TAG_FILE:
@@ -165,7 +456,7 @@ def tag_decoder(
         )
 
     elif tag.tag == constants.TAG_TABLE_NAME:
-        return Table._unchecked(tag.value)  # pyright: ignore[reportPrivateUsage]
+        return _table(tag.value)
 
     elif tag.tag == constants.TAG_BOUND_INCLUDED:
         return BoundIncluded(tag.value)
@@ -303,15 +594,111 @@ def encode(obj: Any) -> bytes:
         return fp.getvalue()
 
 
-def decode(data: bytes) -> Any:
+#: Takes the rows of a query response's first statement, decoded one at a time.
+RowsHook = Callable[[Iterator[Any]], Any]
+
+
+def decode(
+    data: bytes, rows_for: Callable[[Any], RowsHook | None] | None = None
+) -> Any:
     """Decode a SurrealDB CBOR payload.
 
     Plain CBOR null becomes :data:`Null`, not ``None``: on this wire a null is
     SurrealDB's NULL, which is a different value from its NONE. The public
     ``surrealdb.cbor`` package is a general-purpose CBOR implementation and is
     left alone - ``loads(b"\\xf6")`` there still returns ``None``.
+
+    *rows_for* is asked, with the response's ``id``, for a :data:`RowsHook`.
+    If it returns one, the rows of the first statement's result are handed to
+    it as they are decoded and its return value stands in for the row list -
+    so ``into=`` can build each model while its record dict is the only one
+    alive, rather than after the whole list of dicts has been decoded.
     """
     with BytesIO(data) as fp:
         decoder = CBORDecoder(fp, tag_hook=tag_decoder)
         decoder.null_value = Null
+        decoder.raw_tag_decoders = _GEOMETRY_READERS
+        if rows_for is not None and _peek(decoder, data) >> 5 == _MAP:
+            return _decode_envelope(decoder, data, rows_for)
         return decoder.decode()
+
+
+# CBOR major types, and the "break" byte that ends an indefinite-length item.
+_ARRAY = 4
+_MAP = 5
+_BREAK = 0xFF
+
+
+def _peek(decoder: CBORDecoder, data: bytes) -> int:
+    """The next initial byte, without consuming it; -1 at the end of *data*."""
+    position = decoder.fp.tell()
+    return data[position] if position < len(data) else -1
+
+
+def _open(decoder: CBORDecoder) -> int | None:
+    """Consume an array or map header; its length, or None if indefinite."""
+    return decoder._decode_length(decoder.read(1)[0] & 31, allow_indefinite=True)
+
+
+def _each(decoder: CBORDecoder, data: bytes, length: int | None) -> Iterator[None]:
+    """Step through the members of a container whose header was just opened.
+
+    The caller decodes each member itself between steps. An indefinite-length
+    container's closing break is consumed here; a truncated one surfaces as the
+    decoder's own end-of-data error on the member that is missing.
+    """
+    if length is None:
+        while _peek(decoder, data) != _BREAK:
+            yield None
+        decoder.read(1)
+    else:
+        for _ in range(length):
+            yield None
+
+
+def _decode_envelope(
+    decoder: CBORDecoder, data: bytes, rows_for: Callable[[Any], RowsHook | None]
+) -> dict[Any, Any]:
+    # SurrealDB writes the envelope's keys in order, and "id" sorts before
+    # "result"; a response that put them the other way round is decoded whole,
+    # and its rows are mapped afterwards like any other.
+    envelope: dict[Any, Any] = {}
+    hook: RowsHook | None = None
+    for _ in _each(decoder, data, _open(decoder)):
+        key = decoder._decode(immutable=True, unshared=True)
+        if key == "id":
+            envelope[key] = decoder.decode()
+            hook = rows_for(envelope[key])
+        elif (
+            key == "result" and hook is not None and _peek(decoder, data) >> 5 == _ARRAY
+        ):
+            envelope[key] = _decode_statements(decoder, data, hook)
+        else:
+            envelope[key] = decoder.decode()
+    return envelope
+
+
+def _decode_statements(decoder: CBORDecoder, data: bytes, hook: RowsHook) -> list[Any]:
+    statements: list[Any] = []
+    for index, _ in enumerate(_each(decoder, data, _open(decoder))):
+        if index == 0 and _peek(decoder, data) >> 5 == _MAP:
+            statement: dict[Any, Any] = {}
+            for _ in _each(decoder, data, _open(decoder)):
+                key = decoder._decode(immutable=True, unshared=True)
+                if key == "result" and _peek(decoder, data) >> 5 == _ARRAY:
+                    rows = _rows(decoder, data)
+                    statement[key] = hook(rows)
+                    # Whatever the hook left unread is still in the stream.
+                    for _ in rows:
+                        pass
+                else:
+                    statement[key] = decoder.decode()
+            statements.append(statement)
+        else:
+            statements.append(decoder.decode())
+    return statements
+
+
+def _rows(decoder: CBORDecoder, data: bytes) -> Iterator[Any]:
+    for _ in _each(decoder, data, _open(decoder)):
+        yield decoder.decode()
@@ -0,0 +1,365 @@
+"""Query rows gathered into typed columns instead of one dict per row.
+
+Analytics code turned every ``query()`` result straight into a pandas or
+Polars frame, which meant one dict per row *and* a second full copy in the
+frame. :class:`ColumnBuffers` takes the rows as the decoder produces them and
+appends each field to a per-column buffer, so the row dicts never accumulate:
+
+===================  ====================================  =====================
+value                ``to_columns()``                      ``to_arrow()``
+===================  ====================================  =====================
+``int``              ``array('q')``                        ``int64``
+``float``            ``array('d')``                        ``float64``
+``str``              ``list[str]``                         ``string``
+``bool``             ``list[bool]``                        ``bool``
+``datetime``         ``array('q')`` of ns since the epoch  ``timestamp[ns, UTC]``
+``RecordID``         ``<name>.tb`` and ``<name>.id``       two dictionary columns
+anything else        ``list``                              inferred by pyarrow
+===================  ====================================  =====================
+
+A column of ints that meets a float becomes a float column, as SurrealDB's own
+``number`` does. Any other mix, or a nested object, makes a plain ``list``
+column. A field that is NONE, NULL or absent from a row is a null: Arrow keeps
+it in the validity mask, while ``to_columns()`` hands back such a column as a
+``list`` with ``None`` in the gaps, since ``array`` has no way to say "missing".
+
+``to_columns()`` needs nothing beyond the standard library, and the ``array``
+buffers expose the buffer protocol, so ``numpy.frombuffer`` views them without
+copying. ``to_arrow()`` needs ``pyarrow`` (``pip install 'surrealdb[arrow]'``).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from surrealdb.data.types.datetime import PreciseDatetime
+from surrealdb.data.types.null import NullType
+from surrealdb.data.types.record_id import RecordID
+from surrealdb.errors import UnexpectedResponseError
+
+#: One column of :meth:`ColumnBuffers.to_columns`.
+if TYPE_CHECKING:
+    Column = array[int] | array[float] | list[Any]
+else:
+    # `array` only takes a subscript from Python 3.12, and this has to resolve
+    # at runtime for anything reading the builders' annotations.
+    Column = array | list
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Column kinds, decided by the first non-null value in the column.
+_INT = "int"
+_FLOAT = "float"
+_BOOL = "bool"
+_STR = "str"
+_DATETIME = "datetime"
+_RECORD = "record"
+_OBJECT = "object"
+
+
+def _kind_of(value: Any) -> str:
+    # `type() is`, not `isinstance`: a bool is an int, and a `PreciseDatetime`
+    # is a datetime that has to keep its nanoseconds.
+    kind = type(value)
+    if kind is int:
+        return _INT
+    if kind is float:
+        return _FLOAT
+    if kind is str:
+        return _STR
+    if kind is bool:
+        return _BOOL
+    if isinstance(value, datetime):
+        return _DATETIME
+    if kind is RecordID:
+        return _RECORD
+    return _OBJECT
+
+
+def _nanoseconds(value: datetime) -> int:
+    """*value* as nanoseconds since the Unix epoch; naive values are UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (
+        (delta.days * 86_400 + delta.seconds) * 1_000_000_000
+        + delta.microseconds * 1_000
+        + getattr(value, "nanosecond", 0)
+    )
+
+
+def _is_null(value: Any) -> bool:
+    return value is None or type(value) is NullType
+
+
+class _Column:
+    """One column's buffer, its validity mask, and for record ids the tables."""
+
+    __slots__ = ("kind", "length", "table_codes", "tables", "valid", "values")
+
+    def __init__(self) -> None:
+        self.kind: str | None = None
+        self.length = 0
+        # Typed while every value fits the kind; a list once it does not.
+        self.values: Any = []
+        # Allocated on the first null; until then every entry is valid.
+        self.valid: bytearray | None = None
+        # A record id column keeps its ids in `values` and its tables
+        # dictionary-encoded here: a handful of names repeated on every row.
+        self.tables: dict[str, int] = {}
+        self.table_codes: array[int] = array("i")
+
+    def pad(self, length: int) -> None:
+        """Append nulls up to *length* rows."""
+        while self.length < length:
+            self.append_null()
+
+    def append_null(self) -> None:
+        if self.valid is None:
+            self.valid = bytearray(b"\x01") * self.length
+        self.valid.append(0)
+        if self.kind in (_INT, _DATETIME):
+            self.values.append(0)
+        elif self.kind == _FLOAT:
+            self.values.append(0.0)
+        elif self.kind == _RECORD:
+            self.table_codes.append(-1)
+            self.values.append(None)
+        else:
+            self.values.append(None)
+        self.length += 1
+
+    def append(self, value: Any) -> None:
+        if _is_null(value):
+            self.append_null()
+            return
+        kind = _kind_of(value)
+        if kind != self.kind:
+            self._retype(kind)
+        if self.kind == _DATETIME:
+            self.values.append(_nanoseconds(value))
+        elif self.kind == _RECORD:
+            table = value.table_name
+            code = self.tables.get(table)
+            if code is None:
+                code = self.tables[table] = len(self.tables)
+            self.table_codes.append(code)
+            self.values.append(value.id)
+        elif self.kind == _FLOAT:
+            self.values.append(float(value))
+        else:
+            self.values.append(value)
+        if self.valid is not None:
+            self.valid.append(1)
+        self.length += 1
+
+    def _retype(self, kind: str) -> None:
+        current = self.kind
+        if current is None:
+            # The first value. Anything before it was null, so it is rebuilt
+            # as placeholders of the new kind.
+            nulls = self.length
+            self.kind = kind
+            self.length = 0
+            self.values = (
+                array("q")
+                if kind in (_INT, _DATETIME)
+                else array("d")
+                if kind == _FLOAT
+                else []
+            )
+            self.valid = None
+            for _ in range(nulls):
+                self.append_null()
+        elif current == _INT and kind == _FLOAT:
+            self.kind = _FLOAT
+            self.values = array("d", self.values)
+        elif current == _FLOAT and kind == _INT:
+            pass
+        elif current != _OBJECT:
+            self.values = self.objects()
+            self.table_codes = array("i")
+            self.tables = {}
+            self.kind = _OBJECT
+
+    def objects(self) -> list[Any]:
+        """The column as Python values, ``None`` where it is null."""
+        if self.kind == _DATETIME:
+            values: list[Any] = [
+                PreciseDatetime.from_seconds_and_nanos(*divmod(ns, 1_000_000_000))
+                for ns in self.values
+            ]
+        elif self.kind == _RECORD:
+            tables = list(self.tables)
+            values = [
+                RecordID(tables[code], identifier) if code >= 0 else None
+                for code, identifier in zip(self.table_codes, self.values, strict=True)
+            ]
+        else:
+            values = list(self.values)
+        if self.valid is not None:
+            for index, ok in enumerate(self.valid):
+                if not ok:
+                    values[index] = None
+        return values
+
+
+class ColumnBuffers:
+    """Rows of one statement, appended field by field to typed columns.
+
+    Build one with :meth:`extend` (or hand it the rows one at a time with
+    :meth:`append`), then read it with :meth:`to_columns` or :meth:`to_arrow`.
+    Both may be called any number of times.
+    """
+
+    __slots__ = ("_columns", "_rows", "error")
+
+    def __init__(self) -> None:
+        self._columns: dict[str, _Column] = {}
+        self._rows = 0
+        # Set by `decode_columns` when a row was not a record, to be raised by
+        # whichever caller reads the columns rather than inside the decoder.
+        self.error: Exception | None = None
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, row: Any) -> None:
+        """Add one record.
+
+        :raises UnexpectedResponseError: if *row* is not a record.
+        """
+        if not isinstance(row, Mapping):
+            raise UnexpectedResponseError(
+                "query results can only be read as columns when every row is "
+                f"a record, got {type(row).__name__}: {row!r:.80}"
+            )
+        columns = self._columns
+        rows = self._rows
+        for key, value in row.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = _Column()
+            if column.length < rows:
+                column.pad(rows)
+            column.append(value)
+        self._rows = rows + 1
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        append = self.append
+        for row in rows:
+            append(row)
+
+    def _finished(self) -> dict[str, _Column]:
+        if self.error is not None:
+            raise self.error
+        for column in self._columns.values():
+            column.pad(self._rows)
+        return self._columns
+
+    def to_columns(self) -> dict[str, Column]:
+        """The columns as ``array`` buffers and lists, keyed by field name."""
+        out: dict[str, Column] = {}
+        for name, column in self._finished().items():
+            if column.kind == _RECORD:
+                tables = list(column.tables)
+                out[f"{name}.tb"] = [
+                    tables[code] if code >= 0 else None for code in column.table_codes
+                ]
+                out[f"{name}.id"] = list(column.values)
+            elif column.valid is not None and 0 in column.valid:
+                if column.kind == _DATETIME:
+                    out[name] = [
+                        ns if ok else None
+                        for ns, ok in zip(column.values, column.valid, strict=True)
+                    ]
+                else:
+                    out[name] = column.objects()
+            elif column.kind is None:
+                out[name] = [None] * column.length
+            else:
+                out[name] = column.values
+        return out
+
+    def to_arrow(self) -> Any:
+        """The columns as a ``pyarrow.Table``.
+
+        :raises ImportError: if ``pyarrow`` is not installed.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError(
+                "to_arrow() needs pyarrow: pip install 'surrealdb[arrow]'. "
+                "to_columns() returns the same columns without it."
+            ) from exc
+
+        names: list[str] = []
+        arrays: list[Any] = []
+        for name, column in self._finished().items():
+            if column.kind == _RECORD:
+                tables = pa.DictionaryArray.from_arrays(
+                    _arrow_buffer(pa, column, column.table_codes, pa.int32()),
+                    pa.array(list(column.tables), pa.string()),
+                )
+                ids = pa.array(column.values)
+                if pa.types.is_string(ids.type):
+                    ids = ids.dictionary_encode()
+                names += [f"{name}.tb", f"{name}.id"]
+                arrays += [tables, ids]
+                continue
+            if column.kind == _INT:
+                values = _arrow_buffer(pa, column, column.values, pa.int64())
+            elif column.kind == _FLOAT:
+                values = _arrow_buffer(pa, column, column.values, pa.float64())
+            elif column.kind == _DATETIME:
+                values = _arrow_buffer(
+                    pa, column, column.values, pa.timestamp("ns", tz="UTC")
+                )
+            elif column.kind == _STR:
+                values = pa.array(column.values, pa.string())
+            elif column.kind == _BOOL:
+                values = pa.array(column.values, pa.bool_())
+            elif column.kind is None:
+                values = pa.nulls(column.length)
+            else:
+                values = pa.array(column.objects())
+            names.append(name)
+            arrays.append(values)
+        return pa.table(arrays, names=names)
+
+
+def _arrow_buffer(pa: Any, column: _Column, values: array[Any], type: Any) -> Any:
+    """*values* as an Arrow array of *type*, sharing the buffer when it can.
+
+    A column without nulls is handed over as it is - the ``array`` already
+    holds the bytes Arrow wants. With nulls the validity bitmap would have to
+    be packed bit by bit, which is what ``pa.array`` does anyway.
+    """
+    if column.valid is None or 0 not in column.valid:
+        return pa.Array.from_buffers(type, len(values), [None, pa.py_buffer(values)])
+    return pa.array(
+        [value if ok else None for value, ok in zip(values, column.valid, strict=True)],
+        type,
+    )
+
+
+def decode_columns(rows: Iterable[Any]) -> ColumnBuffers:
+    """A :data:`~surrealdb.data.cbor.RowsHook` gathering the rows into columns.
+
+    A row that is not a record is kept as the buffers' error rather than
+    raised: raising inside the decoder fails the whole frame, and on a
+    websocket every other request waiting on the connection with it.
+    """
+    buffers = ColumnBuffers()
+    try:
+        buffers.extend(rows)
+    except UnexpectedResponseError as exc:
+        buffers.error = exc
+    return buffers
+
+
+__all__ = ["Column", "ColumnBuffers", "decode_columns"]
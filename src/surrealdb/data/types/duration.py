@@ -34,7 +34,7 @@ _PART_RE = re.compile(rf"(\d+)({_UNIT_PATTERN})")
 _DURATION_RE = re.compile(rf"(?:\d+(?:{_UNIT_PATTERN}))+\Z")
 
 
-@dataclass
+@dataclass(slots=True)
 class Duration:
     elapsed: int = 0  # nanoseconds
 
@@ -2,8 +2,10 @@
 Defines a unset of geometry classes for representing geometric shapes such as points, lines, polygons, and collections.
 """
 
+from array import array
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from surrealdb.errors import InvalidGeometryError
 
@@ -49,6 +51,10 @@ class Geometry:
     and parsing them into specific geometry types.
     """
 
+    # Empty, so the dataclasses below - all `slots=True` - really have no
+    # `__dict__`: one slotless base class gives every subclass instance one.
+    __slots__ = ()
+
     def get_coordinates(self) -> Any:
         """
         Returns the coordinates of the geometry. Should be implemented by subclasses.
@@ -68,7 +74,290 @@ class Geometry:
         return hash(_hashable(self.get_coordinates()))
 
 
-@dataclass
+# How many levels of offsets each kind of `GeometryBuffer` carries.
+_OFFSET_LEVELS = {
+    "LineString": 1,
+    "MultiPoint": 1,
+    "Polygon": 2,
+    "MultiLineString": 2,
+    "MultiPolygon": 3,
+}
+
+
+class GeometryBuffer:
+    """One line, polygon or multi-geometry as a single run of float64s.
+
+    ``coordinates`` is an ``array('d')`` of ``x0, y0, x1, y1, ...`` and
+    ``offsets`` says where each part starts, as ``array('q')``s counting
+    points (or rings, or polygons), in shapely's ragged-array layout for one
+    geometry:
+
+    ===================  ================================================
+    ``geometry_type``    ``offsets``
+    ===================  ================================================
+    ``LineString``       ``([0, points],)``
+    ``MultiPoint``       ``([0, points],)``
+    ``Polygon``          ``(ring starts, [0, rings])``
+    ``MultiLineString``  ``(line starts, [0, lines])``
+    ``MultiPolygon``     ``(ring starts, polygon starts, [0, polygons])``
+    ===================  ================================================
+
+    A polygon of 100k vertices decoded into 100k ``GeometryPoint``s, each with
+    its own coordinate tuple. This is what the decoder reads instead: the
+    geometry classes hold one of these until something asks for their
+    ``geometry_points`` (or lines, or polygons), and the encoder writes it back
+    out directly. Get one from any of them with ``to_buffer()``; it converts to
+    NumPy and Shapely without copying the coordinates.
+    """
+
+    __slots__ = ("coordinates", "geometry_type", "offsets")
+
+    def __init__(
+        self,
+        geometry_type: str,
+        coordinates: Iterable[float],
+        offsets: Sequence[Iterable[int]],
+    ) -> None:
+        levels = _OFFSET_LEVELS.get(geometry_type)
+        if levels is None:
+            raise InvalidGeometryError(
+                f"GeometryBuffer() geometry_type must be one of "
+                f"{', '.join(_OFFSET_LEVELS)}, got {geometry_type!r}"
+            )
+        if not (isinstance(coordinates, array) and coordinates.typecode == "d"):
+            coordinates = array("d", coordinates)
+        if len(coordinates) % 2:
+            raise InvalidGeometryError(
+                "GeometryBuffer() coordinates must be x, y pairs, got an odd "
+                f"number of values ({len(coordinates)})"
+            )
+        if len(offsets) != levels:
+            raise InvalidGeometryError(
+                f"a {geometry_type} GeometryBuffer has {levels} level(s) of "
+                f"offsets, got {len(offsets)}"
+            )
+        self.geometry_type: str = geometry_type
+        self.coordinates: array[float] = coordinates
+        self.offsets: tuple[array[int], ...] = tuple(
+            level
+            if isinstance(level, array) and level.typecode == "q"
+            else array("q", level)
+            for level in offsets
+        )
+
+    @classmethod
+    def from_geometry(cls, geometry: Geometry) -> "GeometryBuffer":
+        """Pack a ``GeometryLine``, ``GeometryPolygon`` or multi-geometry."""
+        geometry_type = getattr(type(geometry), "_GEOMETRY_TYPE", None)
+        if geometry_type is None:
+            raise InvalidGeometryError(
+                f"only lines, polygons and multi-geometries can be packed, got "
+                f"{type(geometry).__name__}"
+            )
+        buffer = getattr(geometry, "_buffer", None)
+        if buffer is not None:
+            return buffer
+        return cls._pack(geometry_type, geometry.get_coordinates())
+
+    @classmethod
+    def _pack(cls, geometry_type: str, nested: Any) -> "GeometryBuffer":
+        coordinates: array[float] = array("d")
+        levels = _OFFSET_LEVELS[geometry_type]
+        if levels == 1:
+            parts: list[Any] = [nested]
+        elif levels == 2:
+            parts = nested
+        else:
+            parts = [ring for polygon in nested for ring in polygon]
+        part_starts = array("q", [0])
+        for part in parts:
+            for x, y in part:
+                coordinates.append(x)
+                coordinates.append(y)
+            part_starts.append(len(coordinates) // 2)
+        if levels == 1:
+            return cls(geometry_type, coordinates, (part_starts,))
+        if levels == 2:
+            return cls(geometry_type, coordinates, (part_starts, [0, len(parts)]))
+        polygon_starts = array("q", [0])
+        for polygon in nested:
+            polygon_starts.append(polygon_starts[-1] + len(polygon))
+        return cls(
+            geometry_type,
+            coordinates,
+            (part_starts, polygon_starts, [0, len(nested)]),
+        )
+
+    def __len__(self) -> int:
+        """The number of points."""
+        return len(self.coordinates) // 2
+
+    def to_coordinates(self) -> Any:
+        """The nested coordinates, shaped as the geometry's ``get_coordinates()``."""
+        values = self.coordinates
+        points = list(zip(values[0::2], values[1::2], strict=True))
+        if len(self.offsets) == 1:
+            return points
+        parts = _split(points, self.offsets[0])
+        if len(self.offsets) == 2:
+            return parts
+        return _split(parts, self.offsets[1])
+
+    def to_geometry(self) -> Geometry:
+        """The same geometry as ``GeometryPoint`` objects and lists of them."""
+        kind = _PACKABLE[self.geometry_type]
+        return kind.parse_coordinates(self.to_coordinates())
+
+    def to_numpy(self) -> tuple[Any, tuple[Any, ...]]:
+        """``(coordinates, offsets)`` as NumPy arrays sharing this buffer.
+
+        ``coordinates`` has shape ``(points, 2)``; the offsets are ``int64``.
+        Nothing is copied, so the arrays see any change made through the other.
+
+        :raises ImportError: if ``numpy`` is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError(
+                "to_numpy() needs numpy: pip install 'surrealdb[geo]'"
+            ) from exc
+        coordinates = np.frombuffer(self.coordinates, dtype=np.float64).reshape(-1, 2)
+        return coordinates, tuple(
+            np.frombuffer(level, dtype=np.int64) for level in self.offsets
+        )
+
+    def to_shapely(self) -> Any:
+        """The geometry as a Shapely object, built from :meth:`to_numpy`.
+
+        :raises ImportError: if ``shapely`` 2 is not installed.
+        """
+        try:
+            import shapely
+        except ImportError as exc:
+            raise ImportError(
+                "to_shapely() needs shapely: pip install 'surrealdb[geo]'"
+            ) from exc
+        coordinates, offsets = self.to_numpy()
+        kind = getattr(shapely.GeometryType, self.geometry_type.upper())
+        return shapely.from_ragged_array(kind, coordinates, offsets)[0]
+
+    @classmethod
+    def from_shapely(cls, geometry: Any) -> "GeometryBuffer":
+        """Pack a Shapely line, polygon or multi-geometry; z values are dropped.
+
+        :raises ImportError: if ``shapely`` 2 is not installed.
+        """
+        try:
+            import shapely
+        except ImportError as exc:
+            raise ImportError(
+                "from_shapely() needs shapely: pip install 'surrealdb[geo]'"
+            ) from exc
+        kind, coordinates, offsets = shapely.to_ragged_array(
+            [geometry], include_z=False
+        )
+        names = {name.upper(): name for name in _OFFSET_LEVELS}
+        if kind.name not in names:
+            raise InvalidGeometryError(
+                f"only lines, polygons and multi-geometries can be packed, got "
+                f"a shapely {kind.name.title()}"
+            )
+        values: array[float] = array("d")
+        values.frombytes(coordinates.astype("float64").tobytes())
+        return cls(names[kind.name], values, [level.tolist() for level in offsets])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GeometryBuffer):
+            return (
+                self.geometry_type == other.geometry_type
+                and self.coordinates == other.coordinates
+                and self.offsets == other.offsets
+            )
+        return False
+
+    def __hash__(self) -> int:
+        return hash((self.geometry_type, tuple(self.coordinates)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.geometry_type!r}, {len(self)} points)"
+
+
+def _split(items: list[Any], starts: Sequence[int]) -> list[Any]:
+    return [items[starts[n] : starts[n + 1]] for n in range(len(starts) - 1)]
+
+
+class _PackableGeometry(Geometry):
+    """A geometry the decoder may hand over as a :class:`GeometryBuffer`.
+
+    Such an instance has ``_buffer`` set and its ``geometry_*`` slot empty.
+    The objects are built the first time the slot is read, and from then on
+    the list is the geometry - it is the caller's to mutate, so the buffer is
+    dropped rather than kept in step. Until then the coordinates, the hash,
+    equality with another packed geometry and the encoder all read the buffer.
+
+    A geometry built by its constructor never sets ``_buffer`` at all, and
+    reading it answers ``None`` through ``__getattr__``. Assigning it in each
+    ``__init__`` instead trips mypy, which takes a slotted dataclass's slots to
+    be its fields and misses the one inherited from here.
+    """
+
+    __slots__ = ("_buffer",)
+
+    _buffer: GeometryBuffer | None
+
+    #: The slot `_buffer` stands in for, and the `GeometryBuffer` type.
+    _PARTS: ClassVar[str]
+    _GEOMETRY_TYPE: ClassVar[str]
+
+    @classmethod
+    def _from_buffer(cls, buffer: GeometryBuffer) -> Any:
+        instance = object.__new__(cls)
+        instance._buffer = buffer
+        return instance
+
+    if not TYPE_CHECKING:
+        # Hidden from type checkers, which would otherwise accept any
+        # attribute at all on every geometry.
+        def __getattr__(self, name: str) -> Any:
+            # Only reached for a slot that is not set.
+            if name == "_buffer":
+                return None
+            if name == self._PARTS and self._buffer is not None:
+                parts = getattr(self._buffer.to_geometry(), name)
+                setattr(self, name, parts)
+                del self._buffer
+                return parts
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Pickled as the buffer while there is one, rather than by reading
+        # every slot - which would build all the objects just to pickle them.
+        buffer = self._buffer
+        if buffer is not None:
+            return type(self)._from_buffer, (buffer,)
+        return super().__reduce_ex__(protocol)
+
+    def to_buffer(self) -> GeometryBuffer:
+        """The coordinates as a :class:`GeometryBuffer`.
+
+        The decoder's own buffer when the geometry still has it - so this is
+        free for a value read from the database - otherwise a new one.
+        """
+        return GeometryBuffer.from_geometry(self)
+
+    def _packed_equal(self, other: "_PackableGeometry") -> bool | None:
+        """Compare by buffer when both sides have one; ``None`` otherwise."""
+        mine = self._buffer
+        theirs = other._buffer
+        if mine is not None and theirs is not None:
+            return mine == theirs
+        return None
+
+
+@dataclass(slots=True)
 class GeometryPoint(Geometry):
     """
     Represents a single point in a 2D space.
@@ -124,8 +413,8 @@ class GeometryPoint(Geometry):
         return hash((self.longitude, self.latitude))
 
 
-@dataclass
-class GeometryLine(Geometry):
+@dataclass(slots=True)
+class GeometryLine(_PackableGeometry):
     """
     Represents a line defined by two or more points.
 
@@ -134,6 +423,8 @@ class GeometryLine(Geometry):
     """
 
     geometry_points: list[GeometryPoint]
+    _PARTS: ClassVar[str] = "geometry_points"
+    _GEOMETRY_TYPE: ClassVar[str] = "LineString"
 
     def __init__(
         self, point1: GeometryPoint, point2: GeometryPoint, *other_points: GeometryPoint
@@ -150,6 +441,8 @@ class GeometryLine(Geometry):
         Returns:
             A list of (longitude, latitude) tuples.
         """
+        if self._buffer is not None:
+            return self._buffer.to_coordinates()
         return [point.get_coordinates() for point in self.geometry_points]
 
     def __repr__(self) -> str:
@@ -182,6 +475,9 @@ class GeometryLine(Geometry):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, GeometryLine):
+            packed = self._packed_equal(other)
+            if packed is not None:
+                return packed
             return self.geometry_points == other.geometry_points
         return False
 
@@ -189,8 +485,8 @@ class GeometryLine(Geometry):
         return hash(_hashable(self.get_coordinates()))
 
 
-@dataclass
-class GeometryPolygon(Geometry):
+@dataclass(slots=True)
+class GeometryPolygon(_PackableGeometry):
     """
     Represents a polygon defined by linear rings according to the GeoJSON specification.
 
@@ -226,6 +522,8 @@ class GeometryPolygon(Geometry):
     """
 
     geometry_lines: list[GeometryLine]
+    _PARTS: ClassVar[str] = "geometry_lines"
+    _GEOMETRY_TYPE: ClassVar[str] = "Polygon"
 
     def __init__(self, exterior_ring: GeometryLine, *interior_rings: GeometryLine):
         """
@@ -287,6 +585,8 @@ class GeometryPolygon(Geometry):
         Returns:
             A list of lists of (longitude, latitude) tuples representing the linear rings.
         """
+        if self._buffer is not None:
+            return self._buffer.to_coordinates()
         return [line.get_coordinates() for line in self.geometry_lines]
 
     def __repr__(self) -> str:
@@ -326,6 +626,9 @@ class GeometryPolygon(Geometry):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, GeometryPolygon):
+            packed = self._packed_equal(other)
+            if packed is not None:
+                return packed
             return self.geometry_lines == other.geometry_lines
         return False
 
@@ -333,8 +636,8 @@ class GeometryPolygon(Geometry):
         return hash(_hashable(self.get_coordinates()))
 
 
-@dataclass
-class GeometryMultiPoint(Geometry):
+@dataclass(slots=True)
+class GeometryMultiPoint(_PackableGeometry):
     """
     Represents multiple points in 2D space.
 
@@ -343,6 +646,8 @@ class GeometryMultiPoint(Geometry):
     """
 
     geometry_points: list[GeometryPoint]
+    _PARTS: ClassVar[str] = "geometry_points"
+    _GEOMETRY_TYPE: ClassVar[str] = "MultiPoint"
 
     def __init__(self, *geometry_points: GeometryPoint):
         self.geometry_points = list(geometry_points)
@@ -354,6 +659,8 @@ class GeometryMultiPoint(Geometry):
         Returns:
             A list of (longitude, latitude) tuples.
         """
+        if self._buffer is not None:
+            return self._buffer.to_coordinates()
         return [point.get_coordinates() for point in self.geometry_points]
 
     def __repr__(self) -> str:
@@ -388,6 +695,9 @@ class GeometryMultiPoint(Geometry):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, GeometryMultiPoint):
+            packed = self._packed_equal(other)
+            if packed is not None:
+                return packed
             return self.geometry_points == other.geometry_points
         return False
 
@@ -395,8 +705,8 @@ class GeometryMultiPoint(Geometry):
         return hash(_hashable(self.get_coordinates()))
 
 
-@dataclass
-class GeometryMultiLine(Geometry):
+@dataclass(slots=True)
+class GeometryMultiLine(_PackableGeometry):
     """
     Represents multiple lines.
 
@@ -405,6 +715,8 @@ class GeometryMultiLine(Geometry):
     """
 
     geometry_lines: list[GeometryLine]
+    _PARTS: ClassVar[str] = "geometry_lines"
+    _GEOMETRY_TYPE: ClassVar[str] = "MultiLineString"
 
     def __init__(self, *geometry_lines: GeometryLine):
         self.geometry_lines = list(geometry_lines)
@@ -416,6 +728,8 @@ class GeometryMultiLine(Geometry):
         Returns:
             A list of lists of (longitude, latitude) tuples.
         """
+        if self._buffer is not None:
+            return self._buffer.to_coordinates()
         return [line.get_coordinates() for line in self.geometry_lines]
 
     def __repr__(self) -> str:
@@ -450,6 +764,9 @@ class GeometryMultiLine(Geometry):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, GeometryMultiLine):
+            packed = self._packed_equal(other)
+            if packed is not None:
+                return packed
             return self.geometry_lines == other.geometry_lines
         return False
 
@@ -457,8 +774,8 @@ class GeometryMultiLine(Geometry):
         return hash(_hashable(self.get_coordinates()))
 
 
-@dataclass
-class GeometryMultiPolygon(Geometry):
+@dataclass(slots=True)
+class GeometryMultiPolygon(_PackableGeometry):
     """
     Represents multiple polygons.
 
@@ -467,6 +784,8 @@ class GeometryMultiPolygon(Geometry):
     """
 
     geometry_polygons: list[GeometryPolygon]
+    _PARTS: ClassVar[str] = "geometry_polygons"
+    _GEOMETRY_TYPE: ClassVar[str] = "MultiPolygon"
 
     def __init__(self, *geometry_polygons: GeometryPolygon):
         self.geometry_polygons = list(geometry_polygons)
@@ -478,6 +797,8 @@ class GeometryMultiPolygon(Geometry):
         Returns:
             A list of lists of lists of (longitude, latitude) tuples.
         """
+        if self._buffer is not None:
+            return self._buffer.to_coordinates()
         return [polygon.get_coordinates() for polygon in self.geometry_polygons]
 
     def __repr__(self) -> str:
@@ -512,6 +833,9 @@ class GeometryMultiPolygon(Geometry):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, GeometryMultiPolygon):
+            packed = self._packed_equal(other)
+            if packed is not None:
+                return packed
             return self.geometry_polygons == other.geometry_polygons
         return False
 
@@ -519,7 +843,7 @@ class GeometryMultiPolygon(Geometry):
         return hash(_hashable(self.get_coordinates()))
 
 
-@dataclass
+@dataclass(slots=True)
 class GeometryCollection:
     """
     Represents a collection of multiple geometry objects.
@@ -555,3 +879,16 @@ class GeometryCollection:
 
     def __hash__(self) -> int:
         return hash(tuple(self.geometries))
+
+
+# `GeometryBuffer.geometry_type` to the class it packs.
+_PACKABLE: dict[str, Any] = {
+    kind._GEOMETRY_TYPE: kind
+    for kind in (
+        GeometryLine,
+        GeometryPolygon,
+        GeometryMultiPoint,
+        GeometryMultiLine,
+        GeometryMultiPolygon,
+    )
+}
@@ -8,9 +8,6 @@ import uuid as uuid_module
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Union, cast
 
-from pydantic_core import core_schema
-from pydantic_core.core_schema import ValidationInfo
-
 from surrealdb.data.types.range import Range
 from surrealdb.data.types.set import SurrealSet
 from surrealdb.data.types.table import Table, table_name_type_error
@@ -19,6 +16,8 @@ from surrealdb.errors import InvalidRecordIdError
 if TYPE_CHECKING:
     from pydantic import GetJsonSchemaHandler
     from pydantic.json_schema import JsonSchemaValue
+    from pydantic_core import core_schema
+    from pydantic_core.core_schema import ValidationInfo
 
 RecordIdType = Union[str, "RecordID", Table]
 
@@ -185,6 +184,12 @@ class RecordID:
             escaped id fragment.
     """
 
+    # No `__dict__`: a graph traversal hands back one of these per link, and
+    # millions of them each carrying an empty dict roughly tripled what the ids
+    # cost. `__weakref__` is kept, as before slots, so ids can still key a
+    # `WeakKeyDictionary` or be watched with `weakref.finalize`.
+    __slots__ = ("__weakref__", "id", "table_name")
+
     def __init__(self, table_name: str, identifier: RecordIdValue) -> None:
         """
         The constructor for the RecordID class.
@@ -315,6 +320,10 @@ class RecordID:
         _source_type: Any,  # pyright: ignore[reportExplicitAny, reportAny]
         _handler: Callable[[Any], core_schema.CoreSchema],  # pyright: ignore[reportExplicitAny]
     ) -> core_schema.CoreSchema:
+        # Imported here: only pydantic ever asks, and at module level it was
+        # most of what importing the data types cost.
+        from pydantic_core import core_schema
+
         def validate_from_str(value: str, _info: ValidationInfo) -> RecordID:
             return RecordID.parse(value)
 
@@ -346,4 +355,6 @@ class RecordID:
     def __get_pydantic_json_schema__(
         cls, _core_schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
     ) -> JsonSchemaValue:
+        from pydantic_core import core_schema
+
         return handler(core_schema.str_schema())
@@ -54,6 +54,11 @@ class Table:
         table_name: The name of the table.
     """
 
+    # Slotted like `RecordID`, and immutable: the decoder hands out one shared
+    # instance per name, so reassigning `table_name` on one would rename the
+    # table in every other result holding it.
+    __slots__ = ("__weakref__", "table_name")
+
     def __init__(self, table_name: str) -> None:
         """
         Initializes a Table object with a specific table name.
@@ -77,7 +82,8 @@ class Table:
         """
         if not isinstance(table_name, str):  # pyright: ignore[reportUnnecessaryIsInstance]
             raise table_name_type_error("Table", table_name)
-        self.table_name: str = table_name
+        self.table_name: str
+        object.__setattr__(self, "table_name", table_name)
 
     @classmethod
     def _unchecked(cls, table_name: Any) -> "Table":
@@ -87,9 +93,22 @@ class Table:
         check rather than sharing it.
         """
         table = object.__new__(cls)
-        table.table_name = table_name
+        object.__setattr__(table, "table_name", table_name)
         return table
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"Table is immutable; build a new Table instead of setting {name!r}"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Table is immutable; {name!r} cannot be deleted")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle and copy rebuild through the constructor: the default restores
+        # slots with `setattr`, which an immutable table refuses.
+        return (Table, (self.table_name,))
+
     def __str__(self) -> str:
         """
         Returns a string representation of the table.
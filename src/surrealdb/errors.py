@@ -456,6 +456,15 @@ class UnexpectedResponseError(SurrealError):
     """Server returned an unexpected response format."""
 
 
+class LiveQueueOverflowError(SurrealError):
+    """A live subscription's queue overflowed under ``on_overflow="error"``.
+
+    Raised by the subscription once it has delivered everything queued before
+    the overflow, so the consumer knows exactly where its view of the table
+    stopped being complete.
+    """
+
+
 class InvalidRecordIdError(SurrealError):
     """RecordID string could not be parsed."""
 
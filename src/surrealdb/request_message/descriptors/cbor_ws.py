@@ -1,11 +1,9 @@
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
-from pydantic_core import SchemaValidator
-from pydantic_core import ValidationError as PydanticValidationError
-
 from surrealdb.data.cbor import encode
 from surrealdb.data.types.record_id import RecordIdType
 from surrealdb.data.types.table import Table
@@ -13,6 +11,9 @@ from surrealdb.data.utils import process_record
 from surrealdb.request_message.methods import RequestMethod
 
 if TYPE_CHECKING:
+    from pydantic_core import SchemaValidator
+    from pydantic_core import ValidationError as PydanticValidationError
+
     from surrealdb.request_message.message import RequestMessage
 
 
@@ -51,6 +52,8 @@ def _build_validator(
     }
     if params_schema is not None:
         fields["params"] = {"schema": params_schema, "required": True}
+    from pydantic_core import SchemaValidator
+
     return SchemaValidator({"type": "typed-dict", "fields": fields})
 
 
@@ -70,15 +73,18 @@ def _inject_session_txn(data: dict[str, Any], obj: RequestMessage) -> None:
         data["txn"] = str(txn) if isinstance(txn, UUID) else txn
 
 
-USE_VALIDATOR = _build_validator(
-    RequestMethod.USE.value,
-    _list_schema({"type": "str", "strict": True}, min_length=2, max_length=2),
-)
-INFO_VALIDATOR = _build_validator(RequestMethod.INFO.value)
-VERSION_VALIDATOR = _build_validator(RequestMethod.VERSION.value)
-AUTHENTICATE_VALIDATOR = _build_validator(
-    RequestMethod.AUTHENTICATE.value,
-    _list_schema(
+# The `params` schema each validated method is checked against; `None` for a
+# method that takes no params. Only the schemas are built here. Compiling all
+# nineteen validators at import was a pydantic-core round trip each, paid by
+# every `import surrealdb` whether or not a request was ever sent, so each is
+# compiled by `_validator` the first time its method is.
+_PARAMS_SCHEMAS: dict[RequestMethod, dict[str, Any] | None] = {
+    RequestMethod.USE: _list_schema(
+        {"type": "str", "strict": True}, min_length=2, max_length=2
+    ),
+    RequestMethod.INFO: None,
+    RequestMethod.VERSION: None,
+    RequestMethod.AUTHENTICATE: _list_schema(
         {
             "type": "str",
             "strict": True,
@@ -87,68 +93,46 @@ AUTHENTICATE_VALIDATOR = _build_validator(
         min_length=1,
         max_length=1,
     ),
-)
-INVALIDATE_VALIDATOR = _build_validator(RequestMethod.INVALIDATE.value)
-LET_VALIDATOR = _build_validator(RequestMethod.LET.value, _list_schema(min_length=2))
-UNSET_VALIDATOR = _build_validator(RequestMethod.UNSET.value, _list_schema())
-LIVE_VALIDATOR = _build_validator(RequestMethod.LIVE.value, _list_schema())
-KILL_VALIDATOR = _build_validator(RequestMethod.KILL.value, _list_schema())
-QUERY_VALIDATOR = _build_validator(
-    RequestMethod.QUERY.value, _list_schema(min_length=2, max_length=2)
-)
-INSERT_VALIDATOR = _build_validator(
-    RequestMethod.INSERT.value, _list_schema(min_length=2, max_length=2)
-)
-PATCH_VALIDATOR = _build_validator(
-    RequestMethod.PATCH.value, _list_schema(min_length=2, max_length=2)
-)
-SELECT_VALIDATOR = _build_validator(RequestMethod.SELECT.value, _list_schema())
-CREATE_VALIDATOR = _build_validator(
-    RequestMethod.CREATE.value, _list_schema(min_length=1, max_length=2)
-)
-UPDATE_VALIDATOR = _build_validator(
-    RequestMethod.UPDATE.value, _list_schema(min_length=1, max_length=2)
-)
-MERGE_VALIDATOR = _build_validator(
-    RequestMethod.MERGE.value, _list_schema(min_length=1, max_length=2)
-)
-DELETE_VALIDATOR = _build_validator(
-    RequestMethod.DELETE.value, _list_schema(min_length=1, max_length=1)
-)
-INSERT_RELATION_VALIDATOR = _build_validator(
-    RequestMethod.INSERT_RELATION.value, _list_schema(min_length=2, max_length=2)
-)
-UPSERT_VALIDATOR = _build_validator(
-    RequestMethod.UPSERT.value, _list_schema(min_length=1, max_length=2)
-)
-
-_VALIDATORS: dict[RequestMethod, SchemaValidator] = {
-    RequestMethod.USE: USE_VALIDATOR,
-    RequestMethod.INFO: INFO_VALIDATOR,
-    RequestMethod.VERSION: VERSION_VALIDATOR,
-    RequestMethod.AUTHENTICATE: AUTHENTICATE_VALIDATOR,
-    RequestMethod.INVALIDATE: INVALIDATE_VALIDATOR,
-    RequestMethod.LET: LET_VALIDATOR,
-    RequestMethod.UNSET: UNSET_VALIDATOR,
-    RequestMethod.LIVE: LIVE_VALIDATOR,
-    RequestMethod.KILL: KILL_VALIDATOR,
-    RequestMethod.QUERY: QUERY_VALIDATOR,
-    RequestMethod.INSERT: INSERT_VALIDATOR,
-    RequestMethod.PATCH: PATCH_VALIDATOR,
-    RequestMethod.SELECT: SELECT_VALIDATOR,
-    RequestMethod.CREATE: CREATE_VALIDATOR,
-    RequestMethod.UPDATE: UPDATE_VALIDATOR,
-    RequestMethod.MERGE: MERGE_VALIDATOR,
-    RequestMethod.DELETE: DELETE_VALIDATOR,
-    RequestMethod.INSERT_RELATION: INSERT_RELATION_VALIDATOR,
-    RequestMethod.UPSERT: UPSERT_VALIDATOR,
+    RequestMethod.INVALIDATE: None,
+    RequestMethod.LET: _list_schema(min_length=2),
+    RequestMethod.UNSET: _list_schema(),
+    RequestMethod.LIVE: _list_schema(),
+    RequestMethod.KILL: _list_schema(),
+    RequestMethod.QUERY: _list_schema(min_length=2, max_length=2),
+    RequestMethod.INSERT: _list_schema(min_length=2, max_length=2),
+    RequestMethod.PATCH: _list_schema(min_length=2, max_length=2),
+    RequestMethod.SELECT: _list_schema(),
+    RequestMethod.CREATE: _list_schema(min_length=1, max_length=2),
+    RequestMethod.UPDATE: _list_schema(min_length=1, max_length=2),
+    RequestMethod.MERGE: _list_schema(min_length=1, max_length=2),
+    RequestMethod.DELETE: _list_schema(min_length=1, max_length=1),
+    RequestMethod.INSERT_RELATION: _list_schema(min_length=2, max_length=2),
+    RequestMethod.UPSERT: _list_schema(min_length=1, max_length=2),
 }
 
 
+@cache
+def _validator(method: RequestMethod) -> SchemaValidator | None:
+    """The compiled validator for *method*, or ``None`` if it is not validated."""
+    if method not in _PARAMS_SCHEMAS:
+        return None
+    return _build_validator(method.value, _PARAMS_SCHEMAS[method])
+
+
+def __getattr__(name: str) -> Any:
+    # `USE_VALIDATOR`, `QUERY_VALIDATOR`, ... were module constants.
+    method = RequestMethod.__members__.get(name.removesuffix("_VALIDATOR"))
+    if name.endswith("_VALIDATOR") and method in _PARAMS_SCHEMAS:
+        return _validator(method)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _validate_payload(data: dict[str, Any], method: RequestMethod) -> None:
-    validator = _VALIDATORS.get(method)
+    validator = _validator(method)
     if validator is None:
         return
+    from pydantic_core import ValidationError as PydanticValidationError
+
     try:
         validator.validate_python(data)
     except PydanticValidationError as exc:
@@ -0,0 +1,358 @@
+"""Opt-in tracing and metrics for every RPC the transports send.
+
+Tracing used to mean wrapping each call from outside (``examples/logfire``),
+which sees how long a call took and nothing about why: not how much of it was
+encoding, the network, or decoding, not how big either side was, and not what
+statement it ran. The transports now describe each RPC to a recorder as they
+send it::
+
+    from surrealdb import telemetry
+
+    telemetry.instrument()  # OpenTelemetry: `pip install 'surrealdb[otel]'`
+
+Each RPC becomes a ``CLIENT`` span named ``surrealdb <method>`` with
+
+===================================  ========================================
+``db.system.name``                   ``"surrealdb"``
+``db.operation.name``                the RPC method, ``query``, ``select``, ...
+``db.namespace``                     ``"<namespace>/<database>"`` when known
+``db.query.text``                    a ``query``'s SurrealQL, literals as ``?``
+``surrealdb.statement.fingerprint``  a hash of that text, for grouping
+``surrealdb.transport``              ``ws``, ``http`` or ``embedded``
+``surrealdb.request.size``           bytes sent
+``surrealdb.response.size``          bytes received
+``surrealdb.encode.duration``        seconds spent encoding the request
+``surrealdb.decode.duration``        seconds spent decoding the reply
+``surrealdb.network.duration``       the rest: the round trip itself
+``server.address``                   the server's host, when it has one
+``server.port``                      and its port
+===================================  ========================================
+
+and a ``timeout`` event when no reply arrived in time. A failed RPC gets
+``error.type`` and an error status. The same measurements feed histograms:
+``db.client.operation.duration``, ``surrealdb.client.encode.duration``,
+``surrealdb.client.decode.duration`` (seconds), ``surrealdb.client.request.size``
+and ``surrealdb.client.response.size`` (bytes).
+
+Disabled - the default - a transport checks one module attribute per RPC and
+does nothing else. Anything with ``start`` and ``finish`` methods can be the
+recorder (:class:`Recorder`), so other backends, and tests, need not go
+through OpenTelemetry at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Protocol
+
+from surrealdb.request_message.methods import RequestMethod
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from surrealdb.request_message.message import RequestMessage
+
+#: What the transports report to; ``None`` when instrumentation is off. Read
+#: on every RPC, so it is a plain module attribute and not a function call.
+recorder: Recorder | None = None
+
+# A `query`'s text is kept up to this long on the span.
+_QUERY_TEXT_LIMIT = 2048
+
+# String literals (either quote, with escapes), then anything starting with a
+# digit that is not part of an identifier: numbers, durations such as `10ms`,
+# and a record id's numeric key - `person:1` and `person:2` are the same
+# statement.
+_LITERALS = re.compile(r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|(?<![\w$])\d[\w.]*""")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class Recorder(Protocol):
+    """Where the transports report each RPC.
+
+    ``start`` runs just before the request is encoded, in the caller's context
+    - so an OpenTelemetry span started there has the caller's span as its
+    parent. ``finish`` runs once the reply is decoded or the RPC has failed,
+    with every measurement on *call* filled in. Neither may raise.
+    """
+
+    def start(self, call: RpcCall) -> None: ...
+
+    def finish(self, call: RpcCall) -> None: ...
+
+
+class RpcCall:
+    """One RPC, as a transport measured it.
+
+    Durations are nanoseconds from ``time.perf_counter_ns``. ``decode_ns``
+    covers every frame read on the way to the reply, which on a blocking
+    websocket includes live notifications that arrived first.
+    """
+
+    __slots__ = (
+        "database",
+        "decode_ns",
+        "duration_ns",
+        "encode_ns",
+        "error",
+        "events",
+        "fingerprint",
+        "method",
+        "namespace",
+        "query",
+        "recorder",
+        "request_bytes",
+        "response_bytes",
+        "server_address",
+        "server_port",
+        "span",
+        "started_ns",
+        "transport",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        transport: str,
+        *,
+        namespace: str | None = None,
+        database: str | None = None,
+        server_address: str | None = None,
+        server_port: int | None = None,
+        query: str | None = None,
+    ) -> None:
+        self.method = method
+        self.transport = transport
+        self.namespace = namespace
+        self.database = database
+        self.server_address = server_address
+        self.server_port = server_port
+        #: The statement with its literals replaced, for a ``query`` RPC.
+        self.query: str | None = None
+        self.fingerprint: str | None = None
+        if query is not None:
+            self.query, self.fingerprint = fingerprint(query)
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.encode_ns = 0
+        self.decode_ns = 0
+        self.duration_ns = 0
+        #: ``(name, wall-clock ns, attributes)`` for each event, in order.
+        self.events: list[tuple[str, int, dict[str, Any]]] = []
+        self.error: BaseException | None = None
+        #: The recorder that saw it start, and whatever that keeps for it.
+        self.recorder: Recorder | None = None
+        self.span: Any = None
+        self.started_ns = time.perf_counter_ns()
+
+    @property
+    def network_ns(self) -> int:
+        """The part of the RPC that was neither encoding nor decoding."""
+        return max(0, self.duration_ns - self.encode_ns - self.decode_ns)
+
+    def encode(self, message: RequestMessage) -> bytes:
+        """*message*'s wire form, timing it."""
+        started = time.perf_counter_ns()
+        data = message.WS_CBOR_DESCRIPTOR
+        self.encode_ns += time.perf_counter_ns() - started
+        self.request_bytes += len(data)
+        return data
+
+    def decode(self, decode: Callable[..., Any], data: bytes, *args: Any) -> Any:
+        """``decode(data, *args)``, timing it."""
+        started = time.perf_counter_ns()
+        try:
+            return decode(data, *args)
+        finally:
+            self.decoded(len(data), time.perf_counter_ns() - started)
+
+    def decoded(self, size: int, elapsed_ns: int) -> None:
+        """Count a reply decoded elsewhere - by a websocket reader task."""
+        self.response_bytes += size
+        self.decode_ns += elapsed_ns
+
+    def event(self, name: str, **attributes: Any) -> None:
+        """Note something that happened during the RPC: a ``timeout``, a ``retry``."""
+        self.events.append((name, time.time_ns(), attributes))
+
+    def fail(self, error: BaseException) -> None:
+        self.error = error
+
+    def end(self) -> None:
+        self.duration_ns = time.perf_counter_ns() - self.started_ns
+        if self.recorder is not None:
+            self.recorder.finish(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"RpcCall({self.method!r}, {self.transport!r}, "
+            f"duration_ns={self.duration_ns}, error={self.error!r})"
+        )
+
+
+def start(connection: Any, message: RequestMessage, transport: str) -> RpcCall:
+    """Describe *message*, about to be sent on *connection*, to the recorder.
+
+    Only called by a transport that has already seen :data:`recorder` set.
+    """
+    kwargs = message.kwargs
+    if message.method is RequestMethod.USE:
+        namespace, database = kwargs.get("namespace"), kwargs.get("database")
+    elif kwargs.get("session") is not None:
+        # A session has its own namespace and database, which the connection
+        # does not know.
+        namespace = database = None
+    else:
+        namespace = getattr(connection, "namespace", None)
+        database = getattr(connection, "database", None)
+    query = kwargs.get("query") if message.method is RequestMethod.QUERY else None
+    call = RpcCall(
+        message.method.value,
+        transport,
+        namespace=namespace,
+        database=database,
+        server_address=getattr(connection, "host", None),
+        server_port=getattr(connection, "port", None),
+        query=query if isinstance(query, str) else None,
+    )
+    # Kept on the call, so switching recorders mid-flight finishes each RPC
+    # where it started.
+    call.recorder = recorder
+    if call.recorder is not None:
+        call.recorder.start(call)
+    return call
+
+
+@lru_cache(maxsize=512)
+def fingerprint(query: str) -> tuple[str, str]:
+    """*query* with its literals replaced by ``?``, and a short hash of that.
+
+    Two runs of the same statement with different values - inlined rather than
+    bound as parameters - share a fingerprint. Cached, since an application
+    runs the same handful of statements over and over.
+    """
+    normalized = _WHITESPACE.sub(" ", _LITERALS.sub("?", query)).strip()
+    digest = hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+    return normalized[:_QUERY_TEXT_LIMIT], digest
+
+
+def set_recorder(new: Recorder | None) -> None:
+    """Report every RPC to *new* from now on; ``None`` turns reporting off."""
+    global recorder
+    recorder = new
+
+
+def instrument(*, tracer_provider: Any = None, meter_provider: Any = None) -> None:
+    """Trace every RPC with OpenTelemetry and record its metrics.
+
+    Uses the global tracer and meter providers unless given others - pass an
+    SDK ``TracerProvider`` with an ``InMemorySpanExporter`` to test against.
+
+    :raises ImportError: if ``opentelemetry-api`` is not installed.
+    """
+    set_recorder(_OpenTelemetry(tracer_provider, meter_provider))
+
+
+def uninstrument() -> None:
+    """Stop tracing. An RPC already in flight still finishes its span."""
+    set_recorder(None)
+
+
+class _OpenTelemetry:
+    """A :class:`Recorder` producing OpenTelemetry spans and histograms."""
+
+    def __init__(self, tracer_provider: Any, meter_provider: Any) -> None:
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as exc:
+            raise ImportError(
+                "telemetry.instrument() needs OpenTelemetry: "
+                "pip install 'surrealdb[otel]'"
+            ) from exc
+
+        self._kind = trace.SpanKind.CLIENT
+        self._error = trace.Status(trace.StatusCode.ERROR)
+        self._tracer = trace.get_tracer("surrealdb", tracer_provider=tracer_provider)
+        meter = metrics.get_meter("surrealdb", meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            "db.client.operation.duration",
+            unit="s",
+            description="Duration of SurrealDB RPCs.",
+        )
+        self._encode = meter.create_histogram(
+            "surrealdb.client.encode.duration",
+            unit="s",
+            description="Time spent encoding SurrealDB requests.",
+        )
+        self._decode = meter.create_histogram(
+            "surrealdb.client.decode.duration",
+            unit="s",
+            description="Time spent decoding SurrealDB replies.",
+        )
+        self._request_size = meter.create_histogram(
+            "surrealdb.client.request.size",
+            unit="By",
+            description="Size of SurrealDB requests.",
+        )
+        self._response_size = meter.create_histogram(
+            "surrealdb.client.response.size",
+            unit="By",
+            description="Size of SurrealDB replies.",
+        )
+
+    def start(self, call: RpcCall) -> None:
+        call.span = self._tracer.start_span(f"surrealdb {call.method}", kind=self._kind)
+
+    def finish(self, call: RpcCall) -> None:
+        common: dict[str, Any] = {
+            "db.system.name": "surrealdb",
+            "db.operation.name": call.method,
+            "surrealdb.transport": call.transport,
+        }
+        if call.namespace is not None and call.database is not None:
+            common["db.namespace"] = f"{call.namespace}/{call.database}"
+        if call.server_address is not None:
+            common["server.address"] = call.server_address
+        if call.server_port is not None:
+            common["server.port"] = call.server_port
+        if call.error is not None:
+            common["error.type"] = type(call.error).__qualname__
+
+        self._duration.record(call.duration_ns / 1e9, common)
+        self._encode.record(call.encode_ns / 1e9, common)
+        self._request_size.record(call.request_bytes, common)
+        if call.response_bytes:
+            self._decode.record(call.decode_ns / 1e9, common)
+            self._response_size.record(call.response_bytes, common)
+
+        span = call.span
+        attributes = dict(common)
+        if call.query is not None:
+            attributes["db.query.text"] = call.query
+            attributes["surrealdb.statement.fingerprint"] = call.fingerprint
+        attributes["surrealdb.request.size"] = call.request_bytes
+        attributes["surrealdb.response.size"] = call.response_bytes
+        attributes["surrealdb.encode.duration"] = call.encode_ns / 1e9
+        attributes["surrealdb.decode.duration"] = call.decode_ns / 1e9
+        attributes["surrealdb.network.duration"] = call.network_ns / 1e9
+        span.set_attributes(attributes)
+        for name, timestamp, event_attributes in call.events:
+            span.add_event(name, event_attributes, timestamp=timestamp)
+        if call.error is not None:
+            span.record_exception(call.error)
+            span.set_status(self._error)
+        span.end()
+
+
+__all__ = [
+    "Recorder",
+    "RpcCall",
+    "fingerprint",
+    "instrument",
+    "recorder",
+    "set_recorder",
+    "uninstrument",
+]
@@ -0,0 +1,701 @@
+"""A stand-in SurrealDB server, for driving clients without a database.
+
+Load-testing a service's database layer, or exercising reconnects and
+connection pools, needed either a real server - slow to start and never quite
+deterministic - or mocks of the SDK's own transports, which test the mocks.
+:class:`MockServer` is neither: a local asyncio server that speaks the
+``/rpc`` protocol over both the websocket and HTTP, decodes each request with
+the SDK's own codec, and answers from scripted handlers or recorded fixtures::
+
+    from surrealdb import AsyncSurreal
+    from surrealdb.testing import MockServer
+
+    async with MockServer(latency=0.002, jitter=0.001, seed=1) as server:
+        server.respond("query", query_result([{"id": 1, "name": "Tobie"}]))
+        server.inject_fault("error", method="query", message="busy")
+
+        db = AsyncSurreal(server.url)  # or server.http_url
+        await db.connect()
+        await db.select("person")  # ServerError: busy
+        await db.select("person")  # [{"id": 1, "name": "Tobie"}]
+
+Out of the box it answers what a client sends to get going - ``use``,
+``signin``, ``authenticate``, ``let``, ``version``, ``live``, ``attach``,
+``begin`` and the like - and every ``query`` with one empty, successful
+statement. ``select()``, ``create()`` and the other builders are sent as
+``query`` RPCs, so scripting ``query`` - with :func:`query_result` to shape
+the reply - covers them. Anything else is ``Method not found`` until it is
+scripted with :meth:`MockServer.handle` or :meth:`MockServer.respond`, or
+matched by a :class:`Fixture`. :class:`FixtureRecorder` records fixtures from
+a real server as middleware.
+
+Blocking clients need the server on another thread::
+
+    with MockServer().background() as server:
+        db = Surreal(server.url)
+
+Nothing here is imported by ``import surrealdb``, and ``aiohttp`` is only
+imported once a server starts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import random
+import threading
+import uuid
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
+
+from surrealdb.data.cbor import decode, encode
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+    from surrealdb.request_message.message import RequestMessage
+
+T = TypeVar("T")
+
+#: What a handler is given and may return: the ``result`` of the reply, or an
+#: awaitable of it. Raising :class:`RpcError` - or anything else - makes the
+#: reply an error instead.
+Handler = Callable[["MockRequest"], Any]
+
+#: What :meth:`MockServer.inject_fault` can do to a request.
+#:
+#: ``"error"``
+#:     reply with an RPC error.
+#: ``"drop"``
+#:     never reply.
+#: ``"disconnect"``
+#:     close the connection instead of replying.
+#: ``"garbage"``
+#:     reply with bytes that are not CBOR.
+FaultKind = Literal["error", "drop", "disconnect", "garbage"]
+
+# A syntactically valid JWT - the blocking transports check the shape - that
+# no real server issued.
+_TOKEN = (
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
+    "eyJpc3MiOiJzdXJyZWFsZGIudGVzdGluZyJ9."
+    "bW9jay1zZXJ2ZXI"
+)
+_GARBAGE = b"\xff\xfe not cbor"
+
+
+class RpcError(Exception):
+    """Raised by a handler to answer with this RPC error.
+
+    Any other exception a handler raises is answered as ``-32000`` with the
+    exception's text, as the server reports an internal error.
+    """
+
+    def __init__(self, message: str, code: int = -32000) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+@dataclass(frozen=True)
+class MockRequest:
+    """One RPC as the mock server received it.
+
+    Attributes:
+        id: The request id the client chose; ``None`` over HTTP, which has no
+            need of one.
+        method: The RPC method, ``"query"``, ``"select"``, ...
+        params: Its decoded parameters.
+        transport: ``"ws"`` or ``"http"``.
+        session: The session the request ran in, if not the default one.
+        txn: The transaction it ran in, if any.
+        namespace: Over HTTP, the ``Surreal-NS`` header.
+        database: Over HTTP, the ``Surreal-DB`` header.
+    """
+
+    id: Any
+    method: str
+    params: list[Any]
+    transport: Literal["ws", "http"]
+    session: Any = None
+    txn: Any = None
+    namespace: str | None = None
+    database: str | None = None
+
+
+@dataclass(frozen=True)
+class Fixture:
+    """A recorded request and the reply to replay for it.
+
+    A request matches when its method is the same and its parameters encode
+    to the same CBOR. ``error`` is the error object of an error reply, with
+    ``code`` and ``message``; otherwise ``result`` is replayed.
+    """
+
+    method: str
+    params: list[Any] = field(default_factory=list)
+    result: Any = None
+    error: dict[str, Any] | None = None
+
+    def _key(self) -> tuple[str, bytes]:
+        return self.method, encode(self.params)
+
+
+def save_fixtures(path: str | Path, fixtures: Iterable[Fixture]) -> None:
+    """Write *fixtures* to *path*, as CBOR so SurrealDB values round-trip."""
+    Path(path).write_bytes(
+        encode(
+            [
+                {
+                    "method": fixture.method,
+                    "params": fixture.params,
+                    "result": fixture.result,
+                    "error": fixture.error,
+                }
+                for fixture in fixtures
+            ]
+        )
+    )
+
+
+def load_fixtures(path: str | Path) -> list[Fixture]:
+    """Read fixtures written by :func:`save_fixtures`."""
+    return [Fixture(**entry) for entry in decode(Path(path).read_bytes())]
+
+
+class FixtureRecorder:
+    """Middleware that records each RPC and its reply as a :class:`Fixture`.
+
+    Run a client against a real server with it, then replay the session::
+
+        recorder = FixtureRecorder()
+        db.use_middleware(recorder.async_middleware)  # `.middleware` if blocking
+        ...
+        recorder.save("session.cbor")
+
+        server = MockServer(fixtures=load_fixtures("session.cbor"))
+    """
+
+    def __init__(self) -> None:
+        self.fixtures: list[Fixture] = []
+
+    async def async_middleware(
+        self,
+        message: RequestMessage,
+        call_next: Callable[[RequestMessage], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        response = await call_next(message)
+        self._record(message, response)
+        return response
+
+    def middleware(
+        self,
+        message: RequestMessage,
+        call_next: Callable[[RequestMessage], dict[str, Any]],
+    ) -> dict[str, Any]:
+        response = call_next(message)
+        self._record(message, response)
+        return response
+
+    def save(self, path: str | Path) -> None:
+        save_fixtures(path, self.fixtures)
+
+    def _record(self, message: RequestMessage, response: dict[str, Any]) -> None:
+        params = decode(message.WS_CBOR_DESCRIPTOR).get("params", [])
+        self.fixtures.append(
+            Fixture(
+                message.method.value,
+                params,
+                result=response.get("result"),
+                error=response.get("error"),
+            )
+        )
+
+
+@dataclass
+class _Fault:
+    kind: FaultKind
+    method: str | None
+    remaining: int | None
+    code: int
+    message: str
+
+
+#: The largest request the mock server accepts, over either transport.
+_MAX_MESSAGE = 1024 * 1024 * 1024
+
+
+def query_result(*results: Any) -> list[dict[str, Any]]:
+    """The ``result`` of a ``query`` RPC whose statements returned *results*.
+
+    One successful statement per argument, in order.
+    """
+    return [{"result": result, "status": "OK", "time": "0ns"} for result in results]
+
+
+def _statement(_: MockRequest) -> list[dict[str, Any]]:
+    return query_result([])
+
+
+class MockServer:
+    """A local server speaking SurrealDB's ``/rpc`` over websocket and HTTP.
+
+    Args:
+        latency: Seconds to wait before each reply.
+        jitter: Up to this many more seconds, drawn at random per reply.
+            Websocket requests are answered concurrently, so with jitter
+            replies come back out of order, as they can from a real server.
+        seed: Seeds the jitter and the ids the server makes up, for runs that
+            repeat exactly.
+        fixtures: Recorded replies to answer matching requests with, ahead
+            of any handler.
+        history: How many requests :attr:`requests` keeps; the oldest are
+            dropped first, so a long load test does not grow without bound.
+
+    Attributes:
+        requests: The most recent requests, oldest first.
+        counts: How many requests of each method arrived, over the server's
+            life.
+        live_queries: The table of every live query open on a websocket, by
+            live query id.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = None,
+        fixtures: Iterable[Fixture] = (),
+        history: int = 10_000,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.requests: deque[MockRequest] = deque(maxlen=history)
+        self.counts: Counter[str] = Counter()
+        self.live_queries: dict[uuid.UUID, str] = {}
+        self.host: str | None = None
+        self.port: int | None = None
+        self._random = random.Random(seed)
+        self._fixtures: dict[tuple[str, bytes], Fixture] = {}
+        self.add_fixtures(fixtures)
+        self._faults: list[_Fault] = []
+        self._live_sockets: dict[uuid.UUID, web.WebSocketResponse] = {}
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._runner: web.AppRunner | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._handlers: dict[str, Handler] = {
+            "query": _statement,
+            "signin": lambda _: _TOKEN,
+            "signup": lambda _: _TOKEN,
+            "version": lambda _: "surrealdb-3.0.0",
+            "live": lambda _: self._new_id(),
+            "attach": lambda _: self._new_id(),
+            "begin": lambda _: self._new_id(),
+        }
+        for method in (
+            "use",
+            "let",
+            "unset",
+            "authenticate",
+            "invalidate",
+            "info",
+            "kill",
+            "detach",
+            "commit",
+            "cancel",
+            "ping",
+        ):
+            self._handlers[method] = lambda _: None
+
+    # ----------------------------------------------------------------------- #
+    #  lifecycle                                                               #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def url(self) -> str:
+        """The websocket URL to connect a client to."""
+        return f"ws://{self._address()}"
+
+    @property
+    def http_url(self) -> str:
+        """The HTTP URL to connect a client to."""
+        return f"http://{self._address()}"
+
+    def _address(self) -> str:
+        if self.port is None:
+            raise RuntimeError("the MockServer has not been started")
+        return f"{self.host}:{self.port}"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Listen on *host* and *port*; port ``0`` picks a free one."""
+        from aiohttp import web
+
+        # aiohttp caps request bodies at 1 MiB and websocket messages at 4 MiB
+        # by default; a real server takes far larger file writes than either.
+        app = web.Application(client_max_size=_MAX_MESSAGE)
+        app.router.add_get("/rpc", self._websocket)
+        app.router.add_post("/rpc", self._http)
+        app.router.add_get("/health", self._health)
+        app.router.add_get("/version", self._version)
+        runner = web.AppRunner(app, handle_signals=False)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        self._runner = runner
+        self._loop = asyncio.get_running_loop()
+        self.host, self.port = runner.addresses[0][:2]
+
+    async def stop(self) -> None:
+        """Close every connection and stop listening."""
+        for socket in list(self._sockets):
+            await socket.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> MockServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    @contextmanager
+    def background(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> Iterator[MockServer]:
+        """Run the server on a thread of its own, for blocking clients.
+
+        :meth:`notify` and :meth:`burst` are coroutines on that thread's
+        loop; call them through :meth:`run`.
+        """
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever, name="surrealdb-mock-server", daemon=True
+        )
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self.start(host, port), loop).result()
+            yield self
+        finally:
+            asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+            self._loop = None
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run *coroutine* on the server's loop from another thread."""
+        if self._loop is None:
+            raise RuntimeError("the MockServer has not been started")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    # ----------------------------------------------------------------------- #
+    #  scripting                                                               #
+    # ----------------------------------------------------------------------- #
+
+    @overload
+    def handle(self, method: str, handler: Handler) -> Handler: ...
+
+    @overload
+    def handle(self, method: str) -> Callable[[Handler], Handler]: ...
+
+    def handle(
+        self, method: str, handler: Handler | None = None
+    ) -> Callable[[Handler], Handler] | Handler:
+        """Answer *method* with *handler*, replacing any previous one.
+
+        Usable as a decorator::
+
+            @server.handle("select")
+            async def select(request: MockRequest) -> list[dict]:
+                return [{"id": request.params[0]}]
+        """
+        if handler is not None:
+            self._handlers[method] = handler
+            return handler
+
+        def register(handler: Handler) -> Handler:
+            self._handlers[method] = handler
+            return handler
+
+        return register
+
+    def respond(self, method: str, result: Any) -> None:
+        """Answer every *method* request with *result*."""
+        self._handlers[method] = lambda _: result
+
+    def add_fixtures(self, fixtures: Iterable[Fixture]) -> None:
+        """Replay each of *fixtures* for the requests that match it.
+
+        A later fixture for the same request replaces an earlier one.
+        """
+        for fixture in fixtures:
+            self._fixtures[fixture._key()] = fixture
+
+    def inject_fault(
+        self,
+        kind: FaultKind,
+        *,
+        method: str | None = None,
+        times: int | None = 1,
+        code: int = -32000,
+        message: str = "injected fault",
+    ) -> None:
+        """Make the next *times* requests - of *method*, or any - fail.
+
+        ``times=None`` keeps failing until :meth:`clear_faults`. Faults are
+        consulted in the order they were injected; the first that applies to
+        a request is used up. *code* and *message* are the ``"error"`` kind's
+        error.
+        """
+        self._faults.append(_Fault(kind, method, times, code, message))
+
+    def clear_faults(self) -> None:
+        self._faults.clear()
+
+    # ----------------------------------------------------------------------- #
+    #  live queries                                                            #
+    # ----------------------------------------------------------------------- #
+
+    async def notify(
+        self, target: uuid.UUID | str, result: Any, action: str = "CREATE"
+    ) -> int:
+        """Send one live notification; returns how many subscribers got it.
+
+        *target* is a live query id, or a table name to notify every live
+        query open on it.
+        """
+        return await self.burst(target, [result], action)
+
+    async def burst(
+        self, target: uuid.UUID | str, results: Iterable[Any], action: str = "CREATE"
+    ) -> int:
+        """Send a notification per item of *results*, back to back.
+
+        Returns how many were sent: one per result, per matching live query.
+        """
+        live_ids = self._live_ids(target)
+        sent = 0
+        for result in results:
+            for live_id in live_ids:
+                socket = self._live_sockets.get(live_id)
+                if socket is None or socket.closed:
+                    continue
+                frame = {"result": {"id": live_id, "action": action, "result": result}}
+                await socket.send_bytes(encode(frame))
+                sent += 1
+        return sent
+
+    def _live_ids(self, target: uuid.UUID | str) -> list[uuid.UUID]:
+        if isinstance(target, uuid.UUID):
+            return [target]
+        try:
+            return [uuid.UUID(target)]
+        except ValueError:
+            return [
+                live for live, table in self.live_queries.items() if table == target
+            ]
+
+    # ----------------------------------------------------------------------- #
+    #  answering                                                               #
+    # ----------------------------------------------------------------------- #
+
+    def _new_id(self) -> uuid.UUID:
+        return uuid.UUID(int=self._random.getrandbits(128), version=4)
+
+    async def _health(self, _: web.Request) -> web.Response:
+        from aiohttp import web
+
+        return web.Response()
+
+    async def _version(self, _: web.Request) -> web.Response:
+        from aiohttp import web
+
+        return web.Response(text="surrealdb-3.0.0")
+
+    def _take_fault(self, method: str) -> _Fault | None:
+        for fault in self._faults:
+            if fault.method is None or fault.method == method:
+                if fault.remaining is not None:
+                    fault.remaining -= 1
+                    if fault.remaining <= 0:
+                        self._faults.remove(fault)
+                return fault
+        return None
+
+    async def _delay(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _answer(self, request: MockRequest) -> dict[str, Any]:
+        """The reply envelope for *request*, less its id."""
+        fixture = self._fixtures.get((request.method, encode(request.params)))
+        if fixture is not None:
+            if fixture.error is not None:
+                return {"error": fixture.error}
+            return {"result": fixture.result}
+        handler = self._handlers.get(request.method)
+        if handler is None:
+            return {
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: {request.method} (script it "
+                    "with MockServer.handle() or MockServer.respond())",
+                }
+            }
+        try:
+            result = handler(request)
+            if inspect.isawaitable(result):
+                result = await result
+        except RpcError as exc:
+            return {"error": {"code": exc.code, "message": exc.message}}
+        except Exception as exc:
+            return {"error": {"code": -32000, "message": str(exc)}}
+        return {"result": result}
+
+    def _receive(
+        self, data: bytes, transport: Literal["ws", "http"], headers: Any = None
+    ) -> MockRequest:
+        envelope = decode(data)
+        request = MockRequest(
+            id=envelope.get("id"),
+            method=envelope["method"],
+            params=envelope.get("params") or [],
+            transport=transport,
+            session=envelope.get("session"),
+            txn=envelope.get("txn"),
+            namespace=headers.get("Surreal-NS") if headers is not None else None,
+            database=headers.get("Surreal-DB") if headers is not None else None,
+        )
+        self.requests.append(request)
+        self.counts[request.method] += 1
+        return request
+
+    async def _websocket(self, http_request: web.Request) -> web.WebSocketResponse:
+        from aiohttp import WSMsgType, web
+
+        socket = web.WebSocketResponse(protocols=("cbor",), max_msg_size=_MAX_MESSAGE)
+        await socket.prepare(http_request)
+        self._sockets.add(socket)
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            async for frame in socket:
+                if frame.type is not WSMsgType.BINARY:
+                    continue
+                # Each request gets its own task, so a slow reply does not hold
+                # up the ones behind it - a real server does not answer in order.
+                task = asyncio.ensure_future(self._ws_request(socket, frame.data))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            self._sockets.discard(socket)
+            for task in tasks:
+                task.cancel()
+            for live_id, owner in list(self._live_sockets.items()):
+                if owner is socket:
+                    del self._live_sockets[live_id]
+                    self.live_queries.pop(live_id, None)
+        return socket
+
+    async def _ws_request(self, socket: web.WebSocketResponse, data: bytes) -> None:
+        try:
+            request = self._receive(data, "ws")
+        except Exception as exc:
+            await socket.send_bytes(
+                encode({"error": {"code": -32700, "message": f"Parse error: {exc}"}})
+            )
+            return
+        fault = self._take_fault(request.method)
+        if fault is not None and fault.kind == "drop":
+            return
+        await self._delay()
+        if fault is not None:
+            if fault.kind == "disconnect":
+                await socket.close()
+                return
+            if fault.kind == "garbage":
+                await socket.send_bytes(_GARBAGE)
+                return
+            reply: dict[str, Any] = {
+                "error": {"code": fault.code, "message": fault.message}
+            }
+        else:
+            reply = await self._answer(request)
+            self._track_live(request, reply, socket)
+        if not socket.closed:
+            await socket.send_bytes(encode({"id": request.id, **reply}))
+
+    def _track_live(
+        self,
+        request: MockRequest,
+        reply: dict[str, Any],
+        socket: web.WebSocketResponse,
+    ) -> None:
+        if request.method == "live" and isinstance(reply.get("result"), uuid.UUID):
+            live_id = reply["result"]
+            self.live_queries[live_id] = str(request.params[0])
+            self._live_sockets[live_id] = socket
+        elif request.method == "kill" and request.params:
+            for live_id in self._live_ids(str(request.params[0])):
+                self.live_queries.pop(live_id, None)
+                self._live_sockets.pop(live_id, None)
+
+    async def _http(self, http_request: web.Request) -> web.StreamResponse:
+        from aiohttp import web
+
+        try:
+            request = self._receive(
+                await http_request.read(), "http", http_request.headers
+            )
+        except Exception as exc:
+            return web.Response(status=400, text=f"Parse error: {exc}")
+        fault = self._take_fault(request.method)
+        if fault is not None and fault.kind == "drop":
+            # Held until the client gives up, or the server stops.
+            await asyncio.Event().wait()
+        await self._delay()
+        if fault is not None:
+            if fault.kind == "disconnect":
+                if http_request.transport is not None:
+                    http_request.transport.close()
+                return web.Response()
+            if fault.kind == "garbage":
+                return web.Response(body=_GARBAGE, content_type="application/cbor")
+            reply: dict[str, Any] = {
+                "error": {"code": fault.code, "message": fault.message}
+            }
+        elif request.method == "live":
+            reply = {
+                "error": {
+                    "code": -32000,
+                    "message": "Live queries need a websocket connection",
+                }
+            }
+        else:
+            reply = await self._answer(request)
+        return web.Response(
+            body=encode({"id": request.id, **reply}), content_type="application/cbor"
+        )
+
+
+__all__ = [
+    "FaultKind",
+    "Fixture",
+    "FixtureRecorder",
+    "Handler",
+    "MockRequest",
+    "MockServer",
+    "RpcError",
+    "load_fixtures",
+    "query_result",
+    "save_fixtures",
+]
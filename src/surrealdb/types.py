@@ -16,6 +16,7 @@ from surrealdb.data.types.datetime import Datetime
 from surrealdb.data.types.duration import Duration
 from surrealdb.data.types.file import File
 from surrealdb.data.types.geometry import (
+    GeometryBuffer,
     GeometryCollection,
     GeometryLine,
     GeometryMultiLine,
@@ -61,6 +62,8 @@ Value = (
     | GeometryMultiLine
     | GeometryMultiPolygon
     | GeometryCollection
+    # Encodes as the line, polygon or multi-geometry it packs.
+    | GeometryBuffer
     # A SurrealDB set. A `list` subclass, so `list["Value"]` below already
     # covers it structurally - named explicitly so the distinct type is
     # visible in the public union rather than hidden inside it.
@@ -0,0 +1,60 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from surrealdb.connections.async_ws import AsyncWsSurrealConnection
+from surrealdb.data.cbor import decode, encode
+from tests.unit_tests.fake_bucket import FakeBucket
+
+
+class AnsweringSocket:
+    """Stands in for a connected websocket, answering each frame in-process.
+
+    ``use`` is answered with nothing and anything else with *result*, or
+    every request with an error when *fail* is set. Keeps what it was sent,
+    and answers nothing while :attr:`hold` is set.
+    """
+
+    def __init__(self, conn: AsyncWsSurrealConnection, result: Any, fail: bool) -> None:
+        self._conn = conn
+        self._result = result
+        self._fail = fail
+        self.sent: list[dict[str, Any]] = []
+        self.hold = False
+
+    async def send(self, data: bytes) -> None:
+        request = decode(data)
+        self.sent.append(request)
+        if self.hold:
+            return
+        reply: dict[str, Any] = {"id": request["id"]}
+        if self._fail:
+            reply["error"] = {"code": -32000, "message": "refused"}
+        elif request["method"] == "use":
+            reply["result"] = None
+        else:
+            reply["result"] = self._result
+        asyncio.get_running_loop().call_soon(self._conn._route_frame, encode(reply))
+
+
+@pytest.fixture
+def answering_ws() -> Callable[..., AsyncWsSurrealConnection]:
+    """Makes an ``AsyncWsSurrealConnection`` to ``db.example:8000`` whose
+    socket is an :class:`AnsweringSocket`; call it as ``(result, fail=False)``
+    from inside the test's event loop.
+    """
+
+    def connect(result: Any = None, fail: bool = False) -> AsyncWsSurrealConnection:
+        conn = AsyncWsSurrealConnection("ws://db.example:8000")
+        conn.loop = asyncio.get_running_loop()
+        conn.socket = AnsweringSocket(conn, result, fail)
+        return conn
+
+    return connect
+
+
+@pytest.fixture
+def fake_bucket() -> FakeBucket:
+    return FakeBucket()
@@ -0,0 +1,56 @@
+"""``EmbeddedOptions`` reaches the engine.
+
+The option validation itself is covered engine-free in
+``tests/unit_tests/test_embedded_options.py``; this checks the rendered
+endpoint takes effect.
+"""
+
+import datetime
+import shutil
+import tempfile
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from surrealdb import BlockingSurrealConnection, EmbeddedOptions, Surreal
+from surrealdb.connections.blocking_embedded import BlockingEmbeddedSurrealConnection
+
+
+@pytest.fixture
+def directory() -> Generator[Path, None, None]:
+    path = Path(tempfile.mkdtemp())
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _assert_versioned(db: BlockingSurrealConnection) -> None:
+    try:
+        db.use("ns", "db")
+        db.query("CREATE t:1 SET n = 1").execute()
+        stamp = (
+            datetime.datetime.now(datetime.timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z")
+        )
+        time.sleep(0.05)
+        db.query("UPDATE t:1 SET n = 2").execute()
+
+        assert db.query(f'SELECT VALUE n FROM t:1 VERSION d"{stamp}"').first() == [1]
+    finally:
+        db.close()
+
+
+def test_versioned_option_matches_the_versioned_scheme(directory: Path) -> None:
+    _assert_versioned(
+        BlockingEmbeddedSurrealConnection(
+            f"surrealkv://{directory / 'db'}", EmbeddedOptions(versioned=True)
+        )
+    )
+
+
+def test_surreal_passes_options_to_the_engine(directory: Path) -> None:
+    _assert_versioned(
+        Surreal(f"surrealkv://{directory / 'db'}", EmbeddedOptions(versioned=True))
+    )
@@ -0,0 +1,196 @@
+"""``query_many`` runs a batch of queries on an embedded connection.
+
+It must behave exactly like the same queries sent one at a time: same results,
+same order, same session, same error mapping.
+"""
+
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import Any
+
+import pytest
+
+from surrealdb import telemetry
+from surrealdb.connections.async_embedded import AsyncEmbeddedSurrealConnection
+from surrealdb.connections.blocking_embedded import BlockingEmbeddedSurrealConnection
+from surrealdb.errors import ConnectionUnavailableError, ServerError
+from surrealdb.request_message.message import RequestMessage
+
+
+@pytest.fixture
+def db() -> Generator[BlockingEmbeddedSurrealConnection, None, None]:
+    connection = BlockingEmbeddedSurrealConnection("memory")
+    connection.use("ns", "db")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+async def async_db() -> AsyncGenerator[AsyncEmbeddedSurrealConnection, None]:
+    connection = AsyncEmbeddedSurrealConnection("memory")
+    await connection.use("ns", "db")
+    yield connection
+    await connection.close()
+
+
+def test_results_match_separate_queries(db: BlockingEmbeddedSurrealConnection) -> None:
+    results = db.query_many(
+        [
+            "RETURN 1; RETURN 2",
+            ("RETURN $x", {"x": "bound"}),
+            ("RETURN 3", None),
+        ]
+    )
+
+    assert results == [[1, 2], ["bound"], [3]]
+
+
+def test_queries_run_in_order(db: BlockingEmbeddedSurrealConnection) -> None:
+    db.query_many(
+        [("CREATE type::thing('t', $id) SET n = $id", {"id": i}) for i in range(100)]
+        + ["UPDATE t SET n = n * 2"]
+    )
+
+    assert db.query("RETURN math::sum(SELECT VALUE n FROM t)").first() == 9900
+
+
+def test_batch_shares_the_connection_session(
+    db: BlockingEmbeddedSurrealConnection,
+) -> None:
+    db.let("who", "session")
+
+    assert db.query_many(["RETURN [session::db(), $who]"]) == [[["db", "session"]]]
+
+
+def test_empty_batch_returns_nothing(db: BlockingEmbeddedSurrealConnection) -> None:
+    assert db.query_many([]) == []
+
+
+def test_failure_is_raised_after_the_whole_batch_ran(
+    db: BlockingEmbeddedSurrealConnection,
+) -> None:
+    with pytest.raises(ServerError):
+        db.query_many(
+            [
+                "CREATE t:1",
+                "THROW 'nope'",
+                "CREATE t:2",
+            ]
+        )
+
+    assert db.query("RETURN count(SELECT * FROM t)").first() == 2
+
+
+@pytest.mark.parametrize("entry", [42, ("RETURN 1",), ("RETURN $x", ["x"])])
+def test_malformed_entry_runs_nothing(
+    db: BlockingEmbeddedSurrealConnection, entry: object
+) -> None:
+    with pytest.raises(TypeError):
+        db.query_many(["CREATE t:1", entry])  # type: ignore[list-item]
+
+    assert db.query("SELECT * FROM t").first() == []
+
+
+def test_bare_string_is_refused(db: BlockingEmbeddedSurrealConnection) -> None:
+    with pytest.raises(TypeError, match="single string"):
+        db.query_many("RETURN 1")
+
+
+def test_closed_connection_maps_like_execute() -> None:
+    connection = BlockingEmbeddedSurrealConnection("memory")
+    connection.close()
+
+    with pytest.raises(ConnectionUnavailableError):
+        connection.query_many(["RETURN 1"])
+
+
+@pytest.mark.asyncio
+async def test_async_batch(async_db: AsyncEmbeddedSurrealConnection) -> None:
+    results = await async_db.query_many(
+        [
+            ("CREATE type::thing('t', $id) RETURN VALUE id.id()", {"id": i})
+            for i in range(3)
+        ]
+    )
+
+    assert results == [[[0]], [[1]], [[2]]]
+
+
+@pytest.mark.asyncio
+async def test_async_failure_is_raised(
+    async_db: AsyncEmbeddedSurrealConnection,
+) -> None:
+    with pytest.raises(ServerError):
+        await async_db.query_many(["RETURN 1", "THROW 'nope'"])
+
+
+def test_each_query_is_counted_in_stats(
+    db: BlockingEmbeddedSurrealConnection,
+) -> None:
+    before = db.stats()
+
+    db.query_many(["RETURN 1", "RETURN 2", "RETURN 3"])
+
+    after = db.stats()
+    assert after.requests - before.requests == 3
+    assert after.frames_sent - before.frames_sent == 3
+    assert after.frames_received - before.frames_received == 3
+    assert after.in_flight == 0
+    assert "query" not in before.latency
+    assert after.latency["query"].count == 3
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.finished: list[telemetry.RpcCall] = []
+
+    def start(self, call: telemetry.RpcCall) -> None:
+        pass
+
+    def finish(self, call: telemetry.RpcCall) -> None:
+        self.finished.append(call)
+
+
+def test_each_query_is_reported_to_telemetry(
+    db: BlockingEmbeddedSurrealConnection,
+) -> None:
+    recorder = _Recorder()
+    telemetry.set_recorder(recorder)
+    try:
+        db.query_many(["RETURN 1", ("RETURN $x", {"x": 2})])
+    finally:
+        telemetry.set_recorder(None)
+
+    assert [call.query for call in recorder.finished] == ["RETURN ?", "RETURN $x"]
+    assert all(call.transport == "embedded" for call in recorder.finished)
+    assert all(call.request_bytes and call.response_bytes for call in recorder.finished)
+
+
+def test_middleware_sees_each_query(db: BlockingEmbeddedSurrealConnection) -> None:
+    seen: list[Any] = []
+
+    def record(
+        message: RequestMessage, call_next: Callable[[RequestMessage], Any]
+    ) -> Any:
+        seen.append(message.kwargs.get("query"))
+        return call_next(message)
+
+    db.use_middleware(record)
+
+    assert db.query_many(["RETURN 1", "RETURN 2"]) == [[1], [2]]
+    assert seen == ["RETURN 1", "RETURN 2"]
+
+
+@pytest.mark.asyncio
+async def test_async_middleware_sees_each_query(
+    async_db: AsyncEmbeddedSurrealConnection,
+) -> None:
+    seen: list[Any] = []
+
+    async def record(message: RequestMessage, call_next: Any) -> Any:
+        seen.append(message.kwargs.get("query"))
+        return await call_next(message)
+
+    async_db.use_middleware(record)
+
+    assert await async_db.query_many(["RETURN 1", "RETURN 2"]) == [[1], [2]]
+    assert seen == ["RETURN 1", "RETURN 2"]
@@ -376,6 +376,141 @@ def test_a_misspelled_option_is_a_type_error_not_a_silent_full_listing(
         blocking_ws_connection.files.list(bucket, limti=2)  # type: ignore[call-arg]  # pyright: ignore[reportCallIssue]
 
 
+# ------------------------------------------------------ streams and batches
+#
+# ``put_stream`` and ``open`` join and split parts with the server-side
+# ``_ASSEMBLE`` and ``_SPLIT`` queries, which the fake bucket of the unit tests
+# only imitates. A ``chunk_size`` far below ``EVERY_BYTE`` makes these take the
+# multi-part path against the real thing.
+
+
+def _parts_left(db: BlockingWsSurrealConnection, bucket: str) -> list[str]:
+    return [
+        entry.file.key for entry in db.files.list(bucket) if ".~part-" in entry.file.key
+    ]
+
+
+def test_put_stream_joins_its_parts_into_the_file(
+    blocking_ws_connection: BlockingWsSurrealConnection, bucket: str
+) -> None:
+    f = File(bucket, _key("stream-"))
+    chunks = [EVERY_BYTE[i : i + 100] for i in range(0, len(EVERY_BYTE), 100)]
+
+    written = blocking_ws_connection.files.put_stream(f, chunks, chunk_size=300)
+
+    assert written == len(EVERY_BYTE)
+    assert blocking_ws_connection.files.get(f) == EVERY_BYTE
+    assert _parts_left(blocking_ws_connection, bucket) == []
+
+
+def test_open_reads_a_file_back_through_its_parts(
+    blocking_ws_connection: BlockingWsSurrealConnection, bucket: str
+) -> None:
+    f = File(bucket, _key("open-"))
+    blocking_ws_connection.files.put(f, EVERY_BYTE)
+
+    with blocking_ws_connection.files.open(f, chunk_size=300) as reader:
+        chunks = list(reader.chunks())
+
+    assert b"".join(chunks) == EVERY_BYTE
+    assert max(len(chunk) for chunk in chunks) == 300
+    assert _parts_left(blocking_ws_connection, bucket) == []
+
+
+def test_closing_a_reader_early_deletes_the_unread_parts(
+    blocking_ws_connection: BlockingWsSurrealConnection, bucket: str
+) -> None:
+    f = File(bucket, _key("early-"))
+    blocking_ws_connection.files.put(f, EVERY_BYTE)
+
+    with blocking_ws_connection.files.open(f, chunk_size=300) as reader:
+        assert reader.read(10) == EVERY_BYTE[:10]
+
+    assert _parts_left(blocking_ws_connection, bucket) == []
+    assert blocking_ws_connection.files.get(f) == EVERY_BYTE
+
+
+async def test_the_async_stream_round_trips(
+    async_ws_connection: AsyncWsSurrealConnection,
+    blocking_ws_connection: BlockingWsSurrealConnection,
+    bucket: str,
+) -> None:
+    f = File(bucket, _key("astream-"))
+
+    written = await async_ws_connection.files.put_stream(
+        f, EVERY_BYTE, chunk_size=300, concurrency=3
+    )
+    async with async_ws_connection.files.open(f, chunk_size=300) as reader:
+        read = await reader.read()
+
+    assert written == len(EVERY_BYTE)
+    assert read == EVERY_BYTE
+    assert _parts_left(blocking_ws_connection, bucket) == []
+
+
+def test_the_many_methods_report_each_file(
+    blocking_ws_connection: BlockingWsSurrealConnection, bucket: str
+) -> None:
+    files = blocking_ws_connection.files
+    sources = [File(bucket, _key("many-")) for _ in range(3)]
+    targets = [File(bucket, _key("many-copy-")) for _ in sources]
+    missing = File(bucket, _key("many-missing-"))
+
+    put = files.put_many({f: EVERY_BYTE[:n] for n, f in enumerate(sources)})
+    got = files.get_many([*sources, missing])
+    copied = files.copy_many([*zip(sources, targets, strict=True), (missing, missing)])
+    deleted = files.delete_many([*sources, *targets])
+
+    assert all(result.ok for result in put)
+    assert [result.value for result in got] == [
+        b"",
+        EVERY_BYTE[:1],
+        EVERY_BYTE[:2],
+        None,
+    ]
+    assert [result.ok for result in copied] == [True, True, True, False]
+    assert all(result.ok for result in deleted)
+    assert files.list(bucket, prefix="/many-") == []
+
+
+async def test_the_async_many_methods_report_each_file(
+    async_ws_connection: AsyncWsSurrealConnection, bucket: str
+) -> None:
+    files = async_ws_connection.files
+    sources = [File(bucket, _key("amany-")) for _ in range(3)]
+
+    put = await files.put_many([(f, b"x" * n) for n, f in enumerate(sources)])
+    got = await files.get_many(sources)
+    deleted = await files.delete_many(sources)
+
+    assert all(result.ok for result in put)
+    assert [result.value for result in got] == [b"", b"x", b"xx"]
+    assert all(result.ok for result in deleted)
+    assert await files.list(bucket, prefix="/amany-") == []
+
+
+def test_iter_pages_through_the_bucket_in_key_order(
+    blocking_ws_connection: BlockingWsSurrealConnection, bucket: str
+) -> None:
+    keys = sorted(_key("iter-") for _ in range(7))
+    blocking_ws_connection.files.put_many((File(bucket, key), b"x") for key in keys)
+
+    listed = blocking_ws_connection.files.iter(bucket, prefix="/iter-", page_size=3)
+
+    assert [entry.file.key for entry in listed] == keys
+
+
+async def test_the_async_iter_pages_through_the_bucket(
+    async_ws_connection: AsyncWsSurrealConnection, bucket: str
+) -> None:
+    keys = sorted(_key("aiter-") for _ in range(7))
+    await async_ws_connection.files.put_many((File(bucket, key), b"x") for key in keys)
+
+    listed = async_ws_connection.files.iter(bucket, prefix="/aiter-", page_size=3)
+
+    assert [entry.file.key async for entry in listed] == keys
+
+
 # --------------------------------------------------------------- every transport
 
 
@@ -102,7 +102,7 @@ async def test_async_connect_opens_one_socket_for_concurrent_callers(
 
         return record()
 
-    module.websockets.connect = counting_connect  # type: ignore[misc,assignment]
+    module.websockets.connect = counting_connect
     try:
         results = await asyncio.gather(
             *[
@@ -112,7 +112,7 @@ async def test_async_connect_opens_one_socket_for_concurrent_callers(
             return_exceptions=True,
         )
     finally:
-        module.websockets.connect = real_connect  # type: ignore[misc]
+        module.websockets.connect = real_connect
 
     failures = [r for r in results if isinstance(r, BaseException)]
     try:
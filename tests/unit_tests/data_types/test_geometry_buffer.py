@@ -0,0 +1,205 @@
+"""Geometry decoded into, and encoded from, one flat coordinate buffer."""
+
+import math
+import pickle
+from array import array
+
+import pytest
+
+from surrealdb.cbor import CBORTag, dumps
+from surrealdb.data.cbor import decode, encode
+from surrealdb.data.types import constants
+from surrealdb.data.types.geometry import (
+    GeometryBuffer,
+    GeometryCollection,
+    GeometryLine,
+    GeometryMultiLine,
+    GeometryMultiPoint,
+    GeometryMultiPolygon,
+    GeometryPoint,
+    GeometryPolygon,
+)
+from surrealdb.errors import InvalidGeometryError
+
+
+def _ring(x: float) -> GeometryLine:
+    return GeometryLine(
+        GeometryPoint(x, 0.0),
+        GeometryPoint(x + 1, 0.0),
+        GeometryPoint(x + 1, 1.0),
+        GeometryPoint(x, 0.0),
+    )
+
+
+GEOMETRIES = [
+    _ring(0.0),
+    GeometryPolygon(_ring(0.0), _ring(0.25)),
+    GeometryMultiPoint(GeometryPoint(1.0, 2.0), GeometryPoint(3.0, 4.0)),
+    GeometryMultiLine(
+        _ring(0.0), GeometryLine(GeometryPoint(5.0, 6.0), GeometryPoint(7.0, 8.0))
+    ),
+    GeometryMultiPolygon(
+        GeometryPolygon(_ring(0.0)), GeometryPolygon(_ring(2.0), _ring(2.25))
+    ),
+]
+
+
+@pytest.mark.parametrize("geometry", GEOMETRIES, ids=lambda g: type(g).__name__)
+def test_decoding_keeps_the_coordinates_packed(geometry: GeometryLine) -> None:
+    decoded = decode(encode(geometry))
+
+    assert type(decoded) is type(geometry)
+    assert isinstance(decoded._buffer, GeometryBuffer)
+    assert decoded.get_coordinates() == geometry.get_coordinates()
+    assert hash(decoded) == hash(geometry)
+    # Written back from the buffer, byte for byte what the objects encode to.
+    assert encode(decoded) == encode(geometry)
+    assert decoded._buffer is not None
+
+
+@pytest.mark.parametrize("geometry", GEOMETRIES, ids=lambda g: type(g).__name__)
+def test_the_objects_are_built_on_first_use(geometry: GeometryLine) -> None:
+    decoded = decode(encode(geometry))
+
+    parts = getattr(decoded, decoded._PARTS)
+
+    assert parts == getattr(geometry, geometry._PARTS)
+    assert decoded._buffer is None
+    assert decoded == geometry
+
+
+def test_a_changed_geometry_encodes_its_change() -> None:
+    line = decode(encode(_ring(0.0)))
+
+    line.geometry_points.append(GeometryPoint(9.0, 9.0))
+
+    assert decode(encode(line)).get_coordinates()[-1] == (9.0, 9.0)
+
+
+def test_two_packed_geometries_compare_by_buffer() -> None:
+    first, second = decode(encode([_ring(0.0), _ring(0.0)]))
+
+    assert first == second
+    assert first._buffer is not None and second._buffer is not None
+
+
+def test_a_collection_packs_its_members() -> None:
+    collection = GeometryCollection(GeometryPoint(1.0, 2.0), _ring(0.0))
+
+    decoded = decode(encode(collection))
+
+    assert type(decoded.geometries[0]) is GeometryPoint
+    assert decoded.geometries[1]._buffer is not None
+    assert decoded == collection
+
+
+def test_integer_coordinates_decode_as_before() -> None:
+    line = GeometryLine(GeometryPoint(1, 2), GeometryPoint(3, 4))
+
+    decoded = decode(encode(line))
+
+    assert decoded._buffer is None
+    assert type(decoded.geometry_points[0].longitude) is int
+
+
+def test_narrow_floats_are_read_too() -> None:
+    # Servers write a float in the narrowest width that holds it exactly.
+    point = b"\xd8\x58\x82\xf9\x3c\x00\xfa\x3f\xc0\x00\x00"  # (1.0, 1.5)
+    data = b"\xd8\x59\x82" + point + point
+
+    assert decode(data).get_coordinates() == [(1.0, 1.5), (1.0, 1.5)]
+    assert decode(data)._buffer is not None
+
+
+def test_non_finite_coordinates_round_trip() -> None:
+    line = GeometryLine(GeometryPoint(math.inf, 0.0), GeometryPoint(0.0, -math.inf))
+
+    decoded = decode(encode(line))
+
+    assert decoded._buffer is not None
+    assert encode(decoded) == encode(line)
+
+
+def test_an_open_ring_is_refused_as_it_was() -> None:
+    def point(x: float, y: float) -> CBORTag:
+        return CBORTag(constants.TAG_GEOMETRY_POINT, [x, y])
+
+    ring = [point(0.0, 0.0), point(1.0, 0.0), point(1.0, 1.0), point(0.0, 1.0)]
+    data = dumps(
+        CBORTag(
+            constants.TAG_GEOMETRY_POLYGON,
+            [CBORTag(constants.TAG_GEOMETRY_LINE, ring)],
+        )
+    )
+
+    with pytest.raises(InvalidGeometryError, match="exterior ring"):
+        decode(data)
+
+
+def test_a_packed_geometry_pickles_as_its_buffer() -> None:
+    polygon = decode(encode(GEOMETRIES[1]))
+
+    restored = pickle.loads(pickle.dumps(polygon))
+
+    assert restored._buffer == polygon._buffer
+    assert polygon._buffer is not None
+    assert restored == GEOMETRIES[1]
+
+
+# --------------------------------------------------------------------------- #
+#  GeometryBuffer                                                              #
+# --------------------------------------------------------------------------- #
+
+
+def test_offsets_follow_the_shapely_layout() -> None:
+    buffer = GeometryMultiPolygon(
+        GeometryPolygon(_ring(0.0)), GeometryPolygon(_ring(2.0), _ring(2.25))
+    ).to_buffer()
+
+    assert buffer.geometry_type == "MultiPolygon"
+    assert len(buffer) == 12
+    assert buffer.coordinates[:4] == array("d", [0.0, 0.0, 1.0, 0.0])
+    assert buffer.offsets == (
+        array("q", [0, 4, 8, 12]),
+        array("q", [0, 1, 3]),
+        array("q", [0, 2]),
+    )
+
+
+@pytest.mark.parametrize("geometry", GEOMETRIES, ids=lambda g: type(g).__name__)
+def test_to_geometry_undoes_from_geometry(geometry: GeometryLine) -> None:
+    assert GeometryBuffer.from_geometry(geometry).to_geometry() == geometry
+
+
+def test_a_buffer_is_validated() -> None:
+    with pytest.raises(InvalidGeometryError, match="geometry_type"):
+        GeometryBuffer("Point", [1.0, 2.0], [[0, 1]])
+    with pytest.raises(InvalidGeometryError, match="pairs"):
+        GeometryBuffer("LineString", [1.0, 2.0, 3.0], [[0, 1]])
+    with pytest.raises(InvalidGeometryError, match="level"):
+        GeometryBuffer("Polygon", [1.0, 2.0], [[0, 1]])
+    with pytest.raises(InvalidGeometryError, match="GeometryPoint"):
+        GeometryBuffer.from_geometry(GeometryPoint(1.0, 2.0))
+
+
+def test_to_numpy_shares_the_buffer() -> None:
+    pytest.importorskip("numpy")
+    buffer = _ring(0.0).to_buffer()
+
+    coordinates, offsets = buffer.to_numpy()
+
+    assert coordinates.shape == (4, 2)
+    assert offsets[0].tolist() == [0, 4]
+    coordinates[0, 0] = 7.0
+    assert buffer.coordinates[0] == 7.0
+
+
+def test_shapely_round_trip() -> None:
+    shapely = pytest.importorskip("shapely")
+    polygon = GeometryPolygon(_ring(0.0), _ring(0.25))
+
+    shape = polygon.to_buffer().to_shapely()
+
+    assert isinstance(shape, shapely.Polygon)
+    assert len(shape.interiors) == 1
+    assert GeometryBuffer.from_shapely(shape).to_geometry() == polygon
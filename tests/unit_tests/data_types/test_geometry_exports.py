@@ -28,6 +28,7 @@ from surrealdb.data import cbor
 from surrealdb.data.types import geometry
 from surrealdb.data.types.geometry import (
     Geometry,
+    GeometryBuffer,
     GeometryCollection,
     GeometryLine,
     GeometryMultiLine,
@@ -73,7 +74,9 @@ def _public_geometry_classes() -> dict[str, type]:
 
 def test_every_public_geometry_class_has_a_sample() -> None:
     """Keeps the table above honest when a class is added."""
-    covered = set(SAMPLES) | {"Geometry"}
+    # `GeometryBuffer` encodes as the geometry it packs, so it decodes as that
+    # class rather than as itself; it has its own test below.
+    covered = set(SAMPLES) | {"Geometry", "GeometryBuffer"}
 
     assert set(_public_geometry_classes()) == covered
 
@@ -119,3 +122,13 @@ def test_isinstance_against_the_exported_base_still_works() -> None:
     # `Geometry` annotation will not accept it. Widening that is additive and
     # can happen later; asserting it here stops the surprise being silent.
     assert not isinstance(SAMPLES["GeometryCollection"], surrealdb.Geometry)
+
+
+def test_a_geometry_buffer_is_exported_and_sends_as_its_geometry() -> None:
+    assert "GeometryBuffer" in surrealdb.__all__
+    assert surrealdb.GeometryBuffer is GeometryBuffer
+
+    buffer = GeometryBuffer.from_geometry(_POLYGON)
+
+    assert cbor.encode(buffer) == cbor.encode(_POLYGON)
+    assert cbor.decode(cbor.encode(buffer)) == _POLYGON
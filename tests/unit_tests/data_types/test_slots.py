@@ -0,0 +1,92 @@
+"""The value types are slotted, and the decoder shares repeated table names."""
+
+import copy
+import pickle
+import weakref
+
+import pytest
+
+from surrealdb.data import cbor
+from surrealdb.data.cbor import decode, encode
+from surrealdb.data.types.duration import Duration
+from surrealdb.data.types.geometry import (
+    GeometryCollection,
+    GeometryLine,
+    GeometryMultiLine,
+    GeometryMultiPoint,
+    GeometryMultiPolygon,
+    GeometryPoint,
+    GeometryPolygon,
+)
+from surrealdb.data.types.record_id import RecordID
+from surrealdb.data.types.table import Table
+
+_RING = GeometryLine(
+    GeometryPoint(0, 0), GeometryPoint(1, 0), GeometryPoint(1, 1), GeometryPoint(0, 0)
+)
+
+VALUES = [
+    RecordID("person", 1),
+    Table("person"),
+    Duration(5),
+    GeometryPoint(1.5, 2.5),
+    _RING,
+    GeometryPolygon(_RING),
+    GeometryMultiPoint(GeometryPoint(1, 2)),
+    GeometryMultiLine(_RING),
+    GeometryMultiPolygon(GeometryPolygon(_RING)),
+    GeometryCollection(GeometryPoint(1, 2), _RING),
+]
+
+
+@pytest.mark.parametrize("value", VALUES, ids=lambda v: type(v).__name__)
+def test_instances_have_no_dict(value: object) -> None:
+    assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        value.misspelt = 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("value", VALUES, ids=lambda v: type(v).__name__)
+def test_instances_still_copy_pickle_and_round_trip(value: object) -> None:
+    assert pickle.loads(pickle.dumps(value)) == value
+    assert copy.deepcopy(value) == value
+    assert decode(encode(value)) == value
+
+
+def test_decoded_record_ids_share_their_table_name() -> None:
+    # Built from separate strings, so only the decoder can make them one.
+    ids = decode(encode([RecordID("".join(["per", "son"]), n) for n in range(3)]))
+
+    assert ids == [RecordID("person", n) for n in range(3)]
+    assert ids[0].table_name is ids[1].table_name is ids[2].table_name
+
+
+def test_decoded_tables_are_one_instance_per_name() -> None:
+    first, second, other = decode(encode([Table("t"), Table("t"), Table("u")]))
+
+    assert first is second
+    assert first == Table("t") and other == Table("u")
+
+
+def test_a_shared_table_cannot_be_renamed() -> None:
+    first, second = decode(encode([Table("t"), Table("t")]))
+
+    with pytest.raises(AttributeError, match="immutable"):
+        first.table_name = "renamed"
+    with pytest.raises(AttributeError, match="immutable"):
+        del first.table_name
+    assert second.table_name == "t"
+
+
+@pytest.mark.parametrize("value", [RecordID("person", 1), Table("person")])
+def test_ids_and_tables_still_take_weak_references(value: object) -> None:
+    assert weakref.ref(value)() is value
+
+
+def test_the_table_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cbor, "_TABLES", {})
+    monkeypatch.setattr(cbor, "_TABLES_MAX", 4)
+
+    decode(encode([Table(f"t{n}") for n in range(10)]))
+
+    assert len(cbor._TABLES) <= 4
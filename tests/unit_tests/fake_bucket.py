@@ -0,0 +1,134 @@
+"""An in-memory stand-in for a server's file bucket, for the ``db.files`` tests.
+
+A plain module rather than part of ``conftest.py``, so test modules can import
+the class; the ``fake_bucket`` fixture there hands each test a fresh one.
+"""
+
+import asyncio
+import base64
+import re
+from typing import Any
+
+from surrealdb import File
+from surrealdb.connections import files as files_module
+from surrealdb.testing import MockRequest
+
+# One `RETURN file::...($a, $b)` statement of a `db.files` query.
+_FILE_STATEMENT = re.compile(r"RETURN file::(\w+)\(\$(\w+)(?:, \$(\w+))?\)")
+
+
+class FakeBucket:
+    """Does what the server would for each query ``db.files`` sends.
+
+    Files live in :attr:`objects`, by key, and ``file::list`` lists them in
+    key order. Hand :meth:`run` each query from a fake query runner, or
+    install :meth:`handle` as a ``MockServer``'s ``query`` handler. Set
+    :attr:`fail_put_after` to lose the connection on a later ``file::put``.
+    """
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        #: Every query, as sent.
+        self.queries: list[str] = []
+        #: The number of statements in each query that came through `handle`.
+        self.statements: list[int] = []
+        #: The options of each `file::list`.
+        self.pages: list[dict[str, Any]] = []
+        self.fail_put_after: int | None = None
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    def run(self, query: str, vars: dict[str, Any]) -> list[Any]:
+        """The result of each statement in *query*."""
+        return [statement["result"] for statement in self._query(query, vars)]
+
+    async def handle(self, request: MockRequest) -> list[dict[str, Any]]:
+        query, vars = request.params[0], request.params[1]
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            statements = self._query(query, vars)
+            self.statements.append(len(statements))
+            return statements
+        finally:
+            self.in_flight -= 1
+
+    def parts(self) -> list[str]:
+        return [key for key in self.objects if ".~part-" in key]
+
+    def _query(self, query: str, vars: dict[str, Any]) -> list[dict[str, Any]]:
+        self.queries.append(query)
+        if query == files_module._ASSEMBLE:
+            text = "".join(
+                base64.b64encode(self.objects[part.key]).decode()
+                for part in vars["parts"]
+            )
+            self.objects[vars["f"].key] = base64.b64decode(text)
+            for part in vars["parts"]:
+                del self.objects[part.key]
+            return [_ok(None), _ok(None)]
+        if query == files_module._SPLIT:
+            text = base64.b64encode(self.objects[vars["f"].key]).decode()
+            for part in vars["parts"]:
+                start = part["start"]
+                self.objects[part["file"].key] = base64.b64decode(
+                    text[start : start + vars["n"]]
+                )
+            return [_ok(None), _ok(None)]
+        if query == files_module._DELETE_ALL:
+            for part in vars["parts"]:
+                self.objects.pop(part.key, None)
+            return [_ok(None)]
+        return [self._statement(text, vars) for text in query.split(";")]
+
+    def _statement(self, text: str, vars: dict[str, Any]) -> dict[str, Any]:
+        match = _FILE_STATEMENT.fullmatch(text)
+        assert match, f"unexpected query {text!r}"
+        function, first, second = match.groups()
+        if function == "list":
+            options = vars[second]
+            self.pages.append(options)
+            keys = [
+                key
+                for key in sorted(self.objects)
+                if key > options.get("start", "")
+                and key.startswith(options.get("prefix", ""))
+            ][: options["limit"]]
+            return _ok(
+                [
+                    {
+                        "file": File(vars[first], key),
+                        "size": len(self.objects[key]),
+                        "updated": None,
+                    }
+                    for key in keys
+                ]
+            )
+        key = vars[first].key
+        if function == "put":
+            if self.fail_put_after is not None:
+                if self.fail_put_after == 0:
+                    raise ConnectionError("lost")
+                self.fail_put_after -= 1
+            self.objects[key] = vars[second]
+        elif function == "get":
+            return _ok(self.objects.get(key))
+        elif function == "head":
+            data = self.objects.get(key)
+            if data is None:
+                return _ok(None)
+            return _ok({"file": vars[first], "size": len(data), "updated": None})
+        elif function == "delete":
+            self.objects.pop(key, None)
+        elif function == "copy":
+            if key not in self.objects:
+                return {"status": "ERR", "result": f"{key} does not exist"}
+            self.objects[vars[second].key] = self.objects[key]
+        else:
+            raise AssertionError(f"unexpected query {text!r}")
+        return _ok(None)
+
+
+def _ok(result: Any) -> dict[str, Any]:
+    return {"status": "OK", "result": result, "time": "0ns"}
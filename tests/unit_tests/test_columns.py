@@ -0,0 +1,269 @@
+"""``query().to_columns()`` / ``.to_arrow()`` and the buffers behind them.
+
+The executors here encode a response and decode it the way a transport does,
+so the decode-time path - rows appended to columns as they come off the wire -
+is exercised without a server.
+"""
+
+from array import array
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from surrealdb import AsyncSurreal, Surreal
+from surrealdb.connections.builders import (
+    AsyncQueryBuilder,
+    SyncQueryBuilder,
+    _decode_rows_for,
+)
+from surrealdb.data.cbor import decode, encode
+from surrealdb.data.columns import ColumnBuffers
+from surrealdb.data.types.datetime import PreciseDatetime
+from surrealdb.data.types.null import Null
+from surrealdb.data.types.record_id import RecordID
+from surrealdb.errors import UnexpectedResponseError
+from surrealdb.testing import MockServer, query_result
+
+
+def _columns(rows: list[Any]) -> dict[str, Any]:
+    buffers = ColumnBuffers()
+    buffers.extend(rows)
+    return buffers.to_columns()
+
+
+def test_numbers_land_in_typed_arrays() -> None:
+    columns = _columns([{"n": 1, "x": 0.5}, {"n": 2, "x": 1.5}])
+
+    assert columns["n"] == array("q", [1, 2])
+    assert columns["x"] == array("d", [0.5, 1.5])
+
+
+def test_an_int_column_meeting_a_float_becomes_float() -> None:
+    assert _columns([{"n": 1}, {"n": 2.5}, {"n": 3}])["n"] == array(
+        "d", [1.0, 2.5, 3.0]
+    )
+
+
+def test_strings_and_bools_are_lists() -> None:
+    columns = _columns([{"s": "a", "b": True}, {"s": "b", "b": False}])
+
+    assert columns == {"s": ["a", "b"], "b": [True, False]}
+
+
+def test_missing_none_and_null_are_all_gaps() -> None:
+    columns = _columns([{"n": 1}, {"n": None}, {"n": Null}, {"m": "late"}])
+
+    assert columns["n"] == [1, None, None, None]
+    assert columns["m"] == [None, None, None, "late"]
+
+
+def test_a_mixed_column_falls_back_to_values() -> None:
+    columns = _columns([{"v": 1}, {"v": "one"}, {"v": {"nested": True}}])
+
+    assert columns["v"] == [1, "one", {"nested": True}]
+
+
+def test_record_ids_split_into_table_and_id() -> None:
+    columns = _columns(
+        [
+            {"id": RecordID("person", 1)},
+            {"id": RecordID("robot", "r2")},
+            {"id": None},
+        ]
+    )
+
+    assert columns["id.tb"] == ["person", "robot", None]
+    assert columns["id.id"] == [1, "r2", None]
+
+
+def test_datetimes_are_epoch_nanoseconds() -> None:
+    stamp = PreciseDatetime(2024, 1, 1, tzinfo=timezone.utc, nanosecond=7)
+    naive = datetime(1970, 1, 1, 0, 0, 1)
+
+    columns = _columns([{"at": stamp}, {"at": naive}])
+
+    assert columns["at"] == array("q", [1_704_067_200_000_000_007, 1_000_000_000])
+
+
+def test_a_datetime_column_that_turns_mixed_keeps_its_values() -> None:
+    stamp = PreciseDatetime(2024, 1, 1, tzinfo=timezone.utc, nanosecond=7)
+
+    at = _columns([{"at": stamp}, {"at": "soon"}])["at"]
+
+    assert at[0] == stamp and at[0].nanosecond == 7
+    assert at[1] == "soon"
+
+
+def test_rows_that_are_not_records_are_refused() -> None:
+    with pytest.raises(UnexpectedResponseError, match="record"):
+        _columns([1, 2])
+
+
+def test_to_arrow_without_pyarrow_names_the_extra() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        pytest.skip("pyarrow is installed")
+
+    with pytest.raises(ImportError, match=r"surrealdb\[arrow\]"):
+        ColumnBuffers().to_arrow()
+
+
+def test_to_arrow_types() -> None:
+    pa = pytest.importorskip("pyarrow")
+    buffers = ColumnBuffers()
+    buffers.extend(
+        [
+            {"id": RecordID("person", "a"), "n": 1, "at": datetime(2024, 1, 1)},
+            {"id": RecordID("person", "b"), "n": None, "at": datetime(2024, 1, 2)},
+        ]
+    )
+
+    table = buffers.to_arrow()
+
+    assert table.column_names == ["id.tb", "id.id", "n", "at"]
+    assert pa.types.is_dictionary(table.schema.field("id.tb").type)
+    assert table.column("n").to_pylist() == [1, None]
+    assert table.schema.field("at").type == pa.timestamp("ns", tz="UTC")
+
+
+# --------------------------------------------------------------------------- #
+#  The query builders                                                          #
+# --------------------------------------------------------------------------- #
+
+
+ROWS = [{"n": n, "name": f"p{n}"} for n in range(4)]
+
+
+class _Wire:
+    """An executor that round-trips its response through CBOR, like a transport."""
+
+    def __init__(self, rows: Any) -> None:
+        self.rows = rows
+        self.calls = 0
+        self.decoded_rows: list[Any] = []
+
+    def __call__(self, query: str, params: dict[str, Any]) -> dict[str, Any]:
+        self.calls += 1
+        data = encode(
+            {
+                "id": "q",
+                "result": [{"result": self.rows, "status": "OK", "time": "1ms"}],
+            }
+        )
+        response = decode(data, _decode_rows_for())
+        self.decoded_rows.append(response["result"][0]["result"])
+        return response
+
+
+def test_sync_to_columns_decodes_straight_into_columns() -> None:
+    wire = _Wire(ROWS)
+    builder = SyncQueryBuilder(executor=wire, query="SELECT * FROM person")
+
+    columns = builder.to_columns()
+
+    assert columns == {"n": array("q", [0, 1, 2, 3]), "name": ["p0", "p1", "p2", "p3"]}
+    # What the decoder produced was the buffers, not a list of row dicts.
+    assert isinstance(wire.decoded_rows[0], ColumnBuffers)
+    assert builder.to_columns() == columns
+    assert wire.calls == 1
+
+
+def test_sync_to_columns_reuses_rows_already_fetched() -> None:
+    wire = _Wire(ROWS)
+    builder = SyncQueryBuilder(executor=wire, query="SELECT * FROM person")
+
+    assert builder.execute() == [ROWS]
+    assert builder.to_columns()["n"] == array("q", [0, 1, 2, 3])
+    assert wire.calls == 1
+
+
+def test_sync_to_columns_reports_non_record_rows() -> None:
+    builder = SyncQueryBuilder(executor=_Wire([1, 2]), query="SELECT VALUE n FROM x")
+
+    with pytest.raises(UnexpectedResponseError, match="record"):
+        builder.to_columns()
+
+
+async def test_async_to_columns() -> None:
+    wire = _Wire(ROWS)
+
+    async def executor(query: str, params: dict[str, Any]) -> dict[str, Any]:
+        return wire(query, params)
+
+    builder = AsyncQueryBuilder(executor=executor, query="SELECT * FROM person")
+
+    columns = await builder.to_columns()
+
+    assert columns["n"] == array("q", [0, 1, 2, 3])
+    assert isinstance(wire.decoded_rows[0], ColumnBuffers)
+    assert await builder.to_columns() == columns
+    # The rows were never kept, and running the query again could repeat
+    # its writes, so reading them now is refused.
+    with pytest.raises(RuntimeError, match="keep no rows"):
+        await builder
+    with pytest.raises(RuntimeError, match="keep no rows"):
+        await builder.into(dict, rows=True)
+    assert wire.calls == 1
+
+
+async def test_async_to_columns_reuses_rows_already_fetched() -> None:
+    wire = _Wire(ROWS)
+
+    async def executor(query: str, params: dict[str, Any]) -> dict[str, Any]:
+        return wire(query, params)
+
+    builder = AsyncQueryBuilder(executor=executor, query="SELECT * FROM person")
+
+    assert await builder == [ROWS]
+    assert (await builder.to_columns())["n"] == array("q", [0, 1, 2, 3])
+    assert wire.calls == 1
+
+
+def test_sync_execute_after_to_columns_is_refused() -> None:
+    wire = _Wire(ROWS)
+    builder = SyncQueryBuilder(executor=wire, query="SELECT * FROM person")
+
+    builder.to_columns()
+
+    with pytest.raises(RuntimeError, match="keep no rows"):
+        builder.execute()
+    with pytest.raises(RuntimeError, match="keep no rows"):
+        builder.first()
+    assert wire.calls == 1
+
+
+_WRITE_THEN_READ = "CREATE person:1 SET n = 1; SELECT * FROM person"
+
+
+async def test_to_columns_then_await_sends_one_query() -> None:
+    async with MockServer() as server:
+        server.respond("query", query_result([{"n": 1}], [{"n": 1}]))
+        db = AsyncSurreal(server.url)
+        await db.connect()
+        builder = db.query(_WRITE_THEN_READ)
+
+        assert (await builder.to_columns())["n"] == array("q", [1])
+        with pytest.raises(RuntimeError, match="keep no rows"):
+            await builder
+        await db.close()
+
+    assert server.counts["query"] == 1
+
+
+def test_blocking_to_columns_then_execute_sends_one_query() -> None:
+    with MockServer().background() as server:
+        server.respond("query", query_result([{"n": 1}], [{"n": 1}]))
+        db = Surreal(server.url)
+        db.connect()
+        builder = db.query(_WRITE_THEN_READ)
+
+        assert builder.to_columns()["n"] == array("q", [1])
+        with pytest.raises(RuntimeError, match="keep no rows"):
+            builder.execute()
+        db.close()
+
+    assert server.counts["query"] == 1
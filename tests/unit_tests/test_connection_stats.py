@@ -0,0 +1,176 @@
+"""``stats()`` counts what a connection did, from the points that see it.
+
+Driven through a fake websocket that answers in-process and a fake
+``requests.post``, so the counts are exact.
+"""
+
+import asyncio
+import random
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from surrealdb.connections import blocking_http
+from surrealdb.connections.async_ws import AsyncWsSurrealConnection
+from surrealdb.connections.blocking_http import BlockingHttpSurrealConnection
+from surrealdb.connections.stats import LatencyHistogram
+from surrealdb.data.cbor import encode
+from surrealdb.errors import SurrealError
+
+HTTP_URL = "http://localhost:8000"
+
+
+# --------------------------------------------------------------------------- #
+#  the histogram                                                               #
+# --------------------------------------------------------------------------- #
+
+
+def test_a_recording_reads_back_within_three_percent() -> None:
+    rng = random.Random(0)
+    for ns in [*range(200), *(rng.randrange(1, 10**11) for _ in range(2000))]:
+        histogram = LatencyHistogram()
+        histogram.record(ns)
+        # A larger one, so the median is read from ns's bucket, not the max.
+        histogram.record(10**12)
+        assert abs(histogram.percentile(50) - ns) <= ns / 32 + 1
+
+
+def test_every_rank_reads_back_within_three_percent() -> None:
+    histogram = LatencyHistogram()
+    for ns in range(1, 100_001):
+        histogram.record(ns)
+
+    for percent in range(1, 100):
+        expected = percent * 1000
+        assert abs(histogram.percentile(percent) - expected) <= expected / 32 + 1
+
+
+def test_a_negative_duration_counts_as_zero() -> None:
+    histogram = LatencyHistogram()
+    histogram.record(-5)
+    histogram.record(100)
+
+    assert histogram.percentile(50) == 0
+    assert histogram.max_ns == 100
+
+
+def test_percentiles() -> None:
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms * 1_000_000)
+
+    assert histogram.count == 100
+    assert histogram.percentile(50) == pytest.approx(50_000_000, rel=0.04)
+    assert histogram.percentile(99) == pytest.approx(99_000_000, rel=0.04)
+    assert histogram.percentile(100) == 100_000_000
+    summary = histogram.summary()
+    assert summary.mean == pytest.approx(0.0505)
+    assert summary.max == 0.1
+
+
+def test_an_empty_histogram() -> None:
+    assert LatencyHistogram().percentile(99) == 0
+    assert LatencyHistogram().summary().count == 0
+
+
+# --------------------------------------------------------------------------- #
+#  over a websocket                                                            #
+# --------------------------------------------------------------------------- #
+
+
+async def test_rpcs_are_counted_by_method(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws()
+
+    await conn.use("ns", "db")
+    await conn.let("a", 1)
+    await conn.let("b", 2)
+
+    stats = conn.stats()
+    assert (stats.requests, stats.frames_sent, stats.frames_received) == (3, 3, 3)
+    assert stats.bytes_sent > 0 and stats.bytes_received > 0
+    assert stats.in_flight == 0
+    assert stats.errors == stats.timeouts == 0
+    assert {method: s.count for method, s in stats.latency.items()} == {
+        "use": 1,
+        "let": 2,
+    }
+    assert 0 < stats.latency["let"].p50 <= stats.latency["let"].max
+
+
+async def test_in_flight_counts_requests_awaiting_a_reply(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws()
+    conn.socket.hold = True
+
+    pending = asyncio.ensure_future(conn.let("a", 1))
+    await asyncio.sleep(0)
+
+    assert conn.stats().in_flight == 1
+    pending.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    stats = conn.stats()
+    assert (stats.in_flight, stats.errors) == (0, 1)
+
+
+async def test_uncorrelated_errors_are_counted(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws()
+
+    conn._route_frame(encode({"error": {"code": -32700, "message": "Parse error"}}))
+
+    assert conn.stats().uncorrelated_errors == 1
+
+
+async def test_live_queue_depths_and_drops(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws()
+    conn._register_live_queue("live-1", 2, "drop_newest")
+
+    for n in range(5):
+        conn._route_frame(encode({"result": {"id": "live-1", "n": n}}))
+
+    stats = conn.stats()
+    assert stats.live_queue_depths == {"live-1": 2}
+    assert stats.dropped_notifications == 3
+    assert stats.frames_received == 5
+
+
+# --------------------------------------------------------------------------- #
+#  over HTTP                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+class _Response:
+    status_code = 200
+    content = encode({"id": "1", "result": None})
+
+
+def test_http_rpcs_and_timeouts_are_counted(monkeypatch: pytest.MonkeyPatch) -> None:
+    replies: list[Any] = [_Response(), blocking_http.requests.exceptions.Timeout()]
+
+    def _post(url: str, **kwargs: Any) -> _Response:
+        reply = replies.pop(0)
+        if isinstance(reply, BaseException):
+            raise reply
+        return reply
+
+    monkeypatch.setattr(blocking_http.requests, "post", _post)
+    conn = BlockingHttpSurrealConnection(HTTP_URL)
+
+    conn.query_raw("RETURN 1")
+    with pytest.raises(SurrealError):
+        conn.query_raw("RETURN 2")
+
+    stats = conn.stats()
+    assert (stats.requests, stats.errors, stats.timeouts) == (2, 1, 1)
+    assert (stats.frames_sent, stats.frames_received) == (2, 1)
+    assert stats.bytes_received == len(_Response.content)
+    assert stats.latency["query"].count == 2
+    assert stats.live_queue_depths == {}
@@ -0,0 +1,211 @@
+"""Rows built as ``into=`` models while the response is decoded.
+
+The decoder hands the first statement's rows to a hook one at a time, so each
+record's dict is released as soon as its model exists instead of a whole list
+of dicts being decoded first. Driven through a fake websocket that answers each
+frame with a canned response, so these run without a server.
+"""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from surrealdb.connections.async_ws import AsyncWsSurrealConnection
+from surrealdb.data.cbor import decode, encode
+from surrealdb.data.types.record_id import RecordID
+from surrealdb.data.types.table import Table
+from surrealdb.errors import UnexpectedResponseError
+from surrealdb.testing import query_result
+
+
+@dataclass
+class Person:
+    id: RecordID
+    name: str
+
+
+def _envelope(rows: Any, response_id: str = "q1") -> dict[str, Any]:
+    return {
+        "id": response_id,
+        "result": [
+            {"result": rows, "status": "OK", "time": "1ms"},
+            {"result": [{"name": "second"}], "status": "OK", "time": "1ms"},
+        ],
+    }
+
+
+def _people(count: int) -> list[dict[str, Any]]:
+    return [{"id": RecordID("person", n), "name": f"p{n}"} for n in range(count)]
+
+
+# --------------------------------------------------------------------------- #
+#  decode(rows_for=...)                                                        #
+# --------------------------------------------------------------------------- #
+
+
+def test_the_hook_builds_the_first_statements_rows() -> None:
+    data = encode(_envelope(_people(3)))
+
+    def hook(rows: Any) -> list[str]:
+        return [row["name"].upper() for row in rows]
+
+    decoded = decode(data, lambda response_id: hook)
+
+    assert decoded["result"][0]["result"] == ["P0", "P1", "P2"]
+    # Only the first statement's rows; everything else decodes as before.
+    assert decoded["result"][1]["result"] == [{"name": "second"}]
+    assert decoded["id"] == "q1"
+
+
+def test_the_hook_is_chosen_by_response_id() -> None:
+    data = encode(_envelope(_people(2), response_id="other"))
+
+    decoded = decode(data, {"q1": lambda rows: []}.get)
+
+    assert decoded == decode(data)
+
+
+def test_rows_the_hook_leaves_unread_are_still_consumed() -> None:
+    data = encode(_envelope(_people(5)))
+
+    decoded = decode(data, lambda response_id: lambda rows: next(rows)["name"])
+
+    assert decoded["result"][0]["result"] == "p0"
+    assert decoded["result"][1]["result"] == [{"name": "second"}]
+
+
+def test_indefinite_length_containers_are_walked_too() -> None:
+    # {_ "id": "q1", "result": [_ {_ "result": [_ {...}, {...}], "status": "OK"}]}
+    data = (
+        b"\xbf"
+        + encode("id")
+        + encode("q1")
+        + encode("result")
+        + b"\x9f\xbf"
+        + encode("result")
+        + b"\x9f"
+        + encode({"n": 1})
+        + encode({"n": 2})
+        + b"\xff"
+        + encode("status")
+        + encode("OK")
+        + b"\xff\xff\xff"
+    )
+
+    decoded = decode(data, lambda response_id: lambda rows: [r["n"] for r in rows])
+
+    assert decoded == {"id": "q1", "result": [{"result": [1, 2], "status": "OK"}]}
+
+
+def test_a_payload_that_is_not_an_envelope_is_decoded_whole() -> None:
+    assert decode(encode([1, 2]), lambda response_id: lambda rows: None) == [1, 2]
+
+
+# --------------------------------------------------------------------------- #
+#  select(into=) over a websocket                                              #
+# --------------------------------------------------------------------------- #
+
+
+async def test_select_into_builds_rows_while_decoding(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result(_people(3), [{"name": "second"}]))
+
+    people = await conn.select(Table("person"), into=Person)
+
+    assert type(people) is list
+    assert people == [Person(RecordID("person", n), f"p{n}") for n in range(3)]
+    assert conn._row_hooks == {}
+
+
+async def test_select_into_a_single_record(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result(_people(1), [{"name": "second"}]))
+
+    person = await conn.select(RecordID("person", 0), into=Person)
+
+    assert person == Person(RecordID("person", 0), "p0")
+
+
+async def test_select_without_into_is_unchanged(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result(_people(2), [{"name": "second"}]))
+
+    rows = await conn.select(Table("person"))
+
+    assert type(rows) is list
+    assert rows == _people(2)
+
+
+async def test_a_row_that_does_not_fit_fails_only_its_caller(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(
+        query_result(
+            [{"id": RecordID("person", 1), "name": "a", "age": 3}], [{"name": "second"}]
+        )
+    )
+
+    with pytest.raises(UnexpectedResponseError, match="into=Person"):
+        await conn.select(Table("person"), into=Person)
+    with pytest.raises(UnexpectedResponseError, match="into=Person"):
+        await conn.select(RecordID("person", 1), into=Person)
+
+    # The frame itself decoded fine: nothing else on the connection failed.
+    assert conn._uncorrelated_error is None
+
+
+async def test_pydantic_rows_are_validated_as_one_list(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    pytest.importorskip("pydantic")
+    import pydantic
+
+    class Item(pydantic.BaseModel):
+        id: int
+        name: str
+
+    conn = answering_ws(
+        query_result([{"id": "1", "name": "a"}, {"id": 2, "name": "b"}], [])
+    )
+    assert [item.id for item in await conn.select(Table("item"), into=Item)] == [1, 2]
+
+    conn = answering_ws(
+        query_result([{"id": 1, "name": "a"}, {"id": "x", "name": "b"}], [])
+    )
+    with pytest.raises(pydantic.ValidationError) as caught:
+        await conn.select(Table("item"), into=Item)
+    # Named by its position in the list, as `map_rows` names it.
+    assert caught.value.errors()[0]["loc"][0] == 1
+
+
+async def test_concurrent_selects_each_get_their_own_model(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    @dataclass
+    class Named:
+        name: str
+
+    conn = answering_ws(query_result([{"name": "x"}], [{"name": "second"}]))
+
+    named, raw = await asyncio.gather(
+        conn.select(Table("person"), into=Named),
+        conn.select(Table("person")),
+    )
+
+    assert named == [Named("x")]
+    assert raw == [{"name": "x"}]
+
+
+def test_request_ids_are_strings() -> None:
+    # `_row_hooks` is keyed like `qry`, by the id the response echoes back.
+    from surrealdb.request_message.message import RequestMessage
+    from surrealdb.request_message.methods import RequestMethod
+
+    message = RequestMessage(RequestMethod.QUERY, query="", params={})
+    assert isinstance(decode(message.WS_CBOR_DESCRIPTOR)["id"], str)
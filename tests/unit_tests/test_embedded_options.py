@@ -0,0 +1,70 @@
+"""``EmbeddedOptions`` validation and the endpoint it renders.
+
+Server- and engine-free: this covers the Python half - what is refused, and the
+endpoint an options object turns into. What the engine then does with it is
+covered under ``connections/embedded``.
+"""
+
+import pytest
+
+from surrealdb import EmbeddedOptions
+from surrealdb.connections.embedded_options import engine_url
+
+
+def test_defaults_change_nothing() -> None:
+    assert engine_url("surrealkv://db", EmbeddedOptions()) == "surrealkv://db"
+    assert engine_url("memory", EmbeddedOptions()) == "memory"
+    assert engine_url("memory", None) == "memory"
+
+
+def test_storage_parameters_are_appended_to_the_endpoint() -> None:
+    options = EmbeddedOptions(
+        versioned=True, storage={"sync": "every", "cache": 1024, "flag": False}
+    )
+
+    assert (
+        engine_url("surrealkv://data/db", options)
+        == "surrealkv://data/db?sync=every&cache=1024&flag=false&versioned=true"
+    )
+
+
+def test_existing_query_string_is_kept() -> None:
+    options = EmbeddedOptions(storage={"sync": "every"})
+
+    assert (
+        engine_url("file://db?retention=1d", options)
+        == "file://db?retention=1d&sync=every"
+    )
+
+
+def test_parameter_in_url_and_options_is_refused() -> None:
+    with pytest.raises(ValueError, match="already sets sync"):
+        engine_url(
+            "surrealkv://db?sync=never", EmbeddedOptions(storage={"sync": "every"})
+        )
+    with pytest.raises(ValueError, match="already sets versioned"):
+        engine_url("surrealkv+versioned://db", EmbeddedOptions(versioned=True))
+
+
+@pytest.mark.parametrize("url", ["memory", "mem://"])
+def test_storage_options_on_memory_are_refused(url: str) -> None:
+    with pytest.raises(ValueError, match="file-backed"):
+        engine_url(url, EmbeddedOptions(versioned=True))
+    with pytest.raises(ValueError, match="file-backed"):
+        engine_url(url, EmbeddedOptions(storage={"sync": "every"}))
+
+
+def test_wrongly_typed_storage_values_are_refused() -> None:
+    with pytest.raises(TypeError):
+        EmbeddedOptions(storage={"cache": 1.5})  # type: ignore[dict-item]
+
+
+def test_storage_may_not_repeat_versioned() -> None:
+    with pytest.raises(ValueError, match="EmbeddedOptions\\(versioned="):
+        EmbeddedOptions(storage={"versioned": "true"})
+
+
+@pytest.mark.parametrize("name", ["", "a&b", "a=b", "a?b", "a#b"])
+def test_storage_names_that_break_the_query_string_are_refused(name: str) -> None:
+    with pytest.raises(ValueError, match="storage parameter name"):
+        EmbeddedOptions(storage={name: "x"})
@@ -0,0 +1,101 @@
+"""``files.iter`` pages through a bucket with ``list``'s exclusive ``start``.
+
+Against ``MockServer``, whose ``query`` handler lists a sorted set of keys the
+way ``file::list`` does.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import Any
+
+import pytest
+
+from surrealdb import AsyncSurreal, File, Surreal
+from surrealdb.testing import MockServer
+from tests.unit_tests.fake_bucket import FakeBucket
+
+KEYS = [f"/{n:05d}" for n in range(2500)]
+
+
+@pytest.fixture
+async def db(fake_bucket: FakeBucket) -> AsyncIterator[Any]:
+    fake_bucket.objects = dict.fromkeys(KEYS, b"x")
+    async with MockServer() as server:
+        server.handle("query", fake_bucket.handle)
+        db = AsyncSurreal(server.url)
+        await db.connect()
+        yield db
+        await db.close()
+
+
+async def test_every_file_arrives_once_in_order(
+    db: Any, fake_bucket: FakeBucket
+) -> None:
+    keys = [entry.file.key async for entry in db.files.iter("b", page_size=1000)]
+
+    assert keys == KEYS
+    assert [page.get("start") for page in fake_bucket.pages] == [
+        None,
+        "/00999",
+        "/01999",
+    ]
+
+
+async def test_a_full_last_page_takes_one_more_request(
+    db: Any, fake_bucket: FakeBucket
+) -> None:
+    fake_bucket.objects = dict.fromkeys(KEYS[:2000], b"x")
+
+    assert len([entry async for entry in db.files.iter("b", page_size=1000)]) == 2000
+    assert len(fake_bucket.pages) == 3
+
+
+async def test_the_next_page_is_fetched_while_this_one_is_consumed(
+    db: Any, fake_bucket: FakeBucket
+) -> None:
+    async with aclosing(db.files.iter("b", page_size=100)) as entries:
+        await anext(entries)
+        await asyncio.sleep(0.05)
+        assert len(fake_bucket.pages) == 2
+        for _ in range(99):
+            await anext(entries)
+        assert len(fake_bucket.pages) == 2
+
+    await asyncio.sleep(0.05)
+    assert len(fake_bucket.pages) == 2
+
+
+async def test_prefix_and_start_are_passed_on(db: Any, fake_bucket: FakeBucket) -> None:
+    entries = db.files.iter("b", prefix="/000", start="/00050", page_size=10)
+
+    keys = [entry.file.key async for entry in entries]
+
+    assert keys == KEYS[51:100]
+    assert all(page["prefix"] == "/000" for page in fake_bucket.pages)
+
+
+async def test_arguments_are_checked_when_called(db: Any) -> None:
+    with pytest.raises(ValueError, match="page_size"):
+        db.files.iter("b", page_size=0)
+    with pytest.raises(TypeError, match="bucket"):
+        db.files.iter(File("b", "/a"))
+    with pytest.raises(TypeError, match="prefix"):
+        db.files.iter("b", prefix=1)
+
+
+def test_blocking_iter_fetches_a_page_when_it_reaches_it() -> None:
+    fake_bucket = FakeBucket()
+    fake_bucket.objects = dict.fromkeys(KEYS, b"x")
+    with MockServer().background() as server:
+        server.handle("query", fake_bucket.handle)
+        db = Surreal(server.url)
+        db.connect()
+
+        entries = db.files.iter("b", page_size=1000)
+        assert fake_bucket.pages == []
+        assert next(entries).file.key == KEYS[0]
+        assert len(fake_bucket.pages) == 1
+        assert [entry.file.key for entry in entries] == KEYS[1:]
+        assert len(fake_bucket.pages) == 3
+        db.close()
@@ -0,0 +1,131 @@
+"""``files.put_many`` / ``get_many`` / ``copy_many`` / ``delete_many``.
+
+Driven through real connections against ``MockServer``, whose ``query``
+handler runs each ``RETURN file::...`` statement against a dict - so what is
+checked is the packing and per-statement results a server would see.
+"""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from surrealdb import AsyncSurreal, File, FileResult, Surreal
+from surrealdb.errors import ServerError
+from surrealdb.testing import MockServer
+from tests.unit_tests.fake_bucket import FakeBucket
+
+
+@pytest.fixture
+async def server(fake_bucket: FakeBucket) -> AsyncIterator[MockServer]:
+    async with MockServer() as server:
+        server.handle("query", fake_bucket.handle)
+        yield server
+
+
+@pytest.fixture(params=["ws", "http"])
+async def db(request: pytest.FixtureRequest, server: MockServer) -> AsyncIterator[Any]:
+    db = AsyncSurreal(server.url if request.param == "ws" else server.http_url)
+    await db.connect()
+    yield db
+    await db.close()
+
+
+def _files(n: int) -> list[File]:
+    return [File("b", f"/{i:04d}.txt") for i in range(n)]
+
+
+async def test_many_small_files_are_packed(db: Any, fake_bucket: FakeBucket) -> None:
+    files = _files(150)
+
+    put = await db.files.put_many({f: f.key.encode() for f in files})
+    got = await db.files.get_many([*files, File("b", "/missing")])
+
+    assert all(isinstance(r, FileResult) and r.ok for r in put)
+    assert [r.file for r in got] == [*files, File("b", "/missing")]
+    assert [r.value for r in got] == [f.key.encode() for f in files] + [None]
+    # 64 statements to a query: 150 puts, then 151 gets.
+    assert sorted(fake_bucket.statements) == [22, 23, 64, 64, 64, 64]
+
+    assert all(r.ok for r in await db.files.delete_many(files))
+    assert fake_bucket.objects == {}
+
+
+async def test_put_many_packs_up_to_a_byte_budget(
+    db: Any, fake_bucket: FakeBucket
+) -> None:
+    mib = 1024 * 1024
+    sizes = [1, 3 * mib, 3 * mib, 5 * mib, 1]
+
+    results = await db.files.put_many(
+        [(File("b", f"/{n}"), b"x" * size) for n, size in enumerate(sizes)],
+        concurrency=1,
+    )
+
+    # Up to 4 MiB of content to a query; a larger file goes on its own.
+    assert [r.ok for r in results] == [True] * 5
+    assert fake_bucket.statements == [2, 1, 1, 1]
+
+
+async def test_each_file_fails_on_its_own(db: Any, fake_bucket: FakeBucket) -> None:
+    fake_bucket.objects["/a"] = b"a"
+
+    results = await db.files.copy_many(
+        {File("b", "/a"): File("b", "/a2"), File("b", "/gone"): File("b", "/g2")}
+    )
+
+    assert results[0] == FileResult(File("b", "/a2"))
+    assert results[1].file == File("b", "/g2")
+    assert isinstance(results[1].error, ServerError)
+    assert "/gone does not exist" in str(results[1].error)
+    assert fake_bucket.objects == {"/a": b"a", "/a2": b"a"}
+
+
+async def test_a_failed_query_fails_its_files_only(
+    db: Any, server: MockServer, fake_bucket: FakeBucket
+) -> None:
+    server.inject_fault("error", method="query", times=1, message="busy")
+
+    results = await db.files.put_many([(f, b"") for f in _files(100)], concurrency=1)
+
+    assert [r.ok for r in results] == [False] * 64 + [True] * 36
+    assert "busy" in str(results[0].error)
+    assert len(fake_bucket.objects) == 36
+
+
+async def test_queries_in_flight_are_bounded(db: Any, fake_bucket: FakeBucket) -> None:
+    await db.files.delete_many(_files(64 * 6), concurrency=2)
+
+    assert fake_bucket.statements == [64] * 6
+    assert fake_bucket.most_in_flight == 2
+
+
+async def test_bad_arguments_raise_before_anything_is_sent(
+    db: Any, server: MockServer
+) -> None:
+    with pytest.raises(TypeError, match="encode"):
+        await db.files.put_many([(File("b", "/a"), b"a"), (File("b", "/b"), "b")])
+    with pytest.raises(TypeError, match=r"surrealdb\.File"):
+        await db.files.get_many([File("b", "/a"), "b:/b"])
+    with pytest.raises(TypeError, match="pairs"):
+        await db.files.copy_many([File("b", "/a")])
+    with pytest.raises(ValueError, match="concurrency"):
+        await db.files.delete_many([], concurrency=0)
+
+    assert server.counts["query"] == 0
+    assert await db.files.get_many([]) == []
+
+
+def test_blocking_connections_pack_too() -> None:
+    fake_bucket = FakeBucket()
+    with MockServer().background() as server:
+        server.handle("query", fake_bucket.handle)
+        for url in (server.url, server.http_url):
+            db = Surreal(url)
+            db.connect()
+            files = _files(70)
+            assert all(r.ok for r in db.files.put_many([(f, b"!") for f in files]))
+            assert {r.value for r in db.files.get_many(files)} == {b"!"}
+            db.close()
+
+    assert fake_bucket.statements == [64, 6] * 4
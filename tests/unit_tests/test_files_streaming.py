@@ -0,0 +1,287 @@
+"""``files.put_stream`` and ``files.open`` move a file in bounded parts.
+
+Driven through a fake query runner that carries out each query against an
+in-memory bucket - including the base64 join and split the server does for
+``_ASSEMBLE`` and ``_SPLIT`` - so the part arithmetic is checked end to end.
+The same round trips against a real server, which runs the real queries,
+are in ``connections/files/test_files.py``.
+"""
+
+import asyncio
+import io
+import random
+import shutil
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from surrealdb import File
+from surrealdb.connections import files as files_module
+from surrealdb.connections.files import AsyncFiles, BlockingFiles
+from tests.unit_tests.fake_bucket import FakeBucket
+
+BUCKET = "b"
+CONTENT = random.Random(0).randbytes(10_000)
+
+
+class _Result:
+    def __init__(self, values: list[Any]) -> None:
+        self._values = values
+
+    def first(self) -> Any:
+        return self._values[0]
+
+    def execute(self) -> list[Any]:
+        return self._values
+
+
+class _AsyncResult:
+    def __init__(self, bucket: FakeBucket, query: str, vars: dict[str, Any]) -> None:
+        self._bucket, self._query, self._vars = bucket, query, vars
+
+    async def _run(self) -> list[Any]:
+        bucket = self._bucket
+        bucket.in_flight += 1
+        bucket.most_in_flight = max(bucket.most_in_flight, bucket.in_flight)
+        try:
+            await asyncio.sleep(0)
+            return bucket.run(self._query, self._vars)
+        finally:
+            bucket.in_flight -= 1
+
+    async def first(self) -> Any:
+        return (await self._run())[0]
+
+    async def execute(self) -> list[Any]:
+        return await self._run()
+
+
+class _BlockingRunner:
+    def __init__(self, bucket: FakeBucket) -> None:
+        self.bucket = bucket
+
+    def query(self, query: str, vars: dict[str, Any] | None = None) -> _Result:
+        return _Result(self.bucket.run(query, vars or {}))
+
+    def query_raw(self, query: str, vars: dict[str, Any] | None = None) -> Any:
+        raise AssertionError("only the *_many methods use query_raw")
+
+
+class _AsyncRunner:
+    def __init__(self, bucket: FakeBucket) -> None:
+        self.bucket = bucket
+
+    def query(self, query: str, vars: dict[str, Any] | None = None) -> _AsyncResult:
+        return _AsyncResult(self.bucket, query, vars or {})
+
+    async def query_raw(self, query: str, vars: dict[str, Any] | None = None) -> Any:
+        raise AssertionError("only the *_many methods use query_raw")
+
+
+@pytest.fixture
+def files(fake_bucket: FakeBucket) -> BlockingFiles:
+    return BlockingFiles(_BlockingRunner(fake_bucket))
+
+
+@pytest.fixture
+def async_files(fake_bucket: FakeBucket) -> AsyncFiles:
+    return AsyncFiles(_AsyncRunner(fake_bucket))
+
+
+def _pieces(data: bytes, sizes: tuple[int, ...] = (1, 700, 33, 4096)) -> list[bytes]:
+    pieces, start, n = [], 0, 0
+    while start < len(data):
+        size = sizes[n % len(sizes)]
+        pieces.append(data[start : start + size])
+        start, n = start + size, n + 1
+    return pieces
+
+
+# --------------------------------------------------------------------------- #
+#  uploads                                                                     #
+# --------------------------------------------------------------------------- #
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        pytest.param(lambda: CONTENT, id="bytes"),
+        pytest.param(lambda: memoryview(bytearray(CONTENT)), id="memoryview"),
+        pytest.param(lambda: io.BytesIO(CONTENT), id="file-object"),
+        pytest.param(lambda: iter(_pieces(CONTENT)), id="uneven-chunks"),
+    ],
+)
+def test_put_stream_round_trips(
+    files: BlockingFiles, fake_bucket: FakeBucket, source: Any
+) -> None:
+    f = File(BUCKET, "/big.bin")
+
+    # 1000 is not a multiple of 3, so this also checks the rounding down.
+    assert files.put_stream(f, source(), chunk_size=1000) == len(CONTENT)
+
+    assert fake_bucket.objects == {"/big.bin": CONTENT}
+    assert fake_bucket.queries.count("RETURN file::put($f, $c)") == -(
+        -len(CONTENT) // 999
+    )
+
+
+def test_content_that_fits_one_part_is_a_plain_put(
+    files: BlockingFiles, fake_bucket: FakeBucket
+) -> None:
+    f = File(BUCKET, "/small.bin")
+
+    assert files.put_stream(f, io.BytesIO(b"abc")) == 3
+    assert files.put_stream(File(BUCKET, "/empty.bin"), []) == 0
+
+    assert fake_bucket.objects == {"/small.bin": b"abc", "/empty.bin": b""}
+    assert fake_bucket.queries == ["RETURN file::put($f, $c)"] * 2
+
+
+def test_a_str_is_refused(files: BlockingFiles) -> None:
+    with pytest.raises(TypeError, match="encode"):
+        files.put_stream(File(BUCKET, "/a"), "text")  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+    with pytest.raises(TypeError, match="encode"):
+        files.put_stream(File(BUCKET, "/a"), ["text"])  # type: ignore[list-item]  # pyright: ignore[reportArgumentType]
+
+
+def test_a_failed_upload_leaves_no_parts(
+    files: BlockingFiles, fake_bucket: FakeBucket
+) -> None:
+    fake_bucket.objects["/big.bin"] = b"previous"
+    fake_bucket.fail_put_after = 3
+
+    with pytest.raises(ConnectionError):
+        files.put_stream(File(BUCKET, "/big.bin"), CONTENT, chunk_size=999)
+
+    assert fake_bucket.objects == {"/big.bin": b"previous"}
+
+
+async def test_async_uploads_are_concurrent_but_bounded(
+    async_files: AsyncFiles, fake_bucket: FakeBucket
+) -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        for piece in _pieces(CONTENT):
+            yield piece
+
+    f = File(BUCKET, "/big.bin")
+    written = await async_files.put_stream(f, chunks(), chunk_size=300, concurrency=3)
+
+    assert written == len(CONTENT)
+    assert fake_bucket.objects == {"/big.bin": CONTENT}
+    assert fake_bucket.most_in_flight == 3
+
+
+async def test_a_failed_async_upload_leaves_no_parts(
+    async_files: AsyncFiles, fake_bucket: FakeBucket
+) -> None:
+    fake_bucket.fail_put_after = 5
+
+    with pytest.raises(ConnectionError):
+        await async_files.put_stream(File(BUCKET, "/big.bin"), CONTENT, chunk_size=300)
+
+    assert fake_bucket.objects == {}
+
+
+# --------------------------------------------------------------------------- #
+#  downloads                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+def test_open_reads_a_large_file_in_parts(
+    files: BlockingFiles, fake_bucket: FakeBucket
+) -> None:
+    fake_bucket.objects["/big.bin"] = CONTENT
+
+    with files.open(File(BUCKET, "/big.bin"), chunk_size=999) as reader:
+        assert reader.size == len(CONTENT)
+        assert reader.read(10) == CONTENT[:10]
+        out = io.BytesIO()
+        shutil.copyfileobj(io.BufferedReader(reader), out)
+
+    assert out.getvalue() == CONTENT[10:]
+    assert fake_bucket.parts() == []
+    assert fake_bucket.objects == {"/big.bin": CONTENT}
+
+
+def test_closing_early_deletes_the_unread_parts(
+    files: BlockingFiles, fake_bucket: FakeBucket
+) -> None:
+    fake_bucket.objects["/big.bin"] = CONTENT
+
+    with files.open(File(BUCKET, "/big.bin"), chunk_size=999) as reader:
+        next(reader.chunks())
+        assert len(fake_bucket.parts()) == 10
+
+    assert fake_bucket.parts() == []
+
+
+def test_a_small_file_is_one_get(files: BlockingFiles, fake_bucket: FakeBucket) -> None:
+    fake_bucket.objects["/small.bin"] = b"abc"
+
+    with files.open(File(BUCKET, "/small.bin")) as reader:
+        assert reader.read() == b"abc"
+
+    assert files_module._SPLIT not in fake_bucket.queries
+
+
+def test_opening_a_missing_file_raises(files: BlockingFiles) -> None:
+    with pytest.raises(FileNotFoundError, match="b:/missing"):
+        files.open(File(BUCKET, "/missing"))
+
+
+async def test_async_open_reads_and_iterates(
+    async_files: AsyncFiles, fake_bucket: FakeBucket
+) -> None:
+    fake_bucket.objects["/big.bin"] = CONTENT
+
+    async with async_files.open(File(BUCKET, "/big.bin"), chunk_size=999) as reader:
+        assert reader.size == len(CONTENT)
+        head = await reader.read(5)
+        rest = [chunk async for chunk in reader]
+
+    assert head + b"".join(rest) == CONTENT
+    assert [len(chunk) for chunk in rest[1:]] == [999] * 9 + [10]
+    assert fake_bucket.parts() == []
+
+
+async def test_async_close_cancels_the_prefetch_and_cleans_up(
+    async_files: AsyncFiles, fake_bucket: FakeBucket
+) -> None:
+    fake_bucket.objects["/big.bin"] = CONTENT
+
+    reader = async_files.open(File(BUCKET, "/big.bin"), chunk_size=999)
+    assert await reader.read(1) == CONTENT[:1]
+    await reader.close()
+
+    assert fake_bucket.parts() == []
+    with pytest.raises(ValueError, match="closed"):
+        await reader.read()
+
+
+async def test_cancelling_close_is_not_swallowed(async_files: AsyncFiles) -> None:
+    reader = async_files.open(File(BUCKET, "/big.bin"))
+
+    async def stubborn() -> bytes:
+        # A fetch that takes a while to wind down once cancelled.
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0.05)
+        return b""
+
+    prefetch = reader._prefetch = asyncio.ensure_future(stubborn())
+    await asyncio.sleep(0)
+    closing = asyncio.ensure_future(reader.close())
+    await asyncio.sleep(0)
+    closing.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await closing
+    assert prefetch.done()
+
+
+async def test_async_open_of_a_missing_file_raises(async_files: AsyncFiles) -> None:
+    with pytest.raises(FileNotFoundError):
+        async with async_files.open(File(BUCKET, "/missing")):
+            pass
@@ -113,6 +113,7 @@ async def test_async_authenticate_sends_the_token_it_was_given(
         data: bytes,
         operation: str,
         bypass: bool,
+        call: Any = None,
     ) -> dict[str, Any]:
         seen.append(dict(headers))
         return {"id": "1", "result": None}
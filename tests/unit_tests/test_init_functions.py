@@ -1,6 +1,6 @@
 import pytest
 
-from surrealdb import AsyncSurreal, Surreal
+from surrealdb import AsyncSurreal, EmbeddedOptions, Surreal
 from surrealdb.connections.async_http import AsyncHttpSurrealConnection
 from surrealdb.connections.async_ws import AsyncWsSurrealConnection
 from surrealdb.connections.blocking_http import BlockingHttpSurrealConnection
@@ -127,6 +127,16 @@ def test_unsupported_scheme_raises_surreal_error() -> None:
         AsyncSurreal("rocksdb://tmp/db")
 
 
+@pytest.mark.parametrize("url", ["http://localhost:8000", "ws://localhost:8000"])
+def test_embedded_options_for_a_server_are_refused(url: str) -> None:
+    """``options`` configures an embedded datastore, which a server URL has not."""
+    with pytest.raises(ValueError, match="embedded"):
+        Surreal(url, EmbeddedOptions(versioned=True))
+
+    with pytest.raises(ValueError, match="embedded"):
+        AsyncSurreal(url, EmbeddedOptions())
+
+
 def test_http_connections_implement_connect() -> None:
     """``connect()`` works on HTTP, not just the websocket transports.
 
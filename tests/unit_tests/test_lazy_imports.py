@@ -0,0 +1,86 @@
+"""``import surrealdb`` leaves the transport libraries for first use.
+
+aiohttp, requests, websockets, pydantic-core and the native engine used to be
+imported by the package itself, so a CLI or a serverless cold start paid for
+every transport while using one. The import is checked in a fresh interpreter,
+since this one has long since loaded all of them.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from surrealdb.connections import async_http, blocking_http, blocking_ws
+from surrealdb.request_message.descriptors import cbor_ws
+from surrealdb.request_message.message import RequestMessage
+from surrealdb.request_message.methods import RequestMethod
+
+DEFERRED = (
+    "aiohttp",
+    "requests",
+    "websockets",
+    "pydantic_core",
+    "surrealdb_embedded",
+)
+
+
+def _loaded_after(code: str) -> set[str]:
+    probe = (
+        f"import sys; {code}; "
+        f"print(','.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    )
+    done = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    return {name for name in done.stdout.strip().split(",") if name}
+
+
+def test_importing_the_package_loads_no_transport() -> None:
+    assert _loaded_after("import surrealdb") == set()
+
+
+def test_the_connection_classes_are_still_eager() -> None:
+    # Constructing one is not a connection either.
+    loaded = _loaded_after(
+        "from surrealdb import Surreal, AsyncSurreal; "
+        "Surreal('ws://localhost:8000'); AsyncSurreal('http://localhost:8000')"
+    )
+    assert loaded == set()
+
+
+def test_the_first_request_loads_what_it_needs() -> None:
+    loaded = _loaded_after(
+        "from surrealdb.request_message.message import RequestMessage; "
+        "from surrealdb.request_message.methods import RequestMethod; "
+        "RequestMessage(RequestMethod.QUERY, query='', params={}).WS_CBOR_DESCRIPTOR"
+    )
+    assert loaded == {"pydantic_core"}
+
+
+def test_the_former_module_names_still_resolve() -> None:
+    import aiohttp
+    import requests
+    import websockets.sync.client
+    from websockets.protocol import State
+
+    assert async_http.aiohttp is aiohttp
+    assert blocking_http.requests is requests
+    assert blocking_ws.ws_sync is websockets.sync.client
+    assert blocking_ws.State is State
+    with pytest.raises(AttributeError):
+        _ = blocking_ws.missing
+
+
+def test_validators_are_built_once_and_on_demand() -> None:
+    assert cbor_ws.QUERY_VALIDATOR is cbor_ws._validator(RequestMethod.QUERY)
+    assert cbor_ws._validator(RequestMethod.SIGN_IN) is None
+    with pytest.raises(AttributeError):
+        _ = cbor_ws.SIGN_IN_VALIDATOR
+
+
+def test_a_lazily_built_validator_still_rejects_a_bad_payload() -> None:
+    message = RequestMessage(RequestMethod.USE, namespace="ns", database=None)
+
+    with pytest.raises(ValueError, match="Invalid schema for Cbor WS encoding"):
+        _ = message.WS_CBOR_DESCRIPTOR
@@ -0,0 +1,200 @@
+"""``subscribe_live_batches``: notifications gathered up to a size or time bound.
+
+Driven through the same routing as the single-notification subscriptions - the
+async connection's ``_route_frame`` and a fake blocking socket - so these run
+without a server.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any
+
+import pytest
+
+from surrealdb import LiveQueueOverflowError
+from surrealdb.connections.async_ws import AsyncWsSurrealConnection
+from surrealdb.connections.blocking_ws import BlockingWsSurrealConnection
+from surrealdb.data.cbor import encode
+from surrealdb.errors import ConnectionUnavailableError
+
+WS_URL = "ws://localhost:8000"
+
+
+def _frame(live_id: str, n: int) -> bytes:
+    return encode({"result": {"id": live_id, "action": "CREATE", "result": {"n": n}}})
+
+
+def _numbers(batch: list[Any]) -> list[int]:
+    return [notification["result"]["n"] for notification in batch]
+
+
+async def _next_batch(subscription: Any) -> list[int]:
+    return _numbers(await asyncio.wait_for(subscription.__anext__(), timeout=1))
+
+
+async def test_queued_notifications_come_out_in_max_items_batches() -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    batches = await conn.subscribe_live_batches(live_id, max_items=4)
+    for n in range(10):
+        conn._route_frame(_frame(live_id, n))
+
+    assert await _next_batch(batches) == [0, 1, 2, 3]
+    assert await _next_batch(batches) == [4, 5, 6, 7]
+    assert await _next_batch(batches) == [8, 9]
+    assert batches.stats.delivered == 10
+
+
+async def test_a_partial_batch_waits_for_max_latency() -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    batches = await conn.subscribe_live_batches(live_id, max_items=100, max_latency=0.2)
+    conn._route_frame(_frame(live_id, 0))
+
+    async def late() -> None:
+        await asyncio.sleep(0.05)
+        conn._route_frame(_frame(live_id, 1))
+
+    started = time.monotonic()
+    producer = asyncio.create_task(late())
+    assert await _next_batch(batches) == [0, 1]
+    assert time.monotonic() - started >= 0.15
+    await producer
+
+
+async def test_zero_latency_takes_only_what_is_queued() -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    batches = await conn.subscribe_live_batches(live_id, max_latency=0)
+    for n in range(3):
+        conn._route_frame(_frame(live_id, n))
+
+    assert await _next_batch(batches) == [0, 1, 2]
+
+
+async def test_close_flushes_the_partial_batch_then_ends() -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    batches = await conn.subscribe_live_batches(live_id, max_latency=10)
+    conn._route_frame(_frame(live_id, 0))
+    conn._route_frame(_frame(live_id, 1))
+
+    await conn.close()
+
+    assert await _next_batch(batches) == [0, 1]
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(batches.__anext__(), timeout=1)
+
+
+async def test_overflow_is_raised_after_the_backlog_batch() -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    batches = await conn.subscribe_live_batches(
+        live_id, max_latency=0, maxsize=2, on_overflow="error"
+    )
+    for n in range(5):
+        conn._route_frame(_frame(live_id, n))
+
+    assert await _next_batch(batches) == [0, 1]
+    with pytest.raises(LiveQueueOverflowError):
+        await asyncio.wait_for(batches.__anext__(), timeout=1)
+
+
+async def test_closing_the_batches_deregisters_the_queue() -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    batches = await conn.subscribe_live_batches(live_id)
+    conn._route_frame(_frame(live_id, 0))
+    assert await _next_batch(batches) == [0]
+
+    await batches.aclose()
+
+    assert conn.live_queues[live_id] == []
+
+
+async def test_invalid_batch_bounds_are_refused() -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    with pytest.raises(ValueError, match="max_items"):
+        await conn.subscribe_live_batches(live_id, max_items=0)
+    with pytest.raises(ValueError, match="max_latency"):
+        await conn.subscribe_live_batches(live_id, max_latency=-1)
+    with pytest.raises(TypeError, match="max_items"):
+        await conn.subscribe_live_batches(live_id, max_items=1.5)  # type: ignore[arg-type]
+
+    assert live_id not in conn.live_queues
+
+
+# --------------------------------------------------------------------------- #
+#  Blocking transport                                                          #
+# --------------------------------------------------------------------------- #
+
+
+class _IdleAfterFramesSocket:
+    """Sync socket that hands out its frames, then times out on every read."""
+
+    def __init__(self, frames: list[bytes]) -> None:
+        self._frames = list(frames)
+        self.idle_reads = 0
+
+    def recv(self, timeout: float | None = None, decode: bool | None = None) -> bytes:
+        if self._frames:
+            return self._frames.pop(0)
+        self.idle_reads += 1
+        time.sleep(timeout or 0)
+        raise TimeoutError
+
+    def close(self) -> None:
+        pass
+
+
+def test_blocking_batches_split_at_max_items() -> None:
+    conn = BlockingWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    conn.socket = _IdleAfterFramesSocket(  # type: ignore[assignment]
+        [_frame(live_id, n) for n in range(5)]
+    )
+    batches = conn.subscribe_live_batches(live_id, max_items=3, max_latency=0.05)
+    try:
+        assert _numbers(next(batches)) == [0, 1, 2]
+        assert _numbers(next(batches)) == [3, 4]
+    finally:
+        batches.close()
+
+    assert live_id not in conn.live_queues
+
+
+def test_blocking_partial_batch_is_yielded_after_max_latency() -> None:
+    conn = BlockingWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    socket = _IdleAfterFramesSocket([_frame(live_id, 0)])
+    conn.socket = socket  # type: ignore[assignment]
+    batches = conn.subscribe_live_batches(live_id, max_items=100, max_latency=0.05)
+    try:
+        assert _numbers(next(batches)) == [0]
+        assert socket.idle_reads >= 1
+    finally:
+        batches.close()
+
+
+class _ResetAfterFramesSocket(_IdleAfterFramesSocket):
+    """Sync socket that hands out its frames, then fails like a dropped peer."""
+
+    def recv(self, timeout: float | None = None, decode: bool | None = None) -> bytes:
+        if self._frames:
+            return self._frames.pop(0)
+        raise OSError("connection reset")
+
+
+def test_blocking_failure_flushes_the_partial_batch_first() -> None:
+    conn = BlockingWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    conn.socket = _ResetAfterFramesSocket(  # type: ignore[assignment]
+        [_frame(live_id, 0), _frame(live_id, 1)]
+    )
+    batches = conn.subscribe_live_batches(live_id, max_items=100, max_latency=10)
+
+    assert _numbers(next(batches)) == [0, 1]
+    with pytest.raises(ConnectionUnavailableError):
+        next(batches)
@@ -0,0 +1,304 @@
+"""``live_query`` and sharing one live query between many local subscribers.
+
+The connections' RPCs are faked at ``_send`` and notifications are routed with
+the connection's own ``_route_frame``, so these run without a server.
+"""
+
+import asyncio
+import queue
+import threading
+import uuid
+from typing import Any
+
+import pytest
+
+from surrealdb import AsyncLiveMultiplexer, LiveMultiplexer
+from surrealdb.connections.async_ws import AsyncWsSurrealConnection
+from surrealdb.connections.blocking_ws import BlockingWsSurrealConnection
+from surrealdb.connections.live_multiplex import PredicateDispatcher
+from surrealdb.data.cbor import encode
+from surrealdb.errors import UnexpectedResponseError
+from surrealdb.request_message.message import RequestMessage
+from surrealdb.request_message.methods import RequestMethod
+
+WS_URL = "ws://localhost:8000"
+
+
+# --------------------------------------------------------------------------- #
+#  PredicateDispatcher                                                         #
+# --------------------------------------------------------------------------- #
+
+
+def test_dispatcher_routes_by_equality() -> None:
+    dispatcher: PredicateDispatcher[str] = PredicateDispatcher()
+    dispatcher.add("x", {"tenant": "x"})
+    dispatcher.add("y", {"tenant": "y"})
+    dispatcher.add("all")
+
+    assert dispatcher.match({"tenant": "x", "n": 1}) == ["all", "x"]
+    assert dispatcher.match({"tenant": "z"}) == ["all"]
+    assert dispatcher.match({"n": 1}) == ["all"]
+
+
+def test_dispatcher_requires_every_condition() -> None:
+    dispatcher: PredicateDispatcher[str] = PredicateDispatcher()
+    dispatcher.add("paid-x", {"tenant": "x", "status": "paid"})
+
+    assert dispatcher.match({"tenant": "x", "status": "paid"}) == ["paid-x"]
+    assert dispatcher.match({"tenant": "x", "status": "open"}) == []
+    assert dispatcher.match({"tenant": "x"}) == []
+
+
+def test_dispatcher_follows_dotted_paths() -> None:
+    dispatcher: PredicateDispatcher[str] = PredicateDispatcher()
+    dispatcher.add("eu", {"customer.region": "eu"})
+
+    assert dispatcher.match({"customer": {"region": "eu"}}) == ["eu"]
+    assert dispatcher.match({"customer": "eu"}) == []
+
+
+def test_dispatcher_shares_one_index_field() -> None:
+    """Subscribers land under a field already indexed, keeping lookups per record flat."""
+    dispatcher: PredicateDispatcher[int] = PredicateDispatcher()
+    dispatcher.add(0, {"tenant": "t0"})
+    for n in range(1, 100):
+        dispatcher.add(n, {"status": "paid", "tenant": f"t{n}"})
+
+    assert list(dispatcher._index) == ["tenant"]
+    assert dispatcher.match({"tenant": "t42", "status": "paid"}) == [42]
+
+
+def test_dispatcher_remove_cleans_up() -> None:
+    dispatcher: PredicateDispatcher[str] = PredicateDispatcher()
+    dispatcher.add("x", {"tenant": "x"})
+    dispatcher.add("all")
+    dispatcher.remove("x")
+    dispatcher.remove("all")
+    dispatcher.remove("never-added")
+
+    assert len(dispatcher) == 0
+    assert dispatcher._index == {}
+    assert dispatcher.match({"tenant": "x"}) == []
+
+
+def test_dispatcher_non_mapping_records_reach_only_unfiltered() -> None:
+    dispatcher: PredicateDispatcher[str] = PredicateDispatcher()
+    dispatcher.add("x", {"tenant": "x"})
+    dispatcher.add("all")
+
+    assert dispatcher.match([{"op": "replace", "path": "/tenant"}]) == ["all"]
+    assert dispatcher.match({"tenant": ["unhashable"]}) == ["all"]
+
+
+def test_dispatcher_refuses_what_it_cannot_index() -> None:
+    dispatcher: PredicateDispatcher[str] = PredicateDispatcher()
+    with pytest.raises(TypeError, match="hashable"):
+        dispatcher.add("x", {"tags": ["a"]})
+    with pytest.raises(ValueError, match="non-empty"):
+        dispatcher.add("x", {"": 1})
+    dispatcher.add("x")
+    with pytest.raises(ValueError, match="already registered"):
+        dispatcher.add("x")
+
+
+# --------------------------------------------------------------------------- #
+#  live_query                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+def _query_reply(result: Any) -> dict[str, Any]:
+    return {"result": [{"status": "OK", "time": "1ms", "result": result}]}
+
+
+def _fake_async_send(
+    conn: AsyncWsSurrealConnection, live_id: uuid.UUID, sent: list[RequestMessage]
+) -> Any:
+    async def _send(
+        message: RequestMessage, process: str, bypass: bool = False
+    ) -> dict[str, Any]:
+        sent.append(message)
+        if message.method == RequestMethod.QUERY:
+            return _query_reply(live_id)
+        return {}
+
+    return _send
+
+
+async def test_live_query_registers_the_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = uuid.uuid4()
+    sent: list[RequestMessage] = []
+    monkeypatch.setattr(conn, "_send", _fake_async_send(conn, live_id, sent))
+
+    returned = await conn.live_query(
+        "LIVE SELECT id, status FROM order WHERE tenant = $tenant", {"tenant": "x"}
+    )
+
+    assert returned == live_id
+    assert conn.live_queues[str(live_id)] == []
+    assert sent[0].kwargs["params"] == {"tenant": "x"}
+
+
+async def test_live_query_refuses_other_statements() -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    with pytest.raises(ValueError, match="LIVE SELECT"):
+        await conn.live_query("SELECT * FROM order")
+
+
+async def test_live_query_refuses_a_result_that_is_not_an_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+
+    async def _send(
+        message: RequestMessage, process: str, bypass: bool = False
+    ) -> dict[str, Any]:
+        return _query_reply([])
+
+    monkeypatch.setattr(conn, "_send", _send)
+    with pytest.raises(UnexpectedResponseError):
+        await conn.live_query("live select * from order")
+
+
+# --------------------------------------------------------------------------- #
+#  AsyncLiveMultiplexer                                                        #
+# --------------------------------------------------------------------------- #
+
+
+def _frame(live_id: uuid.UUID, tenant: str, n: int) -> bytes:
+    return encode(
+        {
+            "result": {
+                "id": live_id,
+                "action": "UPDATE",
+                "result": {"tenant": tenant, "n": n},
+            }
+        }
+    )
+
+
+async def _take(subscription: Any, count: int) -> list[int]:
+    return [
+        (await asyncio.wait_for(subscription.__anext__(), timeout=1))["result"]["n"]
+        for _ in range(count)
+    ]
+
+
+async def test_subscribers_share_one_live_query(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = uuid.uuid4()
+    sent: list[RequestMessage] = []
+    monkeypatch.setattr(conn, "_send", _fake_async_send(conn, live_id, sent))
+
+    mux = AsyncLiveMultiplexer(conn, "LIVE SELECT * FROM order")
+    tenant_x = await mux.subscribe({"tenant": "x"})
+    tenant_y = await mux.subscribe({"tenant": "y"})
+    everything = await mux.subscribe()
+    for n, tenant in enumerate(["x", "y", "x", "z"]):
+        conn._route_frame(_frame(live_id, tenant, n))
+
+    assert await _take(tenant_x, 2) == [0, 2]
+    assert await _take(tenant_y, 1) == [1]
+    assert await _take(everything, 4) == [0, 1, 2, 3]
+    assert [message.method for message in sent] == [RequestMethod.QUERY]
+
+    await mux.close()
+
+    assert sent[-1].method == RequestMethod.KILL
+    for subscription in (tenant_x, tenant_y, everything):
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(subscription.__anext__(), timeout=1)
+
+
+async def test_closing_a_subscriber_stops_routing_to_it(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = uuid.uuid4()
+    monkeypatch.setattr(conn, "_send", _fake_async_send(conn, live_id, []))
+    mux = AsyncLiveMultiplexer(conn, "LIVE SELECT * FROM order")
+    tenant_x = await mux.subscribe({"tenant": "x"})
+    conn._route_frame(_frame(live_id, "x", 0))
+    assert await _take(tenant_x, 1) == [0]
+
+    await tenant_x.aclose()
+
+    assert len(mux._dispatcher) == 0
+    await mux.close()
+
+
+async def test_subscriber_bounds_apply_per_subscriber(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = uuid.uuid4()
+    monkeypatch.setattr(conn, "_send", _fake_async_send(conn, live_id, []))
+    mux = AsyncLiveMultiplexer(conn, "LIVE SELECT * FROM order")
+    latest = await mux.subscribe(maxsize=1, on_overflow="drop_oldest")
+    complete = await mux.subscribe()
+    for n in range(5):
+        conn._route_frame(_frame(live_id, "x", n))
+    await asyncio.sleep(0)
+
+    assert await _take(complete, 5) == [0, 1, 2, 3, 4]
+    assert await _take(latest, 1) == [4]
+    assert latest.stats.dropped == 4
+    await mux.close()
+
+
+# --------------------------------------------------------------------------- #
+#  LiveMultiplexer (blocking)                                                  #
+# --------------------------------------------------------------------------- #
+
+
+class _FeedSocket:
+    """Sync socket fed from a queue; idles with a timeout when it is empty."""
+
+    def __init__(self) -> None:
+        self.frames: queue.Queue[bytes] = queue.Queue()
+
+    def recv(self, timeout: float | None = None, decode: bool | None = None) -> bytes:
+        try:
+            return self.frames.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError from None
+
+    def close(self) -> None:
+        pass
+
+
+def test_blocking_subscribers_share_one_live_query(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = BlockingWsSurrealConnection(WS_URL)
+    socket = _FeedSocket()
+    conn.socket = socket  # type: ignore[assignment]
+    live_id = uuid.uuid4()
+    sent: list[RequestMessage] = []
+    lock = threading.Lock()
+
+    def _send(
+        message: RequestMessage, process: str, bypass: bool = False
+    ) -> dict[str, Any]:
+        with lock:
+            sent.append(message)
+        if message.method == RequestMethod.QUERY:
+            return _query_reply(live_id)
+        return {}
+
+    monkeypatch.setattr(conn, "_send", _send)
+
+    with LiveMultiplexer(conn, "LIVE SELECT * FROM order") as mux:
+        tenant_x = mux.subscribe({"tenant": "x"})
+        tenant_y = mux.subscribe({"tenant": "y"})
+        for n, tenant in enumerate(["x", "y", "x"]):
+            socket.frames.put(_frame(live_id, tenant, n))
+
+        assert [next(tenant_x)["result"]["n"] for _ in range(2)] == [0, 2]
+        assert next(tenant_y)["result"]["n"] == 1
+
+    assert sent[-1].method == RequestMethod.KILL
+    assert list(tenant_x) == []
+    assert list(tenant_y) == []
@@ -0,0 +1,258 @@
+"""Bounded live-query queues: overflow policies and their counters.
+
+``subscribe_live`` used to give every consumer an unbounded queue, so a
+consumer slower than its table grew memory until the process was killed. These
+drive the routing directly - ``_route_frame`` on the async transport, the
+queue's ``put`` on the blocking one - so they run without a server.
+"""
+
+import asyncio
+import threading
+import uuid
+import weakref
+from typing import Any
+
+import pytest
+
+from surrealdb import LiveQueueOverflowError
+from surrealdb.connections.async_ws import AsyncWsSurrealConnection, _read_frames
+from surrealdb.connections.blocking_ws import BlockingWsSurrealConnection
+from surrealdb.connections.live_queue import AsyncLiveQueue, LiveQueue
+from surrealdb.data.cbor import encode
+from surrealdb.data.types.record_id import RecordID
+
+WS_URL = "ws://localhost:8000"
+
+
+def _notification(live_id: str, n: int, record: Any = None) -> dict[str, Any]:
+    return {
+        "id": live_id,
+        "action": "UPDATE",
+        "record": record if record is not None else RecordID("t", n),
+        "result": {"n": n},
+    }
+
+
+def _frame(live_id: str, n: int, record: Any = None) -> bytes:
+    return encode({"result": _notification(live_id, n, record)})
+
+
+async def _drain(subscription: Any, count: int) -> list[Any]:
+    return [
+        (await asyncio.wait_for(subscription.__anext__(), timeout=1))["result"]["n"]
+        for _ in range(count)
+    ]
+
+
+async def _subscribe(
+    maxsize: int, on_overflow: Any
+) -> tuple[AsyncWsSurrealConnection, str, Any]:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    subscription = await conn.subscribe_live(
+        live_id, maxsize=maxsize, on_overflow=on_overflow
+    )
+    return conn, live_id, subscription
+
+
+async def test_unbounded_by_default() -> None:
+    conn, live_id, subscription = await _subscribe(0, "block")
+    for n in range(100):
+        assert conn._route_frame(_frame(live_id, n)) == []
+
+    assert subscription.stats.lag == 100
+    assert await _drain(subscription, 3) == [0, 1, 2]
+
+
+async def test_drop_newest_keeps_the_first_notifications() -> None:
+    conn, live_id, subscription = await _subscribe(3, "drop_newest")
+    for n in range(10):
+        conn._route_frame(_frame(live_id, n))
+
+    assert await _drain(subscription, 3) == [0, 1, 2]
+    assert subscription.stats.received == 10
+    assert subscription.stats.dropped == 7
+    assert subscription.stats.delivered == 3
+    assert subscription.stats.max_lag == 3
+
+
+async def test_drop_oldest_keeps_the_latest_notifications() -> None:
+    conn, live_id, subscription = await _subscribe(3, "drop_oldest")
+    for n in range(10):
+        conn._route_frame(_frame(live_id, n))
+
+    assert await _drain(subscription, 3) == [7, 8, 9]
+    assert subscription.stats.dropped == 7
+    assert subscription.stats.lag == 0
+
+
+async def test_coalesce_keeps_the_latest_per_record_in_first_seen_order() -> None:
+    conn, live_id, subscription = await _subscribe(10, "coalesce_by_id")
+    record_a, record_b = RecordID("t", "a"), RecordID("t", "b")
+    for n, record in enumerate([record_a, record_b, record_a, record_a, record_b]):
+        conn._route_frame(_frame(live_id, n, record))
+
+    assert await _drain(subscription, 2) == [3, 4]
+    assert subscription.stats.dropped == 3
+    assert subscription.stats.lag == 0
+
+
+async def test_coalesce_drops_the_oldest_record_when_still_full() -> None:
+    conn, live_id, subscription = await _subscribe(2, "coalesce_by_id")
+    for n in range(3):
+        conn._route_frame(_frame(live_id, n))
+
+    assert await _drain(subscription, 2) == [1, 2]
+    assert subscription.stats.dropped == 1
+
+
+async def test_error_delivers_the_backlog_then_raises() -> None:
+    conn, live_id, subscription = await _subscribe(2, "error")
+    for n in range(5):
+        conn._route_frame(_frame(live_id, n))
+
+    assert await _drain(subscription, 2) == [0, 1]
+    with pytest.raises(LiveQueueOverflowError, match=live_id):
+        await asyncio.wait_for(subscription.__anext__(), timeout=1)
+    assert subscription.stats.dropped == 3
+
+
+async def test_kill_and_close_sentinels_are_never_dropped() -> None:
+    conn, live_id, subscription = await _subscribe(1, "drop_newest")
+    conn._route_frame(_frame(live_id, 0))
+    conn._route_frame(_frame(live_id, 1))
+
+    await conn.close()
+
+    assert await _drain(subscription, 1) == [0]
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(subscription.__anext__(), timeout=1)
+
+
+class _FramesAsyncSocket:
+    """Async socket that hands out queued frames, then waits for more."""
+
+    def __init__(self, frames: list[bytes]) -> None:
+        self._frames = list(frames)
+        self.read = 0
+
+    def __aiter__(self) -> "_FramesAsyncSocket":
+        return self
+
+    async def __anext__(self) -> bytes:
+        while not self._frames:
+            await asyncio.sleep(0.01)
+        self.read += 1
+        return self._frames.pop(0)
+
+
+async def test_block_stops_the_reader_until_the_consumer_catches_up() -> None:
+    conn, live_id, subscription = await _subscribe(2, "block")
+    socket = _FramesAsyncSocket([_frame(live_id, n) for n in range(5)])
+    reader = asyncio.create_task(_read_frames(weakref.ref(conn), socket))
+    try:
+        await asyncio.sleep(0.05)
+        assert socket.read == 2, "the reader kept reading into a full queue"
+        assert subscription.stats.lag == 2
+
+        assert await _drain(subscription, 5) == [0, 1, 2, 3, 4]
+        assert subscription.stats.dropped == 0
+    finally:
+        reader.cancel()
+
+
+async def test_closing_a_blocked_subscription_frees_the_reader() -> None:
+    conn, live_id, subscription = await _subscribe(1, "block")
+    socket = _FramesAsyncSocket([_frame(live_id, n) for n in range(3)])
+    reader = asyncio.create_task(_read_frames(weakref.ref(conn), socket))
+    try:
+        await asyncio.sleep(0.05)
+        assert socket.read == 1
+
+        # A consumer that takes one notification and breaks out of its loop.
+        assert await _drain(subscription, 1) == [0]
+        await subscription.aclose()
+        await asyncio.sleep(0.05)
+
+        assert socket.read == 3, "the reader is still waiting on a closed queue"
+    finally:
+        reader.cancel()
+
+
+async def test_invalid_options_are_refused_before_registering() -> None:
+    conn = AsyncWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    with pytest.raises(ValueError, match="on_overflow"):
+        await conn.subscribe_live(live_id, on_overflow="sometimes")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="maxsize"):
+        await conn.subscribe_live(live_id, maxsize=-1)
+
+    assert live_id not in conn.live_queues
+
+
+def test_async_queue_refuses_nothing_it_is_handed() -> None:
+    """``put_nowait`` never raises ``QueueFull``; the policy decides instead."""
+    queue = AsyncLiveQueue(1, "drop_newest")
+    queue.put_nowait(_notification("x", 0))
+    queue.put_nowait(_notification("x", 1))
+
+    assert queue.qsize() == 1
+    assert queue.stats.dropped == 1
+
+
+# --------------------------------------------------------------------------- #
+#  Blocking transport                                                          #
+# --------------------------------------------------------------------------- #
+
+
+def test_blocking_drop_oldest() -> None:
+    conn = BlockingWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    subscription = conn.subscribe_live(live_id, maxsize=2, on_overflow="drop_oldest")
+    (notifications,) = conn.live_queues[live_id]
+    for n in range(5):
+        notifications.put(_notification(live_id, n))
+
+    assert [next(subscription)["result"]["n"] for _ in range(2)] == [3, 4]
+    assert subscription.stats.dropped == 3
+    subscription.close()
+    assert live_id not in conn.live_queues
+
+
+def test_blocking_error_policy_raises_after_the_backlog() -> None:
+    conn = BlockingWsSurrealConnection(WS_URL)
+    live_id = str(uuid.uuid4())
+    subscription = conn.subscribe_live(live_id, maxsize=1, on_overflow="error")
+    (notifications,) = conn.live_queues[live_id]
+    notifications.put(_notification(live_id, 0))
+    notifications.put(_notification(live_id, 1))
+
+    assert next(subscription)["result"]["n"] == 0
+    with pytest.raises(LiveQueueOverflowError):
+        next(subscription)
+
+
+def test_blocking_block_policy_waits_for_room() -> None:
+    queue = LiveQueue(1, "block")
+    queue.put(_notification("x", 0))
+    second_put = threading.Thread(target=queue.put, args=(_notification("x", 1),))
+    second_put.start()
+    second_put.join(timeout=0.1)
+    assert second_put.is_alive(), "put returned with the queue full"
+
+    assert queue.get_nowait()["result"]["n"] == 0
+    second_put.join(timeout=1)
+    assert not second_put.is_alive()
+    assert queue.get_nowait()["result"]["n"] == 1
+
+
+def test_blocking_release_frees_a_waiting_producer() -> None:
+    queue = LiveQueue(1, "block")
+    queue.put(_notification("x", 0))
+    second_put = threading.Thread(target=queue.put, args=(_notification("x", 1),))
+    second_put.start()
+
+    queue.release()
+
+    second_put.join(timeout=1)
+    assert not second_put.is_alive()
@@ -0,0 +1,159 @@
+"""``use_middleware`` sees every RPC and may answer it without sending.
+
+Driven through a fake websocket that answers each frame in-process and a fake
+``requests.post``, so the frames actually sent can be counted.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from surrealdb.connections import blocking_http
+from surrealdb.connections.async_ws import AsyncWsSurrealConnection
+from surrealdb.connections.blocking_http import BlockingHttpSurrealConnection
+from surrealdb.data.cbor import encode
+from surrealdb.data.types.table import Table
+from surrealdb.errors import ServerError, UnexpectedResponseError
+from surrealdb.request_message.message import RequestMessage
+from surrealdb.request_message.methods import RequestMethod
+from surrealdb.testing import query_result
+
+HTTP_URL = "http://localhost:8000"
+
+
+async def test_middleware_runs_outermost_first(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result([{"n": 1}]))
+    seen: list[str] = []
+
+    def named(name: str) -> Any:
+        async def middleware(message: RequestMessage, call_next: Any) -> Any:
+            seen.append(f"{name} {message.method.value}")
+            response = await call_next(message)
+            seen.append(f"{name} {response['result'][0]['status']}")
+            return response
+
+        return middleware
+
+    conn.use_middleware(named("outer"))
+    conn.use_middleware(named("inner"))
+
+    assert await conn.select(Table("person")) == [{"n": 1}]
+    assert seen == ["outer query", "inner query", "inner OK", "outer OK"]
+    assert len(conn.socket.sent) == 1
+
+
+async def test_a_short_circuit_sends_nothing_and_keeps_correlation(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result([{"n": 1}]))
+    cached = {"id": "an-earlier-request", "result": query_result([{"n": 2}])}
+
+    async def cache(message: RequestMessage, call_next: Any) -> Any:
+        return cached
+
+    conn.use_middleware(cache)
+
+    response = await conn.query_raw("SELECT * FROM person")
+
+    assert conn.socket.sent == []
+    assert response["result"] == cached["result"]
+    assert response["id"] != "an-earlier-request"
+    assert cached["id"] == "an-earlier-request"
+    assert conn.qry == {}
+
+
+async def test_a_short_circuited_error_is_raised_like_the_servers(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result([{"n": 1}]))
+
+    async def refuse(message: RequestMessage, call_next: Any) -> Any:
+        return {"error": {"code": -32000, "message": "circuit open"}}
+
+    conn.use_middleware(refuse)
+
+    with pytest.raises(ServerError, match="circuit open"):
+        await conn.use("ns", "db")
+    assert conn.socket.sent == []
+
+
+async def test_a_middleware_that_raises_fails_only_its_call(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result([{"n": 1}]))
+
+    async def breaker(message: RequestMessage, call_next: Any) -> Any:
+        if message.method is RequestMethod.QUERY:
+            raise ConnectionRefusedError("open")
+        return await call_next(message)
+
+    conn.use_middleware(breaker)
+
+    with pytest.raises(ConnectionRefusedError):
+        await conn.query_raw("RETURN 1")
+    await conn.use("ns", "db")
+    assert [request["method"] for request in conn.socket.sent] == ["use"]
+
+
+async def test_a_middleware_must_return_an_envelope(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result([{"n": 1}]))
+
+    async def broken(message: RequestMessage, call_next: Any) -> Any:
+        await call_next(message)
+
+    conn.use_middleware(broken)
+
+    with pytest.raises(UnexpectedResponseError, match="a middleware returned"):
+        await conn.query_raw("RETURN 1")
+
+
+async def test_sessions_go_through_the_connections_middleware(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result([{"n": 1}]))
+    seen: list[str] = []
+
+    async def record(message: RequestMessage, call_next: Any) -> Any:
+        seen.append(message.method.value)
+        return await call_next(message)
+
+    conn.use_middleware(record)
+    session = await conn.new_session()
+    await session.query_raw("RETURN 1")
+
+    assert seen == ["attach", "query"]
+
+
+def test_blocking_middleware_can_short_circuit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    posted: list[bytes] = []
+
+    class _Response:
+        status_code = 200
+        content = encode({"id": "1", "result": query_result([{"n": 1}])})
+
+    def _post(url: str, **kwargs: Any) -> _Response:
+        posted.append(kwargs["data"])
+        return _Response()
+
+    monkeypatch.setattr(blocking_http.requests, "post", _post)
+    conn = BlockingHttpSurrealConnection(HTTP_URL)
+    cache: dict[str, dict[str, Any]] = {}
+
+    def caching(message: RequestMessage, call_next: Any) -> Any:
+        key = message.kwargs["query"]
+        if key not in cache:
+            cache[key] = call_next(message)
+        return cache[key]
+
+    conn.use_middleware(caching)
+
+    assert conn.select(Table("person")) == [{"n": 1}]
+    assert conn.select(Table("person")) == [{"n": 1}]
+    assert len(posted) == 1
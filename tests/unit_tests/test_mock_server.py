@@ -0,0 +1,198 @@
+"""``surrealdb.testing.MockServer`` speaks ``/rpc`` to the real clients.
+
+Every test drives an actual ``AsyncSurreal`` / ``Surreal`` connection over
+localhost, so what is checked is what a service under test would see.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from surrealdb import AsyncSurreal, Surreal
+from surrealdb.errors import ConnectionUnavailableError, ServerError
+from surrealdb.testing import (
+    FixtureRecorder,
+    MockRequest,
+    MockServer,
+    RpcError,
+    load_fixtures,
+    query_result,
+)
+
+ROWS = [{"id": 1, "name": "Tobie"}]
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[MockServer]:
+    async with MockServer() as server:
+        yield server
+
+
+@pytest.fixture(params=["ws", "http"])
+def url(request: pytest.FixtureRequest, server: MockServer) -> str:
+    return server.url if request.param == "ws" else server.http_url
+
+
+async def _connect(url: str) -> Any:
+    db = AsyncSurreal(url)
+    await db.connect()
+    return db
+
+
+async def test_a_client_can_get_going_without_scripting(
+    server: MockServer, url: str
+) -> None:
+    db = await _connect(url)
+    await db.use("ns", "db")
+    await db.signin({"username": "root", "password": "root"})
+
+    assert await db.query("RETURN 1") == [[]]
+    assert await db.version() == "surrealdb-3.0.0"
+    assert [request.method for request in server.requests] == [
+        "use",
+        "signin",
+        "query",
+        "version",
+    ]
+    await db.close()
+
+
+async def test_scripted_replies(server: MockServer, url: str) -> None:
+    server.respond("query", query_result(ROWS))
+    db = await _connect(url)
+
+    assert await db.select("person") == ROWS
+    assert server.requests[-1].transport == url.split(":")[0]
+    await db.close()
+
+
+async def test_handlers_see_the_request_and_may_fail(server: MockServer) -> None:
+    @server.handle("query")
+    async def query(request: MockRequest) -> Any:
+        if request.params[0] == "fail":
+            raise RpcError("refused", code=-32002)
+        if request.params[0] == "crash":
+            raise ValueError("handler bug")
+        return query_result(request.params[0])
+
+    db = await _connect(server.url)
+
+    assert (await db.query_raw("echo"))["result"][0]["result"] == "echo"
+    with pytest.raises(ServerError, match="refused"):
+        await db.query("fail")
+    with pytest.raises(ServerError, match="handler bug"):
+        await db.query("crash")
+    await db.close()
+
+
+async def test_an_unscripted_method_is_not_found(server: MockServer) -> None:
+    db = await _connect(server.url)
+
+    with pytest.raises(ServerError, match="Method not found: run"):
+        await db.run("fn::greet")
+    await db.close()
+
+
+async def test_concurrent_replies_out_of_order_stay_correlated() -> None:
+    async with MockServer(jitter=0.02, seed=7) as server:
+        server.handle("query", lambda request: query_result(request.params[0]))
+        db = await _connect(server.url)
+
+        texts = [f"q{n}" for n in range(20)]
+        replies = await asyncio.gather(*(db.query_raw(text) for text in texts))
+
+        assert [reply["result"][0]["result"] for reply in replies] == texts
+        await db.close()
+
+
+# --------------------------------------------------------------------------- #
+#  faults                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+async def test_errors_are_injected_for_a_number_of_requests(
+    server: MockServer, url: str
+) -> None:
+    server.inject_fault("error", method="query", times=2, message="busy")
+    db = await _connect(url)
+
+    await db.use("ns", "db")
+    for _ in range(2):
+        with pytest.raises(ServerError, match="busy"):
+            await db.query("RETURN 1")
+    await db.query("RETURN 1")
+    await db.close()
+
+
+async def test_a_disconnect_fails_the_request(server: MockServer, url: str) -> None:
+    server.inject_fault("disconnect")
+    db = await _connect(url)
+
+    with pytest.raises(ConnectionUnavailableError):
+        await db.query_raw("RETURN 1")
+
+
+async def test_a_dropped_request_is_never_answered(server: MockServer) -> None:
+    server.inject_fault("drop")
+    db = await _connect(server.url)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(db.query_raw("RETURN 1"), 0.2)
+    await db.query_raw("RETURN 1")
+    await db.close()
+
+
+# --------------------------------------------------------------------------- #
+#  live queries                                                                #
+# --------------------------------------------------------------------------- #
+
+
+async def test_a_burst_of_notifications_arrives_in_order(server: MockServer) -> None:
+    db = await _connect(server.url)
+    live_id = await db.live("person")
+    subscription = await db.subscribe_live(live_id)
+
+    assert server.live_queries == {live_id: "person"}
+    assert await server.burst("person", [{"n": n} for n in range(50)]) == 50
+
+    received = [(await anext(subscription))["result"]["n"] for _ in range(50)]
+    assert received == list(range(50))
+
+    await db.kill(live_id)
+    assert server.live_queries == {}
+    await db.close()
+
+
+# --------------------------------------------------------------------------- #
+#  fixtures, and blocking clients                                              #
+# --------------------------------------------------------------------------- #
+
+
+async def test_recorded_fixtures_replay(server: MockServer, tmp_path: Path) -> None:
+    server.respond("query", query_result(ROWS))
+    recorder = FixtureRecorder()
+    db = await _connect(server.url)
+    db.use_middleware(recorder.async_middleware)
+    await db.query_raw("SELECT * FROM person")
+    await db.close()
+    recorder.save(tmp_path / "session.cbor")
+
+    async with MockServer(fixtures=load_fixtures(tmp_path / "session.cbor")) as replay:
+        db = await _connect(replay.http_url)
+        assert await db.query("SELECT * FROM person") == [ROWS]
+        assert await db.query("SELECT * FROM company") == [[]]
+        await db.close()
+
+
+def test_blocking_clients_use_a_background_server() -> None:
+    with MockServer().background() as server:
+        server.respond("query", query_result(ROWS))
+        for url in (server.url, server.http_url):
+            db = Surreal(url)
+            db.connect()
+            assert db.query_raw("SELECT * FROM person")["result"][0]["result"] == ROWS
+            db.close()
+        assert server.counts["query"] == 2
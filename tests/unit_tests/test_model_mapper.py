@@ -0,0 +1,133 @@
+"""The per-class model mapper behind ``into=`` and the public ``map_rows``.
+
+A class is inspected once and its mapper reused; these check that the cached
+path maps exactly what the per-row path did, and that it fails the same way.
+"""
+
+import gc
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from surrealdb import map_rows
+from surrealdb.connections.builders import _MAPPERS, _map_result, _map_to_class
+from surrealdb.errors import UnexpectedResponseError
+
+
+@dataclass
+class Order:
+    id: int
+    total: float
+    tags: list[str] = field(default_factory=list)
+
+
+def test_map_rows_builds_every_row() -> None:
+    rows = [{"id": n, "total": n * 1.5} for n in range(3)]
+
+    orders = map_rows(Order, rows)
+
+    assert orders == [Order(0, 0.0), Order(1, 1.5), Order(2, 3.0)]
+
+
+def test_map_rows_accepts_any_iterable() -> None:
+    orders = map_rows(Order, ({"id": n, "total": 0} for n in range(2)))
+    assert [order.id for order in orders] == [0, 1]
+
+
+def test_the_mapper_is_built_once_per_class() -> None:
+    map_rows(Order, [{"id": 1, "total": 1}])
+    mapper = _MAPPERS[Order]
+
+    _map_result(Order, [{"id": 2, "total": 2}])
+    _map_to_class(Order, {"id": 3, "total": 3})
+
+    assert _MAPPERS[Order] is mapper
+
+
+def test_the_positional_form_is_cached_too() -> None:
+    assert _map_to_class(Order, [1, 2.0, ["a"]]) == Order(1, 2.0, ["a"])
+    assert _MAPPERS[Order]._positional == ["id", "total", "tags"]
+    with pytest.raises(UnexpectedResponseError, match="expects 3 statement"):
+        _map_to_class(Order, [1, 2.0])
+
+
+def test_the_cache_does_not_keep_a_class_alive() -> None:
+    @dataclass
+    class Transient:
+        id: int
+
+    map_rows(Transient, [{"id": 1}])
+    assert len([cls for cls in _MAPPERS if cls.__name__ == "Transient"]) == 1
+
+    del Transient
+    gc.collect()
+
+    assert not [cls for cls in _MAPPERS if cls.__name__ == "Transient"]
+
+
+def test_a_bad_row_is_reported_with_its_record() -> None:
+    with pytest.raises(UnexpectedResponseError, match="into=Order") as caught:
+        map_rows(Order, [{"id": 1, "total": 1}, {"id": 2, "paid": True}])
+
+    assert "'paid'" in str(caught.value)
+    assert isinstance(caught.value.__cause__, TypeError)
+
+
+def test_a_row_that_is_not_a_record_is_refused() -> None:
+    with pytest.raises(UnexpectedResponseError):
+        map_rows(Order, [{"id": 1, "total": 1}, 7])  # type: ignore[list-item]
+
+
+def test_map_rows_refuses_something_that_is_not_a_class() -> None:
+    with pytest.raises(TypeError):
+        map_rows(Order(1, 1), [])  # type: ignore[arg-type]
+
+
+def test_pydantic_rows_are_validated_as_one_list() -> None:
+    pytest.importorskip("pydantic")
+    import pydantic
+
+    class Item(pydantic.BaseModel):
+        id: int
+        name: str
+
+    items = map_rows(Item, [{"id": "1", "name": "a"}, {"id": 2, "name": "b"}])
+
+    assert [item.id for item in items] == [1, 2]
+    assert _MAPPERS[Item]._validates_list is True
+
+    with pytest.raises(pydantic.ValidationError) as caught:
+        map_rows(Item, [{"id": 1, "name": "a"}, {"id": "x", "name": "b"}])
+    # The failing row is named by its position in the list.
+    assert caught.value.errors()[0]["loc"][0] == 1
+
+
+def test_the_list_validator_does_not_keep_a_pydantic_model_alive() -> None:
+    pytest.importorskip("pydantic")
+    import pydantic
+
+    class Transient(pydantic.BaseModel):
+        id: int
+
+    assert map_rows(Transient, [{"id": 1}])[0].id == 1
+    assert _MAPPERS[Transient]._validates_list is True
+
+    del Transient
+    gc.collect()
+
+    assert not [cls for cls in _MAPPERS if cls.__name__ == "Transient"]
+
+
+def test_a_pydantic_model_with_a_custom_init_still_runs_it() -> None:
+    pytest.importorskip("pydantic")
+    import pydantic
+
+    class Shouty(pydantic.BaseModel):
+        name: str
+
+        def __init__(self, **data: Any) -> None:
+            data["name"] = data["name"].upper()
+            super().__init__(**data)
+
+    assert [s.name for s in map_rows(Shouty, [{"name": "a"}])] == ["A"]
@@ -0,0 +1,228 @@
+"""Each RPC is described to the telemetry recorder as the transport sends it.
+
+Driven through a list recorder and fake transports, so they run without a
+server or OpenTelemetry; the OpenTelemetry recorder itself is checked against
+the SDK's in-memory exporter when the SDK is installed.
+"""
+
+import builtins
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+from surrealdb import telemetry
+from surrealdb.connections import blocking_http
+from surrealdb.connections.async_ws import AsyncWsSurrealConnection
+from surrealdb.connections.blocking_http import BlockingHttpSurrealConnection
+from surrealdb.data.cbor import encode
+from surrealdb.data.types.table import Table
+from surrealdb.errors import SurrealError
+from surrealdb.testing import query_result
+
+HTTP_URL = "http://db.example:8000"
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.started: list[telemetry.RpcCall] = []
+        self.finished: list[telemetry.RpcCall] = []
+
+    def start(self, call: telemetry.RpcCall) -> None:
+        self.started.append(call)
+
+    def finish(self, call: telemetry.RpcCall) -> None:
+        self.finished.append(call)
+
+
+@pytest.fixture
+def recorder() -> Iterator[_Recorder]:
+    recorder = _Recorder()
+    telemetry.set_recorder(recorder)
+    try:
+        yield recorder
+    finally:
+        telemetry.set_recorder(None)
+
+
+# --------------------------------------------------------------------------- #
+#  fingerprints                                                                #
+# --------------------------------------------------------------------------- #
+
+
+def test_literals_do_not_change_the_fingerprint() -> None:
+    first = telemetry.fingerprint("SELECT * FROM person:1 WHERE name = 'ann'")
+    second = telemetry.fingerprint('SELECT *  FROM person:22 WHERE name = "bob"')
+
+    assert first == second
+    assert first[0] == "SELECT * FROM person:? WHERE name = ?"
+
+
+def test_identifiers_with_digits_are_kept() -> None:
+    normalized, _ = telemetry.fingerprint("SELECT v2 FROM t1 LIMIT 10")
+
+    assert normalized == "SELECT v2 FROM t1 LIMIT ?"
+
+
+def test_different_statements_differ() -> None:
+    assert (
+        telemetry.fingerprint("SELECT * FROM a")[1]
+        != telemetry.fingerprint("SELECT * FROM b")[1]
+    )
+
+
+# --------------------------------------------------------------------------- #
+#  over a websocket                                                            #
+# --------------------------------------------------------------------------- #
+
+
+async def test_a_websocket_rpc_is_measured(
+    recorder: _Recorder, answering_ws: Callable[..., AsyncWsSurrealConnection]
+) -> None:
+    conn = answering_ws(query_result([{"age": 31}]))
+    conn.namespace, conn.database = "ns", "db"
+
+    await conn.query_raw("SELECT * FROM person WHERE age > 30")
+
+    [call] = recorder.finished
+    assert recorder.started == [call]
+    assert (call.method, call.transport) == ("query", "ws")
+    assert (call.namespace, call.database) == ("ns", "db")
+    assert (call.server_address, call.server_port) == ("db.example", 8000)
+    assert call.query == "SELECT * FROM person WHERE age > ?"
+    assert call.request_bytes > 0 and call.response_bytes > 0
+    assert call.encode_ns > 0 and call.decode_ns > 0
+    assert call.duration_ns >= call.encode_ns + call.decode_ns
+    assert call.error is None
+    assert conn._rpc_calls == {}
+
+
+async def test_use_reports_the_namespace_it_switches_to(
+    recorder: _Recorder, answering_ws: Callable[..., AsyncWsSurrealConnection]
+) -> None:
+    conn = answering_ws(query_result([]))
+
+    await conn.use("ns", "db")
+    await conn.select(Table("person"))
+
+    assert [(c.method, c.namespace, c.database) for c in recorder.finished] == [
+        ("use", "ns", "db"),
+        ("query", "ns", "db"),
+    ]
+    assert recorder.finished[0].query is None
+
+
+async def test_a_failed_rpc_carries_its_error(
+    recorder: _Recorder, answering_ws: Callable[..., AsyncWsSurrealConnection]
+) -> None:
+    conn = answering_ws(fail=True)
+
+    with pytest.raises(SurrealError):
+        await conn.use("ns", "db")
+
+    [call] = recorder.finished
+    assert isinstance(call.error, SurrealError)
+
+
+async def test_nothing_is_recorded_when_off(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    conn = answering_ws(query_result([]))
+
+    await conn.select(Table("person"))
+
+    assert conn._rpc_calls == {}
+
+
+# --------------------------------------------------------------------------- #
+#  over HTTP                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, result: Any) -> None:
+        self.content = encode({"id": "1", "result": query_result(result)})
+
+
+def test_an_http_rpc_is_measured(
+    recorder: _Recorder, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    response = _FakeResponse([{"id": 1}])
+    monkeypatch.setattr(blocking_http.requests, "post", lambda url, **kw: response)
+    conn = BlockingHttpSurrealConnection(HTTP_URL)
+
+    conn.select(Table("person"))
+
+    [call] = recorder.finished
+    assert (call.method, call.transport) == ("query", "http")
+    assert call.response_bytes == len(response.content)
+    assert call.request_bytes > 0 and call.decode_ns > 0
+
+
+def test_an_http_timeout_is_an_event(
+    recorder: _Recorder, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _slow(url: str, **kwargs: Any) -> _FakeResponse:
+        raise blocking_http.requests.exceptions.Timeout()
+
+    monkeypatch.setattr(blocking_http.requests, "post", _slow)
+    conn = BlockingHttpSurrealConnection(HTTP_URL)
+
+    with pytest.raises(SurrealError):
+        conn.select(Table("person"))
+
+    [call] = recorder.finished
+    assert [name for name, _, _ in call.events] == ["timeout"]
+    assert call.error is not None
+
+
+# --------------------------------------------------------------------------- #
+#  OpenTelemetry                                                               #
+# --------------------------------------------------------------------------- #
+
+
+def test_instrument_names_the_extra_without_opentelemetry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    real_import = builtins.__import__
+
+    def _no_otel(name: str, *args: Any, **kwargs: Any) -> Any:
+        if name.startswith("opentelemetry"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", _no_otel)
+
+    with pytest.raises(ImportError, match=r"surrealdb\[otel\]"):
+        telemetry.instrument()
+    assert telemetry.recorder is None
+
+
+async def test_opentelemetry_spans(
+    answering_ws: Callable[..., AsyncWsSurrealConnection],
+) -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    telemetry.instrument(tracer_provider=provider)
+    try:
+        conn = answering_ws(query_result([]))
+        conn.namespace, conn.database = "ns", "db"
+        await conn.query_raw("SELECT * FROM person:1")
+    finally:
+        telemetry.uninstrument()
+
+    [span] = exporter.get_finished_spans()
+    assert span.name == "surrealdb query"
+    assert span.attributes["db.namespace"] == "ns/db"
+    assert span.attributes["db.query.text"] == "SELECT * FROM person:?"
+    assert span.attributes["surrealdb.request.size"] > 0